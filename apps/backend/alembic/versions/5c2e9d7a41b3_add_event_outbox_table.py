@@ -0,0 +1,53 @@
+"""add event_outbox table
+
+Revision ID: 5c2e9d7a41b3
+Revises: fbacadb30ed4
+Create Date: 2026-10-17 10:12:40.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e9d7a41b3"
+down_revision: Union[str, Sequence[str], None] = "fbacadb30ed4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("topic_kind", sa.String(length=16), nullable=False),
+        sa.Column("topic_id", sa.UUID(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("topic_kind IN ('room', 'case')", name="ck_event_outbox_topic_kind"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_event_outbox_pending",
+        "event_outbox",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("delivered_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_outbox_pending", table_name="event_outbox")
+    op.drop_table("event_outbox")
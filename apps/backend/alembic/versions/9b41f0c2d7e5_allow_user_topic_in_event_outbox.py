@@ -0,0 +1,38 @@
+"""allow user topic in event_outbox
+
+Revision ID: 9b41f0c2d7e5
+Revises: 5c2e9d7a41b3
+Create Date: 2026-10-17 14:03:11.502817
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b41f0c2d7e5"
+down_revision: Union[str, Sequence[str], None] = "5c2e9d7a41b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint("ck_event_outbox_topic_kind", "event_outbox", type_="check")
+    op.create_check_constraint(
+        "ck_event_outbox_topic_kind",
+        "event_outbox",
+        "topic_kind IN ('room', 'case', 'user')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM event_outbox WHERE topic_kind = 'user'")
+    op.drop_constraint("ck_event_outbox_topic_kind", "event_outbox", type_="check")
+    op.create_check_constraint(
+        "ck_event_outbox_topic_kind",
+        "event_outbox",
+        "topic_kind IN ('room', 'case')",
+    )
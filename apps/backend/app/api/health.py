@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+from dataclasses import asdict
+
 from fastapi import APIRouter
 from sqlalchemy import text
 
+from app.core.security.jwt import JwtHandlerDep
+from app.infra.db.pool_metrics import db_pool_stats
 from app.infra.db.session import DbSessionDep
-from app.infra.redis.client import RedisClientDep
+from app.infra.redis.client import (
+    RedisBinaryClientDep,
+    RedisClientDep,
+    get_redis_namespace_clients,
+    redis_pool_stats,
+)
 
 router = APIRouter(tags=["health"])
 
@@ -18,3 +27,23 @@ async def health(db: DbSessionDep, redis_client: RedisClientDep):
     await redis_client.ping()
 
     return {"ok": True}
+
+
+@router.get("/health/pools")
+async def pool_stats(redis_client: RedisClientDep, redis_binary_client: RedisBinaryClientDep):
+    """connection pool 상태. (pool 크기를 부하 중 수치로 정하기 위함)"""
+    redis_clients = {
+        "redis": redis_client,
+        "redis_binary": redis_binary_client,
+        **{f"redis_{ns}": client for ns, client in get_redis_namespace_clients().items()},
+    }
+    return {
+        "db": [asdict(stats) for stats in db_pool_stats()],
+        "redis": [asdict(redis_pool_stats(name, client)) for name, client in redis_clients.items()],
+    }
+
+
+@router.get("/health/jwt")
+async def jwt_stats(jwt_handler: JwtHandlerDep):
+    """이 프로세스의 JWT 검증 통계. (claims 캐시 hit/miss, 서명 검증 시간)"""
+    return asdict(jwt_handler.stats)
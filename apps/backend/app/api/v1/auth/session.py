@@ -5,9 +5,9 @@ from fastapi import APIRouter, Request, Response, status
 from app.core.config import JwtConfig
 from app.core.error_codes import AuthCommonErrorCode, AuthTokenErrorCode
 from app.core.exceptions import EnvelopeHTTPException
-from app.core.security.auth import CurrentUser
+from app.core.security.auth import CurrentRequestContext
 from app.core.security.jwt import ACCESS_TOKEN, REFRESH_TOKEN, JwtHandlerDep
-from app.repositories.deps import CaseRepoDep, RoomMemberRepoDep
+from app.infra.redis.token_deny_list import TokenDenyListDep
 from app.schemas.auth.request import GuestLoginRequest
 from app.schemas.auth.response import (
     GuestInfo,
@@ -74,11 +74,7 @@ router = APIRouter()
         },
     },
 )
-async def me(
-    user: CurrentUser,
-    room_member_repo: RoomMemberRepoDep,
-    case_repo: CaseRepoDep,
-) -> UserInfoResponse:
+async def me(ctx: CurrentRequestContext) -> UserInfoResponse:
     """Return current guest info from access_token cookie.
 
     - Reads `access_token` from cookies.
@@ -86,22 +82,12 @@ async def me(
     - On missing/invalid/expired token, raises 401.
     """
 
-    # DB에서 실제 user 조회
-    room_id = None
-    case_id = None
-    room_member = await room_member_repo.get_active_by_user_id(user_id=user.id)
-    if room_member is not None:
-        room_id = room_member.room_id
-
-    if room_id is not None:
-        case = await case_repo.get_running_by_room_id(room_id=room_id)
-        case_id = case.id if case else None
-
+    # user, 현재 room/case는 요청 context 캐시에서 (miss면 DB에서 읽어 채운다)
     data = GuestInfo(
-        id=user.id,
-        username=user.username,
-        current_room_id=room_id,
-        current_case_id=case_id,
+        id=ctx.user.id,
+        username=ctx.user.username,
+        current_room_id=ctx.room_id,
+        current_case_id=ctx.case_id,
     )
     return UserInfoResponse(ok=True, code=LoginCode.OK, message=None, data=data, meta=None)
 
@@ -155,6 +141,7 @@ async def guest_login(
     # 2. issue JWT (MVP: sub=username)
     access = jwt_handler.create_access_token(
         sub=str(user.id),
+        username=user.username,
     )
     refresh, jti = jwt_handler.create_refresh_token(sub=str(user.id))
 
@@ -196,6 +183,7 @@ async def refresh(
     response: Response,
     auth_service: AuthServiceDep,
     jwt_handler: JwtHandlerDep,
+    deny_list: TokenDenyListDep,
 ) -> UserInfoResponse:
     """
     Refresh access token using refresh_token cookie.
@@ -213,12 +201,22 @@ async def refresh(
         )
 
     # NOTE:
-    # - extract_user_id_from_token(token, token_type) 내부에서 typ 검증이 일어나야 함.
+    # - decode_and_verify_async(token, token_type) 내부에서 typ 검증이 일어나야 함.
     #   (여기서는 token_type=REFRESH_TOKEN을 전달해서 refresh 토큰으로 검증되게 함)
-    user_id = jwt_handler.extract_user_id_from_token(refresh_token, REFRESH_TOKEN)
+    claims = await jwt_handler.decode_and_verify_async(refresh_token, REFRESH_TOKEN)
+    user_id = claims["sub"]
+    if deny_list is not None and await deny_list.is_denied(claims["jti"]):
+        raise EnvelopeHTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            code=AuthTokenErrorCode.AUTH_TOKEN_INVALID,
+            message="revoked token",
+        )
+
+    # DB에서 user 조회 (응답과 stateless access token의 username claim에 쓴다)
+    username = await auth_service.get_username_by_user_id(user_id)
 
     # access 토큰 재발급 (sub=user_id UUID string)
-    access = jwt_handler.create_access_token(sub=user_id)
+    access = jwt_handler.create_access_token(sub=user_id, username=username)
 
     # access cookie만 갱신 (refresh rotation은 MVP에선 하지 않음)
     response.set_cookie(
@@ -231,9 +229,6 @@ async def refresh(
         max_age=int(jwt_handler.cfg.access_ttl.total_seconds()),
     )
 
-    # DB에서 user 조회해서 응답 구성
-    username = await auth_service.get_username_by_user_id(user_id)
-
     data = GuestInfo(
         id=UUID(user_id),
         username=username,
@@ -267,18 +262,37 @@ async def refresh(
         },
     },
 )
-async def logout(response: Response) -> LogoutResponse:
+async def logout(
+    request: Request,
+    response: Response,
+    jwt_handler: JwtHandlerDep,
+    deny_list: TokenDenyListDep,
+) -> LogoutResponse:
     """
     POST /api/v1/auth/logout
 
     의미:
     - 현재 세션의 access/refresh JWT 쿠키를 제거한다.
-    - MVP: 토큰 블랙리스트/회전/서버측 세션 무효화는 하지 않는다.
+    - stateless access token 모드면 두 token을 deny-list에 넣어 exp 전에도 쓸 수 없게 한다.
+      (그 외에는 토큰 블랙리스트/회전/서버측 세션 무효화는 하지 않는다)
     - MVP: case 참가 중이면 leave_room 등의 부수효과는 아직 구현하지 않는다.
 
     Side effect:
     - Set-Cookie로 access_token/refresh_token을 Max-Age=0으로 만료시킨다.
     """
+    if deny_list is not None:
+        # cookie 이름과 token type이 같다.
+        for token_type in (ACCESS_TOKEN, REFRESH_TOKEN):
+            token = request.cookies.get(token_type)
+            if not token:
+                continue
+            try:
+                claims = await jwt_handler.decode_and_verify_async(token, token_type)
+            except EnvelopeHTTPException:
+                continue  # 이미 쓸 수 없는 token
+            if "jti" in claims:
+                await deny_list.deny(claims["jti"], expires_at=claims["exp"])
+
     # 쿠키 삭제 지시 (브라우저/클라이언트가 저장된 쿠키를 제거하도록)
     response.delete_cookie(key=ACCESS_TOKEN, path="/")
     response.delete_cookie(key=REFRESH_TOKEN, path="/")
@@ -22,6 +22,37 @@ class Settings(BaseSettings):
     database_url: str
     redis_url: str
 
+    # Read replica
+    # - 있으면 auth/room 멤버십 확인, room snapshot, case history 같은 읽기 전용 조회를 보낸다.
+    # - read_pin: user가 쓰기를 commit한 뒤(또는 room event가 나간 뒤) 이 시간 동안은
+    #   그 user/room 조회를 primary로 보낸다. (replica 지연 동안 자기 쓰기를 못 보는 일 방지)
+    database_read_url: str | None = None
+    db_read_pin_seconds: float = 5.0
+
+    # 실시간 stream(SSE/WS) 전용 DB pool
+    # - stream은 session을 들고 있지 않고, 조회마다 이 pool에서 빌려 바로 반납한다.
+    # - REST pool과 분리해서, 열린 stream이 많아도 REST 요청이 connection을 기다리지 않게 한다.
+    realtime_db_pool_size: int = 5
+    realtime_db_max_overflow: int = 5
+
+    # Connection pool
+    # - db_pool_*: REST engine의 pool.
+    #   timeout/recycle은 realtime, read replica engine에도 같이 쓴다.
+    #   (read replica engine의 크기도 db_pool_size/db_max_overflow)
+    #   (recycle: 이 시간(초)보다 오래된 connection은 checkout 시 새로 연결. -1이면 비활성)
+    # - redis_*: 모든 Redis client(Redis.from_url)에 적용. None이면 redis-py 기본값
+    #   (socket_timeout은 XREAD BLOCK(pubsub_stream_block_ms)보다 길어야 하고,
+    #    max_connections는 PUB/SUB 구독이 연결을 하나씩 잡는 것까지 감안해야 한다)
+    # - pool 상태(checked-out/idle/overflow, checkout 대기 시간 등)는 GET /api/health/pools
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = -1
+    redis_max_connections: int | None = None
+    redis_socket_timeout_seconds: float | None = None
+    redis_socket_connect_timeout_seconds: float | None = None
+    redis_health_check_interval_seconds: int = 0
+
     # JWT
     # - access/refresh 분리
     # - 운영에서는 RS256(+private/public key)도 고려 가능하지만, MVP는 HS256로 시작해도 충분
@@ -34,6 +65,12 @@ class Settings(BaseSettings):
 
     jwt_access_expires_minutes: int = 15
     jwt_refresh_expires_days: int = 30
+    # 검증된 claims 캐시 크기 (token digest -> claims, exp까지). 0이면 매번 서명 검증
+    jwt_claims_cache_max_entries: int = 10_000
+    # stateless access token (opt-in)
+    # - access token에 username/jti를 넣고, 인증 시 users를 조회하지 않고 exp까지 claims를 믿는다.
+    # - 폐기는 Redis deny-list(jti)로 한다. logout이 현재 access/refresh token을 넣는다.
+    jwt_stateless_access: bool = False
 
     # Web Domain & CORS settings
     # - local/dev에서는 편의상 넓게 열 수 있지만, prod에서는 allow_origins를 꼭 제한하세요.
@@ -46,6 +83,83 @@ class Settings(BaseSettings):
     cors_allow_headers: str = "*"  # dev/local 기본값
     cors_allow_headers_prod: str = "Authorization,Content-Type"
 
+    # PubSub transport
+    # - redis: PUB/SUB (fire-and-forget)
+    # - redis_streams: XADD/XREAD (XREAD 사이에 들어온 entry를 놓치지 않는다)
+    #   재연결한 room stream은 놓친 delta를 log에서 이어받는다. stream key는 마지막 publish 후
+    #   pubsub_stream_ttl_seconds가 지나면 만료된다. (0이면 만료 없음)
+    # - memory: 프로세스 내 전달만 (단일 worker, Redis 없이). room event version도 쓰지 않는다.
+    # - hybrid: 같은 worker에는 프로세스 내로, 다른 worker에는 Redis PUB/SUB로
+    pubsub_transport: Literal["redis", "redis_streams", "memory", "hybrid"] = "redis"
+    pubsub_stream_maxlen: int = 10_000
+    pubsub_stream_ttl_seconds: int = 3600
+    pubsub_stream_block_ms: int = 5_000
+    pubsub_memory_max_pending: int = 1024
+
+    # PubSub topic namespace(room/case/user/conn) 라우팅 (redis, redis_streams, hybrid)
+    # - namespace_redis_urls: namespace별 Redis URL. 적힌 namespace는 전용 connection pool을 쓴다.
+    #   (같은 URL이어도 pool은 따로) 없는 namespace는 redis_url
+    #   예) PUBSUB_NAMESPACE_REDIS_URLS='{"case": "redis://case-redis:6379/0"}'
+    # - sharded_namespaces: SPUBLISH/SSUBSCRIBE로 보낼 namespace (Redis 7+, PUB/SUB transport만)
+    pubsub_namespace_redis_urls: dict[Literal["room", "case", "user", "conn"], str] = {}
+    pubsub_sharded_namespaces: list[Literal["room", "case", "user", "conn"]] = []
+
+    # 직렬화 codec
+    # - pubsub: bus가 transport로 보내는 payload (msgpack은 바이너리라 Redis 구간 전용)
+    # - sse: SSE/WS frame의 data (텍스트 JSON이어야 함)
+    # - orjson, msgpack은 선택 의존성. 설치되어 있지 않으면 시작 시 에러
+    pubsub_codec: Literal["json", "orjson", "msgpack"] = "json"
+    sse_codec: Literal["json", "orjson"] = "json"
+
+    # PubSub fat event
+    # - 0이면 비활성. 양수면 직렬화된 snapshot이 이 크기(bytes) 이하일 때 delta에 같이 싣는다.
+    pubsub_inline_snapshot_max_bytes: int = 0
+
+    # Event outbox relay
+    # - mutation과 같은 트랜잭션에 쓴 event를 background에서 batch(pipeline)로 publish한다.
+    # - poll: kick이 없어도 이 주기로 남은 row(이전 실패분 등)를 확인한다.
+    # - retention: 전달된 row를 이 시간(초)이 지나면 지운다.
+    outbox_relay_batch_size: int = 100
+    outbox_relay_poll_seconds: float = 1.0
+    outbox_retention_seconds: float = 3600.0
+
+    # Room presence (Redis TTL heartbeat)
+    # - room stream(SSE/WS)이 열려 있는 동안 ttl/3마다 (room, user) key를 갱신한다. 0이면 비활성
+    # - sweep: 이 주기로 TTL이 지난 user를 찾아 room에서 내보낸다. (MEMBER_LEFT)
+    presence_ttl_seconds: int = 30
+    presence_sweep_seconds: float = 10.0
+
+    # Case SSE frame cache
+    # - (case_id, snapshot_no) -> 인코딩된 frame. 프로세스 내 LRU + (선택) Redis 2차 캐시
+    case_frame_cache_max_entries: int = 2048
+    case_frame_cache_redis_enabled: bool = False
+    case_frame_cache_redis_ttl_seconds: int = 3600
+
+    # 요청 context 캐시 (user, active room, running case)
+    # - ttl: Redis TTL. 0이면 캐시를 끄고 매 요청 DB에서 읽는다.
+    # - local: 프로세스 내 캐시 TTL. 다른 worker의 무효화가 이만큼 늦게 보일 수 있다. 0이면 Redis만
+    request_context_cache_ttl_seconds: int = 60
+    request_context_local_ttl_seconds: float = 1.0
+    request_context_local_max_entries: int = 10_000
+
+    # Case SSE patch frame (encoding=patch)
+    # - snapshot_no가 이 값의 배수면 patch 대신 전체 snapshot(keyframe)을 보낸다.
+    case_patch_keyframe_interval: int = 20
+
+    # 실시간 stream 연결별 buffer
+    # - 연결 하나가 쌓아둘 수 있는 delta 수의 상한(= 연결당 메모리 상한)
+    # - coalesce: 최신 것만 남김, drop: 새 delta 버림, disconnect: STREAM_CLOSE 후 연결 종료
+    stream_buffer_max_events: int = 64
+    stream_buffer_overflow_policy: Literal["coalesce", "drop", "disconnect"] = "coalesce"
+
+    # SSE keepalive
+    # - heartbeat: frame이 없을 때 comment 주기, retry: 재연결 대기 힌트(+ 연결마다 jitter)
+    # - disconnect_poll: 끊긴 client를 event를 기다리지 않고 정리하는 확인 주기
+    sse_heartbeat_seconds: float = 15.0
+    sse_retry_ms: int = 3_000
+    sse_retry_jitter_ms: int = 2_000
+    sse_disconnect_poll_seconds: float = 1.0
+
     @model_validator(mode="after")
     def _fill_cors_defaults(self):
         if not self.cors_allow_origins:
@@ -70,6 +184,7 @@ class JwtConfig:
     algorithm: str  # "HS256" or "RS256"
     secret_key: str
     public_key: str | None = None  # RS256 검증용(선택)
+    stateless_access: bool = False  # access token에 username/jti를 넣는다
 
 
 def get_jwt_config(settings: SettingsDep) -> JwtConfig:
@@ -82,4 +197,5 @@ def get_jwt_config(settings: SettingsDep) -> JwtConfig:
         algorithm=settings.jwt_algorithm,
         secret_key=settings.jwt_secret,
         public_key=settings.jwt_public_key,
+        stateless_access=settings.jwt_stateless_access,
     )
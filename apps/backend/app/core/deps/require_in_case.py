@@ -7,19 +7,24 @@ from fastapi import Depends
 from app.core.deps.require_in_room import CurrentRoomId
 from app.core.error_codes import ConflictErrorCode
 from app.core.exceptions import raise_conflict
-from app.core.security.auth import CurrentUser
+from app.core.security.auth import CurrentRequestContext
 from app.models.case import Case
-from app.repositories.deps import CaseRepoDep
+from app.repositories.case import CaseRepo
+from app.schemas.common.ids import CaseId, RoomId
 
 
-async def get_current_case(
-    user: CurrentUser, room_id: CurrentRoomId, case_repo: CaseRepoDep
-) -> Case:
+async def find_running_case(room_id: RoomId, case_repo: CaseRepo) -> Case:
     case_ = await case_repo.get_running_by_room_id(room_id=room_id)
     if case_ is None:
         raise_conflict(code=ConflictErrorCode.CONFLICT_NOT_ON_CASE)
     return case_
 
 
-RequireInCase = Depends(get_current_case)
-CurrentCase = Annotated[Case, Depends(get_current_case)]
+async def get_current_case_id(ctx: CurrentRequestContext, room_id: CurrentRoomId) -> CaseId:
+    if ctx.case_id is None:
+        raise_conflict(code=ConflictErrorCode.CONFLICT_NOT_ON_CASE)
+    return ctx.case_id
+
+
+RequireInCase = Depends(get_current_case_id)
+CurrentCaseId = Annotated[CaseId, Depends(get_current_case_id)]
@@ -7,13 +7,14 @@ from fastapi import Depends
 # test
 from app.core.error_codes import PermissionErrorCode
 from app.core.exceptions import raise_forbidden
-from app.core.security.auth import CurrentUser
+from app.core.security.auth import CurrentRequestContext
+from app.domain.types import AuthUser
 from app.mvp import MVP_ROOM_ID
-from app.repositories.deps import RoomMemberRepoDep
+from app.repositories.room_member import RoomMemberRepo
 from app.schemas.common.ids import RoomId
 
 
-async def get_current_room_id(user: CurrentUser, room_member_repo: RoomMemberRepoDep) -> RoomId:
+async def find_current_room_id(user: AuthUser, room_member_repo: RoomMemberRepo) -> RoomId:
     room_member = await room_member_repo.get_active_by_user_id(user_id=user.id)
     if room_member is None:
         raise_forbidden(code=PermissionErrorCode.PERMISSION_DENIED_NOT_IN_ROOM)
@@ -23,5 +24,12 @@ async def get_current_room_id(user: CurrentUser, room_member_repo: RoomMemberRep
     return room_id
 
 
+async def get_current_room_id(ctx: CurrentRequestContext) -> RoomId:
+    if ctx.room_id is None:
+        raise_forbidden(code=PermissionErrorCode.PERMISSION_DENIED_NOT_IN_ROOM)
+    # MVP
+    return MVP_ROOM_ID
+
+
 RequireInRoom = Depends(get_current_room_id)
 CurrentRoomId = Annotated[RoomId, Depends(get_current_room_id)]
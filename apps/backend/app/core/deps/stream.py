@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.deps.require_in_case import find_running_case
+from app.core.deps.require_in_room import find_current_room_id
+from app.core.security.auth import AccessIdentityDep, load_auth_user
+from app.domain.types import AuthUser
+from app.infra.db.session import RealtimeReadSessionsDep, RealtimeSessionFactoryDep
+from app.models.case import Case
+from app.repositories.case import CaseRepo
+from app.repositories.room_member import RoomMemberRepo
+from app.schemas.common.ids import RoomId
+
+# 실시간 stream(SSE/WS) 전용 인증/권한 dependency.
+# CurrentUser/CurrentRoomId/CurrentCaseId와 같은 검사를 하지만, 요청 session(get_db) 대신
+# 짧은 session을 열어 검사 직후 닫는다. get_db는 응답이 끝날 때까지 session을 잡고 있으므로
+# stream에서 쓰면 연결이 열려 있는 내내 DB connection 하나를 점유한다.
+# user/room 멤버십 확인은 (pin 중이 아니면) read replica에서 읽는다.
+
+
+async def get_stream_user(
+    identity: AccessIdentityDep, read_sessions: RealtimeReadSessionsDep
+) -> AuthUser:
+    # stateless token이면 claims의 user를 그대로 쓴다.
+    if identity.user is not None:
+        return identity.user
+    async with read_sessions.session(user_id=identity.user_id) as db:
+        return await load_auth_user(db, identity.user_id)
+
+
+StreamUser = Annotated[AuthUser, Depends(get_stream_user)]
+
+
+async def get_stream_room_id(user: StreamUser, read_sessions: RealtimeReadSessionsDep) -> RoomId:
+    async with read_sessions.session(user_id=user.id) as db:
+        return await find_current_room_id(user, RoomMemberRepo(db))
+
+
+StreamRoomId = Annotated[RoomId, Depends(get_stream_room_id)]
+
+
+# case는 다른 user(host)의 요청으로 시작되므로, 시작 직후 연결해도 보이도록 primary에서 확인한다.
+async def get_stream_case(
+    user: StreamUser, room_id: StreamRoomId, session_factory: RealtimeSessionFactoryDep
+) -> Case:
+    async with session_factory() as db:
+        return await find_running_case(room_id, CaseRepo(db))
+
+
+StreamCase = Annotated[Case, Depends(get_stream_case)]
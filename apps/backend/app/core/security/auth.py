@@ -1,24 +1,34 @@
 from __future__ import annotations
 
-from typing import Annotated
+from dataclasses import dataclass
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import Depends, Request, status
+from fastapi import Depends, status
+from fastapi.requests import HTTPConnection
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.error_codes import AuthCommonErrorCode, AuthUserErrorCode
+from app.core.error_codes import AuthCommonErrorCode, AuthTokenErrorCode, AuthUserErrorCode
 from app.core.exceptions import EnvelopeHTTPException
-from app.core.security.jwt import ACCESS_TOKEN, JwtHandlerDep
+from app.core.security.jwt import ACCESS_TOKEN, JwtHandler, JwtHandlerDep
 from app.domain.types import AuthUser
+from app.infra.db.read_routing import pin_user_after_commit
 from app.infra.db.session import DbSessionDep
+from app.infra.redis.request_context import (
+    RequestContext,
+    RequestContextCache,
+    RequestContextCacheDep,
+)
+from app.infra.redis.token_deny_list import TokenDenyListDep
 from app.models.auth import User
+from app.repositories.case import CaseRepo
+from app.repositories.room_member import RoomMemberRepo
 
 
-async def get_current_user(
-    request: Request,
-    jwt_handler: JwtHandlerDep,
-    db: DbSessionDep,
-) -> AuthUser:
+async def authenticate_claims(request: HTTPConnection, jwt_handler: JwtHandler) -> dict[str, Any]:
+    """access token cookie를 검증하고 claims를 꺼낸다. (DB는 보지 않는다)"""
+    # HTTPConnection: HTTP 요청과 WebSocket 연결 모두 cookie로 인증한다.
     token = request.cookies.get(ACCESS_TOKEN)
     if not token:
         raise EnvelopeHTTPException(
@@ -26,12 +36,14 @@ async def get_current_user(
             code=AuthCommonErrorCode.AUTH_UNAUTHORIZED,
         )
 
-    claims = jwt_handler.decode_and_verify(token)
+    return await jwt_handler.decode_and_verify_async(token)
+
 
+def _user_id_from_claims(claims: dict[str, Any]) -> UUID:
     user_id = claims["sub"]
 
     try:
-        user_id = UUID(user_id)
+        return UUID(user_id)
     except ValueError:
         # Invalid UUID in token/session payload -> treat as unauthorized.
         raise EnvelopeHTTPException(
@@ -39,6 +51,43 @@ async def get_current_user(
             code=AuthCommonErrorCode.AUTH_UNAUTHORIZED,
         )
 
+
+@dataclass(frozen=True)
+class AccessIdentity:
+    """검증된 access token이 말하는 user.
+
+    user: stateless token(username/jti 포함)이면 claims로 만든 user, 아니면 None (users 조회 필요)
+    """
+
+    user_id: UUID
+    user: AuthUser | None
+
+
+async def get_access_identity(
+    request: HTTPConnection, jwt_handler: JwtHandlerDep, deny_list: TokenDenyListDep
+) -> AccessIdentity:
+    claims = await authenticate_claims(request, jwt_handler)
+    user_id = _user_id_from_claims(claims)
+
+    username = claims.get("username")
+    jti = claims.get("jti")
+    # deny-list가 없으면(stateless 모드가 아니면) claims의 username을 믿지 않는다.
+    if deny_list is None or not isinstance(username, str) or not isinstance(jti, str):
+        return AccessIdentity(user_id=user_id, user=None)
+
+    if await deny_list.is_denied(jti):
+        raise EnvelopeHTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            code=AuthTokenErrorCode.AUTH_TOKEN_INVALID,
+            message="revoked token",
+        )
+    return AccessIdentity(user_id=user_id, user=AuthUser(id=user_id, username=username))
+
+
+AccessIdentityDep = Annotated[AccessIdentity, Depends(get_access_identity)]
+
+
+async def load_auth_user(db: AsyncSession, user_id: UUID) -> AuthUser:
     query = select(User).where(User.id == user_id)
     result = await db.execute(query)
     user = result.scalar_one_or_none()
@@ -52,5 +101,75 @@ async def get_current_user(
     return AuthUser(id=user.id, username=user.username)
 
 
+async def load_request_context(
+    db: AsyncSession, user_id: UUID, *, user: AuthUser | None = None
+) -> RequestContext:
+    """user를 넘기면(stateless token) users는 조회하지 않는다."""
+    if user is None:
+        user = await load_auth_user(db, user_id)
+    room_member = await RoomMemberRepo(db).get_active_by_user_id(user_id=user_id)
+    if room_member is None:
+        return RequestContext(user=user, room_id=None, case_id=None)
+    case = await CaseRepo(db).get_running_by_room_id(room_id=room_member.room_id)
+    return RequestContext(
+        user=user, room_id=room_member.room_id, case_id=case.id if case is not None else None
+    )
+
+
+class RequestContextResolver:
+    """요청 하나의 RequestContext를 처음 필요할 때 한 번만 구한다.
+
+    CurrentUser는 stateless token이면 context 없이 claims만으로 끝나므로,
+    context 조회를 dependency 자체가 아니라 이 resolver 뒤로 미룬다.
+    """
+
+    def __init__(
+        self, identity: AccessIdentity, db: AsyncSession, context_cache: RequestContextCache
+    ) -> None:
+        self._identity = identity
+        self._db = db
+        self._context_cache = context_cache
+        self._ctx: RequestContext | None = None
+
+    async def resolve(self) -> RequestContext:
+        if self._ctx is None:
+            identity, db = self._identity, self._db
+            # 캐시에 넣을 값은 replica가 아니라 primary에서 읽는다.
+            # (replica의 지연이 캐시 TTL만큼 늘어나지 않도록)
+            self._ctx = await self._context_cache.get_or_load(
+                identity.user_id,
+                lambda: load_request_context(db, identity.user_id, user=identity.user),
+            )
+        return self._ctx
+
+
+def get_request_context_resolver(
+    identity: AccessIdentityDep, db: DbSessionDep, context_cache: RequestContextCacheDep
+) -> RequestContextResolver:
+    # 이 요청이 쓰기를 commit하면 이후 잠시 이 user의 조회는 primary로 간다. (read-your-writes)
+    # pin은 요청 session의 commit() 안에서 한다. (ReadPinningSession)
+    pin_user_after_commit(db, identity.user_id)
+    return RequestContextResolver(identity, db, context_cache)
+
+
+RequestContextResolverDep = Annotated[RequestContextResolver, Depends(get_request_context_resolver)]
+
+
+async def get_request_context(resolver: RequestContextResolverDep) -> RequestContext:
+    """인증된 요청의 (user, active room, running case). 캐시에 있으면 DB를 보지 않는다."""
+    return await resolver.resolve()
+
+
+CurrentRequestContext = Annotated[RequestContext, Depends(get_request_context)]
+
+
+async def get_current_user(
+    identity: AccessIdentityDep, resolver: RequestContextResolverDep
+) -> AuthUser:
+    if identity.user is not None:
+        return identity.user
+    return (await resolver.resolve()).user
+
+
 RequireAuthentication = Depends(get_current_user)
 CurrentUser = Annotated[AuthUser, Depends(get_current_user)]
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Annotated, Any, Literal
 
 import jwt  # PyJWT
 from fastapi import Depends, status
 
-from app.core.config import JwtConfig, get_jwt_config
+from app.core.config import JwtConfig, SettingsDep, get_jwt_config
 from app.core.error_codes import AuthTokenErrorCode
 from app.core.exceptions import EnvelopeHTTPException
 
@@ -17,9 +22,50 @@ REFRESH_TOKEN: Literal["refresh_token"] = "refresh_token"
 _token_type_mapping = {"access_token": "access", "refresh_token": "refresh"}
 
 
+@dataclass(frozen=True)
+class JwtVerifyStats:
+    hits: int
+    misses: int
+    size: int
+    verified: int
+    failed: int
+    verify_seconds_total: float
+    verify_seconds_max: float
+
+
 class JwtHandler:
-    def __init__(self, cfg: JwtConfig):
+    """JWT 발급/검증.
+
+    - 검증에 성공한 claims를 token digest(sha256) -> claims로 exp까지 캐시한다. (LRU)
+      같은 token이 요청/SSE 재연결마다 오므로 서명 검증은 token당 한 번이면 된다.
+    - 비대칭(RS*/ES*) 서명 검증은 CPU를 쓰므로 decode_and_verify_async가 thread에서 돌린다.
+      HS*는 thread로 넘기는 비용이 검증보다 커서 그대로 검증한다.
+    """
+
+    def __init__(self, cfg: JwtConfig, *, claims_cache_max_entries: int = 10_000):
         self.cfg = cfg
+        self._claims_cache_max_entries = claims_cache_max_entries
+        self._claims: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        self._verify_in_thread = not cfg.algorithm.startswith("HS")
+
+        self._hits = 0
+        self._misses = 0
+        self._verified = 0
+        self._failed = 0
+        self._verify_seconds_total = 0.0
+        self._verify_seconds_max = 0.0
+
+    @property
+    def stats(self) -> JwtVerifyStats:
+        return JwtVerifyStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._claims),
+            verified=self._verified,
+            failed=self._failed,
+            verify_seconds_total=self._verify_seconds_total,
+            verify_seconds_max=self._verify_seconds_max,
+        )
 
     @staticmethod
     def _now() -> int:
@@ -28,7 +74,13 @@ class JwtHandler:
     def _encode(self, claims: dict[str, Any]) -> str:
         return jwt.encode(claims, self.cfg.secret_key, algorithm=self.cfg.algorithm)
 
-    def create_access_token(self, *, sub: str, extra: dict[str, Any] | None = None) -> str:
+    def create_access_token(
+        self, *, sub: str, extra: dict[str, Any] | None = None, username: str | None = None
+    ) -> str:
+        """access token 발급.
+
+        cfg.stateless_access면 username과 jti(폐기용)를 같이 넣는다. (인증 시 users 조회 생략)
+        """
         if extra is not None and set(extra) & {"iss", "aud", "sub", "iat", "exp", "typ"}:
             raise KeyError("parameter `extra` has non-extra fields")
 
@@ -41,6 +93,9 @@ class JwtHandler:
             "exp": now + int(self.cfg.access_ttl.total_seconds()),
             "typ": "access",
         }
+        if self.cfg.stateless_access and username is not None:
+            payload["username"] = username
+            payload["jti"] = uuid.uuid4().hex
         if extra:
             payload.update(extra)
         return self._encode(payload)
@@ -59,16 +114,19 @@ class JwtHandler:
         }
         return self._encode(payload), refresh_jti
 
-    def decode_and_verify(
-        self, token: str, token_type: Literal["access_token", "refresh_token"] = ACCESS_TOKEN
-    ) -> dict[str, Any]:
+    def _verify(self, token: str) -> tuple[dict[str, Any] | jwt.InvalidTokenError, float]:
+        """서명/claim 검증 -> (payload 또는 PyJWT 에러, 걸린 시간)
+
+        thread에서도 부르므로 handler 상태를 바꾸지 않는다.
+        """
         key = (
             self.cfg.public_key
             if (self.cfg.algorithm.startswith("RS") and self.cfg.public_key)
             else self.cfg.secret_key
         )
+        started = time.perf_counter()
         try:
-            payload = jwt.decode(
+            result: dict[str, Any] | jwt.InvalidTokenError = jwt.decode(
                 token,
                 key,
                 algorithms=[self.cfg.algorithm],
@@ -76,22 +134,62 @@ class JwtHandler:
                 issuer=self.cfg.issuer,
                 options={"require": ["exp", "iat", "sub", "typ"]},
             )
-        except jwt.ExpiredSignatureError as e:
+        except jwt.InvalidTokenError as e:
+            result = e
+        return result, time.perf_counter() - started
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _get_cached(self, digest: bytes) -> dict[str, Any] | None:
+        payload = self._claims.get(digest)
+        if payload is not None and payload["exp"] <= time.time():
+            # 만료된 token은 다시 검증해서 AUTH_TOKEN_EXPIRED로 거절한다.
+            del self._claims[digest]
+            payload = None
+        if payload is None:
+            self._misses += 1
+            return None
+        self._claims.move_to_end(digest)
+        self._hits += 1
+        return payload
+
+    def _record(
+        self, digest: bytes, result: dict[str, Any] | jwt.InvalidTokenError, elapsed: float
+    ) -> dict[str, Any]:
+        self._verify_seconds_total += elapsed
+        self._verify_seconds_max = max(self._verify_seconds_max, elapsed)
+        if isinstance(result, jwt.ExpiredSignatureError):
+            self._failed += 1
             raise EnvelopeHTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 code=AuthTokenErrorCode.AUTH_TOKEN_EXPIRED,
-            ) from e
-        except jwt.MissingRequiredClaimError:
+            ) from result
+        if isinstance(result, jwt.MissingRequiredClaimError):
+            self._failed += 1
             raise EnvelopeHTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 code=AuthTokenErrorCode.AUTH_TOKEN_PAYLOAD_INVALID,
             )
-        except jwt.InvalidTokenError as e:
+        if isinstance(result, jwt.InvalidTokenError):
+            self._failed += 1
             raise EnvelopeHTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 code=AuthTokenErrorCode.AUTH_TOKEN_INVALID,
-            ) from e
+            ) from result
 
+        self._verified += 1
+        if self._claims_cache_max_entries > 0:
+            self._claims[digest] = result
+            while len(self._claims) > self._claims_cache_max_entries:
+                self._claims.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _check_type(
+        payload: dict[str, Any], token_type: Literal["access_token", "refresh_token"]
+    ) -> dict[str, Any]:
         token_typ = _token_type_mapping[token_type]
         if payload["typ"] != token_typ:
             raise EnvelopeHTTPException(
@@ -101,6 +199,28 @@ class JwtHandler:
             )
         return payload
 
+    def decode_and_verify(
+        self, token: str, token_type: Literal["access_token", "refresh_token"] = ACCESS_TOKEN
+    ) -> dict[str, Any]:
+        digest = self._digest(token)
+        payload = self._get_cached(digest)
+        if payload is None:
+            payload = self._record(digest, *self._verify(token))
+        return self._check_type(payload, token_type)
+
+    async def decode_and_verify_async(
+        self, token: str, token_type: Literal["access_token", "refresh_token"] = ACCESS_TOKEN
+    ) -> dict[str, Any]:
+        """decode_and_verify와 같지만, 캐시 miss인 비대칭 서명 검증은 thread에서 돌린다."""
+        if not self._verify_in_thread:
+            return self.decode_and_verify(token, token_type)
+        digest = self._digest(token)
+        payload = self._get_cached(digest)
+        if payload is None:
+            # 캐시/통계는 event loop에서만 건드린다.
+            payload = self._record(digest, *await asyncio.to_thread(self._verify, token))
+        return self._check_type(payload, token_type)
+
     def extract_user_id_from_token(
         self, token: str, token_type: Literal["access_token", "refresh_token"] = ACCESS_TOKEN
     ) -> str:
@@ -126,8 +246,14 @@ class JwtHandler:
 JwtConfigDep = Annotated[JwtConfig, Depends(get_jwt_config)]
 
 
-def get_jwt_handler(cfg: JwtConfigDep) -> JwtHandler:
-    return JwtHandler(cfg)
+@lru_cache(maxsize=8)
+def _jwt_handler_for(cfg: JwtConfig, claims_cache_max_entries: int) -> JwtHandler:
+    return JwtHandler(cfg, claims_cache_max_entries=claims_cache_max_entries)
+
+
+def get_jwt_handler(cfg: JwtConfigDep, settings: SettingsDep) -> JwtHandler:
+    # 설정이 같으면 프로세스에서 같은 handler(= 같은 claims 캐시)를 쓴다.
+    return _jwt_handler_for(cfg, settings.jwt_claims_cache_max_entries)
 
 
 JwtHandlerDep = Annotated[JwtHandler, Depends(get_jwt_handler)]
@@ -23,3 +23,5 @@ class CaseEventDelta(BaseModel):
     phase_id: PhaseId  # 부가
     ts: Annotated[datetime, Field(default_factory=lambda: datetime.now(timezone.utc))]
     snapshot_no: int  # 실제 snapshot 가져오는 id
+    # fat event 모드에서만 채워짐: snapshot_no에 해당하는 직렬화된 CaseSnapshot(JSON)
+    snapshot_json: str | None = None
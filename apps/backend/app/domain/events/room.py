@@ -24,3 +24,5 @@ class RoomEventDelta(BaseModel):
     user_id: UserId | None = None
     ts: Annotated[datetime, Field(default_factory=lambda: datetime.now(timezone.utc))]
     version: int | None = None
+    # fat event 모드에서만 채워짐: 직렬화된 RoomSnapshot(JSON). 없으면 subscriber가 DB에서 조회한다.
+    snapshot_json: str | None = None
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from app.schemas.common.ids import ConnId, RoomId, UserId
+
+
+class UserEventType(str, Enum):
+    ROOM_KICKED = "user.room.kicked"
+    STREAM_CLOSE = "user.stream_close"
+    NOTIFICATION = "user.notification"
+
+
+class UserEvent(BaseModel):
+    """한 user(의 연결들)에게만 보내는 event. (room 전체에 broadcast하지 않는다)"""
+
+    type: UserEventType
+    user_id: UserId
+    # 관련 room. room stream은 자기 room의 event만 처리한다. (None이면 모든 room stream)
+    room_id: RoomId | None = None
+    # 특정 연결에만 보낼 때 채워짐 (ConnTopic으로 publish). None이면 user의 모든 연결
+    conn_id: ConnId | None = None
+    message: str | None = None
+    ts: Annotated[datetime, Field(default_factory=lambda: datetime.now(timezone.utc))]
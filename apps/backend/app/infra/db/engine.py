@@ -1,15 +1,40 @@
 from functools import lru_cache
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import get_settings
+from app.infra.db.pool_metrics import InstrumentedQueuePool, instrument_engine
+from app.infra.db.read_routing import ReadPinningSession, WriteTrackingSession
+
+
+def _create_engine(
+    name: str, *, pool_size: int, max_overflow: int, url: str | None = None
+) -> AsyncEngine:
+    settings = get_settings()
+    engine = create_async_engine(
+        url or settings.database_url,
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+    return instrument_engine(name, engine, max_overflow=max_overflow)
 
 
 @lru_cache
 def get_engine():
-    return create_async_engine(
-        get_settings().database_url,
-        pool_pre_ping=True,
+    settings = get_settings()
+    return _create_engine(
+        "db",
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
     )
 
 
@@ -17,5 +42,51 @@ def get_engine():
 def get_sessionmaker():
     return async_sessionmaker(
         bind=get_engine(),
+        class_=ReadPinningSession,
+        expire_on_commit=False,
+        sync_session_class=WriteTrackingSession,
+    )
+
+
+@lru_cache
+def get_realtime_engine():
+    """실시간 stream 조회 전용 engine. (REST와 pool을 나눈다)"""
+    settings = get_settings()
+    return _create_engine(
+        "realtime_db",
+        pool_size=settings.realtime_db_pool_size,
+        max_overflow=settings.realtime_db_max_overflow,
+    )
+
+
+@lru_cache
+def get_realtime_sessionmaker():
+    return async_sessionmaker(
+        bind=get_realtime_engine(),
+        expire_on_commit=False,
+    )
+
+
+@lru_cache
+def get_read_engine() -> AsyncEngine | None:
+    """read replica engine. settings.database_read_url이 없으면 None"""
+    settings = get_settings()
+    if settings.database_read_url is None:
+        return None
+    return _create_engine(
+        "read_db",
+        url=settings.database_read_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+
+
+@lru_cache
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession] | None:
+    engine = get_read_engine()
+    if engine is None:
+        return None
+    return async_sessionmaker(
+        bind=engine,
         expire_on_commit=False,
     )
@@ -0,0 +1,172 @@
+"""DB connection pool 계측.
+
+engine마다 PoolMetrics를 하나 붙여 누적 값(checkout 대기 시간 histogram, invalidate,
+pre-ping 실패)을 모으고, checked-out/idle/overflow는 읽는 시점의 pool 상태를 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# checkout 대기 시간 histogram 상한(초). 마지막 bucket은 +Inf
+WAIT_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(frozen=True)
+class WaitHistogram:
+    buckets: list[tuple[float, int]]  # (상한, 누적 개수). +Inf bucket은 count
+    count: int
+    sum_seconds: float
+    max_seconds: float
+
+
+@dataclass(frozen=True)
+class DbPoolStats:
+    name: str
+    size: int | None  # QueuePool이 아니면 None (아래 pool 상태 값도 0)
+    max_overflow: int | None
+    checked_out: int
+    idle: int
+    overflow: int  # size를 넘어 추가로 연 connection 수 (음수면 아직 size만큼 열지 않음)
+    checkout_wait: WaitHistogram
+    checkout_timeouts: int  # pool_timeout 안에 connection을 못 받은 횟수
+    invalidated: int
+    pre_ping_failures: int
+
+
+class PoolMetrics:
+    def __init__(self, name: str, *, max_overflow: int | None = None) -> None:
+        """max_overflow: engine을 만들 때 설정한 값 (pool은 공개 accessor가 없으므로 받아둔다)"""
+        self.name = name
+        self._max_overflow = max_overflow
+        self._engine: AsyncEngine | None = None
+        self._wait_counts = [0] * (len(WAIT_BUCKETS_SECONDS) + 1)
+        self._wait_sum = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+        self._invalidated = 0
+        self._pre_ping_failures = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """engine에 event listener를 걸고, InstrumentedQueuePool이면 대기 시간도 받는다."""
+        self._engine = engine
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "handle_error", self._on_handle_error)
+        event.listen(sync_engine, "invalidate", self._on_invalidate)
+        pool = sync_engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self
+
+    def observe_checkout(self, seconds: float, *, timed_out: bool = False) -> None:
+        self._wait_counts[bisect.bisect_left(WAIT_BUCKETS_SECONDS, seconds)] += 1
+        self._wait_sum += seconds
+        self._wait_max = max(self._wait_max, seconds)
+        if timed_out:
+            self._timeouts += 1
+
+    def stats(self) -> DbPoolStats:
+        pool = self._engine.sync_engine.pool if self._engine is not None else None
+
+        cumulative = 0
+        buckets: list[tuple[float, int]] = []
+        for upper, n in zip(WAIT_BUCKETS_SECONDS, self._wait_counts):
+            cumulative += n
+            buckets.append((upper, cumulative))
+
+        size: int | None = None
+        max_overflow: int | None = None
+        checked_out = idle = overflow = 0
+        if isinstance(pool, QueuePool):
+            size, max_overflow = pool.size(), self._max_overflow
+            checked_out, idle, overflow = pool.checkedout(), pool.checkedin(), pool.overflow()
+
+        return DbPoolStats(
+            name=self.name,
+            size=size,
+            max_overflow=max_overflow,
+            checked_out=checked_out,
+            idle=idle,
+            overflow=overflow,
+            checkout_wait=WaitHistogram(
+                buckets=buckets,
+                count=sum(self._wait_counts),
+                sum_seconds=self._wait_sum,
+                max_seconds=self._wait_max,
+            ),
+            checkout_timeouts=self._timeouts,
+            invalidated=self._invalidated,
+            pre_ping_failures=self._pre_ping_failures,
+        )
+
+    def _on_handle_error(self, context: ExceptionContext) -> None:
+        if context.is_pre_ping:
+            self._pre_ping_failures += 1
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        self._invalidated += 1
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """checkout(대기 + pre-ping + 필요 시 새 연결)에 걸린 시간을 metrics에 남기는 pool.
+
+    engine.dispose()로 pool이 새로 만들어져도 metrics는 이어진다.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            self._observe(started, timed_out=True)
+            raise
+        self._observe(started)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _observe(self, started: float, *, timed_out: bool = False) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_checkout(time.perf_counter() - started, timed_out=timed_out)
+
+
+_pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(
+    name: str, engine: AsyncEngine, *, max_overflow: int | None = None
+) -> AsyncEngine:
+    metrics = PoolMetrics(name, max_overflow=max_overflow)
+    metrics.attach(engine)
+    _pool_metrics[name] = metrics
+    return engine
+
+
+def db_pool_stats() -> list[DbPoolStats]:
+    return [metrics.stats() for metrics in list(_pool_metrics.values())]
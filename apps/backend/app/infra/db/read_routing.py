@@ -0,0 +1,124 @@
+"""읽기 전용 조회를 read replica로 보내는 routing.
+
+- 조회 쪽이 메서드 단위로 ReadSessions.session(...)을 골라 쓴다. (기본은 primary)
+- replica가 설정되어 있지 않거나, 조회 대상 user/room이 pin 중이면 primary에서 읽는다.
+- pin은 쓰기 쪽이 남긴다.
+  - 요청: get_current_user가 요청 session에 user를 표시해두고, 서비스의 commit()이
+    끝나는 자리에서(ReadPinningSession) 그 session이 실제로 무언가를 썼을 때만 pin한다.
+    get_db의 teardown은 응답을 보낸 뒤에 돌기 때문에, 거기서 pin하면 client의 바로 다음
+    요청이 pin보다 먼저 replica에 도착할 수 있다.
+  - room: outbox relay가 room event를 publish하기 전에 pin한다.
+    (delta를 받은 구독자의 snapshot 조회가 replica의 이전 상태를 보지 않도록)
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from app.infra.redis.read_pins import ReadPins
+from app.schemas.common.ids import RoomId, UserId
+
+_WROTE = "read_routing.wrote"
+_PIN_USER_IDS = "read_routing.pin_user_ids"
+_READ_PINS = "read_routing.read_pins"
+
+
+class WriteTrackingSession(Session):
+    """flush나 DML 실행이 있었는지 session.info에 남기는 Session. (get_db의 pin 판단용)"""
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _on_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _on_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_WROTE] = True
+
+
+def pin_user_after_commit(session: AsyncSession, user_id: UserId) -> None:
+    """이 session이 쓰기를 commit하면 user를 pin하도록 표시한다."""
+    session.info.setdefault(_PIN_USER_IDS, set()).add(user_id)
+
+
+async def pin_committed_writes(session: AsyncSession, pins: ReadPins) -> None:
+    """commit 직후 호출한다. 쓴 것이 있으면 표시된 user들을 pin한다."""
+    user_ids = session.info.get(_PIN_USER_IDS)
+    if session.info.pop(_WROTE, False) and user_ids:
+        await pins.pin(user_ids=user_ids)
+
+
+def pin_on_commit(session: AsyncSession, pins: ReadPins) -> None:
+    """이 session의 commit()이 끝날 때 pin_committed_writes를 부르도록 한다."""
+    session.info[_READ_PINS] = pins
+
+
+class ReadPinningSession(AsyncSession):
+    """commit() 직후, 반환하기 전에 pin까지 끝내는 AsyncSession. (pin_on_commit으로 켠다)"""
+
+    async def commit(self) -> None:
+        await super().commit()
+        pins: ReadPins | None = self.info.get(_READ_PINS)
+        if pins is not None:
+            await pin_committed_writes(self, pins)
+
+
+class ReadSessions:
+    """읽기 전용 조회가 쓸 session을 고른다. (replica 또는 primary)"""
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        pins: ReadPins | None = None,
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._pins = pins
+
+    @property
+    def has_replica(self) -> bool:
+        return self._replica is not None
+
+    @property
+    def primary(self) -> async_sessionmaker[AsyncSession]:
+        """replica가 늦었을 때 다시 읽을 primary."""
+        return self._primary
+
+    async def _use_replica(self, user_id: UserId | None, room_id: RoomId | None) -> bool:
+        if self._replica is None:
+            return False
+        if self._pins is None:
+            return True
+        return not await self._pins.is_pinned(user_id=user_id, room_id=room_id)
+
+    @asynccontextmanager
+    async def session(
+        self,
+        *,
+        user_id: UserId | None = None,
+        room_id: RoomId | None = None,
+        primary: AsyncSession | None = None,
+    ) -> AsyncIterator[AsyncSession]:
+        """user_id/room_id가 pin 중이 아니면 replica session을 빌려준다.
+
+        primary: primary에서 읽을 때 쓸 이미 열린 session. (요청 session을 넘기면
+        replica가 없을 때 connection을 하나 더 빌리지 않는다)
+        """
+        if await self._use_replica(user_id, room_id):
+            assert self._replica is not None
+            async with self._replica() as session:
+                yield session
+        elif primary is not None:
+            yield primary
+        else:
+            async with self._primary() as session:
+                yield session
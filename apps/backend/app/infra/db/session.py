@@ -4,13 +4,18 @@ from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.infra.db.engine import get_sessionmaker
+from app.infra.db.engine import get_read_sessionmaker, get_realtime_sessionmaker, get_sessionmaker
+from app.infra.db.read_routing import ReadSessions, pin_on_commit
+from app.infra.redis.read_pins import ReadPinsDep
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(read_pins: ReadPinsDep) -> AsyncGenerator[AsyncSession, None]:
     async with get_sessionmaker()() as session:
+        # pin은 서비스의 commit() 안에서 한다. (이 teardown은 응답을 보낸 뒤에 돈다)
+        if read_pins is not None:
+            pin_on_commit(session, read_pins)
         try:
             yield session
             await session.commit()
@@ -20,3 +25,39 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 DbSessionDep = Annotated[AsyncSession, Depends(get_db)]
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """요청 하나 안에서 session을 여러 개 열어야 할 때 쓴다. (예: WebSocket의 stream별 session)"""
+    return get_sessionmaker()
+
+
+SessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
+
+
+def get_realtime_session_factory() -> async_sessionmaker[AsyncSession]:
+    """실시간 stream용 session factory. (조회마다 짧게 열고 닫는다, 별도 pool)"""
+    return get_realtime_sessionmaker()
+
+
+RealtimeSessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession], Depends(get_realtime_session_factory)
+]
+
+
+def get_read_sessions(session_factory: SessionFactoryDep, read_pins: ReadPinsDep) -> ReadSessions:
+    """REST 읽기 전용 조회용. (replica가 없으면 primary)"""
+    return ReadSessions(session_factory, get_read_sessionmaker(), pins=read_pins)
+
+
+ReadSessionsDep = Annotated[ReadSessions, Depends(get_read_sessions)]
+
+
+def get_realtime_read_sessions(
+    session_factory: RealtimeSessionFactoryDep, read_pins: ReadPinsDep
+) -> ReadSessions:
+    """실시간 stream 읽기 전용 조회용. (primary는 realtime pool)"""
+    return ReadSessions(session_factory, get_read_sessionmaker(), pins=read_pins)
+
+
+RealtimeReadSessionsDep = Annotated[ReadSessions, Depends(get_realtime_read_sessions)]
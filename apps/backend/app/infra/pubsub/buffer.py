@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from weakref import WeakSet
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """연결별 buffer가 가득 찼을 때의 정책.
+
+    - COALESCE: 쌓인 것을 버리고 가장 최신 item만 남긴다. (frame이 전체 snapshot일 때 유효)
+    - DROP: 새로 들어온 item을 버린다.
+    - DISCONNECT: 더 받지 않고, 소비자에게 BufferOverflowError를 던져 연결을 끊게 한다.
+    """
+
+    COALESCE = "coalesce"
+    DROP = "drop"
+    DISCONNECT = "disconnect"
+
+
+class BufferOverflowError(Exception):
+    """DISCONNECT 정책에서 buffer가 넘쳤을 때 소비자 쪽에서 발생한다."""
+
+
+@dataclass(frozen=True)
+class BufferStats:
+    label: str
+    depth: int
+    max_depth: int  # 지금까지 가장 깊었던 순간
+    evicted: int  # 정책에 의해 버려진 item 수
+    overflowed: bool
+
+
+@dataclass(frozen=True)
+class _Closed:
+    error: BaseException | None = None
+
+
+# 살아있는 buffer들. 연결별 depth/eviction을 들여다보기 위함.
+_active_buffers: WeakSet[ListenerBuffer] = WeakSet()
+
+
+def active_buffer_stats() -> list[BufferStats]:
+    return [buffer.stats for buffer in list(_active_buffers)]
+
+
+class ListenerBuffer[T]:
+    """연결 하나에 대한 bounded buffer.
+
+    - put_nowait는 절대 block하지 않는다. (fanout pump가 느린 소비자 때문에 멈추지 않도록)
+    - maxsize를 넘는 순간 policy를 적용하므로, 연결당 메모리는 maxsize개로 상한이 있다.
+    """
+
+    def __init__(self, *, maxsize: int, policy: OverflowPolicy, label: str = "") -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._label = label
+        self._items: deque[T] = deque()
+        self._wakeup = asyncio.Event()
+        self._closed: _Closed | None = None
+        self._overflowed = False
+        self._coalesced = False
+        self._max_depth = 0
+        self._evicted = 0
+        _active_buffers.add(self)
+
+    @property
+    def stats(self) -> BufferStats:
+        return BufferStats(
+            label=self._label,
+            depth=len(self._items),
+            max_depth=self._max_depth,
+            evicted=self._evicted,
+            overflowed=self._overflowed,
+        )
+
+    def pop_coalesced(self) -> bool:
+        """마지막 확인 이후 COALESCE가 일어났으면 True. (중간 item을 건너뛰었다는 뜻)"""
+        coalesced, self._coalesced = self._coalesced, False
+        return coalesced
+
+    def put_nowait(self, item: T) -> None:
+        if self._closed is not None or self._overflowed:
+            return
+
+        if len(self._items) >= self._maxsize:
+            if self._policy is OverflowPolicy.DROP:
+                self._evicted += 1
+                return
+            self._evicted += len(self._items)
+            self._items.clear()
+            if self._policy is OverflowPolicy.DISCONNECT:
+                self._overflowed = True
+                logger.warning("Slow consumer disconnected: %s", self._label)
+                self._wakeup.set()
+                return
+            self._coalesced = True
+
+        self._items.append(item)
+        self._max_depth = max(self._max_depth, len(self._items))
+        self._wakeup.set()
+
+    def close(self, error: BaseException | None = None) -> None:
+        """upstream이 끝났음을 알린다. 남은 item을 다 꺼낸 뒤 종료(또는 error)된다."""
+        if self._closed is None:
+            self._closed = _Closed(error)
+            self._wakeup.set()
+
+    async def __anext__(self) -> T:
+        while not self._items:
+            if self._overflowed:
+                raise BufferOverflowError(self._label)
+            if self._closed is not None:
+                if self._closed.error is not None:
+                    raise self._closed.error
+                raise StopAsyncIteration
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        if self._overflowed:
+            raise BufferOverflowError(self._label)
+        return self._items.popleft()
+
+    def __aiter__(self) -> ListenerBuffer[T]:
+        return self
@@ -1,25 +1,84 @@
-import json
+from contextlib import AbstractAsyncContextManager
 from typing import AsyncIterator
 
 from app.domain.events.case import CaseEventDelta, CaseSnapshotType
+from app.infra.pubsub.buffer import ListenerBuffer
+from app.infra.pubsub.fanout import FanoutRegistry
 from app.infra.pubsub.topics import CaseTopic
 from app.infra.pubsub.transport.base import PubSub
+from app.infra.serialization.codec import JSON_CODEC, Codec, Payload
+from app.schemas.case.state import CaseSnapshot
+
+
+def _decode_case_event(codec: Codec, msg: Payload | CaseEventDelta) -> CaseEventDelta:
+    if isinstance(msg, CaseEventDelta):  # 프로세스 내 transport
+        return msg
+    return codec.decode_model(CaseEventDelta, msg)
+
+
+# 프로세스 단위로 case topic 구독을 공유한다. (topic당 upstream 구독 1개, decode 1회)
+_case_event_fanouts = FanoutRegistry(_decode_case_event)
 
 
 class CaseEventBus:
-    def __init__(self, pubsub: PubSub):
+    """case event delta publish/subscribe.
+
+    payload는 codec으로 인코딩한다. (publish/subscribe 양쪽이 같은 codec이어야 함)
+    프로세스 내 transport(passes_objects)면 인코딩 없이 delta 객체를 그대로 publish한다.
+
+    fat event 모드(inline_snapshot_max_bytes > 0):
+    - publish 시 넘겨받은 snapshot을 직렬화해서, 크기 이하면 delta에 싣는다.
+    - 크기를 넘으면 기존처럼 snapshot_no만 담긴 delta를 보낸다.
+    """
+
+    def __init__(
+        self,
+        pubsub: PubSub,
+        *,
+        inline_snapshot_max_bytes: int = 0,
+        codec: Codec = JSON_CODEC,
+    ):
         self._pubsub = pubsub
+        self._codec = codec
+        self._fanout = _case_event_fanouts.get(pubsub, codec)
+        self._inline_snapshot_max_bytes = inline_snapshot_max_bytes
+
+    def with_inline_snapshot(
+        self, event: CaseEventDelta, snapshot: CaseSnapshot | None
+    ) -> CaseEventDelta:
+        """fat event 모드면 snapshot을 delta에 싣는다. (크기를 넘으면 그대로)"""
+        if snapshot is None or self._inline_snapshot_max_bytes <= 0:
+            return event
+        snapshot_json = snapshot.model_dump_json()
+        if len(snapshot_json.encode("utf-8")) > self._inline_snapshot_max_bytes:
+            return event
+        return event.model_copy(update={"snapshot_json": snapshot_json})
 
-    async def publish(self, case_topic: CaseTopic, event: CaseEventDelta) -> None:
+    def encode(self, event: CaseEventDelta) -> Payload | CaseEventDelta:
+        """transport로 보낼 message. (프로세스 내 transport면 객체 그대로)"""
         if event.type == CaseSnapshotType.ON_CONNECT:
             raise ValueError("ON_CONNECT must not be published to pubsub")
-        payload = event.model_dump(mode="json")
-        await self._pubsub.publish(
-            case_topic,
-            json.dumps(payload, ensure_ascii=False),
-        )
-
-    async def subscribe(self, case_topic: CaseTopic) -> AsyncIterator[CaseEventDelta]:
-        async for msg in self._pubsub.subscribe(case_topic):
-            data = json.loads(msg)
-            yield CaseEventDelta.model_validate(data)
+        if self._pubsub.passes_objects:
+            return event
+        return self._codec.encode_model(event)
+
+    async def publish(
+        self,
+        case_topic: CaseTopic,
+        event: CaseEventDelta,
+        *,
+        snapshot: CaseSnapshot | None = None,
+    ) -> None:
+        message = self.encode(self.with_inline_snapshot(event, snapshot))
+        await self._pubsub.publish(case_topic, message)  # type: ignore[arg-type]
+
+    def subscribe(
+        self, case_topic: CaseTopic, *, buffer: ListenerBuffer[CaseEventDelta] | None = None
+    ) -> AsyncIterator[CaseEventDelta]:
+        return self._fanout.subscribe(case_topic, buffer=buffer)
+
+    def listen(
+        self, case_topic: CaseTopic, *, buffer: ListenerBuffer[CaseEventDelta] | None = None
+    ) -> AbstractAsyncContextManager[AsyncIterator[CaseEventDelta]]:
+        """진입 즉시 구독을 붙인다. (replay 중에 들어온 delta를 놓치지 않기 위함)"""
+        return self._fanout.listen(case_topic, buffer=buffer)
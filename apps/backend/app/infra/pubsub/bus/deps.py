@@ -2,20 +2,48 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.config import SettingsDep
 from app.infra.pubsub.bus.case_event_bus import CaseEventBus
 from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
 from app.infra.pubsub.transport.deps import PubSubDep
+from app.infra.redis.event_version import RoomEventVersionsDep
+from app.infra.serialization.codec import PubSubCodecDep
 
 
-def get_room_event_bus(pubsub: PubSubDep) -> RoomEventBus:
-    return RoomEventBus(pubsub)
+def get_room_event_bus(
+    pubsub: PubSubDep,
+    settings: SettingsDep,
+    versions: RoomEventVersionsDep,
+    codec: PubSubCodecDep,
+) -> RoomEventBus:
+    return RoomEventBus(
+        pubsub,
+        # memory transport는 Redis 없이 도는 단일 노드용이므로 version도 쓰지 않는다.
+        versions=None if settings.pubsub_transport == "memory" else versions,
+        inline_snapshot_max_bytes=settings.pubsub_inline_snapshot_max_bytes,
+        codec=codec,
+    )
 
 
 RoomEventBusDep = Annotated[RoomEventBus, Depends(get_room_event_bus)]
 
 
-def get_case_event_bus(pubsub: PubSubDep) -> CaseEventBus:
-    return CaseEventBus(pubsub)
+def get_case_event_bus(
+    pubsub: PubSubDep, settings: SettingsDep, codec: PubSubCodecDep
+) -> CaseEventBus:
+    return CaseEventBus(
+        pubsub,
+        inline_snapshot_max_bytes=settings.pubsub_inline_snapshot_max_bytes,
+        codec=codec,
+    )
 
 
 CaseEventBusDep = Annotated[CaseEventBus, Depends(get_case_event_bus)]
+
+
+def get_user_event_bus(pubsub: PubSubDep, codec: PubSubCodecDep) -> UserEventBus:
+    return UserEventBus(pubsub, codec=codec)
+
+
+UserEventBusDep = Annotated[UserEventBus, Depends(get_user_event_bus)]
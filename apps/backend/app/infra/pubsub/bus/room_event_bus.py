@@ -1,25 +1,149 @@
-import json
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.buffer import ListenerBuffer
+from app.infra.pubsub.fanout import FanoutRegistry
 from app.infra.pubsub.topics import RoomTopic
-from app.infra.pubsub.transport.base import PubSub
+from app.infra.pubsub.transport.base import LogPubSub, PubSub
+from app.infra.redis.event_version import RoomEventVersions
+from app.infra.serialization.codec import JSON_CODEC, Codec, Payload
+from app.schemas.room.state import RoomSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def _decode_room_event(codec: Codec, msg: Payload | RoomEventDelta) -> RoomEventDelta:
+    if isinstance(msg, RoomEventDelta):  # 프로세스 내 transport
+        return msg
+    return codec.decode_model(RoomEventDelta, msg)
+
+
+# 재연결 시 log에서 이어받을 최대 event 수. 더 뒤처졌으면 현재 snapshot을 새로 보낸다.
+_MAX_MISSED_EVENTS = 100
+
+# 프로세스 단위로 room topic 구독을 공유한다. (topic당 upstream 구독 1개, decode 1회)
+_room_event_fanouts = FanoutRegistry(_decode_room_event)
 
 
 class RoomEventBus:
-    def __init__(self, pubsub: PubSub):
+    """room event delta publish/subscribe.
+
+    versions가 있으면 publish 시 room별 단조 증가 version을 delta에 부여한다.
+    payload는 codec으로 인코딩한다. (publish/subscribe 양쪽이 같은 codec이어야 함)
+    프로세스 내 transport(passes_objects)면 인코딩 없이 delta 객체를 그대로 publish한다.
+
+    fat event 모드(inline_snapshot_max_bytes > 0):
+    - publish 시 snapshot_loader로 snapshot을 만들어 직렬화하고, 크기 이하면 delta에 싣는다.
+    - 크기를 넘거나 loader가 실패하면 기존처럼 id만 담긴 delta를 보낸다.
+    """
+
+    def __init__(
+        self,
+        pubsub: PubSub,
+        *,
+        versions: RoomEventVersions | None = None,
+        inline_snapshot_max_bytes: int = 0,
+        codec: Codec = JSON_CODEC,
+    ):
         self._pubsub = pubsub
+        self._codec = codec
+        self._fanout = _room_event_fanouts.get(pubsub, codec)
+        self._versions = versions
+        self._inline_snapshot_max_bytes = inline_snapshot_max_bytes
+
+    async def current_version(self, room_topic: RoomTopic) -> int | None:
+        """마지막으로 publish된 event의 version. versions가 없으면 None."""
+        if self._versions is None:
+            return None
+        return await self._versions.current(room_topic.room_id)
 
-    async def publish(self, room_topic: RoomTopic, event: RoomEventDelta) -> None:
+    async def _inline_snapshot(
+        self, event: RoomEventDelta, snapshot_loader: Callable[[], Awaitable[RoomSnapshot]]
+    ) -> RoomEventDelta:
+        try:
+            snapshot_json = (await snapshot_loader()).model_dump_json()
+        except Exception:
+            logger.warning("Failed to load room snapshot for fat event", exc_info=True)
+            return event
+        if len(snapshot_json.encode("utf-8")) > self._inline_snapshot_max_bytes:
+            return event
+        return event.model_copy(update={"snapshot_json": snapshot_json})
+
+    async def prepare(
+        self,
+        room_topic: RoomTopic,
+        event: RoomEventDelta,
+        *,
+        snapshot_loader: Callable[[], Awaitable[RoomSnapshot]] | None = None,
+    ) -> RoomEventDelta:
+        """publish 직전 단계: version을 부여하고 (fat event 모드면) snapshot을 싣는다."""
         if event.type == RoomSnapshotType.ON_CONNECT:
             raise ValueError("ON_CONNECT must not be published to pubsub")
-        payload = event.model_dump(mode="json")
-        await self._pubsub.publish(
-            room_topic,
-            json.dumps(payload, ensure_ascii=False),
-        )
-
-    async def subscribe(self, room_topic: RoomTopic) -> AsyncIterator[RoomEventDelta]:
-        async for msg in self._pubsub.subscribe(room_topic):
-            data = json.loads(msg)
-            yield RoomEventDelta.model_validate(data)
+        if self._versions is not None and event.version is None:
+            version = await self._versions.next(room_topic.room_id)
+            event = event.model_copy(update={"version": version})
+        if snapshot_loader is not None and self._inline_snapshot_max_bytes > 0:
+            event = await self._inline_snapshot(event, snapshot_loader)
+        return event
+
+    def encode(self, event: RoomEventDelta) -> Payload | RoomEventDelta:
+        """transport로 보낼 message. (프로세스 내 transport면 객체 그대로)"""
+        if self._pubsub.passes_objects:
+            return event
+        return self._codec.encode_model(event)
+
+    async def publish(
+        self,
+        room_topic: RoomTopic,
+        event: RoomEventDelta,
+        *,
+        snapshot_loader: Callable[[], Awaitable[RoomSnapshot]] | None = None,
+    ) -> None:
+        event = await self.prepare(room_topic, event, snapshot_loader=snapshot_loader)
+        await self._pubsub.publish(room_topic, self.encode(event))  # type: ignore[arg-type]
+
+    async def read_missed(
+        self, room_topic: RoomTopic, *, after_version: int, upto_version: int
+    ) -> list[RoomEventDelta] | None:
+        """after_version 다음부터 upto_version까지의 delta를 log에서 version 순으로 읽는다.
+
+        - log transport(LogPubSub)와 versions가 있을 때만 이어받을 수 있다.
+        - 그 구간의 version이 log에 하나라도 없으면(잘렸거나 아직 publish 전) None
+        - 같은 version이 두 번 있으면(outbox 재전송) 하나만 쓴다.
+        """
+        missed_count = upto_version - after_version
+        if self._versions is None or not isinstance(self._pubsub, LogPubSub):
+            return None
+        if missed_count <= 0 or missed_count > _MAX_MISSED_EVENTS:
+            return None
+
+        # 재전송으로 중복된 entry가 섞여 있을 수 있으므로 넉넉히 읽는다.
+        payloads = await self._pubsub.read_recent(room_topic, count=missed_count * 2)
+        by_version: dict[int, RoomEventDelta] = {}
+        for payload in payloads:
+            event = _decode_room_event(self._codec, payload)
+            if event.version is not None and after_version < event.version <= upto_version:
+                by_version.setdefault(event.version, event)
+        if len(by_version) != missed_count:
+            return None
+        return [by_version[v] for v in range(after_version + 1, upto_version + 1)]
+
+    def subscribe(
+        self, room_topic: RoomTopic, *, buffer: ListenerBuffer[RoomEventDelta] | None = None
+    ) -> AsyncIterator[RoomEventDelta]:
+        return self._fanout.subscribe(room_topic, buffer=buffer)
+
+    @asynccontextmanager
+    async def open(
+        self, room_topic: RoomTopic, *, buffer: ListenerBuffer[RoomEventDelta] | None = None
+    ) -> AsyncIterator[AsyncIterator[RoomEventDelta]]:
+        """live 구독을 바로 붙인다. (subscribe와 달리 첫 event를 기다리기 전에 listener가 등록됨)
+
+        - buffer: 이 연결의 live buffer (없으면 fanout 기본값)
+        - 재연결 시 놓친 event는 stream이 read_missed로 따로 읽는다.
+        """
+        async with self._fanout.listen(room_topic, buffer=buffer) as live:
+            yield live
@@ -0,0 +1,71 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.domain.events.user import UserEvent
+from app.infra.pubsub.buffer import ListenerBuffer
+from app.infra.pubsub.fanout import FanoutRegistry
+from app.infra.pubsub.topics import ConnTopic, UserTopic
+from app.infra.pubsub.transport.base import PubSub
+from app.infra.serialization.codec import JSON_CODEC, Codec, Payload
+from app.schemas.common.ids import ConnId, UserId
+
+
+def _decode_user_event(codec: Codec, msg: Payload | UserEvent) -> UserEvent:
+    if isinstance(msg, UserEvent):  # 프로세스 내 transport
+        return msg
+    return codec.decode_model(UserEvent, msg)
+
+
+# 프로세스 단위로 user topic 구독을 공유한다. (user당 upstream 구독 1개, decode 1회)
+_user_event_fanouts = FanoutRegistry(_decode_user_event)
+
+
+class UserEventBus:
+    """특정 user/연결에게만 가는 event publish/subscribe.
+
+    - kick/close/notification처럼 한 사람에게만 의미 있는 event는 room에 broadcast하지 않고
+      user 채널(UserTopic)로 보낸다. (room 구독자 전체가 snapshot을 다시 만들 필요가 없다)
+    - ConnTopic으로 publish하면 conn_id를 실어 user 채널로 보낸다. 수신 측이 conn_id로
+      자기 연결 것만 고른다. (연결마다 upstream 구독을 두지 않기 위함)
+    """
+
+    def __init__(self, pubsub: PubSub, *, codec: Codec = JSON_CODEC) -> None:
+        self._pubsub = pubsub
+        self._codec = codec
+        self._fanout = _user_event_fanouts.get(pubsub, codec)
+
+    def encode(self, event: UserEvent) -> Payload | UserEvent:
+        """transport로 보낼 message. (프로세스 내 transport면 객체 그대로)"""
+        if self._pubsub.passes_objects:
+            return event
+        return self._codec.encode_model(event)
+
+    async def publish(self, topic: UserTopic | ConnTopic, event: UserEvent) -> None:
+        if isinstance(topic, ConnTopic):
+            event = event.model_copy(update={"conn_id": topic.conn_id})
+        elif topic.user_id != event.user_id:
+            raise ValueError("UserTopic must match event.user_id")
+        await self._pubsub.publish(UserTopic(event.user_id), self.encode(event))  # type: ignore[arg-type]
+
+    @asynccontextmanager
+    async def listen(
+        self,
+        user_id: UserId,
+        conn_id: ConnId | None = None,
+        *,
+        buffer: ListenerBuffer[UserEvent] | None = None,
+    ) -> AsyncIterator[AsyncIterator[UserEvent]]:
+        """진입 즉시 user 채널 구독을 붙인다.
+
+        conn_id를 넘기면 그 연결을 대상으로 한 event와 user 전체 대상 event만 받는다.
+        """
+        async with self._fanout.listen(UserTopic(user_id), buffer=buffer) as events:
+            yield _for_connection(events, conn_id)
+
+
+async def _for_connection(
+    events: AsyncIterator[UserEvent], conn_id: ConnId | None
+) -> AsyncIterator[UserEvent]:
+    async for event in events:
+        if event.conn_id is None or conn_id is None or event.conn_id == conn_id:
+            yield event
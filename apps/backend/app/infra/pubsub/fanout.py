@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from app.infra.pubsub.buffer import ListenerBuffer, OverflowPolicy
+from app.infra.pubsub.topics import Topic
+from app.infra.pubsub.transport.base import PubSub
+from app.infra.serialization.codec import Codec
+
+logger = logging.getLogger(__name__)
+
+# buffer를 따로 넘기지 않은 listener의 상한. 이만큼 밀렸으면 살아있는 소비자로 보지 않는다.
+DEFAULT_LISTENER_MAXSIZE = 1024
+
+
+@dataclass
+class _Channel[T]:
+    listeners: set[ListenerBuffer[T]] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+
+
+class TopicFanout[R, T]:
+    """하나의 transport 구독을 프로세스 내 여러 listener에게 나눠주는 multiplexer.
+
+    - topic당 upstream 구독(source, 보통 `PubSub.subscribe`)은 하나만 유지한다.
+      첫 listener가 열고, 마지막 listener가 나가면 닫는다(reference count).
+    - upstream 메시지는 한 번만 decode해서 모든 listener buffer에 같은 객체를 넣는다.
+    - listener buffer는 bounded라서 느린 listener가 pump나 다른 listener를 막지 않는다.
+      (넘쳤을 때의 동작은 ListenerBuffer의 OverflowPolicy를 따른다)
+    - decode에 실패한 메시지는 로깅 후 버린다. (한 메시지 때문에 topic 전체가 끊기지 않도록)
+    """
+
+    def __init__(
+        self, source: Callable[[Topic], AsyncIterator[R]], decode: Callable[[R], T]
+    ) -> None:
+        self._source = source
+        self._decode = decode
+        self._channels: dict[Topic, _Channel[T]] = {}
+
+    def listener_count(self, topic: Topic) -> int:
+        channel = self._channels.get(topic)
+        return len(channel.listeners) if channel is not None else 0
+
+    def topics(self) -> list[Topic]:
+        return list(self._channels)
+
+    def subscribe(
+        self, topic: Topic, *, buffer: ListenerBuffer[T] | None = None
+    ) -> AsyncIterator[T]:
+        async def _gen() -> AsyncIterator[T]:
+            async with self.listen(topic, buffer=buffer) as items:
+                async for item in items:
+                    yield item
+
+        return _gen()
+
+    @asynccontextmanager
+    async def listen(
+        self, topic: Topic, *, buffer: ListenerBuffer[T] | None = None
+    ) -> AsyncIterator[AsyncIterator[T]]:
+        """진입 시점에 바로 listener로 등록한다.
+
+        subscribe()는 첫 anext 때 등록되므로, 등록 이후에 다른 일(예: backlog 조회)을
+        해야 하는 경우 이쪽을 쓴다.
+        buffer를 넘기지 않으면 DEFAULT_LISTENER_MAXSIZE, DISCONNECT 정책의 buffer를 쓴다.
+        """
+        if buffer is None:
+            buffer = ListenerBuffer(
+                maxsize=DEFAULT_LISTENER_MAXSIZE,
+                policy=OverflowPolicy.DISCONNECT,
+                label=repr(topic),
+            )
+        channel = self._attach(topic, buffer)
+        try:
+            yield self._drain(buffer)
+        finally:
+            await self._detach(topic, channel, buffer)
+
+    @staticmethod
+    async def _drain(buffer: ListenerBuffer[T]) -> AsyncIterator[T]:
+        async for item in buffer:
+            yield item
+
+    def _attach(self, topic: Topic, buffer: ListenerBuffer[T]) -> _Channel[T]:
+        channel = self._channels.get(topic)
+        if channel is not None and not self._is_alive(channel):
+            # 다른 event loop에서 남겨진 channel(테스트 등)은 재사용하지 않는다.
+            del self._channels[topic]
+            channel = None
+
+        if channel is None:
+            channel = _Channel()
+            self._channels[topic] = channel
+            channel.listeners.add(buffer)
+            channel.task = asyncio.create_task(self._pump(topic, channel))
+            return channel
+
+        channel.listeners.add(buffer)
+        return channel
+
+    @staticmethod
+    def _is_alive(channel: _Channel[T]) -> bool:
+        task = channel.task
+        if task is None or task.done():
+            return False
+        return task.get_loop() is asyncio.get_running_loop()
+
+    async def _detach(self, topic: Topic, channel: _Channel[T], buffer: ListenerBuffer[T]) -> None:
+        channel.listeners.discard(buffer)
+        if channel.listeners:
+            return
+
+        if self._channels.get(topic) is channel:
+            del self._channels[topic]
+
+        task = channel.task
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _pump(self, topic: Topic, channel: _Channel[T]) -> None:
+        error: BaseException | None = None
+        try:
+            async for raw in self._source(topic):
+                try:
+                    item = self._decode(raw)
+                except Exception:
+                    logger.exception("Failed to decode pubsub message: topic=%r", topic)
+                    continue
+                for listener in channel.listeners:
+                    listener.put_nowait(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+
+        if self._channels.get(topic) is channel:
+            del self._channels[topic]
+        for listener in channel.listeners:
+            listener.close(error)
+
+
+class FanoutRegistry[T]:
+    """(PubSub 인스턴스, codec)마다 TopicFanout을 하나씩 공유하기 위한 registry.
+
+    bus는 요청마다 새로 만들어지므로, fanout은 bus가 아니라 PubSub 단위로 묶어둔다.
+    decode는 codec을 받아 payload를 해석한다. (codec이 다르면 upstream 구독도 따로 둔다)
+    """
+
+    def __init__(self, decode: Callable[[Codec, Any], T]) -> None:
+        self._decode = decode
+        self._fanouts: WeakKeyDictionary[PubSub, dict[str, TopicFanout[Any, T]]] = (
+            WeakKeyDictionary()
+        )
+
+    def get(self, pubsub: PubSub, codec: Codec) -> TopicFanout[Any, T]:
+        fanouts = self._fanouts.get(pubsub)
+        if fanouts is None:
+            fanouts = {}
+            self._fanouts[pubsub] = fanouts
+
+        fanout = fanouts.get(codec.name)
+        if fanout is None:
+            fanout = TopicFanout(pubsub.subscribe, partial(self._decode, codec))
+            fanouts[codec.name] = fanout
+        return fanout
@@ -1,35 +1,83 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import ClassVar, Literal
 
 from app.schemas.common.ids import CaseId, ConnId, RoomId, UserId
 
+# topic 종류별 namespace. transport는 이 값으로 채널 이름을 만들고, namespace 단위로
+# 연결(Redis pool/instance)이나 sharded pubsub 여부를 나눈다.
+type TopicNamespace = Literal["room", "case", "user", "conn"]
+
 
 class Topic:
     """
     Transport-independent pub/sub topic marker.
     Redis에 대해 독립적인 StateBus를 구현하기 위함.
+
+    - 하위 클래스는 `class XTopic(Topic, namespace="x")`로 namespace를 등록한다.
+      (namespace는 topic 종류마다 하나, 중복 등록 불가)
+    - key: namespace 안에서 topic을 구분하는 값
     """
 
-    pass
+    namespace: ClassVar[TopicNamespace]
+    _registry: ClassVar[dict[str, type[Topic]]] = {}
+
+    def __init_subclass__(cls, *, namespace: TopicNamespace, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        registered = Topic._registry.get(namespace)
+        if registered is not None:
+            raise ValueError(f"Topic namespace {namespace!r} is already used by {registered!r}")
+        Topic._registry[namespace] = cls
+        cls.namespace = namespace
+
+    @property
+    def key(self) -> str:
+        raise NotImplementedError
+
+
+def topic_namespaces() -> dict[str, type[Topic]]:
+    """등록된 namespace -> topic 클래스."""
+    return dict(Topic._registry)
+
+
+def topic_name(topic: Topic) -> str:
+    """transport 공통 이름. (예: "case:<case_id>")"""
+    return f"{topic.namespace}:{topic.key}"
 
 
 @dataclass(frozen=True)
-class RoomTopic(Topic):
+class RoomTopic(Topic, namespace="room"):
     room_id: RoomId
 
+    @property
+    def key(self) -> str:
+        return str(self.room_id)
+
 
 @dataclass(frozen=True)
-class UserTopic(Topic):
+class UserTopic(Topic, namespace="user"):
     user_id: UserId
 
+    @property
+    def key(self) -> str:
+        return str(self.user_id)
+
 
 @dataclass(frozen=True)
-class CaseTopic(Topic):
+class CaseTopic(Topic, namespace="case"):
     case_id: CaseId
 
+    @property
+    def key(self) -> str:
+        return str(self.case_id)
+
 
 # 확장 대비 (특정 연결)
 @dataclass(frozen=True)
-class ConnTopic(Topic):
+class ConnTopic(Topic, namespace="conn"):
     conn_id: ConnId
+
+    @property
+    def key(self) -> str:
+        return str(self.conn_id)
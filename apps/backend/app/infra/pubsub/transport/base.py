@@ -1,20 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from collections.abc import Sequence
+from typing import AsyncIterator, ClassVar
 
 from app.infra.pubsub.topics import Topic
+from app.infra.serialization.codec import Payload
 
 
 class PubSub(ABC):
     """Transport-independent Pub/Sub interface.
 
     - Topic: 앱 의미 단위(예: RoomTopic(room_id))
-    - message: transport로 흘려보낼 raw payload (보통 JSON str)
+    - message: transport로 흘려보낼 raw payload (bus의 codec이 만든 bytes)
+      transport는 payload를 해석하지 않고, 받은 그대로(bytes 또는 str) 넘긴다.
+    - passes_objects: True면 프로세스 내 전달이라 message 객체를 그대로 넘길 수 있다.
+      bus는 이때 인코딩 없이 model 객체를 publish하고, 받은 쪽도 decode를 건너뛴다.
     """
 
+    passes_objects: ClassVar[bool] = False
+
     @abstractmethod
-    async def publish(self, topic: Topic, message: str) -> int:
+    async def publish(self, topic: Topic, message: Payload) -> int:
         """Publish message to topic.
 
         Returns:
@@ -22,11 +29,32 @@ class PubSub(ABC):
         """
         raise NotImplementedError
 
+    async def publish_many(self, messages: Sequence[tuple[Topic, Payload]]) -> None:
+        """여러 메시지를 순서대로 publish한다.
+
+        기본 구현은 한 건씩 publish한다. 왕복을 줄일 수 있는 transport(예: Redis pipeline)는
+        override해서 한 번에 보낸다. 순서는 반드시 유지해야 한다.
+        """
+        for topic, message in messages:
+            await self.publish(topic, message)
+
     @abstractmethod
-    def subscribe(self, topic: Topic) -> AsyncIterator[str]:
+    def subscribe(self, topic: Topic) -> AsyncIterator[Payload]:
         """Subscribe to topic and yield messages.
 
         Yields:
-            str: raw payload (usually JSON str).
+            Payload: raw payload (decode는 bus의 codec이 한다).
         """
         raise NotImplementedError
+
+
+class LogPubSub(PubSub):
+    """topic별로 최근 message를 bounded log로 남기는 transport.
+
+    재연결한 구독자가 놓친 message를 log에서 다시 읽을 수 있다. (bus가 version으로 맞춰본다)
+    """
+
+    @abstractmethod
+    async def read_recent(self, topic: Topic, count: int) -> list[Payload]:
+        """topic log의 최근 message를 최대 count개, 오래된 것부터 반환한다."""
+        raise NotImplementedError
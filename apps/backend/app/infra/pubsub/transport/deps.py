@@ -3,12 +3,23 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.config import SettingsDep
 from app.infra.pubsub.transport.base import PubSub
-from app.infra.redis.pubsub import RedisPubSubDep
+from app.infra.pubsub.transport.hybrid import get_hybrid_pubsub
+from app.infra.pubsub.transport.memory import get_in_memory_pubsub
+from app.infra.redis.client import RedisBinaryClientDep
+from app.infra.redis.pubsub import get_redis_pubsub
+from app.infra.redis.stream_pubsub import get_redis_stream_pubsub
 
 
-def get_pubsub(redis_pubsub: RedisPubSubDep) -> PubSub:
-    return redis_pubsub
+def get_pubsub(settings: SettingsDep, redis_client: RedisBinaryClientDep) -> PubSub:
+    if settings.pubsub_transport == "memory":
+        return get_in_memory_pubsub()
+    if settings.pubsub_transport == "hybrid":
+        return get_hybrid_pubsub(redis_client)
+    if settings.pubsub_transport == "redis_streams":
+        return get_redis_stream_pubsub(redis_client)
+    return get_redis_pubsub(redis_client)
 
 
 PubSubDep = Annotated[PubSub, Depends(get_pubsub)]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.infra.pubsub.buffer import ListenerBuffer
+from app.infra.pubsub.topics import Topic
+from app.infra.pubsub.transport.base import PubSub
+from app.infra.pubsub.transport.memory import InMemoryPubSub, get_in_memory_pubsub
+from app.infra.redis.pubsub import get_redis_pubsub
+from app.infra.serialization.codec import Codec, get_pubsub_codec
+
+logger = logging.getLogger(__name__)
+
+# remote payload = origin + _SEP + codec payload
+_SEP = b"|"
+
+
+class HybridPubSub(PubSub):
+    """같은 worker의 구독자에게는 프로세스 내로, 다른 worker에게는 remote로 전달한다.
+
+    - publish: local(InMemoryPubSub)에 객체 그대로 넣고, codec으로 인코딩해 remote에도 보낸다.
+      local 구독자는 네트워크 왕복과 encode/decode 없이 받는다.
+    - subscribe: local 메시지 + remote 메시지를 합친다. remote payload 앞에 보낸 worker의
+      origin을 붙여두고, 자기가 보낸 것은 이미 local로 받았으므로 버린다.
+    - remote는 PUB/SUB 계열이어야 한다. (log transport의 entry id는 다루지 않음)
+    """
+
+    passes_objects = True
+
+    def __init__(self, remote: PubSub, *, codec: Codec, local: InMemoryPubSub | None = None):
+        self._remote = remote
+        self._codec = codec
+        self._local = local or InMemoryPubSub()
+        self._origin = uuid4().hex.encode()
+
+    def subscriber_count(self, topic: Topic) -> int:
+        return self._local.subscriber_count(topic)
+
+    def _encode(self, message: Any) -> bytes:
+        if isinstance(message, BaseModel):
+            payload = self._codec.encode_model(message)
+        elif isinstance(message, str):
+            payload = message.encode()
+        else:
+            payload = message
+        return self._origin + _SEP + payload
+
+    async def publish(self, topic: Topic, message: Any) -> int:
+        delivered = self._local.deliver(topic, message)
+        return delivered + await self._remote.publish(topic, self._encode(message))
+
+    async def publish_many(self, messages: Sequence[tuple[Topic, Any]]) -> None:
+        for topic, message in messages:
+            self._local.deliver(topic, message)
+        await self._remote.publish_many([(topic, self._encode(msg)) for topic, msg in messages])
+
+    def subscribe(self, topic: Topic) -> AsyncIterator[Any]:
+        async def _gen() -> AsyncIterator[Any]:
+            buffer = self._local.attach(topic)
+            remote = asyncio.create_task(self._pump_remote(topic, buffer))
+            try:
+                async for message in buffer:
+                    yield message
+            finally:
+                self._local.detach(topic, buffer)
+                remote.cancel()
+                with suppress(asyncio.CancelledError):
+                    await remote
+
+        return _gen()
+
+    async def _pump_remote(self, topic: Topic, buffer: ListenerBuffer[Any]) -> None:
+        try:
+            async for raw in self._remote.subscribe(topic):
+                if isinstance(raw, str):
+                    raw = raw.encode()
+                origin, sep, payload = raw.partition(_SEP)
+                if not sep:
+                    logger.warning("Dropping remote message without origin: topic=%r", topic)
+                    continue
+                if origin == self._origin:
+                    continue  # local로 이미 전달함
+                buffer.put_nowait(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            buffer.close(e)
+
+
+@lru_cache
+def get_hybrid_pubsub(redis_client: Redis) -> HybridPubSub:
+    """client당 하나를 공유한다. (get_redis_pubsub와 같은 이유)"""
+    return HybridPubSub(
+        get_redis_pubsub(redis_client),
+        codec=get_pubsub_codec(),
+        local=get_in_memory_pubsub(),
+    )
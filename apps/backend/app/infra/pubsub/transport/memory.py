@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, AsyncIterator
+
+from app.core.config import get_settings
+from app.infra.pubsub.buffer import ListenerBuffer, OverflowPolicy
+from app.infra.pubsub.topics import Topic
+from app.infra.pubsub.transport.base import PubSub
+
+
+class InMemoryPubSub(PubSub):
+    """프로세스 내 PubSub. (단일 노드, Redis 없이 동작)
+
+    - publish된 객체를 직렬화 없이 그대로 구독자에게 넘긴다. (passes_objects)
+      bus는 이때 model을 인코딩하지 않고 publish하므로 encode/decode가 모두 사라진다.
+    - 구독자마다 bounded buffer(DISCONNECT)를 둔다. 구독자는 보통 topic당 하나인
+      fanout pump라서 밀릴 일이 거의 없지만, 밀리면 끊어서 메모리 상한을 지킨다.
+    - 다른 프로세스로는 전달되지 않는다. (여러 worker면 HybridPubSub)
+    """
+
+    passes_objects = True
+
+    def __init__(self, *, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._subscribers: dict[Topic, set[ListenerBuffer[Any]]] = {}
+
+    def subscriber_count(self, topic: Topic) -> int:
+        return len(self._subscribers.get(topic, ()))
+
+    def attach(self, topic: Topic) -> ListenerBuffer[Any]:
+        """topic 구독 buffer를 등록한다. 다 쓰면 detach로 해제해야 한다."""
+        buffer: ListenerBuffer[Any] = ListenerBuffer(
+            maxsize=self._maxsize, policy=OverflowPolicy.DISCONNECT, label=f"memory:{topic!r}"
+        )
+        self._subscribers.setdefault(topic, set()).add(buffer)
+        return buffer
+
+    def detach(self, topic: Topic, buffer: ListenerBuffer[Any]) -> None:
+        subscribers = self._subscribers.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(buffer)
+        if not subscribers:
+            del self._subscribers[topic]
+
+    def deliver(self, topic: Topic, message: Any) -> int:
+        """현재 구독자 buffer에 바로 넣는다. (block하지 않음)"""
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return 0
+        for buffer in subscribers:
+            buffer.put_nowait(message)
+        return len(subscribers)
+
+    async def publish(self, topic: Topic, message: Any) -> int:
+        return self.deliver(topic, message)
+
+    def subscribe(self, topic: Topic) -> AsyncIterator[Any]:
+        async def _gen() -> AsyncIterator[Any]:
+            buffer = self.attach(topic)
+            try:
+                async for message in buffer:
+                    yield message
+            finally:
+                self.detach(topic, buffer)
+
+        return _gen()
+
+
+@lru_cache
+def get_in_memory_pubsub() -> InMemoryPubSub:
+    """프로세스당 하나. (같은 인스턴스여야 publish/subscribe가 만난다)"""
+    return InMemoryPubSub(maxsize=get_settings().pubsub_memory_max_pending)
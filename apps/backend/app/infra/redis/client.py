@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import Depends
 from redis.asyncio.client import Redis
 
 from app.core.config import get_settings
+from app.infra.pubsub.topics import TopicNamespace
+
+
+def _pool_kwargs() -> dict[str, Any]:
+    """settings의 redis_* pool 설정. None인 값은 넘기지 않아 redis-py 기본값을 쓴다."""
+    settings = get_settings()
+    kwargs: dict[str, Any] = {
+        "max_connections": settings.redis_max_connections,
+        "socket_timeout": settings.redis_socket_timeout_seconds,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout_seconds,
+        "health_check_interval": settings.redis_health_check_interval_seconds,
+    }
+    return {key: value for key, value in kwargs.items() if value is not None}
 
 
 @lru_cache
@@ -14,7 +28,53 @@ def get_redis_client() -> Redis:
     return Redis.from_url(
         get_settings().redis_url,
         decode_responses=True,
+        **_pool_kwargs(),
     )
 
 
 RedisClientDep = Annotated[Redis, Depends(get_redis_client)]
+
+
+@lru_cache
+def get_redis_binary_client() -> Redis:
+    """응답을 decode하지 않는 client. (pubsub payload, frame cache처럼 codec이 만든 bytes용)"""
+    return Redis.from_url(
+        get_settings().redis_url,
+        decode_responses=False,
+        **_pool_kwargs(),
+    )
+
+
+RedisBinaryClientDep = Annotated[Redis, Depends(get_redis_binary_client)]
+
+
+@lru_cache
+def get_redis_namespace_clients() -> dict[TopicNamespace, Redis]:
+    """settings.pubsub_namespace_redis_urls에 적힌 namespace 전용 binary client.
+
+    namespace마다 Redis.from_url로 따로 만들므로 connection pool도 따로다.
+    (case처럼 트래픽이 큰 namespace가 room/lobby의 연결을 잡아먹지 않는다)
+    """
+    return {
+        namespace: Redis.from_url(url, decode_responses=False, **_pool_kwargs())
+        for namespace, url in get_settings().pubsub_namespace_redis_urls.items()
+    }
+
+
+@dataclass(frozen=True)
+class RedisPoolStats:
+    name: str
+    max_connections: int
+    in_use: int
+    idle: int
+
+
+def redis_pool_stats(name: str, client: Redis) -> RedisPoolStats:
+    """client의 connection pool 상태. (redis-py가 공개 API로 주지 않아 내부 목록을 센다)"""
+    pool = client.connection_pool
+    return RedisPoolStats(
+        name=name,
+        max_connections=pool.max_connections,
+        in_use=len(pool._in_use_connections),
+        idle=len(pool._available_connections),
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from app.infra.redis.client import RedisClientDep
+from app.schemas.common.ids import RoomId
+
+
+class RoomEventVersions:
+    """room별 단조 증가 event version. (Redis INCR)
+
+    - publish 시 next()로 부여하고, SSE frame id로 쓴다.
+    - transport와 무관하게 유지되므로 재연결 시 Last-Event-ID와 current()를 비교해
+      놓친 event가 있는지 판단할 수 있다.
+    """
+
+    def __init__(self, client: Redis):
+        self._client = client
+
+    @staticmethod
+    def _key(room_id: RoomId) -> str:
+        return f"room_event_version:{room_id}"
+
+    async def next(self, room_id: RoomId) -> int:
+        return int(await self._client.incr(self._key(room_id)))
+
+    async def current(self, room_id: RoomId) -> int:
+        value = await self._client.get(self._key(room_id))
+        return int(value) if value is not None else 0
+
+
+def get_room_event_versions(redis_client: RedisClientDep) -> RoomEventVersions:
+    return RoomEventVersions(redis_client)
+
+
+RoomEventVersionsDep = Annotated[RoomEventVersions, Depends(get_room_event_versions)]
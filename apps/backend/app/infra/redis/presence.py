@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Sequence
+from contextlib import asynccontextmanager, suppress
+from typing import Annotated, cast
+from uuid import UUID
+
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from app.core.config import SettingsDep
+from app.infra.redis.client import RedisClientDep
+from app.schemas.common.ids import RoomId, UserId
+
+logger = logging.getLogger(__name__)
+
+_ROOMS_KEY = "presence:rooms"
+
+
+class RoomPresence:
+    """(room, user) 단위 online 상태. (Redis TTL heartbeat)
+
+    - room/case stream(SSE/WS)이 열려 있는 동안 keep_alive()로 key의 TTL을 갱신한다.
+      연결이 죽으면(프로세스 crash 포함) 갱신이 멈추고 TTL이 지나면 offline이 된다.
+    - room별 ZSET(user -> 만료 시각)으로 sweeper가 만료된 user를 찾는다.
+    - room_members 테이블에는 쓰지 않는다. (heartbeat마다 DB write가 생기지 않도록)
+
+    keys
+    - presence:{room_id}:{user_id}: "1", EX ttl
+    - presence_expiry:{room_id}: ZSET user_id -> 만료 시각(unix seconds)
+    - presence:rooms: expiry ZSET이 남아 있는 room 목록 (ZSET이 비면 claim_expired가 뺀다)
+    """
+
+    def __init__(self, client: Redis, *, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    @property
+    def heartbeat_interval_seconds(self) -> float:
+        # TTL 안에 두 번 이상 갱신해서, 한 번 늦어도 offline으로 보이지 않게 한다.
+        return self._ttl_seconds / 3
+
+    @staticmethod
+    def _key(room_id: RoomId, user_id: UserId | str) -> str:
+        return f"presence:{room_id}:{user_id}"
+
+    @staticmethod
+    def _expiry_key(room_id: RoomId) -> str:
+        return f"presence_expiry:{room_id}"
+
+    async def heartbeat(self, room_id: RoomId, user_id: UserId) -> None:
+        expires_at = time.time() + self._ttl_seconds
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(room_id, user_id), 1, ex=self._ttl_seconds)
+            pipe.zadd(self._expiry_key(room_id), {str(user_id): expires_at})
+            pipe.sadd(_ROOMS_KEY, str(room_id))
+            await pipe.execute()
+
+    @asynccontextmanager
+    async def keep_alive(self, room_id: RoomId, user_id: UserId) -> AsyncIterator[None]:
+        """block이 열려 있는 동안 heartbeat_interval_seconds마다 heartbeat를 보낸다.
+
+        첫 heartbeat는 block에 들어가기 전에 보낸다. (연결 직후 snapshot에 online으로 보이도록)
+        heartbeat 실패는 호출자를 끊지 않는다. (다음 주기에 다시 시도)
+        """
+
+        async def _heartbeat() -> None:
+            try:
+                await self.heartbeat(room_id, user_id)
+            except Exception:
+                logger.warning("Presence heartbeat failed", exc_info=True)
+
+        async def _beat() -> None:
+            while True:
+                await asyncio.sleep(self.heartbeat_interval_seconds)
+                await _heartbeat()
+
+        await _heartbeat()
+        task = asyncio.create_task(_beat())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def online(self, room_id: RoomId, user_ids: Sequence[UserId]) -> set[UserId]:
+        """user_ids 중 online인 user. (MGET 한 번)"""
+        if not user_ids:
+            return set()
+        values = await self._client.mget([self._key(room_id, u) for u in user_ids])
+        return {u for u, v in zip(user_ids, values, strict=True) if v is not None}
+
+    async def rooms(self) -> list[RoomId]:
+        # redis-py는 sync/async client를 같은 타입으로 선언하므로 await할 수 있는 쪽으로 좁힌다.
+        members = await cast(Awaitable[set[str]], self._client.smembers(_ROOMS_KEY))
+        return [UUID(raw) for raw in members]
+
+    async def claim_expired(self, room_id: RoomId, *, now: float | None = None) -> list[UserId]:
+        """TTL이 지난 user를 가져간다.
+
+        - ZREM이 1인 worker만 가져가므로 여러 sweeper가 돌아도 한 번만 처리된다.
+        - 그 사이 heartbeat가 다시 온 user(key가 살아있음)는 건너뛴다.
+          (index는 다음 heartbeat 때 다시 채워진다)
+        - ZSET이 비면 room을 presence:rooms에서 뺀다. (sweep이 빈 room을 계속 돌지 않도록)
+          그 사이 heartbeat가 끼어들어 빠졌더라도 다음 heartbeat가 다시 넣는다.
+        """
+        now = time.time() if now is None else now
+        expiry_key = self._expiry_key(room_id)
+        expired: list[UserId] = []
+        for raw in await self._client.zrangebyscore(expiry_key, "-inf", now):
+            if await self._client.zrem(expiry_key, raw) == 0:
+                continue
+            if await self._client.exists(self._key(room_id, raw)):
+                continue
+            expired.append(UUID(raw))
+        if await self._client.zcard(expiry_key) == 0:
+            await cast(Awaitable[int], self._client.srem(_ROOMS_KEY, str(room_id)))
+        return expired
+
+
+def get_room_presence(settings: SettingsDep, redis_client: RedisClientDep) -> RoomPresence | None:
+    # memory transport는 Redis 없이 도는 단일 노드용이므로 presence도 쓰지 않는다.
+    if settings.presence_ttl_seconds <= 0 or settings.pubsub_transport == "memory":
+        return None
+    return RoomPresence(redis_client, ttl_seconds=settings.presence_ttl_seconds)
+
+
+RoomPresenceDep = Annotated[RoomPresence | None, Depends(get_room_presence)]
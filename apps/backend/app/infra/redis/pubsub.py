@@ -1,34 +1,82 @@
+import asyncio
+from collections.abc import Collection, Mapping, Sequence
+from functools import lru_cache
 from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
-from app.infra.pubsub.topics import CaseTopic, ConnTopic, RoomTopic, Topic, UserTopic
+from app.core.config import get_settings
+from app.infra.pubsub.topics import Topic, TopicNamespace, topic_name
 from app.infra.pubsub.transport.base import PubSub
-from app.infra.redis.client import RedisClientDep
+from app.infra.redis.client import RedisBinaryClientDep, get_redis_namespace_clients
+from app.infra.serialization.codec import Payload
+
+
+def topic_to_channel(topic: Topic) -> str:
+    """topic -> Redis 채널 이름. namespace가 prefix다. (예: "case:<case_id>")"""
+    if not isinstance(topic, Topic) or not hasattr(type(topic), "namespace"):
+        raise TypeError(
+            f"Unsupported topic: {type(topic)!r}"
+        )  # MVP: 나중엔 UnsupportedTokenError 만들어서 사용.
+    return topic_name(topic)
+
+
+class RedisTopicRouter:
+    """topic namespace -> Redis client.
+
+    - routes에 없는 namespace는 default client를 쓴다.
+    - sharded namespace는 SPUBLISH/SSUBSCRIBE를 쓴다. (cluster에서는 채널이 slot 단위로
+      shard에 나뉘어, 한 namespace의 트래픽이 모든 노드로 퍼지지 않는다)
+    """
+
+    def __init__(
+        self,
+        default: Redis,
+        *,
+        routes: Mapping[TopicNamespace, Redis] | None = None,
+        sharded: Collection[TopicNamespace] = (),
+    ) -> None:
+        self._default = default
+        self._routes = dict(routes or {})
+        self._sharded = frozenset(sharded)
+
+    def client_for(self, topic: Topic) -> Redis:
+        return self._routes.get(topic.namespace, self._default)
+
+    def is_sharded(self, topic: Topic) -> bool:
+        return topic.namespace in self._sharded
 
 
 class RedisPubSub(PubSub):
-    def __init__(self, client: Redis):
+    """Redis PUB/SUB transport.
+
+    payload를 decode하지 않고 그대로 넘긴다. (binary client면 bytes, 아니면 str)
+    topic namespace별로 client와 sharded 여부를 나눌 수 있다. (RedisTopicRouter)
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        routes: Mapping[TopicNamespace, Redis] | None = None,
+        sharded: Collection[TopicNamespace] = (),
+    ):
         self._client = client
+        self._router = RedisTopicRouter(client, routes=routes, sharded=sharded)
 
     def _topic_to_channel(self, topic: Topic) -> str:
-        if isinstance(topic, RoomTopic):
-            return f"room:{topic.room_id}"
-        if isinstance(topic, CaseTopic):
-            return f"room:{topic.case_id}"
-        if isinstance(topic, UserTopic):
-            return f"user:{topic.user_id}"
-        if isinstance(topic, ConnTopic):
-            return f"conn:{topic.conn_id}"
-        raise TypeError(
-            f"Unsupported topic: {type(topic)!r}"
-        )  # MVP: 나중엔 UnsupportedTokenError 만들어서 사용.
+        return topic_to_channel(topic)
 
-    def subscribe(self, topic: Topic) -> AsyncIterator[str]:
-        async def _gen() -> AsyncIterator[str]:
-            channel = self._topic_to_channel(topic)
-            pubsub = self._client.pubsub()
+    def subscribe(self, topic: Topic) -> AsyncIterator[Payload]:
+        client = self._router.client_for(topic)
+        channel = self._topic_to_channel(topic)
+        if self._router.is_sharded(topic):
+            return _listen_sharded(client, channel)
+
+        async def _gen() -> AsyncIterator[Payload]:
+            pubsub = client.pubsub()
 
             try:
                 await pubsub.subscribe(channel)
@@ -38,10 +86,7 @@ class RedisPubSub(PubSub):
                         continue
                     msg = message.get("data")
 
-                    if isinstance(msg, bytes):
-                        msg = msg.decode()
-
-                    assert isinstance(msg, str)
+                    assert isinstance(msg, (bytes, str))
 
                     yield msg
             finally:
@@ -52,14 +97,73 @@ class RedisPubSub(PubSub):
 
         return _gen()
 
-    async def publish(self, topic: Topic, message: str) -> int:
+    async def publish(self, topic: Topic, message: Payload) -> int:
+        client = self._router.client_for(topic)
         channel = self._topic_to_channel(topic)
-        check = await self._client.publish(channel, message)
+        if self._router.is_sharded(topic):
+            return await client.spublish(channel, message)
+        check = await client.publish(channel, message)
         return check
 
-
-def get_redis_pubsub(redis_client: RedisClientDep) -> RedisPubSub:
-    return RedisPubSub(redis_client)
+    async def publish_many(self, messages: Sequence[tuple[Topic, Payload]]) -> None:
+        """client별로 PUBLISH를 pipeline 하나로 묶어 보낸다. (client당 왕복 1회)
+
+        topic은 항상 같은 client로 가므로 topic별 순서는 유지된다.
+        """
+        pipes: dict[int, Pipeline] = {}
+        for topic, message in messages:
+            client = self._router.client_for(topic)
+            pipe = pipes.get(id(client))
+            if pipe is None:
+                pipe = pipes[id(client)] = client.pipeline(transaction=False)
+            channel = self._topic_to_channel(topic)
+            if self._router.is_sharded(topic):
+                pipe.spublish(channel, message)
+            else:
+                pipe.publish(channel, message)
+        await asyncio.gather(*(pipe.execute() for pipe in pipes.values()))
+
+
+async def _listen_sharded(client: Redis, channel: str) -> AsyncIterator[Payload]:
+    """SSUBSCRIBE 구독.
+
+    redis.asyncio의 PubSub은 SSUBSCRIBE를 지원하지 않으므로 pool에서 연결 하나를 빌려
+    직접 읽는다. 구독 상태의 연결은 재사용할 수 없으므로 끊고 돌려준다.
+    """
+    pool = client.connection_pool
+    conn = await pool.get_connection()
+    try:
+        await conn.send_command("SSUBSCRIBE", channel)
+        while True:
+            response = await conn.read_response()
+            kind = response[0]
+            if kind in (b"smessage", "smessage"):
+                msg = response[2]
+                assert isinstance(msg, (bytes, str))
+                yield msg
+    finally:
+        try:
+            await conn.disconnect()
+        finally:
+            await pool.release(conn)
+
+
+@lru_cache
+def _get_shared_redis_pubsub(redis_client: Redis) -> RedisPubSub:
+    return RedisPubSub(
+        redis_client,
+        routes=get_redis_namespace_clients(),
+        sharded=get_settings().pubsub_sharded_namespaces,
+    )
+
+
+def get_redis_pubsub(redis_client: RedisBinaryClientDep) -> RedisPubSub:
+    """client당 RedisPubSub 하나를 공유한다.
+
+    - bus의 topic fanout이 PubSub 인스턴스 단위로 묶이므로,
+      요청마다 새 인스턴스를 만들면 프로세스 내 구독 공유가 깨진다.
+    """
+    return _get_shared_redis_pubsub(redis_client)
 
 
 RedisPubSubDep = Annotated[RedisPubSub, Depends(get_redis_pubsub)]
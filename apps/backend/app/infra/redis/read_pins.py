@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Annotated
+
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from app.core.config import SettingsDep
+from app.infra.redis.client import RedisClientDep
+from app.schemas.common.ids import RoomId, UserId
+
+
+class ReadPins:
+    """쓰기 직후 replica 대신 primary에서 읽어야 하는 user/room. (Redis TTL key)
+
+    replica는 primary보다 늦을 수 있으므로, 쓰기가 commit된 뒤 ttl 동안은
+    그 user의 조회와 그 room의 snapshot 조회를 primary로 보낸다. (read-your-writes)
+    worker가 여러 개여도 같은 pin을 보도록 Redis에 둔다.
+
+    keys
+    - db_pin:user:{user_id}, db_pin:room:{room_id}: "1", PX ttl
+    """
+
+    def __init__(self, client: Redis, *, ttl_seconds: float) -> None:
+        self._client = client
+        self._ttl_ms = max(1, int(ttl_seconds * 1000))
+
+    @staticmethod
+    def _keys(user_ids: Iterable[UserId], room_ids: Iterable[RoomId]) -> list[str]:
+        return [f"db_pin:user:{user_id}" for user_id in user_ids] + [
+            f"db_pin:room:{room_id}" for room_id in room_ids
+        ]
+
+    async def pin(
+        self, *, user_ids: Iterable[UserId] = (), room_ids: Iterable[RoomId] = ()
+    ) -> None:
+        keys = self._keys(user_ids, room_ids)
+        if not keys:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, 1, px=self._ttl_ms)
+            await pipe.execute()
+
+    async def is_pinned(
+        self, *, user_id: UserId | None = None, room_id: RoomId | None = None
+    ) -> bool:
+        keys = self._keys(
+            [user_id] if user_id is not None else [], [room_id] if room_id is not None else []
+        )
+        if not keys:
+            return False
+        return await self._client.exists(*keys) > 0
+
+
+def get_read_pins(settings: SettingsDep, redis_client: RedisClientDep) -> ReadPins | None:
+    # replica가 없으면 모든 조회가 primary로 가므로 pin할 필요가 없다.
+    if settings.database_read_url is None or settings.db_read_pin_seconds <= 0:
+        return None
+    return ReadPins(redis_client, ttl_seconds=settings.db_read_pin_seconds)
+
+
+ReadPinsDep = Annotated[ReadPins | None, Depends(get_read_pins)]
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.domain.types import AuthUser
+from app.infra.redis.client import get_redis_client
+from app.schemas.common.ids import CaseId, RoomId, UserId
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RequestContext:
+    """인증된 요청의 (user, active room, running case). room/case가 없으면 None."""
+
+    user: AuthUser
+    room_id: RoomId | None
+    case_id: CaseId | None
+
+
+@dataclass(frozen=True)
+class RequestContextCacheStats:
+    hits: int
+    redis_hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+
+class RequestContextCache:
+    """user_id -> RequestContext 캐시. (CurrentUser/CurrentRoomId/CurrentCase가 같이 쓴다)
+
+    - 1차: 프로세스 내 LRU (local_ttl_seconds, 0이면 사용 안 함), 2차: Redis (ttl_seconds)
+    - 무효화는 상태를 바꾸는 쪽이 commit 후 invalidate()로 한다.
+      - RoomService: join/leave/kick/presence 만료 -> 해당 user
+      - CaseService.start_case -> case의 모든 player
+      (case를 끝내는 경로가 생기면 그 쪽도 player를 invalidate해야 한다)
+    - Redis 값에는 무효화 세대(gen)를 같이 적는다. invalidate는 세대를 올리므로, 무효화 전에
+      DB를 읽기 시작한 요청이 늦게 채운 값은 다음 조회에서 버려진다.
+    - 다른 worker의 무효화는 그 worker의 1차 캐시에 local_ttl_seconds까지 늦게 반영된다.
+    - Redis 오류는 캐시 miss로 취급한다. (DB가 원본이므로)
+
+    keys
+    - req_ctx:{user_id}: {"g": gen, "n": username, "r": room_id, "c": case_id}, EX ttl
+    - req_ctx_gen:{user_id}: 무효화 세대 (INCR), EX ttl
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None,
+        *,
+        ttl_seconds: int = 60,
+        local_ttl_seconds: float = 1.0,
+        local_max_entries: int = 10_000,
+    ) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._local_ttl_seconds = local_ttl_seconds
+        self._local_max_entries = local_max_entries
+        self._local: OrderedDict[UserId, tuple[float, RequestContext]] = OrderedDict()
+        # 이 프로세스에서 invalidate가 불린 횟수. 조회 도중 바뀌면 1차 캐시에 넣지 않는다.
+        self._epoch = 0
+
+        self._hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> RequestContextCacheStats:
+        return RequestContextCacheStats(
+            hits=self._hits,
+            redis_hits=self._redis_hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            size=len(self._local),
+        )
+
+    @staticmethod
+    def _key(user_id: UserId) -> str:
+        return f"req_ctx:{user_id}"
+
+    @staticmethod
+    def _gen_key(user_id: UserId) -> str:
+        return f"req_ctx_gen:{user_id}"
+
+    @staticmethod
+    def _encode(ctx: RequestContext, gen: int) -> str:
+        return json.dumps(
+            {
+                "g": gen,
+                "n": ctx.user.username,
+                "r": str(ctx.room_id) if ctx.room_id is not None else None,
+                "c": str(ctx.case_id) if ctx.case_id is not None else None,
+            }
+        )
+
+    @staticmethod
+    def _decode(user_id: UserId, raw: str | bytes, gen: int) -> RequestContext | None:
+        data = json.loads(raw)
+        if data["g"] != gen:
+            return None
+        return RequestContext(
+            user=AuthUser(id=user_id, username=data["n"]),
+            room_id=UUID(data["r"]) if data["r"] is not None else None,
+            case_id=UUID(data["c"]) if data["c"] is not None else None,
+        )
+
+    def _get_local(self, user_id: UserId) -> RequestContext | None:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+        expires_at, ctx = entry
+        if expires_at <= time.monotonic():
+            del self._local[user_id]
+            return None
+        self._local.move_to_end(user_id)
+        return ctx
+
+    def _put_local(self, user_id: UserId, ctx: RequestContext, epoch: int) -> None:
+        if self._local_ttl_seconds <= 0 or epoch != self._epoch:
+            return
+        self._local[user_id] = (time.monotonic() + self._local_ttl_seconds, ctx)
+        self._local.move_to_end(user_id)
+        while len(self._local) > self._local_max_entries:
+            self._local.popitem(last=False)
+
+    async def get_or_load(
+        self, user_id: UserId, load: Callable[[], Awaitable[RequestContext]]
+    ) -> RequestContext:
+        ctx = self._get_local(user_id)
+        if ctx is not None:
+            self._hits += 1
+            return ctx
+
+        epoch = self._epoch
+        gen: int | None = None
+        if self._redis is not None:
+            try:
+                raw, raw_gen = await self._redis.mget([self._key(user_id), self._gen_key(user_id)])
+                gen = int(raw_gen or 0)
+                ctx = self._decode(user_id, raw, gen) if raw is not None else None
+            except Exception:
+                logger.warning("Failed to read request context from redis", exc_info=True)
+                gen = None
+            if ctx is not None:
+                self._redis_hits += 1
+                self._put_local(user_id, ctx, epoch)
+                return ctx
+
+        self._misses += 1
+        ctx = await load()
+        self._put_local(user_id, ctx, epoch)
+        # gen을 읽지 못했으면 이번 값이 최신인지 알 수 없으므로 Redis에 쓰지 않는다.
+        if self._redis is not None and gen is not None:
+            try:
+                await self._redis.set(
+                    self._key(user_id), self._encode(ctx, gen), ex=self._ttl_seconds
+                )
+            except Exception:
+                logger.warning("Failed to write request context to redis", exc_info=True)
+        return ctx
+
+    async def invalidate(self, user_ids: Iterable[UserId]) -> None:
+        """commit 후 호출한다. user들의 캐시된 context를 버린다."""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        self._epoch += 1
+        self._invalidations += len(user_ids)
+        for user_id in user_ids:
+            self._local.pop(user_id, None)
+        if self._redis is None:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    pipe.incr(self._gen_key(user_id))
+                    pipe.expire(self._gen_key(user_id), self._ttl_seconds)
+                    pipe.delete(self._key(user_id))
+                await pipe.execute()
+        except Exception:
+            logger.warning("Failed to invalidate request context in redis", exc_info=True)
+
+
+@lru_cache
+def get_request_context_cache() -> RequestContextCache:
+    settings = get_settings()
+    if settings.request_context_cache_ttl_seconds <= 0:
+        # Redis도 1차 캐시도 없으면 매번 DB에서 읽는다.
+        return RequestContextCache(None, local_ttl_seconds=0)
+    return RequestContextCache(
+        get_redis_client(),
+        ttl_seconds=settings.request_context_cache_ttl_seconds,
+        local_ttl_seconds=settings.request_context_local_ttl_seconds,
+        local_max_entries=settings.request_context_local_max_entries,
+    )
+
+
+RequestContextCacheDep = Annotated[RequestContextCache, Depends(get_request_context_cache)]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Annotated, Any, AsyncIterator
+
+from fastapi import Depends
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from app.core.config import get_settings
+from app.infra.pubsub.topics import Topic, TopicNamespace
+from app.infra.pubsub.transport.base import LogPubSub
+from app.infra.redis.client import RedisBinaryClientDep, get_redis_namespace_clients
+from app.infra.redis.pubsub import RedisTopicRouter, topic_to_channel
+from app.infra.serialization.codec import Payload
+
+_DATA_FIELD = "data"
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode()
+    assert isinstance(value, str)
+    return value
+
+
+def _to_entries(raw: list[Any]) -> list[tuple[str, Payload]]:
+    entries: list[tuple[str, Payload]] = []
+    for entry_id, fields in raw:
+        data = fields.get(_DATA_FIELD, fields.get(_DATA_FIELD.encode()))
+        # payload는 codec이 decode하므로 그대로 둔다. (id만 문자열로)
+        entries.append((_to_str(entry_id), data))
+    return entries
+
+
+class RedisStreamPubSub(LogPubSub):
+    """Redis Streams 기반 PubSub.
+
+    - topic당 stream 하나: XADD(MAXLEN ~ maxlen)로 bounded log를 유지한다.
+    - subscribe는 구독 시점의 마지막 id부터 XREAD BLOCK으로 이어 읽는다.
+      (매번 "$"로 읽으면 XREAD 사이에 들어온 entry를 놓치므로 id를 직접 들고 간다.)
+    - read_recent: XREVRANGE로 최근 entry를 읽는다. 재연결한 room stream이 놓친 delta를
+      version으로 찾아 이어받는다. (RoomEventBus.read_missed)
+    - publish마다 key에 EXPIRE(ttl_seconds)를 다시 건다. 끝난 room/case/user topic의 stream은
+      마지막 publish 후 ttl이 지나면 지워진다. (0이면 만료 없음, MAXLEN으로만 자른다)
+    - routes로 topic namespace별 client를 나눌 수 있다. (stream key는 cluster에서 원래
+      slot 단위로 나뉘므로 sharded 설정은 쓰지 않는다)
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        maxlen: int = 10_000,
+        ttl_seconds: int = 3600,
+        block_ms: int = 5_000,
+        read_count: int = 100,
+        routes: Mapping[TopicNamespace, Redis] | None = None,
+    ):
+        self._router = RedisTopicRouter(client, routes=routes)
+        self._maxlen = maxlen
+        self._ttl_seconds = ttl_seconds
+        self._block_ms = block_ms
+        self._read_count = read_count
+
+    def _topic_to_key(self, topic: Topic) -> str:
+        return f"stream:{topic_to_channel(topic)}"
+
+    def _append(self, pipe: Pipeline, topic: Topic, message: Payload) -> None:
+        key = self._topic_to_key(topic)
+        pipe.xadd(key, {_DATA_FIELD: message}, maxlen=self._maxlen, approximate=True)
+        if self._ttl_seconds > 0:
+            pipe.expire(key, self._ttl_seconds)
+
+    async def publish(self, topic: Topic, message: Payload) -> int:
+        """XADD(+EXPIRE) 후 1을 반환한다. (stream은 수신자 수를 알 수 없음)"""
+        pipe = self._router.client_for(topic).pipeline(transaction=False)
+        self._append(pipe, topic, message)
+        await pipe.execute()
+        return 1
+
+    async def publish_many(self, messages: Sequence[tuple[Topic, Payload]]) -> None:
+        """client별로 XADD를 pipeline 하나로 묶어 보낸다. (client당 왕복 1회, topic별 순서 유지)"""
+        pipes: dict[int, Pipeline] = {}
+        for topic, message in messages:
+            client = self._router.client_for(topic)
+            pipe = pipes.get(id(client))
+            if pipe is None:
+                pipe = pipes[id(client)] = client.pipeline(transaction=False)
+            self._append(pipe, topic, message)
+        await asyncio.gather(*(pipe.execute() for pipe in pipes.values()))
+
+    async def last_id(self, topic: Topic) -> str | None:
+        """topic log의 마지막 entry id. (비어 있으면 None)"""
+        raw = await self._router.client_for(topic).xrevrange(self._topic_to_key(topic), count=1)
+        return _to_entries(raw)[0][0] if raw else None
+
+    async def read_recent(self, topic: Topic, count: int) -> list[Payload]:
+        raw = await self._router.client_for(topic).xrevrange(self._topic_to_key(topic), count=count)
+        return [message for _id, message in reversed(_to_entries(raw))]
+
+    def subscribe(self, topic: Topic) -> AsyncIterator[Payload]:
+        async def _gen() -> AsyncIterator[Payload]:
+            client = self._router.client_for(topic)
+            key = self._topic_to_key(topic)
+            last_id = await self.last_id(topic) or "0-0"
+            while True:
+                resp = await client.xread(
+                    {key: last_id}, count=self._read_count, block=self._block_ms
+                )
+                # block 시간 안에 entry가 없으면 빈 응답 -> 같은 id로 다시 읽는다.
+                for _key, raw in resp or []:
+                    for last_id, message in _to_entries(raw):
+                        yield message
+
+        return _gen()
+
+
+@lru_cache
+def _get_shared_redis_stream_pubsub(redis_client: Redis) -> RedisStreamPubSub:
+    settings = get_settings()
+    return RedisStreamPubSub(
+        redis_client,
+        maxlen=settings.pubsub_stream_maxlen,
+        ttl_seconds=settings.pubsub_stream_ttl_seconds,
+        block_ms=settings.pubsub_stream_block_ms,
+        routes=get_redis_namespace_clients(),
+    )
+
+
+def get_redis_stream_pubsub(redis_client: RedisBinaryClientDep) -> RedisStreamPubSub:
+    """client당 RedisStreamPubSub 하나를 공유한다. (get_redis_pubsub와 같은 이유)"""
+    return _get_shared_redis_stream_pubsub(redis_client)
+
+
+RedisStreamPubSubDep = Annotated[RedisStreamPubSub, Depends(get_redis_stream_pubsub)]
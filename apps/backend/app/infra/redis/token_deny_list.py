@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+from typing import Annotated
+
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from app.core.config import SettingsDep
+from app.infra.redis.client import RedisClientDep
+
+
+class TokenDenyList:
+    """폐기된 token의 jti. (Redis TTL key, 확인은 EXISTS 한 번)
+
+    stateless access token은 users를 조회하지 않고 exp까지 믿으므로, 그 전에 무효로 만들
+    token은 여기에 넣는다. key는 token이 어차피 만료되는 시각까지만 남긴다.
+
+    keys
+    - auth_deny:{jti}: "1", EXAT exp
+    """
+
+    def __init__(self, client: Redis) -> None:
+        self._client = client
+
+    @staticmethod
+    def _key(jti: str) -> str:
+        return f"auth_deny:{jti}"
+
+    async def deny(self, jti: str, *, expires_at: int) -> None:
+        if expires_at <= time.time():
+            return
+        await self._client.set(self._key(jti), 1, exat=expires_at)
+
+    async def is_denied(self, jti: str) -> bool:
+        return await self._client.exists(self._key(jti)) > 0
+
+
+def get_token_deny_list(
+    settings: SettingsDep, redis_client: RedisClientDep
+) -> TokenDenyList | None:
+    # stateless access token을 쓰지 않으면 폐기할 token도 없다. (매 요청 users를 조회)
+    if not settings.jwt_stateless_access:
+        return None
+    return TokenDenyList(redis_client)
+
+
+TokenDenyListDep = Annotated[TokenDenyList | None, Depends(get_token_deny_list)]
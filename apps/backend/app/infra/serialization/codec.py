@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, Literal
+
+import pydantic_core
+from fastapi import Depends
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+
+type CodecName = Literal["json", "orjson", "msgpack"]
+type Payload = bytes | str
+
+
+class Codec(ABC):
+    """payload <-> bytes 직렬화.
+
+    - bus(pubsub payload)와 SSE frame builder가 모두 이 인터페이스로 인코딩한다.
+    - text: 출력이 UTF-8 JSON인지. SSE data 줄에는 text codec만 쓸 수 있다.
+    - model 인코딩은 기본적으로 model_dump(mode="json") 후 dumps.
+      pydantic 직렬화기를 바로 쓸 수 있는 codec은 중간 dict 없이 인코딩하도록 override 한다.
+    """
+
+    name: ClassVar[str]
+    text: ClassVar[bool] = True
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: Payload) -> Any:
+        raise NotImplementedError
+
+    def encode_model(self, model: BaseModel, *, exclude: set[str] | None = None) -> bytes:
+        return self.dumps(model.model_dump(mode="json", exclude=exclude))
+
+    def decode_model[M: BaseModel](self, model_type: type[M], data: Payload) -> M:
+        return model_type.model_validate(self.loads(data))
+
+
+class JsonCodec(Codec):
+    """pydantic-core(Rust) JSON. 추가 의존성 없는 기본값.
+
+    model은 dict를 거치지 않고 바로 bytes로, 읽을 때도 model_validate_json으로 한 번에 만든다.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return pydantic_core.to_json(obj)
+
+    def loads(self, data: Payload) -> Any:
+        return pydantic_core.from_json(data)
+
+    def encode_model(self, model: BaseModel, *, exclude: set[str] | None = None) -> bytes:
+        return model.__pydantic_serializer__.to_json(model, exclude=exclude)
+
+    def decode_model[M: BaseModel](self, model_type: type[M], data: Payload) -> M:
+        return model_type.model_validate_json(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson (선택 의존성)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._orjson = _import_optional("orjson", self.name)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Payload) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """msgpack (선택 의존성). 바이너리라서 Redis 구간(pubsub payload) 전용이다."""
+
+    name = "msgpack"
+    text = False
+
+    def __init__(self) -> None:
+        self._msgpack = _import_optional("msgpack", self.name)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: Payload) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        return self._msgpack.unpackb(data, raw=False)
+
+
+def _import_optional(module: str, codec_name: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise RuntimeError(
+            f"codec {codec_name!r} requires the {module!r} package to be installed"
+        ) from e
+
+
+_CODECS: dict[str, type[Codec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+@lru_cache
+def get_codec(name: CodecName) -> Codec:
+    """이름으로 codec을 고른다. 선택 의존성이 없으면 RuntimeError."""
+    try:
+        codec_cls = _CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec: {name!r}") from None
+    return codec_cls()
+
+
+JSON_CODEC: Codec = get_codec("json")
+
+
+@lru_cache
+def get_pubsub_codec() -> Codec:
+    return get_codec(get_settings().pubsub_codec)
+
+
+PubSubCodecDep = Annotated[Codec, Depends(get_pubsub_codec)]
+
+
+@lru_cache
+def get_sse_codec() -> Codec:
+    return get_codec(get_settings().sse_codec)
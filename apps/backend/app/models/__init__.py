@@ -1,4 +1,5 @@
 from .auth import User  # noqa: F401
 from .case import Case, CaseAction, CasePlayer, Phase, VotePhaseState  # noqa: F401
 from .case_snapshot import CaseSnapshotHistory  # noqa: F401
+from .outbox import EventOutbox  # noqa: F401
 from .room import Room, RoomMember  # noqa: F401
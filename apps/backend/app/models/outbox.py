@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class EventOutbox(Base):
+    """
+    Event outbox ORM 모델
+
+    - mutation과 같은 트랜잭션에서 publish할 event delta를 기록한다.
+    - relay가 id 순서대로 읽어 pubsub으로 보내고 delivered_at을 채운다.
+      (id는 commit 순서가 아니므로 publish 순서를 보장하지는 않는다)
+    - 전달된 row는 outbox_retention_seconds가 지나면 relay가 지운다.
+    """
+
+    __tablename__ = "event_outbox"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    # "room" | "case" | "user"
+    topic_kind: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+    )
+
+    topic_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False,
+    )
+
+    # 직렬화된 event (RoomEventDelta / CaseEventDelta / UserEvent)
+    payload: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"),
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    delivered_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "topic_kind IN ('room', 'case', 'user')", name="ck_event_outbox_topic_kind"
+        ),
+        # relay는 미전달 row만 id 순으로 읽는다.
+        Index(
+            "ix_event_outbox_pending",
+            "id",
+            postgresql_where=delivered_at.is_(None),
+            sqlite_where=delivered_at.is_(None),
+        ),
+    )
@@ -29,12 +29,26 @@ async def ensure_singleton_room(db: AsyncSession) -> None:
 SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
 
-def create_mvp_lifespan(session_factory: SessionFactory):
+def create_mvp_lifespan(session_factory: SessionFactory, *, drain_outbox: bool = False):
+    """drain_outbox: 시작 시 relay를 띄워 재기동 전에 남은 outbox row를 보낸다.
+
+    (settings/Redis를 dependency override 없이 직접 읽으므로 테스트 app에서는 끈다)
+    """
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        # outbox_relay가 이 모듈을 import하므로 여기서 import한다.
+        from app.services.outbox_relay import close_outbox_relays, start_outbox_relay
+        from app.services.presence_sweeper import close_presence_sweepers
+
         async with session_factory() as db:
             await ensure_singleton_room(db)
+        if drain_outbox:
+            start_outbox_relay(session_factory)  # type: ignore[arg-type]
         yield
+        # sweeper가 relay를 깨우므로 sweeper를 먼저 멈춘다.
+        await close_presence_sweepers()
+        await close_outbox_relays()
 
     return lifespan
 
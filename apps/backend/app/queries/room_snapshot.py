@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.error_codes import NotFoundErrorCode
 from app.core.exceptions import raise_not_found
+from app.domain.enum import CaseStatus
 from app.domain.events.room import RoomSnapshotType
+from app.infra.redis.presence import RoomPresence
+from app.models.auth import User
+from app.models.case import Case
+from app.models.room import Room
+from app.models.room import RoomMember as RoomMemberModel
 from app.repositories.case import CaseRepo
+from app.repositories.projections import SnapshotRoomMember
 from app.repositories.room import RoomRepo
 from app.repositories.room_member import RoomMemberRepo
 from app.schemas.room.state import (
@@ -17,6 +29,46 @@ from app.schemas.room.state import (
 )
 
 
+def _to_room_snapshot(
+    *,
+    room_id: UUID,
+    room_name: str,
+    host_id: UUID | None,
+    created_at: datetime,
+    members_rows: Sequence[SnapshotRoomMember],
+    online: set[UUID] | None,
+    running_case: RoomCaseInfo | None,
+    last_event: RoomSnapshotType,
+    logs: list[str],
+) -> RoomSnapshot:
+    members = [
+        RoomMember(
+            user_id=m.user_id,
+            username=m.username,
+            joined_at=m.joined_at.isoformat(),
+            online=None if online is None else m.user_id in online,
+        )
+        for m in members_rows
+    ]
+
+    # MVP: settings는 MVP에선 상수(또는 config에서 로드)
+    settings = RoomSettings()
+
+    return RoomSnapshot(
+        room=RoomInfo(
+            id=room_id,
+            room_name=room_name,
+            host_user_id=host_id,
+            created_at=created_at.isoformat(),
+        ),
+        settings=settings,
+        current_case=running_case,
+        members=members,
+        last_event=last_event,
+        logs=logs,
+    )
+
+
 class RoomSnapshotQuery:
     def __init__(
         self,
@@ -24,10 +76,12 @@ class RoomSnapshotQuery:
         room_repo: RoomRepo,
         room_member_repo: RoomMemberRepo,
         case_repo: CaseRepo,
+        presence: RoomPresence | None = None,
     ) -> None:
         self._room_repo = room_repo
         self._room_member_repo = room_member_repo
         self._case_repo = case_repo
+        self._presence = presence
 
     async def build_snapshot(
         self,
@@ -41,14 +95,9 @@ class RoomSnapshotQuery:
             raise_not_found(code=NotFoundErrorCode.NOT_FOUND_ROOM)
 
         members_rows = await self._room_member_repo.get_active_members_by_room_id(room_id=room_id)
-        members = [
-            RoomMember(
-                user_id=m.user_id,
-                username=m.username,
-                joined_at=m.joined_at.isoformat(),
-            )
-            for m in members_rows
-        ]
+        online = None
+        if self._presence is not None:
+            online = await self._presence.online(room_id, [m.user_id for m in members_rows])
 
         running_case = await self._case_repo.get_running_by_room_id(room_id=room_id)
         current_case = None
@@ -58,19 +107,95 @@ class RoomSnapshotQuery:
                 status=running_case.status,
             )
 
-        # MVP: settings는 MVP에선 상수(또는 config에서 로드)
-        settings = RoomSettings()
-
-        return RoomSnapshot(
-            room=RoomInfo(
-                id=room.id,
-                room_name=room.name,
-                host_user_id=room.host_id,
-                created_at=room.created_at.isoformat(),
-            ),
-            settings=settings,
-            current_case=current_case,
-            members=members,
+        return _to_room_snapshot(
+            room_id=room.id,
+            room_name=room.name,
+            host_id=room.host_id,
+            created_at=room.created_at,
+            members_rows=members_rows,
+            online=online,
+            running_case=current_case,
+            last_event=last_event,
+            logs=logs,
+        )
+
+
+class RoomSnapshotReadModel:
+    """RoomSnapshotQuery와 같은 snapshot을 쿼리 한 번(DB 왕복 1회)으로 만든다.
+
+    room 이벤트마다 구독자별로 불리는 경로(stream, outbox relay)용.
+    room에 활성 멤버와 RUNNING case를 LEFT JOIN해서 멤버 한 명당 한 row를 받는다.
+    (멤버가 없으면 멤버 컬럼이 NULL인 row 하나. room 컬럼은 row마다 반복되지만 방 인원이 작다)
+    Postgres 전용 문법(LATERAL, json_agg)은 쓰지 않아 SQLite 테스트에서도 같은 쿼리가 돈다.
+    """
+
+    def __init__(self, db: AsyncSession, *, presence: RoomPresence | None = None) -> None:
+        self._db = db
+        self._presence = presence
+
+    @staticmethod
+    def _statement(room_id: UUID) -> Select:
+        running_case = (
+            select(Case.id, Case.room_id, Case.status)
+            .where(Case.status == CaseStatus.RUNNING)
+            .subquery("running_case")
+        )
+        return (
+            select(
+                Room.id.label("room_id"),
+                Room.name.label("room_name"),
+                Room.host_id,
+                Room.created_at,
+                RoomMemberModel.user_id,
+                User.username,
+                RoomMemberModel.joined_at,
+                running_case.c.id.label("case_id"),
+                running_case.c.status.label("case_status"),
+            )
+            .select_from(Room)
+            .outerjoin(
+                RoomMemberModel,
+                and_(RoomMemberModel.room_id == Room.id, RoomMemberModel.left_at.is_(None)),
+            )
+            .outerjoin(User, User.id == RoomMemberModel.user_id)
+            .outerjoin(running_case, running_case.c.room_id == Room.id)
+            .where(Room.id == room_id)
+            .order_by(RoomMemberModel.joined_at.asc(), RoomMemberModel.user_id.asc())
+        )
+
+    async def build_snapshot(
+        self,
+        *,
+        room_id: UUID,
+        last_event: RoomSnapshotType,
+        logs: list[str],
+    ) -> RoomSnapshot:
+        rows = (await self._db.execute(self._statement(room_id))).all()
+        if not rows:
+            raise_not_found(code=NotFoundErrorCode.NOT_FOUND_ROOM)
+
+        first = rows[0]
+        members_rows = [
+            SnapshotRoomMember(row.user_id, row.username, row.joined_at)
+            for row in rows
+            if row.user_id is not None
+        ]
+        online = None
+        if self._presence is not None:
+            online = await self._presence.online(room_id, [m.user_id for m in members_rows])
+
+        running_case = None
+        if first.case_id is not None:
+            running_case = RoomCaseInfo(case_id=first.case_id, status=first.case_status)
+
+        return _to_room_snapshot(
+            room_id=first.room_id,
+            room_name=first.room_name,
+            host_id=first.host_id,
+            created_at=first.created_at,
+            members_rows=members_rows,
+            online=online,
+            running_case=running_case,
             last_event=last_event,
             logs=logs,
         )
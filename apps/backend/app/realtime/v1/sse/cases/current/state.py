@@ -1,10 +1,11 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from app.core.deps.require_in_case import CurrentCase
+from fastapi import APIRouter, Header, Request
+
+from app.core.deps.stream import StreamCase, StreamUser
 from app.realtime_.sse.stream import sse_stream_response
-from app.realtime_.streams.deps import CaseStateStreamDep
-from app.repositories.deps import CaseHistoryRepoDep
-from app.schemas.case.sse_response import CaseNotCreatedEnvelope
+from app.realtime_.streams.deps import CaseHistoryReaderDep, CaseStateStreamDep
+from app.schemas.case.sse_response import CaseFrameEncoding, CaseNotCreatedEnvelope
 from app.schemas.sse.response import CaseRESTRespType
 
 router = APIRouter()
@@ -12,10 +13,14 @@ router = APIRouter()
 
 @router.get("/state")
 async def case_state_sse(
-    case: CurrentCase,
-    case_history_repo: CaseHistoryRepoDep,
+    request: Request,
+    user: StreamUser,
+    case: StreamCase,
+    case_history: CaseHistoryReaderDep,
     case_state_stream: CaseStateStreamDep,
     after_snapshot_no: int | None = None,
+    encoding: CaseFrameEncoding = CaseFrameEncoding.FULL,
+    last_event_id: Annotated[str | None, Header()] = None,
 ):
     """GET /rt/v1/sse/cases/current/state?after_snapshot_no=...
 
@@ -27,16 +32,31 @@ async def case_state_sse(
     - event: CASE_EVENT
     - id: 1부터 단조증가
     - data: RoomStateResponse(JSON)
+    - 연결 시작 시 `retry:` 힌트, frame이 없는 동안에는 주기적으로 `: ping` comment
+
+    Encoding (?encoding=full|patch)
+    - full: 매 frame이 전체 snapshot (CASE_EVENT)
+    - patch: client가 가진 직전 snapshot 대비 RFC 6902 patch (CASE_PATCH, data.ops)
+      - 첫 frame(after_snapshot_no/Last-Event-ID가 없을 때), gap, keyframe 주기에는 CASE_EVENT
+
+    Resume
+    - EventSource 재연결 시 Last-Event-ID(= snapshot_no)를 after_snapshot_no로 쓴다.
+      (query param이 있으면 그쪽이 우선)
 
     Response (REST)
     - 403: PERMISSION_DENIED_NOT_IN_ROOM
     """
-    latest = await case_history_repo.get_latest_by_case_id(case_id=case.id)
+    if after_snapshot_no is None and last_event_id is not None and last_event_id.isdigit():
+        after_snapshot_no = int(last_event_id)
+
+    latest_snapshot_no = await case_history.get_latest_snapshot_no(
+        case_id=case.id, at_least=after_snapshot_no
+    )
 
     if (
         after_snapshot_no is not None
-        and latest is not None
-        and after_snapshot_no > latest.snapshot_no
+        and latest_snapshot_no is not None
+        and after_snapshot_no > latest_snapshot_no
     ):
         return CaseNotCreatedEnvelope(
             ok=True,
@@ -45,10 +65,16 @@ async def case_state_sse(
             data=None,
             meta={
                 "after_snapshot_no": after_snapshot_no,
-                "latest_snapshot_no": latest.snapshot_no,
+                "latest_snapshot_no": latest_snapshot_no,
             },
         )
 
-    stream = case_state_stream.stream(case_id=case.id, after_snapshot_no=after_snapshot_no)
+    stream = case_state_stream.stream(
+        case_id=case.id,
+        after_snapshot_no=after_snapshot_no,
+        encoding=encoding,
+        user_id=user.id,
+        room_id=case.room_id,
+    )
 
-    return sse_stream_response(stream)
+    return sse_stream_response(stream, request=request)
@@ -1,11 +1,9 @@
-from datetime import datetime, timezone
-
 from fastapi import APIRouter
 
 from app.core.security.auth import CurrentUser
-from app.domain.events.room import RoomEventDelta, RoomSnapshotType
-from app.infra.pubsub.bus.deps import RoomEventBusDep
-from app.infra.pubsub.topics import RoomTopic
+from app.domain.events.user import UserEvent, UserEventType
+from app.infra.pubsub.bus.deps import UserEventBusDep
+from app.infra.pubsub.topics import UserTopic
 from app.mvp import MVP_ROOM_ID
 from app.schemas.room.sse_response import RoomStateEnvelope
 from app.schemas.sse.response import SSEEnvelopeCode
@@ -15,12 +13,11 @@ router = APIRouter()
 
 @router.post("/close")
 async def close_room_state_stream(
-    user: CurrentUser, room_state_bus: RoomEventBusDep
+    user: CurrentUser, user_event_bus: UserEventBusDep
 ) -> RoomStateEnvelope:
 
     room_id = MVP_ROOM_ID
 
-    # room:{room_id} 채널로 "닫아라" 이벤트 publish
     event_resp = RoomStateEnvelope(
         ok=True,
         code=SSEEnvelopeCode.ROOM_STATE,
@@ -28,9 +25,7 @@ async def close_room_state_stream(
         data=None,  # 굳이 snapshot 필요 없음
     )
 
-    event_msg = RoomEventDelta(
-        type=RoomSnapshotType.STREAM_CLOSE, user_id=user.id, ts=datetime.now(timezone.utc)
-    )
-    room_topic = RoomTopic(room_id)
-    await room_state_bus.publish(room_topic, event_msg)
+    # user:{user_id} 채널로 "닫아라" 이벤트 publish (이 user의 room stream만 닫힌다)
+    event_msg = UserEvent(type=UserEventType.STREAM_CLOSE, user_id=user.id, room_id=room_id)  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
+    await user_event_bus.publish(UserTopic(user.id), event_msg)
     return event_resp
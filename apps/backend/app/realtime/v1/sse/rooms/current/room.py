@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Annotated
 
-from app.core.deps.require_in_room import CurrentRoomId
-from app.core.security.auth import CurrentUser
+from fastapi import APIRouter, Header, Request
+
+from app.core.deps.stream import StreamRoomId, StreamUser
 from app.realtime_.sse.stream import sse_stream_response
 from app.realtime_.streams.deps import RoomStateStreamDep
 
@@ -12,7 +13,11 @@ router = APIRouter()
 
 @router.get("/state")
 async def room_state_sse(
-    user: CurrentUser, room_id: CurrentRoomId, room_state_stream: RoomStateStreamDep
+    request: Request,
+    user: StreamUser,
+    room_id: StreamRoomId,
+    room_state_stream: RoomStateStreamDep,
+    last_event_id: Annotated[str | None, Header()] = None,
 ):
     """GET /rt/v1/sse/rooms/current/state
 
@@ -22,11 +27,16 @@ async def room_state_sse(
 
     Response (SSE)
     - event: ROOM_EVENT
-    - id: 단조증가(연결 단위, MVP에서 1로 고정)
+    - id: room event version (room 단위 단조증가)
     - data: RoomStateResponse(JSON)
+    - 연결 시작 시 `retry:` 힌트, frame이 없는 동안에는 주기적으로 `: ping` comment
+
+    Resume
+    - Last-Event-ID가 현재 version과 같으면 ON_CONNECT 없이 이후 event부터 보낸다.
+    - 뒤처져 있으면 현재 snapshot 1회(ON_CONNECT)로 따라잡는다. (room frame은 전체 snapshot)
 
     Response (REST)
     - 403: PERMISSION_DENIED_NOT_IN_ROOM
     """
-    stream = room_state_stream.stream(user.id, room_id)
-    return sse_stream_response(stream)
+    stream = room_state_stream.stream(user.id, room_id, last_event_id=last_event_id)
+    return sse_stream_response(stream, request=request)
@@ -1,3 +1,73 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, WebSocket
+
+from app.core.deps.stream import StreamRoomId, StreamUser
+from app.infra.db.session import RealtimeReadSessionsDep, RealtimeSessionFactoryDep
+from app.infra.pubsub.bus.deps import CaseEventBusDep, RoomEventBusDep, UserEventBusDep
+from app.infra.redis.presence import RoomPresenceDep
+from app.realtime_.connections import ConnectionRegistryDep
+from app.realtime_.sse.case_frame_cache import CaseFrameCacheDep
+from app.realtime_.sse.case_patch import CasePatchFramesDep
+from app.realtime_.streams.buffer import StreamBufferConfigDep
+from app.realtime_.streams.deps import RoomStateBroadcasterDep
+from app.realtime_.ws.gateway import RealtimeGateway
+from app.services.presence_sweeper import PresenceSweeperDep
 
 router = APIRouter(prefix="/ws", tags=["ws"])
+
+
+@router.websocket("")
+async def realtime_ws(
+    websocket: WebSocket,
+    user: StreamUser,
+    room_id: StreamRoomId,
+    room_event_bus: RoomEventBusDep,
+    case_event_bus: CaseEventBusDep,
+    room_state_broadcaster: RoomStateBroadcasterDep,
+    case_frame_cache: CaseFrameCacheDep,
+    buffer_config: StreamBufferConfigDep,
+    session_factory: RealtimeSessionFactoryDep,
+    read_sessions: RealtimeReadSessionsDep,
+    case_patch_frames: CasePatchFramesDep,
+    user_event_bus: UserEventBusDep,
+    connections: ConnectionRegistryDep,
+    presence: RoomPresenceDep,
+    presence_sweeper: PresenceSweeperDep,
+):
+    """WS /rt/v1/ws
+
+    - Auth: User (cookie)
+    - Permission: In Room
+
+    room state, case state stream과 case action을 한 연결에서 주고받는다.
+
+    Client -> Server (JSON text)
+    - {"type": "subscribe", "stream": "room" | "case", "last_event_id": str | null,
+       "encoding": "full" | "patch"}
+    - {"type": "unsubscribe", "stream": "room" | "case"}
+    - {"type": "action", "request_id": str,
+       "action": "red-vote" | "blue-vote" | "init-blue-vote" | "force-skip", "body": {...}}
+
+    Server -> Client (JSON text)
+    - {"type": "event", "stream", "event", "id", "data"}: SSE frame과 같은 event/id/data
+    - {"type": "action_result", "request_id", "data"}: REST action 응답과 같은 envelope
+    - {"type": "error", "request_id", "status", "data"}: error envelope
+    """
+    if presence_sweeper is not None:
+        presence_sweeper.start()
+    gateway = RealtimeGateway(
+        websocket=websocket,
+        user=user,
+        room_id=room_id,
+        room_event_bus=room_event_bus,
+        case_event_bus=case_event_bus,
+        room_state_broadcaster=room_state_broadcaster,
+        case_frame_cache=case_frame_cache,
+        buffer_config=buffer_config,
+        session_factory=session_factory,
+        read_sessions=read_sessions,
+        case_patch_frames=case_patch_frames,
+        user_event_bus=user_event_bus,
+        connections=connections,
+        presence=presence,
+    )
+    await gateway.run()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated
+from uuid import uuid4
+
+from fastapi import Depends
+
+from app.schemas.common.ids import ConnId, UserId
+
+
+@dataclass(frozen=True)
+class Connection:
+    """stream 하나(SSE 연결, WS 구독)의 식별자."""
+
+    conn_id: ConnId
+    user_id: UserId
+
+
+class ConnectionRegistry:
+    """프로세스 내 연결 <-> user 매핑.
+
+    - stream은 열릴 때 connect()로 등록하고, 닫힐 때 자동으로 빠진다.
+    - user event는 user 채널(UserTopic)로 한 번만 구독하고, conn_id로 대상 연결을 고른다.
+      (연결마다 upstream 구독을 두지 않는다)
+    """
+
+    def __init__(self) -> None:
+        self._by_user: dict[UserId, set[ConnId]] = {}
+        self._owners: dict[ConnId, UserId] = {}
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    @contextmanager
+    def connect(self, user_id: UserId) -> Iterator[Connection]:
+        connection = Connection(conn_id=uuid4().hex, user_id=user_id)
+        self._owners[connection.conn_id] = user_id
+        self._by_user.setdefault(user_id, set()).add(connection.conn_id)
+        try:
+            yield connection
+        finally:
+            self._owners.pop(connection.conn_id, None)
+            conn_ids = self._by_user.get(user_id)
+            if conn_ids is not None:
+                conn_ids.discard(connection.conn_id)
+                if not conn_ids:
+                    del self._by_user[user_id]
+
+    def connections_of(self, user_id: UserId) -> set[ConnId]:
+        return set(self._by_user.get(user_id, ()))
+
+    def owner_of(self, conn_id: ConnId) -> UserId | None:
+        return self._owners.get(conn_id)
+
+
+@lru_cache
+def get_connection_registry() -> ConnectionRegistry:
+    return ConnectionRegistry()
+
+
+ConnectionRegistryDep = Annotated[ConnectionRegistry, Depends(get_connection_registry)]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends
+from redis.asyncio.client import Redis
+
+from app.core.config import get_settings
+from app.infra.redis.client import get_redis_binary_client
+from app.realtime_.sse.frame import build_envelope_sse_frame
+from app.schemas.case.sse_response import CaseStateEnvelope
+from app.schemas.case.state import CaseSnapshot
+from app.schemas.common.ids import CaseId
+from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
+
+logger = logging.getLogger(__name__)
+
+
+def build_case_frame(snapshot: CaseSnapshot, snapshot_no: int) -> bytes:
+    """case snapshot 하나를 CASE_EVENT SSE frame으로 인코딩한다. (id = snapshot_no)"""
+    envelope = CaseStateEnvelope(
+        ok=True, code=SSEEnvelopeCode.CASE_STATE, message=None, data=snapshot
+    )
+    return build_envelope_sse_frame(event=SSEEventType.CASE_EVENT, data=envelope, id_=snapshot_no)
+
+
+@dataclass(frozen=True)
+class CaseFrameCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    redis_hits: int
+    size: int
+
+
+class CaseFrameCache:
+    """(case_id, snapshot_no) -> 인코딩된 SSE frame(bytes) 캐시.
+
+    - case snapshot은 한 번 기록되면 바뀌지 않으므로 무효화 없이 LRU로만 관리한다.
+    - 1차: 프로세스 내 LRU(max_entries), 2차(선택): Redis (TTL)
+    - CaseService가 history를 쓸 때, 그리고 reader가 처음 miss 났을 때 채운다.
+    - Redis 오류는 캐시 miss로 취급한다. (DB가 원본이므로)
+    - key_prefix로 같은 구조의 다른 frame(예: patch frame)을 따로 담을 수 있다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        redis: Redis | None = None,
+        redis_ttl_seconds: int = 3600,
+        key_prefix: str = "case_frame",
+    ) -> None:
+        self._max_entries = max_entries
+        self._redis = redis
+        self._redis_ttl_seconds = redis_ttl_seconds
+        self._key_prefix = key_prefix
+        self._frames: OrderedDict[tuple[CaseId, int], bytes] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._redis_hits = 0
+
+    @property
+    def stats(self) -> CaseFrameCacheStats:
+        return CaseFrameCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            redis_hits=self._redis_hits,
+            size=len(self._frames),
+        )
+
+    def _redis_key(self, case_id: CaseId, snapshot_no: int) -> str:
+        return f"{self._key_prefix}:{case_id}:{snapshot_no}"
+
+    def _get_local(self, case_id: CaseId, snapshot_no: int) -> bytes | None:
+        key = (case_id, snapshot_no)
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+        return frame
+
+    def _put_local(self, case_id: CaseId, snapshot_no: int, frame: bytes) -> None:
+        key = (case_id, snapshot_no)
+        self._frames[key] = frame
+        self._frames.move_to_end(key)
+        while len(self._frames) > self._max_entries:
+            self._frames.popitem(last=False)
+            self._evictions += 1
+
+    async def put(self, case_id: CaseId, snapshot_no: int, frame: bytes) -> None:
+        self._put_local(case_id, snapshot_no, frame)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                self._redis_key(case_id, snapshot_no), frame, ex=self._redis_ttl_seconds
+            )
+        except Exception:
+            logger.warning("Failed to write case frame to redis", exc_info=True)
+
+    async def get_range(self, case_id: CaseId, first_no: int, last_no: int) -> list[bytes] | None:
+        """first_no..last_no(포함) frame을 모두 찾으면 순서대로 반환, 하나라도 없으면 None."""
+        if first_no > last_no:
+            return []
+
+        frames: dict[int, bytes] = {}
+        missing: list[int] = []
+        for no in range(first_no, last_no + 1):
+            frame = self._get_local(case_id, no)
+            if frame is None:
+                missing.append(no)
+            else:
+                frames[no] = frame
+
+        if missing and self._redis is not None:
+            try:
+                values = await self._redis.mget([self._redis_key(case_id, no) for no in missing])
+            except Exception:
+                logger.warning("Failed to read case frames from redis", exc_info=True)
+                values = [None] * len(missing)
+            still_missing: list[int] = []
+            for no, value in zip(missing, values):
+                if value is None:
+                    still_missing.append(no)
+                    continue
+                if isinstance(value, str):  # decode_responses client
+                    value = value.encode()
+                self._redis_hits += 1
+                self._put_local(case_id, no, value)
+                frames[no] = value
+            missing = still_missing
+
+        if missing:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return [frames[no] for no in range(first_no, last_no + 1)]
+
+
+@lru_cache
+def get_case_frame_cache() -> CaseFrameCache:
+    settings = get_settings()
+    return CaseFrameCache(
+        max_entries=settings.case_frame_cache_max_entries,
+        redis=get_redis_binary_client() if settings.case_frame_cache_redis_enabled else None,
+        redis_ttl_seconds=settings.case_frame_cache_redis_ttl_seconds,
+    )
+
+
+CaseFrameCacheDep = Annotated[CaseFrameCache, Depends(get_case_frame_cache)]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Annotated, Any
+
+from fastapi import Depends
+
+from app.core.config import get_settings
+from app.infra.redis.client import get_redis_binary_client
+from app.realtime_.sse.case_frame_cache import CaseFrameCache
+from app.realtime_.sse.frame import build_envelope_sse_frame
+from app.schemas.case.sse_response import CasePatch, CasePatchEnvelope
+from app.schemas.case.state import CaseSnapshot
+from app.schemas.common.ids import CaseId
+from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """old -> new 로 가는 RFC 6902 patch(add/remove/replace)를 만든다.
+
+    - dict는 key 단위로 재귀
+    - list는 뒤에 추가만 된 경우(logs 등) "/-" add, 길이가 같으면 index 단위로 재귀,
+      그 외에는 통째로 replace
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list):
+        if len(new) > len(old) and new[: len(old)] == old:
+            return [{"op": "add", "path": f"{path}/-", "value": v} for v in new[len(old) :]]
+        if len(new) == len(old):
+            ops = []
+            for i, (a, b) in enumerate(zip(old, new)):
+                ops.extend(json_diff(a, b, f"{path}/{i}"))
+            return ops
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def build_case_patch_frame(
+    base: CaseSnapshot, base_no: int, target: CaseSnapshot, no: int
+) -> bytes:
+    """base_no -> no patch를 CASE_PATCH SSE frame으로 인코딩한다. (id = no)"""
+    ops = json_diff(base.model_dump(mode="json"), target.model_dump(mode="json"))
+    envelope = CasePatchEnvelope(
+        ok=True,
+        code=SSEEnvelopeCode.CASE_PATCH,
+        message=None,
+        data=CasePatch(base_snapshot_no=base_no, snapshot_no=no, ops=ops),
+    )
+    return build_envelope_sse_frame(event=SSEEventType.CASE_PATCH, data=envelope, id_=no)
+
+
+class CasePatchFrames:
+    """snapshot 전이(no-1 -> no)마다 patch frame을 한 번만 만들어 공유한다.
+
+    - 만든 frame은 CaseFrameCache(key_prefix="case_patch_frame")에 넣는다.
+    - 같은 전이를 여러 연결이 동시에 요청하면 하나의 build를 기다린다. (single-flight)
+    - keyframe_interval의 배수인 snapshot_no는 patch 대신 전체 snapshot을 보내게 한다.
+      (snapshot_no 기준이라 keyframe도 연결 간에 같은 frame cache를 쓴다)
+    """
+
+    def __init__(self, *, cache: CaseFrameCache, keyframe_interval: int) -> None:
+        self._cache = cache
+        self._keyframe_interval = keyframe_interval
+        self._inflight: dict[tuple[CaseId, int], asyncio.Task[bytes | None]] = {}
+
+    def is_keyframe(self, snapshot_no: int) -> bool:
+        return self._keyframe_interval > 0 and snapshot_no % self._keyframe_interval == 0
+
+    async def get(
+        self,
+        case_id: CaseId,
+        snapshot_no: int,
+        load_pair: Callable[[], Awaitable[tuple[CaseSnapshot, CaseSnapshot] | None]],
+    ) -> bytes | None:
+        """snapshot_no-1 -> snapshot_no patch frame. 두 snapshot을 못 읽으면 None."""
+        cached = await self._cache.get_range(case_id, snapshot_no, snapshot_no)
+        if cached is not None:
+            return cached[0]
+
+        key = (case_id, snapshot_no)
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._build(case_id, snapshot_no, load_pair))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _build(
+        self,
+        case_id: CaseId,
+        snapshot_no: int,
+        load_pair: Callable[[], Awaitable[tuple[CaseSnapshot, CaseSnapshot] | None]],
+    ) -> bytes | None:
+        pair = await load_pair()
+        if pair is None:
+            return None
+        base, target = pair
+        frame = build_case_patch_frame(base, snapshot_no - 1, target, snapshot_no)
+        await self._cache.put(case_id, snapshot_no, frame)
+        return frame
+
+
+@lru_cache
+def get_case_patch_frames() -> CasePatchFrames:
+    settings = get_settings()
+    cache = CaseFrameCache(
+        max_entries=settings.case_frame_cache_max_entries,
+        redis=get_redis_binary_client() if settings.case_frame_cache_redis_enabled else None,
+        redis_ttl_seconds=settings.case_frame_cache_redis_ttl_seconds,
+        key_prefix="case_patch_frame",
+    )
+    return CasePatchFrames(cache=cache, keyframe_interval=settings.case_patch_keyframe_interval)
+
+
+CasePatchFramesDep = Annotated[CasePatchFrames, Depends(get_case_patch_frames)]
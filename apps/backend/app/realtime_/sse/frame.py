@@ -1,27 +1,43 @@
-from app.schemas.case.sse_response import CaseStateEnvelope
+from app.infra.serialization.codec import Codec, get_sse_codec
+from app.schemas.case.sse_response import CasePatchEnvelope, CaseStateEnvelope
 from app.schemas.room.sse_response import RoomStateEnvelope
 from app.schemas.sse.response import SSEEventType
 
-type StateEnvelope = RoomStateEnvelope | CaseStateEnvelope
+type StateEnvelope = RoomStateEnvelope | CaseStateEnvelope | CasePatchEnvelope
 
 
-def build_sse_frame(*, event: SSEEventType, data: str, id_: int | None = None) -> str:
+def build_sse_frame(*, event: SSEEventType, data: bytes, id_: int | str | None = None) -> bytes:
     """SSE 프레임을 생성합니다.
 
-    - data는 한 줄 JSON으로 넣습니다(줄바꿈이 있으면 data:가 여러 줄로 쪼개져야 함).
-    - optinal field인 retry는 사용하지 않습니다.
+    - data는 한 줄 JSON(UTF-8 bytes)으로 넣습니다(줄바꿈이 있으면 data:가 여러 줄로 쪼개져야 함).
+    - 결과는 StreamingResponse로 그대로 내보낼 bytes 입니다. (str 왕복 인코딩 없음)
+    - retry는 build_sse_retry로 따로 보냅니다.
     """
 
-    lines: list[str] = [f"event: {event.value}"]
+    head = f"event: {event.value}\n"
     if id_ is not None:
-        lines.append(f"id: {id_}")
+        head += f"id: {id_}\n"
 
-    lines.append(f"data: {data}")
-    return "\n".join(lines) + "\n\n"
+    return b"".join((head.encode(), b"data: ", data, b"\n\n"))
 
 
 def build_envelope_sse_frame(
-    *, event: SSEEventType, data: StateEnvelope, id_: int | None = None
-) -> str:
-    payload = data.model_dump_json(ensure_ascii=False)
-    return build_sse_frame(event=event, data=payload, id_=id_)
+    *,
+    event: SSEEventType,
+    data: StateEnvelope,
+    id_: int | str | None = None,
+    codec: Codec | None = None,
+) -> bytes:
+    """envelope을 codec(기본: settings.sse_codec)으로 인코딩해 SSE frame으로 만든다."""
+    codec = codec or get_sse_codec()
+    return build_sse_frame(event=event, data=codec.encode_model(data), id_=id_)
+
+
+def build_sse_comment(text: str = "") -> bytes:
+    """SSE comment 프레임. EventSource는 무시하므로 keepalive 용도로 씁니다."""
+    return f": {text}\n\n".encode() if text else b":\n\n"
+
+
+def build_sse_retry(retry_ms: int) -> bytes:
+    """EventSource 재연결 대기 시간(ms) 힌트 프레임."""
+    return f"retry: {retry_ms}\n\n".encode()
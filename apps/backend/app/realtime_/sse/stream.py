@@ -1,13 +1,112 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing, suppress
+from dataclasses import dataclass
 
+from fastapi import Request
 from fastapi.responses import StreamingResponse
 
+from app.core.config import get_settings
+from app.realtime_.sse.frame import build_sse_comment, build_sse_retry
 
-def sse_stream_response(gen: AsyncIterator[str]) -> StreamingResponse:
-    return StreamingResponse(
+
+@dataclass(frozen=True)
+class SSEKeepAliveOptions:
+    """
+    - heartbeat_seconds: 이 시간 동안 보낸 frame이 없으면 comment 한 줄을 보낸다.
+      (프록시 idle timeout 방지 + 죽은 TCP 연결은 write 실패로 빨리 드러난다)
+    - retry_ms, retry_jitter_ms: 연결 시작 시 retry 힌트. 재연결이 한 순간에 몰리지 않도록
+      연결마다 [retry_ms, retry_ms + retry_jitter_ms] 사이 값을 고른다.
+    - disconnect_poll_seconds: request.is_disconnected() 확인 주기
+    """
+
+    heartbeat_seconds: float
+    retry_ms: int
+    retry_jitter_ms: int
+    disconnect_poll_seconds: float
+
+    @classmethod
+    def from_settings(cls) -> SSEKeepAliveOptions:
+        settings = get_settings()
+        return cls(
+            heartbeat_seconds=settings.sse_heartbeat_seconds,
+            retry_ms=settings.sse_retry_ms,
+            retry_jitter_ms=settings.sse_retry_jitter_ms,
+            disconnect_poll_seconds=settings.sse_disconnect_poll_seconds,
+        )
+
+    def pick_retry_ms(self) -> int:
+        return self.retry_ms + random.randint(0, max(self.retry_jitter_ms, 0))
+
+
+async def keepalive_stream(
+    gen: AsyncIterator[bytes],
+    *,
+    options: SSEKeepAliveOptions,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+) -> AsyncIterator[bytes]:
+    """gen의 frame 사이에 retry 힌트와 heartbeat comment를 끼워 넣는다.
+
+    - 다음 frame을 기다리는 동안에도 주기적으로 깨어나 client 연결을 확인한다.
+      끊겼으면 대기 중인 gen을 취소하고 닫아서 구독(pubsub, task)을 바로 정리한다.
+    - 예전처럼 다음 event가 와야 끊긴 걸 아는 상황을 없애기 위함이다.
+    """
+    loop = asyncio.get_running_loop()
+    poll_seconds = min(options.heartbeat_seconds, options.disconnect_poll_seconds)
+
+    async with aclosing(gen):  # type: ignore[type-var]
+        yield build_sse_retry(options.pick_retry_ms())
+        last_write = loop.time()
+        pending: asyncio.Task[bytes] | None = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(gen))
+                done, _ = await asyncio.wait({pending}, timeout=poll_seconds)
+
+                if done:
+                    try:
+                        frame = pending.result()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        pending = None
+                    yield frame
+                    last_write = loop.time()
+                    continue
+
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                if loop.time() - last_write >= options.heartbeat_seconds:
+                    yield build_sse_comment("ping")
+                    last_write = loop.time()
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with suppress(asyncio.CancelledError, StopAsyncIteration):
+                    await pending
+
+
+def sse_stream_response(
+    gen: AsyncIterator[bytes],
+    *,
+    request: Request | None = None,
+    options: SSEKeepAliveOptions | None = None,
+) -> StreamingResponse:
+    """SSE StreamingResponse. heartbeat, retry 힌트, 연결 끊김 감지를 같이 건다.
+
+    frame은 이미 인코딩된 bytes라서 StreamingResponse가 다시 encode하지 않고 그대로 쓴다.
+    """
+    stream = keepalive_stream(
         gen,
+        options=options or SSEKeepAliveOptions.from_settings(),
+        is_disconnected=request.is_disconnected if request is not None else None,
+    )
+    return StreamingResponse(
+        stream,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.config import get_settings
+from app.infra.pubsub.buffer import ListenerBuffer, OverflowPolicy
+
+
+@dataclass(frozen=True)
+class StreamBufferConfig:
+    """실시간 stream 연결 하나의 buffer 설정."""
+
+    max_events: int
+    policy: OverflowPolicy
+
+    def new_buffer[T](self, label: str) -> ListenerBuffer[T]:
+        return ListenerBuffer(maxsize=self.max_events, policy=self.policy, label=label)
+
+
+@lru_cache
+def get_stream_buffer_config() -> StreamBufferConfig:
+    settings = get_settings()
+    return StreamBufferConfig(
+        max_events=settings.stream_buffer_max_events,
+        policy=OverflowPolicy(settings.stream_buffer_overflow_policy),
+    )
+
+
+StreamBufferConfigDep = Annotated[StreamBufferConfig, Depends(get_stream_buffer_config)]
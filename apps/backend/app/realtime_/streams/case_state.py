@@ -1,104 +1,209 @@
-import asyncio
+import logging
 from collections.abc import AsyncIterator
-from contextlib import suppress
+from contextlib import AbstractAsyncContextManager, nullcontext
 
 from app.domain.events.case import CaseEventDelta
+from app.infra.pubsub.buffer import BufferOverflowError, BufferStats, ListenerBuffer
 from app.infra.pubsub.bus.case_event_bus import CaseEventBus
 from app.infra.pubsub.topics import CaseTopic
+from app.infra.redis.presence import RoomPresence
+from app.realtime_.sse.case_frame_cache import CaseFrameCache, build_case_frame
+from app.realtime_.sse.case_patch import CasePatchFrames
 from app.realtime_.sse.frame import build_envelope_sse_frame
-from app.repositories.case_history import CaseSnapshotHistoryRepo
-from app.schemas.case.sse_response import CaseStateEnvelope
+from app.realtime_.streams.buffer import StreamBufferConfig
+from app.realtime_.streams.reads import CaseHistoryReader
+from app.schemas.case.sse_response import CaseFrameEncoding, CaseStateEnvelope
 from app.schemas.case.state import CaseSnapshot
-from app.schemas.common.ids import CaseId
+from app.schemas.common.ids import CaseId, RoomId, UserId
 from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
 
+logger = logging.getLogger(__name__)
+
 
 class CaseStateStream:
     def __init__(
         self,
         *,
         case_event_bus: CaseEventBus,
-        case_history_repo: CaseSnapshotHistoryRepo,
+        case_history_repo: CaseHistoryReader,
+        case_frame_cache: CaseFrameCache,
+        buffer_config: StreamBufferConfig | None = None,
+        case_patch_frames: CasePatchFrames | None = None,
+        presence: RoomPresence | None = None,
     ) -> None:
         self._case_event_bus = case_event_bus
         self._case_history_repo = case_history_repo
+        self._case_frame_cache = case_frame_cache
+        self._buffer_config = buffer_config
+        self._case_patch_frames = case_patch_frames
+        self._presence = presence
+        self._buffer: ListenerBuffer[CaseEventDelta] | None = None
 
     async def _build_frames(
-        self, case_id: CaseId, last_sent_no: int
-    ) -> AsyncIterator[tuple[str, int]]:
+        self,
+        case_id: CaseId,
+        last_sent_no: int,
+        latest_no: int | None = None,
+        inline_snapshot_json: str | None = None,
+    ) -> AsyncIterator[tuple[bytes, int]]:
+        """last_sent_no 이후 frame들을 만든다.
+
+        - latest_no를 모르면(replay 시작) DB에서 최신 snapshot_no만 조회한다.
+        - 구간 전체가 캐시에 있으면 DB를 읽지 않는다.
+        - 바로 다음 snapshot 하나만 필요하고 fat delta에 실려 왔으면 그걸로 만든다.
+        - 그 외(gap, oversize로 안 실림)에는 DB에서 읽어 인코딩하고 캐시를 채운다.
+          (latest_no까지만 읽는다. 그 뒤의 snapshot은 각자의 delta로 온다)
+        """
+        if latest_no is None:
+            latest_no = await self._case_history_repo.get_latest_snapshot_no(case_id=case_id)
+            if latest_no is None:
+                return
+
+        cached = await self._case_frame_cache.get_range(case_id, last_sent_no + 1, latest_no)
+        if cached is not None:
+            for snapshot_no, frame in enumerate(cached, start=last_sent_no + 1):
+                yield frame, snapshot_no
+            return
+
+        if inline_snapshot_json is not None and latest_no == last_sent_no + 1:
+            snapshot = CaseSnapshot.model_validate_json(inline_snapshot_json)
+            frame = build_case_frame(snapshot, latest_no)
+            await self._case_frame_cache.put(case_id, latest_no, frame)
+            yield frame, latest_no
+            return
+
         rows = await self._case_history_repo.get_after_snapshot_no(
             case_id=case_id,
             last_seen_no=last_sent_no,
+            until_no=latest_no,
         )
         for row in rows:
             snapshot = CaseSnapshot.model_validate(row.snapshot_json)
-            envelope = CaseStateEnvelope(
-                ok=True, code=SSEEnvelopeCode.CASE_STATE, message=None, data=snapshot
-            )
-            yield (
-                build_envelope_sse_frame(
-                    event=SSEEventType.CASE_EVENT,
-                    data=envelope,
-                    id_=row.snapshot_no,
-                ),
-                row.snapshot_no,
-            )
+            frame = build_case_frame(snapshot, row.snapshot_no)
+            await self._case_frame_cache.put(case_id, row.snapshot_no, frame)
+            yield frame, row.snapshot_no
+
+    async def _load_pair(
+        self, case_id: CaseId, snapshot_no: int
+    ) -> tuple[CaseSnapshot, CaseSnapshot] | None:
+        rows = await self._case_history_repo.get_between_snapshot_no(
+            case_id=case_id, first_no=snapshot_no - 1, last_no=snapshot_no
+        )
+        if len(rows) != 2:
+            return None
+        base, target = (CaseSnapshot.model_validate(row.snapshot_json) for row in rows)
+        return base, target
+
+    async def _encode(
+        self,
+        case_id: CaseId,
+        frames: AsyncIterator[tuple[bytes, int]],
+        client_no: int | None,
+        encoding: CaseFrameEncoding,
+    ) -> AsyncIterator[tuple[bytes, int]]:
+        """encoding=patch면, client가 직전 snapshot을 가진 경우에만 full frame을 patch로 바꾼다.
+
+        - client_no: client가 마지막으로 받은 snapshot_no (모르면 None -> 전체 snapshot)
+        - gap(coalesce로 건너뜀 등), keyframe 주기에는 전체 snapshot을 그대로 보낸다.
+        """
+        patch_frames = self._case_patch_frames
+        async for frame, snapshot_no in frames:
+            if (
+                encoding == CaseFrameEncoding.PATCH
+                and patch_frames is not None
+                and client_no == snapshot_no - 1
+                and not patch_frames.is_keyframe(snapshot_no)
+            ):
+                patch = await patch_frames.get(
+                    case_id, snapshot_no, lambda: self._load_pair(case_id, snapshot_no)
+                )
+                if patch is not None:
+                    frame = patch
+            client_no = snapshot_no
+            yield frame, snapshot_no
+
+    @property
+    def buffer_stats(self) -> BufferStats | None:
+        """마지막으로 연 stream의 buffer 상태. (depth, eviction 수 등)"""
+        return self._buffer.stats if self._buffer is not None else None
+
+    def _keep_presence(
+        self, user_id: UserId | None, room_id: RoomId | None
+    ) -> AbstractAsyncContextManager[None]:
+        # case 화면으로 넘어간 player는 room stream을 닫을 수 있으므로 case stream도 heartbeat한다.
+        if self._presence is None or user_id is None or room_id is None:
+            return nullcontext()
+        return self._presence.keep_alive(room_id, user_id)
+
+    def _build_overflow_frame(self) -> bytes:
+        envelope = CaseStateEnvelope(
+            ok=True,
+            code=SSEEnvelopeCode.STREAM_CLOSE,
+            message="slow consumer",
+            data=None,
+        )
+        return build_envelope_sse_frame(event=SSEEventType.STREAM_CLOSE, data=envelope)
 
     async def stream(
         self,
         *,
         case_id: CaseId,
         after_snapshot_no: int | None = None,
-    ) -> AsyncIterator[str]:
+        encoding: CaseFrameEncoding = CaseFrameEncoding.FULL,
+        user_id: UserId | None = None,
+        room_id: RoomId | None = None,
+    ) -> AsyncIterator[bytes]:
         """
         emit 규칙:
         - after_snapshot_no가 없으면 1번부터 최신까지 전부 replay
         - after_snapshot_no가 있으면 그 이후 snapshot만 replay
-        - replay 중간에 publish된 delta는 queue에 쌓아뒀다가 replay 후 drain
+        - replay 중간에 publish된 delta는 연결 buffer에 쌓였다가 replay 후 처리
         - 이후에는 pubsub delta가 올 때마다 해당 snapshot_no의 snapshot emit
-        """
-        case_topic = CaseTopic(case_id)
-        q: asyncio.Queue[CaseEventDelta] = asyncio.Queue()
 
-        async def _subscriber() -> None:
-            async for delta in self._case_event_bus.subscribe(case_topic):
-                await q.put(delta)
+        buffer가 넘치면 (buffer_config의 policy):
+        - coalesce: 중간 snapshot은 건너뛰고 최신 snapshot만 emit (frame이 전체 snapshot이므로)
+        - drop: 넘친 delta는 버려지고, 다음 delta에서 빠진 구간을 캐시/DB로 메운다
+        - disconnect: STREAM_CLOSE frame을 보내고 종료
 
-        sub_task = asyncio.create_task(_subscriber())
+        encoding=patch면 after_snapshot_no(client가 가진 snapshot) 기준으로 patch frame을 보낸다.
+        user_id/room_id가 있으면 stream이 열려 있는 동안 그 (room, user)의 presence를 갱신한다.
+        """
+        case_topic = CaseTopic(case_id)
+        buffer: ListenerBuffer[CaseEventDelta] | None = None
+        if self._buffer_config is not None:
+            buffer = self._buffer_config.new_buffer(f"case:{case_id}")
+        self._buffer = buffer
 
-        try:
+        async with (
+            self._case_event_bus.listen(case_topic, buffer=buffer) as deltas,
+            self._keep_presence(user_id, room_id),
+        ):
             last_sent_no = after_snapshot_no or 0
+            client_no = after_snapshot_no
 
             # 1) 먼저 현재까지 쌓인 snapshot replay
-            async for frame, last_seen_no in self._build_frames(case_id, last_sent_no):
+            replay = self._build_frames(case_id, last_sent_no)
+            async for frame, last_seen_no in self._encode(case_id, replay, client_no, encoding):
                 yield frame
-                last_sent_no = last_seen_no
-
-            # 2) replay 중 들어온 delta drain
-            while True:
-                try:
-                    delta = q.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-                if delta.snapshot_no <= last_sent_no:
-                    continue
-
-                async for frame, last_seen_no in self._build_frames(case_id, last_sent_no):
-                    yield frame
-                    last_sent_no = last_seen_no
-
-            # 3) 이제부터는 live consume
-            while True:
-                delta = await q.get()
-
-                if delta.snapshot_no <= last_sent_no:
-                    continue
-
-                async for frame, last_seen_no in self._build_frames(case_id, last_sent_no):
-                    yield frame
-                    last_sent_no = last_seen_no
-
-        finally:
-            sub_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await sub_task
+                last_sent_no = client_no = last_seen_no
+
+            # 2) replay 중 쌓인 delta부터 live consume
+            try:
+                async for delta in deltas:
+                    if delta.snapshot_no <= last_sent_no:
+                        continue
+                    if buffer is not None and buffer.pop_coalesced():
+                        # 밀린 구간은 버리고 최신 snapshot만 보낸다.
+                        last_sent_no = delta.snapshot_no - 1
+
+                    frames = self._build_frames(
+                        case_id, last_sent_no, delta.snapshot_no, delta.snapshot_json
+                    )
+                    async for frame, last_seen_no in self._encode(
+                        case_id, frames, client_no, encoding
+                    ):
+                        yield frame
+                        last_sent_no = client_no = last_seen_no
+            except BufferOverflowError:
+                logger.warning("Case stream closed for slow consumer: %r", buffer and buffer.stats)
+                yield self._build_overflow_frame()
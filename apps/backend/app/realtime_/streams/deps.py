@@ -4,28 +4,81 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from app.infra.pubsub.bus.deps import CaseEventBusDep, RoomEventBusDep
-from app.queries.deps import RoomSnapshotQueryDep
+from app.core.deps.stream import StreamUser
+from app.infra.db.session import RealtimeReadSessionsDep
+from app.infra.pubsub.bus.deps import CaseEventBusDep, RoomEventBusDep, UserEventBusDep
+from app.infra.redis.presence import RoomPresenceDep
+from app.realtime_.connections import ConnectionRegistryDep
+from app.realtime_.sse.case_frame_cache import CaseFrameCacheDep
+from app.realtime_.sse.case_patch import CasePatchFramesDep
+from app.realtime_.streams.buffer import StreamBufferConfigDep
 from app.realtime_.streams.case_state import CaseStateStream
+from app.realtime_.streams.reads import SessionPerCallCaseHistory, SessionPerCallRoomSnapshotQuery
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster, get_room_state_broadcaster
 from app.realtime_.streams.room_state import RoomStateStream
-from app.repositories.deps import CaseHistoryRepoDep
+from app.services.presence_sweeper import PresenceSweeperDep
 
+RoomStateBroadcasterDep = Annotated[RoomStateBroadcaster, Depends(get_room_state_broadcaster)]
 
-def get_room_state_stream(
+
+def get_case_history_reader(
+    read_sessions: RealtimeReadSessionsDep,
+) -> SessionPerCallCaseHistory:
+    return SessionPerCallCaseHistory(read_sessions)
+
+
+CaseHistoryReaderDep = Annotated[SessionPerCallCaseHistory, Depends(get_case_history_reader)]
+
+
+async def get_room_state_stream(
+    user: StreamUser,
     room_event_bus: RoomEventBusDep,
-    room_snapshot_query: RoomSnapshotQueryDep,
+    read_sessions: RealtimeReadSessionsDep,
+    room_state_broadcaster: RoomStateBroadcasterDep,
+    buffer_config: StreamBufferConfigDep,
+    user_event_bus: UserEventBusDep,
+    connections: ConnectionRegistryDep,
+    presence: RoomPresenceDep,
+    presence_sweeper: PresenceSweeperDep,
 ) -> RoomStateStream:
-    return RoomStateStream(room_event_bus, room_snapshot_query)
+    # stream이 presence heartbeat를 보내기 시작하므로 만료를 정리할 sweeper도 띄운다.
+    # (sweeper task를 만들어야 하므로 threadpool이 아니라 event loop에서 도는 async dependency)
+    if presence_sweeper is not None:
+        presence_sweeper.start()
+    return RoomStateStream(
+        room_event_bus,
+        SessionPerCallRoomSnapshotQuery(read_sessions, presence=presence, user_id=user.id),
+        room_state_broadcaster,
+        buffer_config=buffer_config,
+        user_event_bus=user_event_bus,
+        connections=connections,
+        presence=presence,
+    )
 
 
 RoomStateStreamDep = Annotated[RoomStateStream, Depends(get_room_state_stream)]
 
 
-def get_case_state_stream(
+async def get_case_state_stream(
     case_event_bus: CaseEventBusDep,
-    case_history_repo: CaseHistoryRepoDep,
+    case_history: CaseHistoryReaderDep,
+    case_frame_cache: CaseFrameCacheDep,
+    buffer_config: StreamBufferConfigDep,
+    case_patch_frames: CasePatchFramesDep,
+    presence: RoomPresenceDep,
+    presence_sweeper: PresenceSweeperDep,
 ) -> CaseStateStream:
-    return CaseStateStream(case_event_bus=case_event_bus, case_history_repo=case_history_repo)
+    # case stream도 room presence heartbeat를 보낸다. (room stream과 같은 이유로 async)
+    if presence_sweeper is not None:
+        presence_sweeper.start()
+    return CaseStateStream(
+        case_event_bus=case_event_bus,
+        case_history_repo=case_history,
+        case_frame_cache=case_frame_cache,
+        buffer_config=buffer_config,
+        case_patch_frames=case_patch_frames,
+        presence=presence,
+    )
 
 
 CaseStateStreamDep = Annotated[CaseStateStream, Depends(get_case_state_stream)]
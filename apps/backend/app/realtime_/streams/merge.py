@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+
+async def merge_streams[T](*iterators: AsyncIterator[T]) -> AsyncIterator[T]:
+    """여러 async iterator를 도착 순서대로 합친다.
+
+    - 하나가 끝나면 나머지로 계속하고, 예외는 그대로 전파한다.
+    - iterator마다 anext는 하나만 걸어둔다. (같은 generator를 동시에 돌리지 않음)
+    - 끝날 때(소비자가 닫는 경우 포함) 대기 중인 anext를 취소하고 모든 iterator를 닫는다.
+    """
+    pending: dict[asyncio.Future[T], AsyncIterator[T]] = {}
+
+    def _schedule(it: AsyncIterator[T]) -> None:
+        pending[asyncio.ensure_future(anext(it))] = it
+
+    for it in iterators:
+        _schedule(it)
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                it = pending.pop(future)
+                try:
+                    item = future.result()
+                except StopAsyncIteration:
+                    continue
+                yield item
+                _schedule(it)
+    finally:
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for it in iterators:
+            aclose = getattr(it, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.events.room import RoomSnapshotType
+from app.infra.db.read_routing import ReadSessions
+from app.infra.redis.presence import RoomPresence
+from app.models.case_snapshot import CaseSnapshotHistory
+from app.queries.room_snapshot import RoomSnapshotReadModel
+from app.repositories.case_history import CaseSnapshotHistoryRepo
+from app.schemas.common.ids import CaseId, UserId
+from app.schemas.room.state import RoomSnapshot
+
+# 오래 열려 있는 stream은 DB session을 들고 있지 않는다.
+# 조회가 필요할 때마다 session을 빌려 쿼리 하나를 실행하고 바로 반납한다.
+# (열린 SSE/WS 연결 수가 pool 크기를 잡아먹지 않도록)
+# session은 ReadSessions에서 빌리므로, replica가 있으면 (pin 중이 아닐 때) replica에서 읽는다.
+
+
+class RoomSnapshotReader(Protocol):
+    async def build_snapshot(
+        self, *, room_id: UUID, last_event: RoomSnapshotType, logs: list[str]
+    ) -> RoomSnapshot: ...
+
+
+class CaseHistoryReader(Protocol):
+    async def get_latest_snapshot_no(self, *, case_id: CaseId) -> int | None: ...
+
+    async def get_after_snapshot_no(
+        self, *, case_id: CaseId, last_seen_no: int, until_no: int | None = None
+    ) -> list[CaseSnapshotHistory]: ...
+
+    async def get_between_snapshot_no(
+        self, *, case_id: CaseId, first_no: int, last_no: int
+    ) -> list[CaseSnapshotHistory]: ...
+
+
+class SessionPerCallRoomSnapshotQuery:
+    """build_snapshot마다 session을 새로 여는 RoomSnapshotReadModel. (쿼리 1회)
+
+    room(event가 나간 직후)이나 user(쓰기 직후)가 pin 중이면 primary에서 읽는다.
+    """
+
+    def __init__(
+        self,
+        read_sessions: ReadSessions,
+        *,
+        presence: RoomPresence | None = None,
+        user_id: UserId | None = None,
+    ) -> None:
+        self._read_sessions = read_sessions
+        self._presence = presence
+        self._user_id = user_id
+
+    async def build_snapshot(
+        self, *, room_id: UUID, last_event: RoomSnapshotType, logs: list[str]
+    ) -> RoomSnapshot:
+        async with self._read_sessions.session(user_id=self._user_id, room_id=room_id) as session:
+            query = RoomSnapshotReadModel(session, presence=self._presence)
+            return await query.build_snapshot(room_id=room_id, last_event=last_event, logs=logs)
+
+
+class SessionPerCallCaseHistory:
+    """조회마다 session을 새로 여는 CaseSnapshotHistoryRepo. (읽기 전용)
+
+    snapshot은 snapshot_no 순서로 추가만 되므로, replica 결과가 기대한 번호에 못 미치면
+    (replica 지연) 그 조회만 primary에서 다시 읽는다. pin은 쓰지 않는다.
+    """
+
+    def __init__(self, read_sessions: ReadSessions) -> None:
+        self._read_sessions = read_sessions
+
+    def _is_behind(self, rows: list[CaseSnapshotHistory], snapshot_no: int) -> bool:
+        if not self._read_sessions.has_replica:
+            return False
+        return not rows or rows[-1].snapshot_no < snapshot_no
+
+    async def get_latest_snapshot_no(
+        self, *, case_id: CaseId, at_least: int | None = None
+    ) -> int | None:
+        """at_least: client가 이미 받은 snapshot_no처럼 최소한 있어야 하는 번호"""
+        async with self._read_sessions.session() as session:
+            latest_no = await CaseSnapshotHistoryRepo(session).get_latest_snapshot_no(
+                case_id=case_id
+            )
+        stale = at_least is not None and (latest_no is None or latest_no < at_least)
+        if stale and self._read_sessions.has_replica:
+            async with self._read_sessions.primary() as session:
+                latest_no = await CaseSnapshotHistoryRepo(session).get_latest_snapshot_no(
+                    case_id=case_id
+                )
+        return latest_no
+
+    async def get_after_snapshot_no(
+        self, *, case_id: CaseId, last_seen_no: int, until_no: int | None = None
+    ) -> list[CaseSnapshotHistory]:
+        async with self._read_sessions.session() as session:
+            rows = await CaseSnapshotHistoryRepo(session).get_after_snapshot_no(
+                case_id=case_id, last_seen_no=last_seen_no, until_no=until_no
+            )
+        if until_no is not None and self._is_behind(rows, until_no):
+            async with self._read_sessions.primary() as session:
+                rows = await CaseSnapshotHistoryRepo(session).get_after_snapshot_no(
+                    case_id=case_id, last_seen_no=last_seen_no, until_no=until_no
+                )
+        return rows
+
+    async def get_between_snapshot_no(
+        self, *, case_id: CaseId, first_no: int, last_no: int
+    ) -> list[CaseSnapshotHistory]:
+        async with self._read_sessions.session() as session:
+            rows = await CaseSnapshotHistoryRepo(session).get_between_snapshot_no(
+                case_id=case_id, first_no=first_no, last_no=last_no
+            )
+        if self._is_behind(rows, last_no):
+            async with self._read_sessions.primary() as session:
+                rows = await CaseSnapshotHistoryRepo(session).get_between_snapshot_no(
+                    case_id=case_id, first_no=first_no, last_no=last_no
+                )
+        return rows
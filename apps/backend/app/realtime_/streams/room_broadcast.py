@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.domain.events.room import RoomEventDelta
+from app.realtime_.sse.frame import build_envelope_sse_frame
+from app.schemas.common.ids import RoomId, UserId
+from app.schemas.room.sse_response import RoomStateEnvelope
+from app.schemas.room.state import RoomSnapshot
+from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
+
+logger = logging.getLogger(__name__)
+
+# room당 최근 delta 몇 개까지 공유 결과를 들고 있을지. (느린 subscriber가 조금 뒤처져도 hit)
+_RECENT_BROADCASTS_PER_ROOM = 8
+# build가 끝난 결과를 이 시간(초) 뒤에 버린다. room의 결과가 모두 빠지면 room key도 지운다.
+_RECENT_BROADCAST_TTL_S = 5.0
+
+
+@dataclass(frozen=True)
+class RoomBroadcastFrame:
+    """delta 하나에 대해 room 전체가 공유하는 결과.
+
+    - snapshot: 공유 snapshot (읽기 전용으로 취급)
+    - member_ids: 구독자별 membership 확인용
+    - frame: 미리 인코딩된 ROOM_EVENT SSE frame (bytes)
+    """
+
+    snapshot: RoomSnapshot
+    member_ids: frozenset[UserId]
+    frame: bytes
+
+    def has_member(self, user_id: UserId) -> bool:
+        return user_id in self.member_ids
+
+
+@dataclass(eq=False)
+class _Broadcast:
+    delta: RoomEventDelta
+    task: asyncio.Task[RoomBroadcastFrame]
+
+
+class RoomStateBroadcaster:
+    """room 단위로 delta당 snapshot 조회와 SSE frame 인코딩을 한 번만 수행한다.
+
+    - 같은 프로세스의 RoomStateStream들은 TopicFanout을 통해 같은 delta 객체를 받는다.
+      그래서 delta 객체 자체를 key로 single-flight를 건다.
+    - 처음 도착한 subscriber의 query로 만들고, 나머지는 같은 결과(같은 frame bytes)를 받는다.
+    - 공유 build가 실패하면(예: 만든 쪽 연결이 끊겨 세션이 닫힘) 각자 다시 만든다.
+    - 끝난 결과는 _RECENT_BROADCAST_TTL_S 뒤에 버리므로, 조용해진 room은 자리를 차지하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._recent: dict[RoomId, deque[_Broadcast]] = {}
+
+    async def get_frame(
+        self,
+        room_id: RoomId,
+        delta: RoomEventDelta,
+        build_snapshot: Callable[[], Awaitable[RoomSnapshot]],
+    ) -> RoomBroadcastFrame:
+        task = self._find_or_start(room_id, delta, build_snapshot)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Shared room snapshot build failed; rebuilding locally", exc_info=True)
+            return await self._build(delta, build_snapshot)
+
+    def _find_or_start(
+        self,
+        room_id: RoomId,
+        delta: RoomEventDelta,
+        build_snapshot: Callable[[], Awaitable[RoomSnapshot]],
+    ) -> asyncio.Task[RoomBroadcastFrame]:
+        loop = asyncio.get_running_loop()
+        recent = self._recent.get(room_id)
+        if recent is None:
+            recent = deque(maxlen=_RECENT_BROADCASTS_PER_ROOM)
+            self._recent[room_id] = recent
+
+        for broadcast in recent:
+            if broadcast.delta is delta and broadcast.task.get_loop() is loop:
+                return broadcast.task
+
+        task = loop.create_task(self._build(delta, build_snapshot))
+        broadcast = _Broadcast(delta=delta, task=task)
+        recent.append(broadcast)
+        task.add_done_callback(
+            lambda _: loop.call_later(_RECENT_BROADCAST_TTL_S, self._forget, room_id, broadcast)
+        )
+        return task
+
+    def _forget(self, room_id: RoomId, broadcast: _Broadcast) -> None:
+        recent = self._recent.get(room_id)
+        if recent is None:
+            return
+        with suppress(ValueError):  # maxlen으로 이미 밀려났으면 없다.
+            recent.remove(broadcast)
+        if not recent:
+            del self._recent[room_id]
+
+    @staticmethod
+    async def _build(
+        delta: RoomEventDelta,
+        build_snapshot: Callable[[], Awaitable[RoomSnapshot]],
+    ) -> RoomBroadcastFrame:
+        snapshot = await build_snapshot()
+        envelope = RoomStateEnvelope(
+            ok=True,
+            code=SSEEnvelopeCode.ROOM_STATE,
+            message=None,
+            data=snapshot,
+        )
+        return RoomBroadcastFrame(
+            snapshot=snapshot,
+            member_ids=frozenset(member.user_id for member in snapshot.members),
+            frame=build_envelope_sse_frame(
+                event=SSEEventType.ROOM_EVENT, id_=delta.version or 1, data=envelope
+            ),
+        )
+
+
+@lru_cache
+def get_room_state_broadcaster() -> RoomStateBroadcaster:
+    return RoomStateBroadcaster()
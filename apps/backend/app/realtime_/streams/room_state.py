@@ -1,26 +1,84 @@
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, aclosing, asynccontextmanager, nullcontext
 
-from app.domain.events.room import RoomSnapshotType
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.domain.events.user import UserEvent, UserEventType
+from app.infra.pubsub.buffer import BufferOverflowError, BufferStats, ListenerBuffer
 from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
 from app.infra.pubsub.topics import RoomTopic
+from app.infra.redis.presence import RoomPresence
 from app.mvp import mvp_logs_mapper
-from app.queries.room_snapshot import RoomSnapshotQuery
+from app.realtime_.connections import ConnectionRegistry
 from app.realtime_.sse.frame import build_envelope_sse_frame
+from app.realtime_.streams.buffer import StreamBufferConfig
+from app.realtime_.streams.merge import merge_streams
+from app.realtime_.streams.reads import RoomSnapshotReader
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster
 from app.schemas.common.ids import RoomId, UserId
 from app.schemas.room.sse_response import RoomStateEnvelope
+from app.schemas.room.state import RoomSnapshot
 from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
 
+logger = logging.getLogger(__name__)
+
+# 자기 자신이 나가거나 kick된 delta는 snapshot 없이 바로 닫는다.
+_SELF_CLOSE_EVENTS = frozenset({RoomSnapshotType.MEMBER_LEFT, RoomSnapshotType.MEMBER_KICKED})
+
+# user event -> (SSE event, envelope code)
+_USER_EVENT_FRAMES: dict[UserEventType, tuple[SSEEventType, SSEEnvelopeCode]] = {
+    UserEventType.ROOM_KICKED: (SSEEventType.ROOM_EVENT, SSEEnvelopeCode.ROOM_KICKED),
+    UserEventType.STREAM_CLOSE: (SSEEventType.STREAM_CLOSE, SSEEnvelopeCode.STREAM_CLOSE),
+    UserEventType.NOTIFICATION: (SSEEventType.NOTIFICATION, SSEEnvelopeCode.NOTIFICATION),
+}
+
+
+def _parse_version(last_event_id: str | None) -> int | None:
+    if last_event_id is None or not last_event_id.isdigit():
+        return None
+    return int(last_event_id)
+
+
+def _replay_missed(missed: list[RoomEventDelta]) -> list[RoomEventDelta]:
+    """log에서 이어받은 delta 중 다시 보낼 것.
+
+    room frame은 전체 snapshot이므로 마지막 delta 하나면 된다. 그 사이 멤버십이 바뀌었으면
+    마지막 snapshot의 멤버 확인에서 닫힌다. (STREAM_CLOSE가 있었으면 그것만 보낸다)
+    """
+    for delta in missed:
+        if delta.type == RoomSnapshotType.STREAM_CLOSE:
+            return [delta]
+    return missed[-1:]
+
 
 class RoomStateStream:
     def __init__(
         self,
         room_event_bus: RoomEventBus,
-        room_snapshot_query: RoomSnapshotQuery,
+        room_snapshot_query: RoomSnapshotReader,
+        room_state_broadcaster: RoomStateBroadcaster,
+        buffer_config: StreamBufferConfig | None = None,
+        *,
+        user_event_bus: UserEventBus | None = None,
+        connections: ConnectionRegistry | None = None,
+        presence: RoomPresence | None = None,
     ) -> None:
         self._room_event_bus = room_event_bus
         self._room_snapshot_query = room_snapshot_query
+        self._room_state_broadcaster = room_state_broadcaster
+        self._buffer_config = buffer_config
+        self._user_event_bus = user_event_bus
+        self._connections = connections if connections is not None else ConnectionRegistry()
+        self._presence = presence
+        self._buffer: ListenerBuffer[RoomEventDelta] | None = None
+
+    @property
+    def buffer_stats(self) -> BufferStats | None:
+        """마지막으로 연 stream의 buffer 상태. (depth, eviction 수 등)"""
+        return self._buffer.stats if self._buffer is not None else None
 
     def _build_close_envelope(self, event_type: RoomSnapshotType) -> RoomStateEnvelope:
         if event_type == RoomSnapshotType.MEMBER_LEFT:
@@ -32,64 +90,186 @@ class RoomStateStream:
             code = SSEEnvelopeCode.ROOM_MEMBERSHIP_INVALID
         return RoomStateEnvelope(ok=True, code=code, message=None, data=None)
 
-    async def stream(self, user_id: UserId, room_id: RoomId) -> AsyncIterator[str]:
-        event_id = 1  # MVP
-        room_topic = RoomTopic(room_id)
+    @staticmethod
+    def _build_user_frame(event: UserEvent, event_id: int) -> bytes:
+        event_type, code = _USER_EVENT_FRAMES[event.type]
+        envelope = RoomStateEnvelope(ok=True, code=code, message=event.message, data=None)
+        return build_envelope_sse_frame(event=event_type, id_=event_id, data=envelope)
+
+    @asynccontextmanager
+    async def _listen_user_events(
+        self, user_id: UserId, room_id: RoomId
+    ) -> AsyncIterator[AsyncIterator[UserEvent]]:
+        """이 연결로 온 user event 중 이 room 것만. (user event bus가 없으면 빈 stream)"""
+        if self._user_event_bus is None:
+            yield _empty()
+            return
+        with self._connections.connect(user_id) as connection:
+            async with self._user_event_bus.listen(user_id, connection.conn_id) as user_events:
+                yield _in_room(user_events, room_id)
+
+    def _keep_presence(self, user_id: UserId, room_id: RoomId) -> AbstractAsyncContextManager[None]:
+        """stream이 열려 있는 동안 presence heartbeat를 보낸다. (presence가 없으면 no-op)"""
+        if self._presence is None:
+            return nullcontext()
+        return self._presence.keep_alive(room_id, user_id)
 
-        on_connect_logs = mvp_logs_mapper(RoomSnapshotType.ON_CONNECT)
-        snapshot = await self._room_snapshot_query.build_snapshot(
+    async def _load_snapshot(self, room_id: RoomId, event_delta: RoomEventDelta) -> RoomSnapshot:
+        # fat event면 delta에 실린 snapshot을 그대로 쓰고, 아니면 DB에서 만든다.
+        if event_delta.snapshot_json is not None:
+            return RoomSnapshot.model_validate_json(event_delta.snapshot_json)
+        return await self._room_snapshot_query.build_snapshot(
             room_id=room_id,
-            last_event=RoomSnapshotType.ON_CONNECT,
-            logs=on_connect_logs,
+            last_event=event_delta.type,
+            logs=mvp_logs_mapper(event_delta.type),
         )
 
-        initial_envelope = RoomStateEnvelope(
-            ok=True,
-            code=SSEEnvelopeCode.ROOM_STATE,
-            message=None,
-            data=snapshot,
-        )
-        yield build_envelope_sse_frame(
-            event=SSEEventType.ON_CONNECT,
-            id_=event_id,
-            data=initial_envelope,
-        )
+    async def stream(
+        self, user_id: UserId, room_id: RoomId, *, last_event_id: str | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        emit 규칙:
+        - frame id는 room event version (versions가 없으면 1, MVP)
+        - room frame은 매번 전체 snapshot이므로, 재연결 시 놓친 event를 하나씩 보내지 않는다.
+          - Last-Event-ID == 현재 version: ON_CONNECT 없이 이후 delta만
+          - 뒤처졌고 놓친 delta가 log에 모두 남아 있으면(redis_streams): ON_CONNECT 대신
+            마지막 delta의 frame 1회 (fat event면 DB 조회 없이 delta에 실린 snapshot으로)
+          - 그 외(신규 연결, 뒤처짐): ON_CONNECT로 현재 snapshot 1회
+        - 이미 반영된 version 이하의 delta는 건너뛴다. (구독과 snapshot 조회 사이의 경합)
+        - 연결 buffer가 넘치면 policy대로 처리한다. room frame도 전체 snapshot이므로
+          coalesce로 중간 delta를 건너뛰어도 최신 상태는 맞다. disconnect면 STREAM_CLOSE 후 종료
+        - kick/close/notification은 room이 아니라 이 user의 채널(UserTopic)로 온다.
+          kick/close면 close envelope 후 종료, notification이면 envelope만 보내고 계속한다.
+        """
+        default_event_id = 1  # MVP
+        room_topic = RoomTopic(room_id)
+        last_version = _parse_version(last_event_id)
+        buffer: ListenerBuffer[RoomEventDelta] | None = None
+        if self._buffer_config is not None:
+            buffer = self._buffer_config.new_buffer(f"room:{room_id}:{user_id}")
+        self._buffer = buffer
+
+        async with (
+            self._room_event_bus.open(room_topic, buffer=buffer) as room_events,
+            self._listen_user_events(user_id, room_id) as user_events,
+            self._keep_presence(user_id, room_id),
+        ):
+            # live 구독을 먼저 붙이고 version을 읽어야 그 사이 event를 놓치지 않는다.
+            sent_version = await self._room_event_bus.current_version(room_topic)
+
+            replay: list[RoomEventDelta] = []
+            if last_version is not None and sent_version is not None:
+                missed = await self._room_event_bus.read_missed(
+                    room_topic, after_version=last_version, upto_version=sent_version
+                )
+                if missed is not None:
+                    replay = _replay_missed(missed)
+                    sent_version = last_version
 
-        async for event_delta in self._room_event_bus.subscribe(room_topic):
-            if event_delta.type == RoomSnapshotType.STREAM_CLOSE:
-                close_envelope = self._build_close_envelope(event_delta.type)
+            if last_version is None or last_version != sent_version:
+                on_connect_logs = mvp_logs_mapper(RoomSnapshotType.ON_CONNECT)
+                snapshot = await self._room_snapshot_query.build_snapshot(
+                    room_id=room_id,
+                    last_event=RoomSnapshotType.ON_CONNECT,
+                    logs=on_connect_logs,
+                )
+
+                initial_envelope = RoomStateEnvelope(
+                    ok=True,
+                    code=SSEEnvelopeCode.ROOM_STATE,
+                    message=None,
+                    data=snapshot,
+                )
                 yield build_envelope_sse_frame(
-                    event=SSEEventType.STREAM_CLOSE,
-                    id_=event_id,
-                    data=close_envelope,
+                    event=SSEEventType.ON_CONNECT,
+                    id_=sent_version or default_event_id,
+                    data=initial_envelope,
                 )
-                return
 
-            logs = mvp_logs_mapper(event_delta.type)
-            snapshot = await self._room_snapshot_query.build_snapshot(
-                room_id=room_id,
-                last_event=event_delta.type,
-                logs=logs,
-            )
+            try:
+                events: AsyncIterator[RoomEventDelta | UserEvent] = merge_streams(
+                    _prepend(replay, room_events), user_events
+                )
+                async with aclosing(events) as event_deltas:  # type: ignore[type-var]
+                    async for event_delta in event_deltas:
+                        if isinstance(event_delta, UserEvent):
+                            yield self._build_user_frame(
+                                event_delta, sent_version or default_event_id
+                            )
+                            if event_delta.type != UserEventType.NOTIFICATION:
+                                return
+                            continue
+
+                        version = event_delta.version
+                        if version is not None and sent_version is not None:
+                            if version <= sent_version:
+                                continue
+                            sent_version = version
+
+                        event_id = version or default_event_id
+                        if event_delta.type == RoomSnapshotType.STREAM_CLOSE:
+                            close_envelope = self._build_close_envelope(event_delta.type)
+                            yield build_envelope_sse_frame(
+                                event=SSEEventType.STREAM_CLOSE,
+                                id_=event_id,
+                                data=close_envelope,
+                            )
+                            return
+
+                        is_self = event_delta.user_id == user_id
+                        if is_self and event_delta.type in _SELF_CLOSE_EVENTS:
+                            close_envelope = self._build_close_envelope(event_delta.type)
+                            yield build_envelope_sse_frame(
+                                event=SSEEventType.ROOM_EVENT,
+                                id_=event_id,
+                                data=close_envelope,
+                            )
+                            return
+
+                        # snapshot 조회와 frame 인코딩은 room 단위로 delta당 한 번만 한다.
+                        broadcast = await self._room_state_broadcaster.get_frame(
+                            room_id,
+                            event_delta,
+                            lambda: self._load_snapshot(room_id, event_delta),
+                        )
 
-            if user_id not in [member.user_id for member in snapshot.members]:
-                close_envelope = self._build_close_envelope(event_delta.type)
+                        if not broadcast.has_member(user_id):
+                            close_envelope = self._build_close_envelope(event_delta.type)
+                            yield build_envelope_sse_frame(
+                                event=SSEEventType.ROOM_EVENT,
+                                id_=event_id,
+                                data=close_envelope,
+                            )
+                            return
+
+                        yield broadcast.frame
+            except BufferOverflowError:
+                logger.warning("Room stream closed for slow consumer: %r", buffer and buffer.stats)
+                overflow_envelope = RoomStateEnvelope(
+                    ok=True, code=SSEEnvelopeCode.STREAM_CLOSE, message="slow consumer", data=None
+                )
                 yield build_envelope_sse_frame(
-                    event=SSEEventType.ROOM_EVENT,
-                    id_=event_id,
-                    data=close_envelope,
+                    event=SSEEventType.STREAM_CLOSE,
+                    id_=sent_version or default_event_id,
+                    data=overflow_envelope,
                 )
-                return
-
-            envelope = RoomStateEnvelope(
-                ok=True,
-                code=SSEEnvelopeCode.ROOM_STATE,
-                message=None,
-                data=snapshot,
-            )
-
-            yield build_envelope_sse_frame(
-                event=SSEEventType.ROOM_EVENT,
-                id_=event_id,
-                data=envelope,
-            )
+
+
+async def _prepend(
+    first: list[RoomEventDelta], rest: AsyncIterator[RoomEventDelta]
+) -> AsyncIterator[RoomEventDelta]:
+    for event in first:
+        yield event
+    async for event in rest:
+        yield event
+
+
+async def _empty() -> AsyncIterator[UserEvent]:
+    return
+    yield
+
+
+async def _in_room(events: AsyncIterator[UserEvent], room_id: RoomId) -> AsyncIterator[UserEvent]:
+    async for event in events:
+        if event.room_id is None or event.room_id == room_id:
+            yield event
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from app.schemas.ws.message import WSServerMessageType, WSStream
+
+
+def _with_raw_data(head: dict[str, Any], data_json: str) -> str:
+    # data는 이미 인코딩된 JSON이므로 다시 파싱/직렬화하지 않고 이어 붙인다.
+    encoded = json.dumps(head, ensure_ascii=False)
+    return f'{encoded[:-1]}, "data": {data_json}}}'
+
+
+def build_ws_event_message(stream: WSStream, sse_frame: bytes) -> str:
+    """stream이 만든 SSE frame을 WebSocket text message로 옮긴다.
+
+    room broadcast, case frame cache가 만든 frame bytes를 그대로 재사용하기 위함이다.
+    (text frame이어야 하므로 data는 여기서 한 번만 decode 한다)
+    """
+    event: str | None = None
+    id_: str | None = None
+    data = "null"
+    for line in sse_frame.split(b"\n"):
+        if line.startswith(b"event: "):
+            event = line.removeprefix(b"event: ").decode()
+        elif line.startswith(b"id: "):
+            id_ = line.removeprefix(b"id: ").decode()
+        elif line.startswith(b"data: "):
+            data = line.removeprefix(b"data: ").decode()
+
+    head = {
+        "type": WSServerMessageType.EVENT.value,
+        "stream": stream.value,
+        "event": event,
+        "id": id_,
+    }
+    return _with_raw_data(head, data)
+
+
+def build_ws_action_result_message(request_id: str, envelope_json: str) -> str:
+    head = {"type": WSServerMessageType.ACTION_RESULT.value, "request_id": request_id}
+    return _with_raw_data(head, envelope_json)
+
+
+def build_ws_error_message(
+    request_id: str | None, status_code: int, envelope: dict[str, Any]
+) -> str:
+    return json.dumps(
+        {
+            "type": WSServerMessageType.ERROR.value,
+            "request_id": request_id,
+            "status": status_code,
+            "data": envelope,
+        },
+        ensure_ascii=False,
+        default=str,
+    )
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing, suppress
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1.cases.phases.actions.blue_vote import blue_vote
+from app.api.v1.cases.phases.actions.force_skip_discuss import force_skip_discuss
+from app.api.v1.cases.phases.actions.init_blue_vote import init_blue_vote
+from app.api.v1.cases.phases.actions.red_vote import red_vote
+from app.core.error_codes import CommonErrorCode, ConflictErrorCode
+from app.core.exceptions import EnvelopeHTTPException
+from app.domain.types import AuthUser
+from app.infra.db.read_routing import ReadSessions
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
+from app.infra.redis.presence import RoomPresence
+from app.models.case import Case
+from app.realtime_.connections import ConnectionRegistry
+from app.realtime_.sse.case_frame_cache import CaseFrameCache
+from app.realtime_.sse.case_patch import CasePatchFrames
+from app.realtime_.streams.buffer import StreamBufferConfig
+from app.realtime_.streams.case_state import CaseStateStream
+from app.realtime_.streams.reads import SessionPerCallCaseHistory, SessionPerCallRoomSnapshotQuery
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster
+from app.realtime_.streams.room_state import RoomStateStream
+from app.realtime_.ws.frame import (
+    build_ws_action_result_message,
+    build_ws_error_message,
+    build_ws_event_message,
+)
+from app.repositories.case import CaseRepo
+from app.schemas.case.actions.blue_vote import BlueVoteRequest
+from app.schemas.case.actions.init_blue_vote import InitBlueVoteRequest
+from app.schemas.case.actions.red_vote import RedVoteRequest
+from app.schemas.case.sse_response import CaseFrameEncoding
+from app.schemas.common.ids import RoomId
+from app.schemas.ws.message import (
+    WSAction,
+    WSActionRequest,
+    WSStream,
+    WSSubscribe,
+    WSUnsubscribe,
+    ws_client_message_adapter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RealtimeGateway:
+    """WebSocket 연결 하나에 room/case stream과 case action을 multiplex 한다.
+
+    - stream은 SSE와 같은 RoomStateStream/CaseStateStream을 쓰고, 만들어진 frame을
+      WebSocket message로 옮기기만 한다. (broadcast/frame cache 결과를 그대로 재사용)
+    - stream은 DB session을 들고 있지 않고, 조회마다 session_factory에서 짧게 빌린다.
+      (연결이 열려 있는 동안 DB connection을 점유하지 않도록)
+      snapshot/history 조회는 read_sessions(replica가 있으면 replica)로, case 확인은 primary로.
+    - action은 REST handler와 같은 함수로 처리하고, 결과 envelope을 request_id와 함께 돌려준다.
+    - 연결이 끊기면 모든 stream task를 취소해서 구독을 바로 정리한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        websocket: WebSocket,
+        user: AuthUser,
+        room_id: RoomId,
+        room_event_bus: RoomEventBus,
+        case_event_bus: CaseEventBus,
+        room_state_broadcaster: RoomStateBroadcaster,
+        case_frame_cache: CaseFrameCache,
+        buffer_config: StreamBufferConfig,
+        session_factory: async_sessionmaker[AsyncSession],
+        read_sessions: ReadSessions | None = None,
+        case_patch_frames: CasePatchFrames | None = None,
+        user_event_bus: UserEventBus | None = None,
+        connections: ConnectionRegistry | None = None,
+        presence: RoomPresence | None = None,
+    ) -> None:
+        self._websocket = websocket
+        self._user = user
+        self._room_id = room_id
+        self._room_event_bus = room_event_bus
+        self._case_event_bus = case_event_bus
+        self._room_state_broadcaster = room_state_broadcaster
+        self._case_frame_cache = case_frame_cache
+        self._buffer_config = buffer_config
+        self._session_factory = session_factory
+        self._read_sessions = read_sessions or ReadSessions(session_factory)
+        self._case_patch_frames = case_patch_frames
+        self._user_event_bus = user_event_bus
+        self._connections = connections
+        self._presence = presence
+
+        self._send_lock = asyncio.Lock()
+        self._streams: dict[WSStream, asyncio.Task[None]] = {}
+
+    async def run(self) -> None:
+        await self._websocket.accept()
+        try:
+            while True:
+                raw = await self._websocket.receive_text()
+                await self._handle(raw)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for stream in list(self._streams):
+                await self._stop_stream(stream)
+
+    async def _send(self, message: str) -> None:
+        async with self._send_lock:
+            await self._websocket.send_text(message)
+
+    async def _send_error(self, request_id: str | None, exc: EnvelopeHTTPException) -> None:
+        envelope = exc.to_envelope_dict()
+        await self._send(build_ws_error_message(request_id, exc.status_code, envelope))
+
+    async def _handle(self, raw: str) -> None:
+        try:
+            message = ws_client_message_adapter.validate_json(raw)
+        except ValidationError as e:
+            await self._send_error(None, _validation_exception(e))
+            return
+
+        if isinstance(message, WSSubscribe):
+            await self._start_stream(message)
+        elif isinstance(message, WSUnsubscribe):
+            await self._stop_stream(message.stream)
+        elif isinstance(message, WSActionRequest):
+            await self._handle_action(message)
+
+    # ---- streams ----
+
+    async def _start_stream(self, message: WSSubscribe) -> None:
+        # 같은 stream을 다시 구독하면 이전 구독을 끊고 새로 시작한다. (재연결과 같은 의미)
+        await self._stop_stream(message.stream)
+        if message.stream == WSStream.ROOM:
+            run = self._run_room_stream(message.last_event_id)
+        else:
+            run = self._run_case_stream(message.last_event_id, message.encoding)
+        self._streams[message.stream] = asyncio.create_task(self._guard(message.stream, run))
+
+    @staticmethod
+    async def _guard(stream: WSStream, run: Awaitable[None]) -> None:
+        # stream 하나가 실패해도 연결(다른 stream, action)은 유지한다.
+        try:
+            await run
+        except Exception:
+            logger.exception("WebSocket stream failed: %s", stream.value)
+
+    async def _stop_stream(self, stream: WSStream) -> None:
+        task = self._streams.pop(stream, None)
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _forward(self, stream: WSStream, frames: AsyncIterator[bytes]) -> None:
+        async with aclosing(frames):  # type: ignore[type-var]
+            async for frame in frames:
+                await self._send(build_ws_event_message(stream, frame))
+
+    async def _run_room_stream(self, last_event_id: str | None) -> None:
+        room_state_stream = RoomStateStream(
+            self._room_event_bus,
+            SessionPerCallRoomSnapshotQuery(
+                self._read_sessions, presence=self._presence, user_id=self._user.id
+            ),
+            self._room_state_broadcaster,
+            buffer_config=self._buffer_config,
+            user_event_bus=self._user_event_bus,
+            connections=self._connections,
+            presence=self._presence,
+        )
+        frames = room_state_stream.stream(self._user.id, self._room_id, last_event_id=last_event_id)
+        await self._forward(WSStream.ROOM, frames)
+
+    async def _run_case_stream(
+        self, last_event_id: str | None, encoding: CaseFrameEncoding
+    ) -> None:
+        async with self._session_factory() as session:
+            case_ = await CaseRepo(session).get_running_by_room_id(room_id=self._room_id)
+        if case_ is None:
+            await self._send_error(None, _not_on_case_exception())
+            return
+
+        after_snapshot_no = None
+        if last_event_id is not None and last_event_id.isdigit():
+            after_snapshot_no = int(last_event_id)
+
+        case_state_stream = CaseStateStream(
+            case_event_bus=self._case_event_bus,
+            case_history_repo=SessionPerCallCaseHistory(self._read_sessions),
+            case_frame_cache=self._case_frame_cache,
+            buffer_config=self._buffer_config,
+            case_patch_frames=self._case_patch_frames,
+            presence=self._presence,
+        )
+        frames = case_state_stream.stream(
+            case_id=case_.id,
+            after_snapshot_no=after_snapshot_no,
+            encoding=encoding,
+            user_id=self._user.id,
+            room_id=self._room_id,
+        )
+        await self._forward(WSStream.CASE, frames)
+
+    # ---- actions ----
+
+    async def _current_case(self) -> Case:
+        async with self._session_factory() as session:
+            case_ = await CaseRepo(session).get_running_by_room_id(room_id=self._room_id)
+        if case_ is None:
+            raise _not_on_case_exception()
+        return case_
+
+    async def _handle_action(self, message: WSActionRequest) -> None:
+        handler = self._action_handlers()[message.action]
+        try:
+            response = await handler(message.body or {})
+        except ValidationError as e:
+            await self._send_error(message.request_id, _validation_exception(e))
+            return
+        except EnvelopeHTTPException as e:
+            await self._send_error(message.request_id, e)
+            return
+        result = build_ws_action_result_message(message.request_id, response.model_dump_json())
+        await self._send(result)
+
+    def _action_handlers(self) -> dict[WSAction, Callable[[dict], Awaitable[BaseModel]]]:
+        async def _red_vote(body: dict) -> BaseModel:
+            case_ = await self._current_case()
+            return await red_vote(RedVoteRequest.model_validate(body), case_.id)
+
+        async def _blue_vote(body: dict) -> BaseModel:
+            return await blue_vote(BlueVoteRequest.model_validate(body))
+
+        async def _init_blue_vote(body: dict) -> BaseModel:
+            return await init_blue_vote(InitBlueVoteRequest.model_validate(body))
+
+        async def _force_skip(body: dict) -> BaseModel:
+            return await force_skip_discuss()
+
+        return {
+            WSAction.RED_VOTE: _red_vote,
+            WSAction.BLUE_VOTE: _blue_vote,
+            WSAction.INIT_BLUE_VOTE: _init_blue_vote,
+            WSAction.FORCE_SKIP: _force_skip,
+        }
+
+
+def _not_on_case_exception() -> EnvelopeHTTPException:
+    return EnvelopeHTTPException(
+        status_code=status.HTTP_409_CONFLICT, code=ConflictErrorCode.CONFLICT_NOT_ON_CASE
+    )
+
+
+def _validation_exception(e: ValidationError) -> EnvelopeHTTPException:
+    return EnvelopeHTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        code=CommonErrorCode.VALIDATION_ERROR,
+        data=json.loads(e.json(include_url=False)),
+    )
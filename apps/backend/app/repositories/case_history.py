@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.case_snapshot import CaseSnapshotHistory
@@ -18,6 +18,12 @@ class CaseSnapshotHistoryRepo:
         )
         return (await self.db.execute(q)).scalar_one_or_none()
 
+    async def get_latest_snapshot_no(self, *, case_id: CaseId) -> int | None:
+        q = select(func.max(CaseSnapshotHistory.snapshot_no)).where(
+            CaseSnapshotHistory.case_id == case_id
+        )
+        return (await self.db.execute(q)).scalar_one_or_none()
+
     async def get_by_snapshot_no(
         self, *, case_id: CaseId, snapshot_no: int
     ) -> CaseSnapshotHistory | None:
@@ -27,8 +33,9 @@ class CaseSnapshotHistoryRepo:
         return (await self.db.execute(q)).scalar_one_or_none()
 
     async def get_after_snapshot_no(
-        self, *, case_id: CaseId, last_seen_no: int
+        self, *, case_id: CaseId, last_seen_no: int, until_no: int | None = None
     ) -> list[CaseSnapshotHistory]:
+        """last_seen_no 이후(until_no가 있으면 until_no까지) snapshot을 순서대로 반환한다."""
         q = (
             select(CaseSnapshotHistory)
             .where(
@@ -37,6 +44,24 @@ class CaseSnapshotHistoryRepo:
             )
             .order_by(CaseSnapshotHistory.snapshot_no)
         )
+        if until_no is not None:
+            q = q.where(CaseSnapshotHistory.snapshot_no <= until_no)
+        result = await self.db.execute(q)
+        return list(result.scalars().all())
+
+    async def get_between_snapshot_no(
+        self, *, case_id: CaseId, first_no: int, last_no: int
+    ) -> list[CaseSnapshotHistory]:
+        """first_no..last_no(포함) snapshot을 순서대로 반환한다."""
+        q = (
+            select(CaseSnapshotHistory)
+            .where(
+                CaseSnapshotHistory.case_id == case_id,
+                CaseSnapshotHistory.snapshot_no >= first_no,
+                CaseSnapshotHistory.snapshot_no <= last_no,
+            )
+            .order_by(CaseSnapshotHistory.snapshot_no)
+        )
         result = await self.db.execute(q)
         return list(result.scalars().all())
 
@@ -6,6 +6,7 @@ from app.infra.db.session import DbSessionDep
 from app.repositories.case import CaseRepo
 from app.repositories.case_history import CaseSnapshotHistoryRepo
 from app.repositories.case_player import CasePlayerRepo
+from app.repositories.outbox import EventOutboxRepo
 from app.repositories.phase import PhaseRepo
 from app.repositories.room import RoomRepo
 from app.repositories.room_member import RoomMemberRepo
@@ -59,3 +60,10 @@ def get_phase_repo(db: DbSessionDep) -> PhaseRepo:
 
 
 PhaseRepoDep = Annotated[PhaseRepo, Depends(get_phase_repo)]
+
+
+def get_event_outbox_repo(db: DbSessionDep) -> EventOutboxRepo:
+    return EventOutboxRepo(db)
+
+
+EventOutboxRepoDep = Annotated[EventOutboxRepo, Depends(get_event_outbox_repo)]
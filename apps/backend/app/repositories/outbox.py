@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.case import CaseEventDelta
+from app.domain.events.room import RoomEventDelta
+from app.domain.events.user import UserEvent
+from app.models.outbox import EventOutbox
+from app.schemas.common.ids import CaseId, RoomId, UserId
+
+
+class EventOutboxRepo:
+    """
+    event_outbox 테이블에 대한 DB 접근 전용 레포.
+
+    규칙:
+    - commit/rollback은 하지 않는다. (서비스/relay가 트랜잭션 경계를 책임)
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    def add_room_event(self, *, room_id: RoomId, event: RoomEventDelta) -> EventOutbox:
+        # version은 relay가 처음 publish할 때 매겨 row에 남기고, snapshot_json은 매번 채운다.
+        payload = event.model_dump(mode="json", exclude={"version", "snapshot_json"})
+        row = EventOutbox(topic_kind="room", topic_id=room_id, payload=payload)
+        self._db.add(row)
+        return row
+
+    def add_case_event(self, *, case_id: CaseId, event: CaseEventDelta) -> EventOutbox:
+        payload = event.model_dump(mode="json")
+        row = EventOutbox(topic_kind="case", topic_id=case_id, payload=payload)
+        self._db.add(row)
+        return row
+
+    def add_user_event(self, *, user_id: UserId, event: UserEvent) -> EventOutbox:
+        payload = event.model_dump(mode="json")
+        row = EventOutbox(topic_kind="user", topic_id=user_id, payload=payload)
+        self._db.add(row)
+        return row
+
+    async def claim_pending(self, *, limit: int) -> list[EventOutbox]:
+        """미전달 row를 id 순서로 잠그고 가져온다.
+
+        FOR UPDATE라서 여러 worker의 relay가 동시에 돌아도 같은 row를 두 번 잡지 않는다.
+        id는 insert 순서일 뿐 commit 순서가 아니므로(늦게 commit된 작은 id는 다음 batch로
+        밀린다) topic 안의 publish 순서도 보장하지 않는다. 수신 측은 room version,
+        case snapshot_no로 순서/중복을 판단한다.
+        """
+        q = (
+            select(EventOutbox)
+            .where(EventOutbox.delivered_at.is_(None))
+            .order_by(EventOutbox.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        return list((await self._db.execute(q)).scalars())
+
+    async def mark_delivered(self, *, ids: Sequence[int]) -> None:
+        q = (
+            update(EventOutbox)
+            .where(EventOutbox.id.in_(ids))
+            .values(delivered_at=datetime.now(timezone.utc))
+        )
+        await self._db.execute(q)
+
+    async def delete_delivered(self, *, before: datetime) -> int:
+        """before 이전에 전달된 row를 지운다. 지운 row 수를 반환한다."""
+        q = delete(EventOutbox).where(
+            EventOutbox.delivered_at.is_not(None), EventOutbox.delivered_at < before
+        )
+        result = await self._db.execute(q)
+        return result.rowcount  # type: ignore[attr-defined]
@@ -3,10 +3,13 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.enum import CaseStatus
 from app.models.auth import User
+from app.models.case import Case, CasePlayer
 from app.models.room import RoomMember
 from app.repositories.projections import SnapshotRoomMember
 
@@ -22,33 +25,27 @@ class RoomMemberRepo:
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
 
-    async def upsert_membership(self, *, room_id: UUID, user_id: UUID) -> RoomMember:
+    async def upsert_membership(self, *, room_id: UUID, user_id: UUID) -> RoomMember | None:
         """
-        (room_id, user_id) 복합 PK 설계에 맞춘 join 처리.
+        (room_id, user_id) 복합 PK 설계에 맞춘 join 처리. (INSERT ... ON CONFLICT 한 문장)
 
         - row가 없으면: INSERT
         - row가 있는데 left_at != NULL이면: revive (left_at=NULL, joined_at=now)
-        - row가 있는데 left_at IS NULL이면: 그대로 반환 (idempotent)
+        - row가 있는데 left_at IS NULL이면: 아무것도 바꾸지 않고 None (idempotent)
+
+        바뀐 row를 반환하므로 None이 아니면 상태가 바뀐 것이다.
         """
-        q = select(RoomMember).where(
-            RoomMember.room_id == room_id,
-            RoomMember.user_id == user_id,
+        insert_stmt = insert(RoomMember).values(room_id=room_id, user_id=user_id)
+        upsert_stmt = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[RoomMember.room_id, RoomMember.user_id],
+                set_={"left_at": None, "joined_at": datetime.now(timezone.utc)},
+                where=RoomMember.left_at.is_not(None),
+            )
+            .returning(RoomMember)
+            .execution_options(populate_existing=True)
         )
-        member = (await self._db.execute(q)).scalar_one_or_none()
-        if member is None:
-            member = RoomMember(room_id=room_id, user_id=user_id)
-            self._db.add(member)
-            # commit/flush는 service가 책임지는 패턴이면 여기서 하지 않음
-            return member
-
-        # 이미 active면 그대로
-        if member.left_at is None:
-            return member
-
-        # revive
-        member.left_at = None
-        member.joined_at = datetime.now(timezone.utc)
-        return member
+        return (await self._db.scalars(upsert_stmt)).one_or_none()
 
     async def get_active_by_user_id(self, *, user_id: UUID) -> RoomMember | None:
         q = select(RoomMember).where(
@@ -57,16 +54,47 @@ class RoomMemberRepo:
         )
         return (await self._db.execute(q)).scalar_one_or_none()
 
-    async def leave_active_by_user_id(self, *, user_id: UUID) -> RoomMember | None:
+    async def leave_active_by_user_id(
+        self,
+        *,
+        user_id: UUID,
+        room_id: UUID | None = None,
+        except_room_id: UUID | None = None,
+        keep_running_case_players: bool = False,
+    ) -> RoomMember | None:
         """
-        active membership을 종료(left_at 세팅).
-        - 변경이 있으면 True, 없으면 False
+        active membership을 종료(left_at 세팅). (UPDATE ... RETURNING 한 문장)
+
+        - room_id: 그 room의 membership만 종료
+        - except_room_id: 그 room 외의 membership만 종료
+        - keep_running_case_players: 그 room에서 진행 중(RUNNING)인 case의 player면 종료하지 않는다.
+        - 종료한 membership을 반환하고, active가 없었으면(변경 없음) None
         """
-        active = await self.get_active_by_user_id(user_id=user_id)
-        if active is None:
-            return None
-        active.left_at = datetime.now(timezone.utc)
-        return active
+        q = update(RoomMember).where(
+            RoomMember.user_id == user_id,
+            RoomMember.left_at.is_(None),
+        )
+        if room_id is not None:
+            q = q.where(RoomMember.room_id == room_id)
+        if except_room_id is not None:
+            q = q.where(RoomMember.room_id != except_room_id)
+        if keep_running_case_players:
+            running_case_player = (
+                select(CasePlayer.id)
+                .join(Case, Case.id == CasePlayer.case_id)
+                .where(
+                    CasePlayer.user_id == RoomMember.user_id,
+                    Case.room_id == RoomMember.room_id,
+                    Case.status == CaseStatus.RUNNING,
+                )
+            )
+            q = q.where(~exists(running_case_player))
+        q = (
+            q.values(left_at=datetime.now(timezone.utc))
+            .returning(RoomMember)
+            .execution_options(populate_existing=True)
+        )
+        return (await self._db.scalars(q)).first()
 
     async def create_membership(self, *, user_id: UUID, room_id: UUID) -> RoomMember:
         member = RoomMember(user_id=user_id, room_id=room_id)
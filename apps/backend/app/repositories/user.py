@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.exceptions import EntityNotFoundError
@@ -33,3 +34,17 @@ class UserRepo:
         user = User(username=username)
         self.db.add(user)
         return user
+
+    async def upsert_by_username(self, username: str) -> User:
+        """username의 user를 가져오거나 만든다. (INSERT ... ON CONFLICT ... RETURNING 한 문장)
+
+        DO NOTHING은 충돌한 row를 RETURNING하지 않으므로 같은 값으로 DO UPDATE 한다.
+        동시에 같은 username이 들어와도 한쪽이 다른 쪽 commit을 기다렸다가 같은 row를 받는다.
+        """
+        insert_stmt = insert(User).values(username=username)
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[User.username],
+            set_={"username": insert_stmt.excluded.username},
+        ).returning(User)
+        res = await self.db.scalars(upsert_stmt, execution_options={"populate_existing": True})
+        return res.one()
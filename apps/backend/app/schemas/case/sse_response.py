@@ -1,6 +1,34 @@
+from enum import Enum
+from typing import Any
+
+from pydantic import Field
+
+from app.schemas.base import RequiredFieldsModel
 from app.schemas.case.state import CaseSnapshot
 from app.schemas.common.envelope import Envelope
 from app.schemas.sse.response import CaseRESTRespType, SSEEnvelopeCode
 
 CaseNotCreatedEnvelope = Envelope[None, CaseRESTRespType]
 CaseStateEnvelope = Envelope[CaseSnapshot, SSEEnvelopeCode]
+
+
+class CaseFrameEncoding(str, Enum):
+    """case state SSE frame 인코딩.
+
+    - FULL: 매 frame이 전체 CaseSnapshot (기본)
+    - PATCH: 직전 snapshot 대비 RFC 6902 patch. keyframe, 첫 frame, gap에는 전체 snapshot
+    """
+
+    FULL = "full"
+    PATCH = "patch"
+
+
+class CasePatch(RequiredFieldsModel):
+    """base_snapshot_no의 snapshot에 ops(RFC 6902)를 적용하면 snapshot_no의 snapshot이 된다."""
+
+    base_snapshot_no: int = Field(description="Snapshot no the patch applies to.")
+    snapshot_no: int = Field(description="Snapshot no after applying the patch.")
+    ops: list[dict[str, Any]] = Field(description="RFC 6902 JSON patch operations.")
+
+
+CasePatchEnvelope = Envelope[CasePatch, SSEEnvelopeCode]
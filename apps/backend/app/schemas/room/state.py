@@ -100,11 +100,13 @@ class RoomMember(RequiredFieldsModel):
     Field interpretation
     - members에는 left_at이 null인 active 멤버만 포함합니다(실제 구현 규칙).
     - members의 정렬은 joined_at ASC(입장 순)입니다(실제 구현 규칙).
+    - online: room stream 연결이 살아있는지(presence). presence를 쓰지 않으면 null입니다.
     """
 
     user_id: UUID
     username: Annotated[str, Field(min_length=4, max_length=255)]
     joined_at: Annotated[str, Field(description="ISO-8601 UTC string")]
+    online: bool | None = None
 
 
 class RoomSnapshot(RequiredFieldsModel):
@@ -16,6 +16,9 @@ class SSEEventType(str, Enum):
 
     - ROOM_EVENT: room change 일어남.
     - CASE_EVENT: case change 일어남.
+    - CASE_PATCH: case change 일어남. (직전 snapshot 대비 patch, encoding=patch일 때)
+
+    - NOTIFICATION: 이 user에게만 보내는 알림. (stream은 유지)
 
     - STREAM_CLOSE: close로 인한 stream 끊기
     """
@@ -24,6 +27,9 @@ class SSEEventType(str, Enum):
 
     ROOM_EVENT = "ROOM_EVENT"
     CASE_EVENT = "CASE_EVENT"
+    CASE_PATCH = "CASE_PATCH"
+
+    NOTIFICATION = "NOTIFICATION"
 
     STREAM_CLOSE = "STREAM_CLOSE"
 
@@ -35,10 +41,13 @@ class SSEEnvelopeCode(str, Enum):
 
     ROOM_STATE = "ROOM_STATE"
     CASE_STATE = "CASE_STATE"
+    CASE_PATCH = "CASE_PATCH"
 
     ROOM_LEAVE = "ROOM_LEAVE"
     ROOM_KICKED = "ROOM_KICKED"
 
     ROOM_MEMBERSHIP_INVALID = "ROOM_MEMBERSHIP_INVALID"
 
+    NOTIFICATION = "NOTIFICATION"
+
     STREAM_CLOSE = "STREAM_CLOSE"  # 강제 종료 시 (close api 등)
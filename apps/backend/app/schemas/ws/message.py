@@ -0,0 +1,75 @@
+from enum import Enum
+from typing import Annotated, Any, Literal
+
+from pydantic import Field, TypeAdapter
+
+from app.schemas.base import RequiredFieldsModel
+from app.schemas.case.sse_response import CaseFrameEncoding
+
+
+class WSStream(str, Enum):
+    """WebSocket 하나에 multiplex 되는 stream 종류. (SSE의 room/case state에 대응)"""
+
+    ROOM = "room"
+    CASE = "case"
+
+
+class WSAction(str, Enum):
+    """WebSocket으로 받을 수 있는 case action. (REST /api/v1/cases/current/* 에 대응)"""
+
+    RED_VOTE = "red-vote"
+    BLUE_VOTE = "blue-vote"
+    INIT_BLUE_VOTE = "init-blue-vote"
+    FORCE_SKIP = "force-skip"
+
+
+class WSServerMessageType(str, Enum):
+    """
+    - EVENT: stream frame (SSE frame의 event/id/data를 그대로 옮김)
+    - ACTION_RESULT: action 처리 결과 (REST 응답 envelope과 같은 shape)
+    - ERROR: 요청을 처리하지 못함 (data는 error envelope)
+    """
+
+    EVENT = "event"
+    ACTION_RESULT = "action_result"
+    ERROR = "error"
+
+
+class WSSubscribe(RequiredFieldsModel):
+    """
+    stream 구독 시작.
+
+    - last_event_id: SSE의 Last-Event-ID와 같은 의미 (room: version, case: snapshot_no)
+    - encoding: case stream frame 인코딩 (SSE의 ?encoding=과 같음, room stream은 무시)
+    """
+
+    type: Literal["subscribe"]
+    stream: WSStream
+    last_event_id: str | None = None
+    encoding: CaseFrameEncoding = CaseFrameEncoding.FULL
+
+
+class WSUnsubscribe(RequiredFieldsModel):
+    type: Literal["unsubscribe"]
+    stream: WSStream
+
+
+class WSActionRequest(RequiredFieldsModel):
+    """
+    case action 제출.
+
+    - request_id: client가 정하는 값. 결과(action_result/error)에 그대로 돌려준다.
+    - body: REST 요청 바디와 같은 shape (force-skip은 없음)
+    """
+
+    type: Literal["action"]
+    request_id: str
+    action: WSAction
+    body: dict[str, Any] | None = None
+
+
+WSClientMessage = Annotated[
+    WSSubscribe | WSUnsubscribe | WSActionRequest, Field(discriminator="type")
+]
+
+ws_client_message_adapter: TypeAdapter[WSClientMessage] = TypeAdapter(WSClientMessage)
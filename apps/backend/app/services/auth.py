@@ -5,11 +5,11 @@ from uuid import UUID
 
 from fastapi import Depends, status
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.error_codes import AuthCommonErrorCode, AuthUserErrorCode
 from app.core.exceptions import EnvelopeHTTPException
+from app.infra.db.read_routing import pin_user_after_commit
 from app.infra.db.session import DbSessionDep
 from app.models.auth import User
 from app.repositories.deps import UserRepoDep
@@ -22,23 +22,13 @@ class AuthService:
         self.repo = user_repo
 
     async def get_or_create_guest_user(self, username: str) -> User:
-        """게스트 로그인용 user upsert."""
-
-        user = await self.repo.get_by_username(username)
-        if user:
-            return user
-
-        user = await self.repo.create(username=username)
-        try:
-            await self.db.commit()
-        except IntegrityError:
-            # UNIQUE(username) 레이스: 생성이 먼저 된 경우 재조회
-            await self.db.rollback()
-            user = await self.repo.get_by_username(username)
-            assert user is not None
-            return user
-
-        await self.db.refresh(user)
+        """게스트 로그인용 user upsert. (upsert 한 문장 + commit)"""
+
+        user = await self.repo.upsert_by_username(username)
+        # 방금 만든 user를 바로 다음 요청(/auth/me 등)에서 replica가 못 찾는 일이 없도록
+        # (commit이 pin하므로 commit 전에 표시한다)
+        pin_user_after_commit(self.db, user.id)
+        await self.db.commit()
         return user
 
     async def get_username_by_user_id(self, user_id: str | UUID) -> str:
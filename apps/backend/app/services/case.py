@@ -11,11 +11,13 @@ from app.domain.enum import CaseStatus
 from app.domain.events.case import CaseEventDelta, CaseSnapshotType
 from app.infra.pubsub.bus.case_event_bus import CaseEventBus
 from app.infra.pubsub.bus.room_event_bus import RoomEventBus
-from app.infra.pubsub.topics import CaseTopic
+from app.infra.redis.request_context import RequestContextCache
 from app.models.case import Case, CasePlayer
+from app.realtime_.sse.case_frame_cache import CaseFrameCache, build_case_frame
 from app.repositories.case import CaseRepo
 from app.repositories.case_history import CaseSnapshotHistoryRepo
 from app.repositories.case_player import CasePlayerRepo
+from app.repositories.outbox import EventOutboxRepo
 from app.repositories.phase import PhaseRepo
 from app.repositories.room import RoomRepo
 from app.repositories.room_member import RoomMemberRepo
@@ -29,6 +31,7 @@ from app.schemas.case.state import (
 )
 from app.schemas.common.ids import RoomId, UserId
 from app.schemas.room.mutation import CaseStartMutation
+from app.services.outbox_relay import OutboxRelay
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +49,10 @@ class CaseService:
         phase_repo: PhaseRepo,
         room_event_bus: RoomEventBus,
         case_event_bus: CaseEventBus,
+        case_frame_cache: CaseFrameCache,
+        outbox_repo: EventOutboxRepo,
+        outbox_relay: OutboxRelay,
+        context_cache: RequestContextCache,
     ):
         self._db = db
         self._case_repo = case_repo
@@ -56,6 +63,10 @@ class CaseService:
         self._phase_repo = phase_repo
         self._room_event_bus = room_event_bus
         self._case_event_bus = case_event_bus
+        self._case_frame_cache = case_frame_cache
+        self._outbox_repo = outbox_repo
+        self._outbox_relay = outbox_relay
+        self._context_cache = context_cache
 
     def _build_initial_snapshot(
         self,
@@ -138,16 +149,24 @@ class CaseService:
             schema_version=schema_version,
             snapshot_json=snapshot.model_dump(mode="json"),
         )
-        await self._db.commit()
-        try:
-            await self._case_event_bus.publish(
-                CaseTopic(case.id),
+        # case event는 같은 트랜잭션에서 outbox에 쓰고, commit 후 relay가 publish한다.
+        self._outbox_repo.add_case_event(
+            case_id=case.id,
+            event=self._case_event_bus.with_inline_snapshot(
                 CaseEventDelta(
                     type=CaseSnapshotType.STARTED,
                     phase_id=phase.id,
                     snapshot_no=case_history.snapshot_no,
                 ),  # type: ignore[call-arg]
-            )
-        except Exception:
-            pass
+                snapshot,
+            ),
+        )
+        await self._db.commit()
+        # commit된 snapshot은 불변이므로, publish 전에 frame 캐시를 미리 채운다.
+        await self._case_frame_cache.put(
+            case.id, case_history.snapshot_no, build_case_frame(snapshot, case_history.snapshot_no)
+        )
+        self._outbox_relay.kick()
+        # player들의 요청 context(running case)가 바뀌었다.
+        await self._context_cache.invalidate(user_ids)
         return CaseStartMutation(subject_id=case.id)
@@ -4,16 +4,20 @@ from fastapi import Depends
 
 from app.infra.db.session import DbSessionDep
 from app.infra.pubsub.bus.deps import CaseEventBusDep, RoomEventBusDep
+from app.infra.redis.request_context import RequestContextCacheDep
+from app.realtime_.sse.case_frame_cache import CaseFrameCacheDep
 from app.repositories.deps import (
     CaseHistoryRepoDep,
     CasePlayerRepoDep,
     CaseRepoDep,
+    EventOutboxRepoDep,
     PhaseRepoDep,
     RoomMemberRepoDep,
     RoomRepoDep,
     UserRepoDep,
 )
 from app.services.case import CaseService
+from app.services.outbox_relay import OutboxRelayDep
 from app.services.room import RoomService
 
 
@@ -21,9 +25,18 @@ def get_room_service(
     db: DbSessionDep,
     repo: RoomMemberRepoDep,
     user_repo: UserRepoDep,
-    room_event_bus: RoomEventBusDep,
+    outbox_repo: EventOutboxRepoDep,
+    outbox_relay: OutboxRelayDep,
+    context_cache: RequestContextCacheDep,
 ) -> RoomService:
-    return RoomService(db, member_repo=repo, user_repo=user_repo, room_event_bus=room_event_bus)
+    return RoomService(
+        db,
+        member_repo=repo,
+        user_repo=user_repo,
+        outbox_repo=outbox_repo,
+        outbox_relay=outbox_relay,
+        context_cache=context_cache,
+    )
 
 
 RoomServiceDep = Annotated[RoomService, Depends(get_room_service)]
@@ -39,6 +52,10 @@ def get_case_service(
     phase_repo: PhaseRepoDep,
     room_event_bus: RoomEventBusDep,
     case_event_bus: CaseEventBusDep,
+    case_frame_cache: CaseFrameCacheDep,
+    outbox_repo: EventOutboxRepoDep,
+    outbox_relay: OutboxRelayDep,
+    context_cache: RequestContextCacheDep,
 ) -> CaseService:
     case_service = CaseService(
         db,
@@ -50,6 +67,10 @@ def get_case_service(
         phase_repo=phase_repo,
         room_event_bus=room_event_bus,
         case_event_bus=case_event_bus,
+        case_frame_cache=case_frame_cache,
+        outbox_repo=outbox_repo,
+        outbox_relay=outbox_relay,
+        context_cache=context_cache,
     )
     return case_service
 
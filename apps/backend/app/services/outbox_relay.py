@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Any
+from weakref import WeakKeyDictionary
+
+from fastapi import Depends
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import SettingsDep, get_settings
+from app.domain.events.case import CaseEventDelta
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.domain.events.user import UserEvent
+from app.infra.db.session import SessionFactoryDep
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.bus.deps import (
+    CaseEventBusDep,
+    RoomEventBusDep,
+    UserEventBusDep,
+    get_case_event_bus,
+    get_room_event_bus,
+    get_user_event_bus,
+)
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
+from app.infra.pubsub.topics import CaseTopic, RoomTopic, Topic, UserTopic
+from app.infra.pubsub.transport.base import PubSub
+from app.infra.pubsub.transport.deps import PubSubDep, get_pubsub
+from app.infra.redis.client import get_redis_binary_client, get_redis_client
+from app.infra.redis.event_version import get_room_event_versions
+from app.infra.redis.presence import RoomPresence, RoomPresenceDep, get_room_presence
+from app.infra.redis.read_pins import ReadPins, ReadPinsDep, get_read_pins
+from app.infra.serialization.codec import get_pubsub_codec
+from app.models.outbox import EventOutbox
+from app.mvp import mvp_logs_mapper
+from app.queries.room_snapshot import RoomSnapshotReadModel
+from app.repositories.outbox import EventOutboxRepo
+from app.schemas.common.ids import RoomId
+from app.schemas.room.state import RoomSnapshot
+
+logger = logging.getLogger(__name__)
+
+# 전달된 row 정리(delete_delivered)를 이 간격보다 자주 하지 않는다.
+_PRUNE_INTERVAL_S = 60.0
+
+
+class OutboxRelay:
+    """event_outbox의 미전달 row를 pubsub으로 보내는 background relay.
+
+    - 서비스는 mutation과 같은 트랜잭션에서 outbox row를 쓰고, commit 후 kick()만 부른다.
+      (요청 지연에 publish 왕복이 들어가지 않는다)
+    - flush: row를 id 순서로 batch만큼 잠그고, publish_many(pipeline 1회)로 보낸 뒤
+      delivered_at을 채워 commit한다. publish나 commit이 실패하면 rollback되어 다음에 다시 보낸다.
+      -> at-least-once. 순서는 보장하지 않는다. (EventOutboxRepo.claim_pending 참고)
+    - room event version은 처음 보낼 때 매겨서 publish 전에 row에 commit해둔다.
+      다시 보내는 row는 같은 version으로 나가므로 수신 측이 version으로 중복을 거를 수 있다.
+      (case event는 snapshot_no가 row에 이미 들어 있다)
+    - read replica를 쓰면, publish 전에 event 대상 room/user를 primary로 pin한다. (ReadPins)
+    - loop: kick 또는 poll_interval_s마다 깨어나 남은 row가 없을 때까지 flush한다.
+      전달된 지 retention_s가 지난 row는 loop가 가끔(_PRUNE_INTERVAL_S) 지운다.
+    - lifespan 시작 시 한 번 kick해서, 재기동 전에 남은 row를 mutation 없이도 보낸다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        pubsub: PubSub,
+        room_event_bus: RoomEventBus,
+        case_event_bus: CaseEventBus,
+        user_event_bus: UserEventBus,
+        batch_size: int = 100,
+        poll_interval_s: float = 1.0,
+        retention_s: float = 3600.0,
+        presence: RoomPresence | None = None,
+        read_pins: ReadPins | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._pubsub = pubsub
+        self._room_event_bus = room_event_bus
+        self._case_event_bus = case_event_bus
+        self._user_event_bus = user_event_bus
+        self._batch_size = batch_size
+        self._poll_interval_s = poll_interval_s
+        self._retention_s = retention_s
+        self._pruned_at: float | None = None
+        self._presence = presence
+        self._read_pins = read_pins
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task[None] | None = None
+
+    def kick(self) -> None:
+        """commit 직후 호출한다. relay loop를 (없으면 띄우고) 깨운다."""
+        if self._closing:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+        self._wakeup.set()
+
+    async def aclose(self) -> None:
+        """남은 row를 한 번 더 보내고 loop를 멈춘다.
+
+        flush 도중에 cancel하면 잠근 row와 connection이 정리되지 않은 채 남을 수 있으므로
+        cancel하지 않고 loop가 스스로 끝나기를 기다린다.
+        """
+        self._closing = True
+        if self._task is None:
+            return
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def flush(self) -> int:
+        """미전달 row를 한 batch 보낸다. 보낸(처리한) row 수를 반환한다."""
+        async with self._session_factory() as session:
+            repo = EventOutboxRepo(session)
+            rows = await repo.claim_pending(limit=self._batch_size)
+            while await self._assign_room_versions(rows):
+                # publish 전에 version을 commit해둔다. (commit하면 잠금이 풀리므로 다시 잡는다)
+                await session.commit()
+                rows = await repo.claim_pending(limit=self._batch_size)
+            if not rows:
+                return 0
+
+            messages: list[tuple[Topic, Any]] = []
+            for row in rows:
+                try:
+                    messages.append(await self._build_message(session, row))
+                except ValidationError:
+                    # 읽을 수 없는 row가 뒤의 row를 영원히 막지 않도록 버린다.
+                    logger.exception("Dropping malformed outbox row: id=%s", row.id)
+
+            if self._read_pins is not None:
+                # event를 받은 구독자가 replica에서 이전 상태를 읽지 않도록 publish 전에 pin한다.
+                await self._read_pins.pin(
+                    user_ids={row.topic_id for row in rows if row.topic_kind == "user"},
+                    room_ids={row.topic_id for row in rows if row.topic_kind == "room"},
+                )
+            await self._pubsub.publish_many(messages)
+            await repo.mark_delivered(ids=[row.id for row in rows])
+            await session.commit()
+            return len(rows)
+
+    async def _assign_room_versions(self, rows: list[EventOutbox]) -> bool:
+        """version이 없는 room row에 version을 매겨 payload에 남긴다. 하나라도 매겼으면 True"""
+        assigned = False
+        for row in rows:
+            if row.topic_kind != "room" or row.payload.get("version") is not None:
+                continue
+            try:
+                event = RoomEventDelta.model_validate(row.payload)
+            except ValidationError:
+                continue  # _build_message에서 버린다.
+            event = await self._room_event_bus.prepare(RoomTopic(row.topic_id), event)
+            if event.version is None:
+                continue  # versions를 쓰지 않는 bus (memory transport)
+            # JSON column은 in-place 변경을 추적하지 않으므로 새 dict로 바꾼다.
+            row.payload = {**row.payload, "version": event.version}
+            assigned = True
+        return assigned
+
+    async def prune(self) -> int:
+        """전달된 지 retention_s가 지난 row를 지운다. 지운 row 수를 반환한다."""
+        before = datetime.now(timezone.utc) - timedelta(seconds=self._retention_s)
+        async with self._session_factory() as session:
+            deleted = await EventOutboxRepo(session).delete_delivered(before=before)
+            await session.commit()
+        self._pruned_at = time.monotonic()
+        return deleted
+
+    def _prune_due(self) -> bool:
+        return self._pruned_at is None or time.monotonic() - self._pruned_at >= _PRUNE_INTERVAL_S
+
+    async def _build_message(self, session: AsyncSession, row: EventOutbox) -> tuple[Topic, Any]:
+        if row.topic_kind == "room":
+            room_topic = RoomTopic(row.topic_id)
+            room_event = await self._room_event_bus.prepare(
+                room_topic,
+                RoomEventDelta.model_validate(row.payload),
+                snapshot_loader=_room_snapshot_loader(
+                    session, row.topic_id, row.payload["type"], presence=self._presence
+                ),
+            )
+            return room_topic, self._room_event_bus.encode(room_event)
+
+        if row.topic_kind == "user":
+            user_event = UserEvent.model_validate(row.payload)
+            return UserTopic(row.topic_id), self._user_event_bus.encode(user_event)
+
+        case_event = CaseEventDelta.model_validate(row.payload)
+        return CaseTopic(row.topic_id), self._case_event_bus.encode(case_event)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                while await self.flush() >= self._batch_size:
+                    pass
+            except Exception:
+                logger.warning("Outbox relay flush failed; retrying later", exc_info=True)
+            if self._closing:
+                return
+            if self._prune_due():
+                try:
+                    await self.prune()
+                except Exception:
+                    logger.warning("Outbox prune failed; retrying later", exc_info=True)
+            with suppress(TimeoutError):
+                async with asyncio.timeout(self._poll_interval_s):
+                    await self._wakeup.wait()
+
+
+def _room_snapshot_loader(
+    session: AsyncSession,
+    room_id: RoomId,
+    event_type: str,
+    *,
+    presence: RoomPresence | None = None,
+) -> Callable[[], Awaitable[RoomSnapshot]]:
+    """fat event 모드에서 bus가 필요할 때만 호출하는 snapshot loader. (relay session으로 조회)"""
+
+    async def _load() -> RoomSnapshot:
+        query = RoomSnapshotReadModel(session, presence=presence)
+        last_event = RoomSnapshotType(event_type)
+        return await query.build_snapshot(
+            room_id=room_id, last_event=last_event, logs=mvp_logs_mapper(last_event)
+        )
+
+    return _load
+
+
+# pubsub(+ session factory)당 relay 하나. (worker 안에서 loop 하나가 outbox를 비운다)
+_relays: WeakKeyDictionary[PubSub, dict[async_sessionmaker[AsyncSession], OutboxRelay]] = (
+    WeakKeyDictionary()
+)
+
+
+def get_outbox_relay(
+    pubsub: PubSubDep,
+    room_event_bus: RoomEventBusDep,
+    case_event_bus: CaseEventBusDep,
+    user_event_bus: UserEventBusDep,
+    session_factory: SessionFactoryDep,
+    settings: SettingsDep,
+    presence: RoomPresenceDep,
+    read_pins: ReadPinsDep,
+) -> OutboxRelay:
+    relays = _relays.setdefault(pubsub, {})
+    relay = relays.get(session_factory)
+    if relay is None:
+        relay = relays[session_factory] = OutboxRelay(
+            session_factory,
+            pubsub=pubsub,
+            room_event_bus=room_event_bus,
+            case_event_bus=case_event_bus,
+            user_event_bus=user_event_bus,
+            batch_size=settings.outbox_relay_batch_size,
+            poll_interval_s=settings.outbox_relay_poll_seconds,
+            retention_s=settings.outbox_retention_seconds,
+            presence=presence,
+            read_pins=read_pins,
+        )
+    return relay
+
+
+OutboxRelayDep = Annotated[OutboxRelay, Depends(get_outbox_relay)]
+
+
+def start_outbox_relay(session_factory: async_sessionmaker[AsyncSession]) -> OutboxRelay:
+    """lifespan 시작 시 호출한다. 요청 dependency와 같은 relay를 띄워 남은 row를 한 번 비운다."""
+    settings = get_settings()
+    redis_client = get_redis_client()
+    pubsub = get_pubsub(settings, get_redis_binary_client())
+    codec = get_pubsub_codec()
+    relay = get_outbox_relay(
+        pubsub,
+        get_room_event_bus(pubsub, settings, get_room_event_versions(redis_client), codec),
+        get_case_event_bus(pubsub, settings, codec),
+        get_user_event_bus(pubsub, codec),
+        session_factory,
+        settings,
+        get_room_presence(settings, redis_client),
+        get_read_pins(settings, redis_client),
+    )
+    relay.kick()
+    return relay
+
+
+async def close_outbox_relays() -> None:
+    """lifespan 종료 시 남은 row를 보내고 relay loop를 멈춘다. (실패분은 재기동 후 lifespan에서)"""
+    relays = [relay for by_factory in _relays.values() for relay in by_factory.values()]
+    _relays.clear()
+    for relay in relays:
+        await relay.aclose()
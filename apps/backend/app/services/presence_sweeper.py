@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Annotated
+from weakref import WeakKeyDictionary
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import SettingsDep
+from app.infra.db.session import SessionFactoryDep
+from app.infra.redis.presence import RoomPresence, RoomPresenceDep
+from app.infra.redis.request_context import RequestContextCache, RequestContextCacheDep
+from app.repositories.outbox import EventOutboxRepo
+from app.repositories.room_member import RoomMemberRepo
+from app.repositories.user import UserRepo
+from app.schemas.common.ids import RoomId, UserId
+from app.services.outbox_relay import OutboxRelay, OutboxRelayDep
+from app.services.room import RoomService
+
+logger = logging.getLogger(__name__)
+
+
+class PresenceSweeper:
+    """presence TTL이 지난 멤버를 room에서 내보내는 background loop.
+
+    - interval_s마다 RoomPresence.claim_expired()로 만료된 user를 가져와
+      RoomService.leave_offline_member()로 membership을 끝낸다. (MEMBER_LEFT는 outbox로)
+    - 여러 worker에서 돌아도 claim_expired가 user 하나를 한 번만 넘겨준다.
+    - 첫 room stream이 열릴 때 start()로 뜬다. (heartbeat가 없으면 할 일도 없음)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        presence: RoomPresence,
+        outbox_relay: OutboxRelay,
+        context_cache: RequestContextCache,
+        interval_s: float = 10.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._presence = presence
+        self._outbox_relay = outbox_relay
+        self._context_cache = context_cache
+        self._interval_s = interval_s
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._closing:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="presence-sweeper")
+
+    async def aclose(self) -> None:
+        """loop를 멈춘다. (relay와 같은 이유로 sweep 도중에 cancel하지 않는다)"""
+        self._closing = True
+        if self._task is None:
+            return
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def sweep(self) -> int:
+        """만료된 멤버를 한 번 정리한다. 내보낸 멤버 수를 반환한다."""
+        left = 0
+        for room_id in await self._presence.rooms():
+            for user_id in await self._presence.claim_expired(room_id):
+                if await self._leave(room_id, user_id):
+                    left += 1
+        return left
+
+    async def _leave(self, room_id: RoomId, user_id: UserId) -> bool:
+        async with self._session_factory() as session:
+            room_service = RoomService(
+                session,
+                member_repo=RoomMemberRepo(session),
+                user_repo=UserRepo(session),
+                outbox_repo=EventOutboxRepo(session),
+                outbox_relay=self._outbox_relay,
+                context_cache=self._context_cache,
+            )
+            return await room_service.leave_offline_member(room_id=room_id, user_id=user_id)
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.warning("Presence sweep failed; retrying later", exc_info=True)
+            with suppress(TimeoutError):
+                async with asyncio.timeout(self._interval_s):
+                    await self._wakeup.wait()
+
+
+# session factory당 sweeper 하나.
+_sweepers: WeakKeyDictionary[async_sessionmaker[AsyncSession], PresenceSweeper] = (
+    WeakKeyDictionary()
+)
+
+
+def get_presence_sweeper(
+    presence: RoomPresenceDep,
+    outbox_relay: OutboxRelayDep,
+    session_factory: SessionFactoryDep,
+    settings: SettingsDep,
+    context_cache: RequestContextCacheDep,
+) -> PresenceSweeper | None:
+    if presence is None:
+        return None
+    sweeper = _sweepers.get(session_factory)
+    if sweeper is None:
+        sweeper = _sweepers[session_factory] = PresenceSweeper(
+            session_factory,
+            presence=presence,
+            outbox_relay=outbox_relay,
+            context_cache=context_cache,
+            interval_s=settings.presence_sweep_seconds,
+        )
+    return sweeper
+
+
+PresenceSweeperDep = Annotated[PresenceSweeper | None, Depends(get_presence_sweeper)]
+
+
+async def close_presence_sweepers() -> None:
+    """lifespan 종료 시 sweeper loop를 멈춘다."""
+    sweepers = list(_sweepers.values())
+    _sweepers.clear()
+    for sweeper in sweepers:
+        await sweeper.aclose()
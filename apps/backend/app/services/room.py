@@ -3,9 +3,10 @@ from __future__ import annotations
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.events.room import RoomEventDelta, RoomSnapshotType
-from app.infra.pubsub.bus.room_event_bus import RoomEventBus
-from app.infra.pubsub.topics import RoomTopic
+from app.domain.events.user import UserEvent, UserEventType
+from app.infra.redis.request_context import RequestContextCache
 from app.mvp import MVP_ROOM_ID
+from app.repositories.outbox import EventOutboxRepo
 from app.repositories.room_member import RoomMemberRepo
 from app.repositories.user import UserRepo
 from app.schemas.common.ids import RoomId, UserId
@@ -18,6 +19,7 @@ from app.schemas.room.mutation import (
     LeaveRoomMutation,
     LeaveRoomReason,
 )
+from app.services.outbox_relay import OutboxRelay
 
 
 class RoomService:
@@ -26,6 +28,8 @@ class RoomService:
 
     규칙:
     - commit/rollback은 여기서 한다. (repo는 순수 DB 접근만)
+    - room event는 mutation과 같은 트랜잭션에서 outbox에 쓰고, commit 후 relay를 깨운다.
+    - membership이 바뀌면 commit 후 그 user의 요청 context 캐시를 무효화한다.
     MVP에 host 이전 로직 누락
     """
 
@@ -34,12 +38,28 @@ class RoomService:
         db: AsyncSession,
         member_repo: RoomMemberRepo,
         user_repo: UserRepo,
-        room_event_bus: RoomEventBus,
+        outbox_repo: EventOutboxRepo,
+        outbox_relay: OutboxRelay,
+        context_cache: RequestContextCache,
     ) -> None:
         self._db = db
         self._member_repo = member_repo
         self._user_repo = user_repo
-        self._room_event_bus = room_event_bus
+        self._outbox_repo = outbox_repo
+        self._outbox_relay = outbox_relay
+        self._context_cache = context_cache
+
+    def _add_room_event(
+        self, room_id: RoomId, event_type: RoomSnapshotType, user_id: UserId
+    ) -> None:
+        """commit 전에 호출한다. (mutation과 같은 트랜잭션으로 기록)"""
+        self._outbox_repo.add_room_event(
+            room_id=room_id,
+            event=RoomEventDelta(
+                type=event_type,
+                user_id=user_id,
+            ),  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
+        )
 
     def _normalize_room_id(self, requested_room_id: RoomId) -> RoomId:
         return MVP_ROOM_ID
@@ -52,8 +72,9 @@ class RoomService:
         - active membership이 있고 room_id가 다르면 -> 기존 leave 후 새로 join
         """
         room_id = self._normalize_room_id(room_id)  # MVP
-        active = await self._member_repo.get_active_by_user_id(user_id=user_id)
-        if active is not None and active.room_id == room_id:
+        # 조회 없이 바로 upsert한다. 이미 active면 아무것도 바뀌지 않고 None
+        member = await self._member_repo.upsert_membership(user_id=user_id, room_id=room_id)
+        if member is None:
             # 이미 같은 방에 있음 -> 멱등
             return JoinRoomMutation(
                 target=Target.ROOM,
@@ -64,31 +85,17 @@ class RoomService:
                 reason=JoinRoomReason.ALREADY_JOINED,
             )
 
-        # 다른 방에 active가 있으면 먼저 종료
-        if active is not None:
-            await self._member_repo.leave_active_by_user_id(user_id=user_id)
+        # 다른 방에 active가 있으면 종료
+        await self._member_repo.leave_active_by_user_id(user_id=user_id, except_room_id=room_id)
 
-        # 새 멤버십 생성
-        member = await self._member_repo.upsert_membership(user_id=user_id, room_id=room_id)
+        # pubsub에는 snapshot이 아니라 event delta만 보낸다.
+        # 이미 가입된 상태(ALREADY_JOINED)처럼 상태 변화가 없는 경우에는 emit하지 않는다.
+        self._add_room_event(room_id, RoomSnapshotType.MEMBER_JOINED, user_id)
 
-        # 트랜잭션 확정
+        # 트랜잭션 확정 (joined_at은 RETURNING으로 이미 받았으므로 refresh하지 않는다)
         await self._db.commit()
-        # server_default(joined_at) 반영
-        await self._db.refresh(member)
-        # Redis pubsub에는 snapshot이 아니라 event delta만 publish한다.
-        # 이미 가입된 상태(ALREADY_JOINED)처럼 상태 변화가 없는 경우에는 emit하지 않는다.
-        try:
-            await self._room_event_bus.publish(
-                RoomTopic(room_id),
-                RoomEventDelta(
-                    type=RoomSnapshotType.MEMBER_JOINED,
-                    user_id=user_id,
-                ),  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
-            )
-        except Exception:
-            # MVP: join 응답 자체는 성공시켜야 하므로 event emit 실패는 삼킨다.
-            # (원하면 추후 로깅/리트라이/에러 정책으로 강화)
-            pass
+        self._outbox_relay.kick()
+        await self._context_cache.invalidate([user_id])
         return JoinRoomMutation(
             target=Target.ROOM,
             subject=Subject.ME,
@@ -105,6 +112,8 @@ class RoomService:
         - 없으면 멱등 처리 (changed=False)
         """
         left_member = await self._member_repo.leave_active_by_user_id(user_id=user_id)
+        if left_member is not None:
+            self._add_room_event(left_member.room_id, RoomSnapshotType.MEMBER_LEFT, user_id)
         await self._db.commit()
 
         if left_member is None:
@@ -117,18 +126,8 @@ class RoomService:
                 reason=LeaveRoomReason.ALREADY_LEFT,
             )
 
-        try:
-            await self._room_event_bus.publish(
-                RoomTopic(left_member.room_id),
-                RoomEventDelta(
-                    type=RoomSnapshotType.MEMBER_LEFT,
-                    user_id=user_id,
-                ),  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
-            )
-        except Exception:
-            # MVP: join 응답 자체는 성공시켜야 하므로 event emit 실패는 삼킨다.
-            # (원하면 추후 로깅/리트라이/에러 정책으로 강화)
-            pass
+        self._outbox_relay.kick()
+        await self._context_cache.invalidate([user_id])
         return LeaveRoomMutation(
             target=Target.ROOM,
             subject=Subject.ME,
@@ -138,6 +137,25 @@ class RoomService:
             reason=LeaveRoomReason.LEFT,
         )
 
+    async def leave_offline_member(self, *, room_id: RoomId, user_id: UserId) -> bool:
+        """presence TTL이 지난 멤버를 room에서 내보낸다. (sweeper용)
+
+        - 그 사이 다른 room으로 옮겼거나 이미 나갔으면 아무것도 하지 않는다.
+        - 진행 중인 case의 player는 내보내지 않는다. (case 중 연결이 잠깐 끊겨도 자리를 지킨다)
+        - DB 효과와 event는 leave와 동일 (MEMBER_LEFT)
+        """
+        left_member = await self._member_repo.leave_active_by_user_id(
+            user_id=user_id, room_id=room_id, keep_running_case_players=True
+        )
+        if left_member is None:
+            return False
+
+        self._add_room_event(room_id, RoomSnapshotType.MEMBER_LEFT, user_id)
+        await self._db.commit()
+        self._outbox_relay.kick()
+        await self._context_cache.invalidate([user_id])
+        return True
+
     async def kick_user(
         self,
         *,
@@ -150,39 +168,35 @@ class RoomService:
         - 누구나 누구를 kick 가능 (권한 체크 없음)
         - target이 현재 room에 없으면 멱등 처리
         - DB 효과는 leave와 동일 (left_at 채움)
+        - 나머지 멤버에게는 room event, 쫓겨난 user의 연결에는 user event로 알린다.
         """
 
-        # 1. target user 존재 확인 (없으면 EntityNotFoundError)
-        await self._user_repo.ensure_exists(target_user_id)
-
-        # 2. target의 active membership 조회
-        active = await self._member_repo.get_active_by_user_id(user_id=target_user_id)
+        # 1. 실제 kick (leave와 동일한 DB 변경, 조건부 UPDATE 한 번)
+        left_member = await self._member_repo.leave_active_by_user_id(user_id=target_user_id)
 
-        # 3. 방에 없는 경우 (멱등)
-        if active is None:
+        # 2. 방에 없는 경우 (멱등). target user가 없으면 EntityNotFoundError
+        if left_member is None:
+            await self._user_repo.ensure_exists(target_user_id)
             return KickUserMutation(
                 subject_id=target_user_id,
                 changed=False,
                 reason=KickUserReason.NOT_IN_ROOM,
             )
 
-        # 4. 실제 kick (leave와 동일한 DB 변경)
-        await self._member_repo.leave_active_by_user_id(user_id=target_user_id)
+        self._add_room_event(room_id, RoomSnapshotType.MEMBER_KICKED, target_user_id)
+        self._outbox_repo.add_user_event(
+            user_id=target_user_id,
+            event=UserEvent(
+                type=UserEventType.ROOM_KICKED,
+                user_id=target_user_id,
+                room_id=room_id,
+            ),  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
+        )
 
         await self._db.commit()
+        self._outbox_relay.kick()
+        await self._context_cache.invalidate([target_user_id])
 
-        try:
-            await self._room_event_bus.publish(
-                RoomTopic(room_id),
-                RoomEventDelta(
-                    type=RoomSnapshotType.MEMBER_KICKED,
-                    user_id=target_user_id,
-                ),  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
-            )
-        except Exception:
-            # MVP: join 응답 자체는 성공시켜야 하므로 event emit 실패는 삼킨다.
-            # (원하면 추후 로깅/리트라이/에러 정책으로 강화)
-            pass
         return KickUserMutation(
             subject_id=target_user_id,
             changed=True,
@@ -0,0 +1,172 @@
+"""codec micro-benchmark.
+
+실제 CaseSnapshot / RoomSnapshot payload로 codec별 인코딩/디코딩/SSE frame 생성 비용을 비교한다.
+
+- legacy: 이전 경로 (model_dump -> json.dumps(str) -> frame str -> StreamingResponse에서 encode)
+- 나머지: 설치된 codec (orjson, msgpack은 선택 의존성이라 없으면 건너뜀)
+
+실행 (apps/backend 에서):
+    python -m benchmarks.bench_codec [--number 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from app.domain.events.room import RoomSnapshotType
+from app.infra.serialization.codec import Codec, get_codec
+from app.realtime_.sse.frame import build_envelope_sse_frame
+from app.schemas.case.sse_response import CaseStateEnvelope
+from app.schemas.case.state import (
+    CaseSnapshot,
+    CaseState,
+    DiscussPhaseInfo,
+    PhaseState,
+    PhaseType,
+    Player,
+)
+from app.schemas.room.sse_response import RoomStateEnvelope
+from app.schemas.room.state import RoomCaseInfo, RoomInfo, RoomMember, RoomSnapshot
+from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
+
+_PLAYERS = 7  # SEAT_MAX_EXCLUSIVE - 1 (가득 찬 방)
+_LOGS = 40
+
+
+def _case_snapshot() -> CaseSnapshot:
+    return CaseSnapshot.model_validate(
+        {
+            "schema_version": 1,
+            "snapshot_no": 42,
+            "case_state": CaseState(case_id=uuid4(), round_no=3),
+            "phase_state": PhaseState(
+                phase_id=uuid4(),
+                phase_type=PhaseType.DISCUSS,
+                seq_in_round=4,
+                phase_no_in_round=2,
+                opened_at="2026-03-05T00:00:00.000Z",
+            ),
+            "players": [
+                Player(
+                    user_id=uuid4(),
+                    username=f"플레이어{i:02d}",
+                    seat_no=i,
+                    life_left=2 - i % 3 % 2,
+                    vote_tokens=i % 3,
+                )
+                for i in range(_PLAYERS)
+            ],
+            "night_phase_info": None,
+            "vote_phase_info": None,
+            "discuss_phase_info": DiscussPhaseInfo.model_validate(
+                {
+                    "player_damaged": 2,
+                    "blue_vote_left": 1,
+                    "last_vote_type": "RED_VOTE",
+                    "fail_reason": "TIE",
+                }
+            ),
+            "logs": [f"{n}번째 로그: seat {n % _PLAYERS}가 투표했습니다." for n in range(_LOGS)],
+        }
+    )
+
+
+def _room_snapshot() -> RoomSnapshot:
+    return RoomSnapshot(
+        room=RoomInfo(room_name="test_room", created_at="2026-01-01T00:00:00.000Z"),
+        current_case=RoomCaseInfo(case_id=uuid4(), status=None),
+        members=[
+            RoomMember(
+                user_id=uuid4(), username=f"user{i:04d}", joined_at="2026-01-01T00:00:00.000Z"
+            )
+            for i in range(_PLAYERS)
+        ],
+        last_event=RoomSnapshotType.MEMBER_JOINED,
+        logs=["user0003 님이 입장했습니다."],
+    )
+
+
+def _legacy_frame(event: SSEEventType, envelope: BaseModel, id_: int) -> bytes:
+    data = json.dumps(envelope.model_dump(mode="json"), ensure_ascii=False)
+    return f"event: {event.value}\nid: {id_}\ndata: {data}\n\n".encode()
+
+
+def _cases(
+    model: BaseModel, envelope: BaseModel, event: SSEEventType, codecs: list[Codec]
+) -> dict[str, dict[str, Callable[[], object]]]:
+    legacy_payload = json.dumps(model.model_dump(mode="json"), ensure_ascii=False)
+    cases: dict[str, dict[str, Callable[[], object]]] = {
+        "legacy": {
+            "encode": lambda: json.dumps(model.model_dump(mode="json"), ensure_ascii=False),
+            "decode": lambda: type(model).model_validate(json.loads(legacy_payload)),
+            "frame": lambda: _legacy_frame(event, envelope, 42),
+        }
+    }
+    for codec in codecs:
+        payload = codec.encode_model(model)
+        cases[codec.name] = {
+            "encode": lambda c=codec: c.encode_model(model),
+            "decode": lambda c=codec, p=payload: c.decode_model(type(model), p),
+        }
+        if codec.text:
+            cases[codec.name]["frame"] = lambda c=codec: build_envelope_sse_frame(
+                event=event,
+                data=envelope,
+                id_=42,
+                codec=c,  # type: ignore[arg-type]
+            )
+    return cases
+
+
+def _available_codecs() -> list[Codec]:
+    codecs: list[Codec] = []
+    for name in ("json", "orjson", "msgpack"):
+        try:
+            codecs.append(get_codec(name))
+        except RuntimeError as e:
+            print(f"skip {name}: {e}")
+    return codecs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5_000)
+    args = parser.parse_args()
+
+    codecs = _available_codecs()
+    case = _case_snapshot()
+    room = _room_snapshot()
+    targets = {
+        "CaseSnapshot": _cases(
+            case,
+            CaseStateEnvelope(ok=True, code=SSEEnvelopeCode.CASE_STATE, message=None, data=case),
+            SSEEventType.CASE_EVENT,
+            codecs,
+        ),
+        "RoomSnapshot": _cases(
+            room,
+            RoomStateEnvelope(ok=True, code=SSEEnvelopeCode.ROOM_STATE, message=None, data=room),
+            SSEEventType.ROOM_EVENT,
+            codecs,
+        ),
+    }
+
+    for target, cases in targets.items():
+        print(f"\n{target} (number={args.number})")
+        print(f"{'codec':<10}{'op':<8}{'us/op':>10}{'bytes':>8}")
+        for name, ops in cases.items():
+            for op, fn in ops.items():
+                seconds = min(timeit.repeat(fn, number=args.number, repeat=3))
+                out = fn()
+                size = len(out.encode() if isinstance(out, str) else out) if op != "decode" else ""
+                print(f"{name:<10}{op:<8}{seconds / args.number * 1e6:>10.2f}{size:>8}")
+
+
+if __name__ == "__main__":
+    main()
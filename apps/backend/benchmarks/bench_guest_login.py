@@ -0,0 +1,147 @@
+"""게스트 로그인 burst benchmark.
+
+동시에 들어오는 게스트 로그인 --concurrency 개의 user upsert(+ commit) 지연을 비교한다.
+(로그인마다 session을 새로 연다. JWT 발급/HTTP는 포함하지 않는다)
+
+- select_insert: 이전 방식 (SELECT -> INSERT -> COMMIT, UNIQUE 충돌 시 ROLLBACK -> SELECT)
+- upsert: AuthService.get_or_create_guest_user (INSERT ... ON CONFLICT ... RETURNING -> COMMIT)
+
+시나리오
+- new: 처음 보는 username
+- returning: 이미 있는 username으로 다시 로그인
+- contended: --hot-users 개의 username에 로그인이 몰림 (같은 username 동시 생성 경합)
+
+대상 DB는 migration(alembic upgrade head)이 끝나 있어야 하고, 벤치용 user를 만든 뒤 지운다.
+pool은 --pool-size 크기로, 넘치는 로그인은 connection을 기다린다. (그 대기도 지연에 포함)
+
+실행 (apps/backend 에서):
+    python -m benchmarks.bench_guest_login [--database-url URL] [--concurrency 300] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.auth import User
+from app.repositories.user import UserRepo
+from app.services.auth import AuthService
+
+Login = Callable[[str], Awaitable[User]]
+
+
+def _logins(factory: async_sessionmaker[AsyncSession]) -> dict[str, Login]:
+    async def select_insert(username: str) -> User:
+        async with factory() as db:
+            repo = UserRepo(db)
+            user = await repo.get_by_username(username)
+            if user:
+                return user
+            user = await repo.create(username=username)
+            try:
+                await db.commit()
+            except IntegrityError:
+                await db.rollback()
+                user = await repo.get_by_username(username)
+                assert user is not None
+                return user
+            await db.refresh(user)
+            return user
+
+    async def upsert(username: str) -> User:
+        async with factory() as db:
+            return await AuthService(db, UserRepo(db)).get_or_create_guest_user(username)
+
+    return {"select_insert": select_insert, "upsert": upsert}
+
+
+async def _burst(login: Login, usernames: list[str]) -> tuple[list[float], float]:
+    async def timed(username: str) -> float:
+        started = time.perf_counter()
+        await login(username)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    samples = await asyncio.gather(*(timed(username) for username in usernames))
+    return list(samples), time.perf_counter() - started
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def _cleanup(factory: async_sessionmaker[AsyncSession], prefix: str) -> None:
+    async with factory() as db:
+        await db.execute(delete(User).where(User.username.startswith(prefix)))
+        await db.commit()
+
+
+async def _run(
+    database_url: str, concurrency: int, rounds: int, pool_size: int, hot_users: int
+) -> None:
+    engine = create_async_engine(database_url, pool_size=pool_size, max_overflow=0)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    prefix = f"bench-{uuid4().hex[:8]}-"
+    try:
+        print(
+            f"\nGuest login burst (concurrency={concurrency}, rounds={rounds}, "
+            f"pool_size={pool_size}, hot_users={hot_users})"
+        )
+        print(f"{'impl':<15}{'scenario':<12}{'p50 ms':>10}{'p99 ms':>10}{'burst ms':>10}")
+        for name, login in _logins(factory).items():
+            # warmup: connection을 pool에 채워둔다.
+            await _burst(login, [f"{prefix}warmup-{name}-{i}" for i in range(pool_size)])
+            results: dict[str, tuple[list[float], list[float]]] = {}
+            for round_no in range(rounds):
+                base = f"{prefix}{name}-{round_no}-"
+                new = [f"{base}{i}" for i in range(concurrency)]
+                hot = [f"{base}hot-{i % hot_users}" for i in range(concurrency)]
+                for scenario, usernames in (
+                    ("new", new),
+                    ("returning", new),
+                    ("contended", hot),
+                ):
+                    samples, wall = await _burst(login, usernames)
+                    all_samples, walls = results.setdefault(scenario, ([], []))
+                    all_samples.extend(samples)
+                    walls.append(wall)
+            for scenario, (samples, walls) in results.items():
+                print(
+                    f"{name:<15}{scenario:<12}"
+                    f"{_percentile(samples, 0.5) * 1e3:>10.3f}"
+                    f"{_percentile(samples, 0.99) * 1e3:>10.3f}"
+                    f"{statistics.fmean(walls) * 1e3:>10.3f}"
+                )
+    finally:
+        await _cleanup(factory, prefix)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None, help="기본값: settings.database_url")
+    parser.add_argument("--concurrency", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pool-size", type=int, default=20)
+    parser.add_argument("--hot-users", type=int, default=10)
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        from app.core.config import get_settings
+
+        database_url = get_settings().database_url
+    asyncio.run(_run(database_url, args.concurrency, args.rounds, args.pool_size, args.hot_users))
+
+
+if __name__ == "__main__":
+    main()
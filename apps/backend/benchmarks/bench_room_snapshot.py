@@ -0,0 +1,145 @@
+"""room snapshot 조회 benchmark.
+
+같은 room에 대해 build_snapshot 지연을 비교한다. (session은 stream처럼 호출마다 새로 연다)
+
+- query: RoomSnapshotQuery (room, 활성 멤버, RUNNING case를 쿼리 3번으로)
+- read_model: RoomSnapshotReadModel (LEFT JOIN 쿼리 1번)
+
+차이는 대부분 DB 왕복 수에서 나오므로,
+앱 서버와 같은 네트워크 거리의 Postgres에서 돌려야 의미가 있다.
+대상 DB는 migration(alembic upgrade head)이 끝나 있어야 하고,
+벤치용 user/room/case를 만든 뒤 지운다.
+
+실행 (apps/backend 에서):
+    python -m benchmarks.bench_room_snapshot [--database-url URL] [--members 7] [--number 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.enum import CaseStatus
+from app.domain.events.room import RoomSnapshotType
+from app.models.auth import User
+from app.models.case import Case
+from app.models.room import Room, RoomMember
+from app.queries.room_snapshot import RoomSnapshotQuery, RoomSnapshotReadModel
+from app.repositories.case import CaseRepo
+from app.repositories.room import RoomRepo
+from app.repositories.room_member import RoomMemberRepo
+from app.schemas.room.state import RoomSnapshot
+
+_WARMUP = 20
+
+
+async def _seed(factory: async_sessionmaker[AsyncSession], members: int) -> tuple[UUID, list[UUID]]:
+    tag = uuid4().hex[:8]
+    users = [User(id=uuid4(), username=f"bench-{tag}-{i}") for i in range(members)]
+    room = Room(id=uuid4(), name=f"bench-room-{tag}", host_id=users[0].id)
+    async with factory() as db:
+        db.add_all(users)
+        await db.flush()
+        db.add(room)
+        await db.flush()
+        db.add_all(RoomMember(room_id=room.id, user_id=user.id) for user in users)
+        db.add(Case(room_id=room.id, host_user_id=users[0].id, status=CaseStatus.RUNNING))
+        await db.commit()
+    return room.id, [user.id for user in users]
+
+
+async def _cleanup(
+    factory: async_sessionmaker[AsyncSession], room_id: UUID, user_ids: list[UUID]
+) -> None:
+    async with factory() as db:
+        await db.execute(delete(Case).where(Case.room_id == room_id))
+        await db.execute(delete(RoomMember).where(RoomMember.room_id == room_id))
+        await db.execute(delete(Room).where(Room.id == room_id))
+        await db.execute(delete(User).where(User.id.in_(user_ids)))
+        await db.commit()
+
+
+def _builders(
+    factory: async_sessionmaker[AsyncSession], room_id: UUID
+) -> dict[str, Callable[[], Awaitable[RoomSnapshot]]]:
+    kwargs = dict(room_id=room_id, last_event=RoomSnapshotType.ON_CONNECT, logs=[])
+
+    async def query() -> RoomSnapshot:
+        async with factory() as db:
+            return await RoomSnapshotQuery(
+                room_repo=RoomRepo(db),
+                room_member_repo=RoomMemberRepo(db),
+                case_repo=CaseRepo(db),
+            ).build_snapshot(**kwargs)
+
+    async def read_model() -> RoomSnapshot:
+        async with factory() as db:
+            return await RoomSnapshotReadModel(db).build_snapshot(**kwargs)
+
+    return {"query": query, "read_model": read_model}
+
+
+async def _measure(fn: Callable[[], Awaitable[RoomSnapshot]], number: int) -> list[float]:
+    for _ in range(_WARMUP):
+        await fn()
+    samples: list[float] = []
+    for _ in range(number):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def _run(database_url: str, members: int, number: int) -> None:
+    engine = create_async_engine(database_url, pool_size=1, max_overflow=0)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    room_id, user_ids = await _seed(factory, members)
+    try:
+        builders = _builders(factory, room_id)
+        snapshots = [await build() for build in builders.values()]
+        assert all(snapshot == snapshots[0] for snapshot in snapshots), "snapshot mismatch"
+
+        print(f"\nRoomSnapshot (members={members}, number={number})")
+        print(f"{'impl':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for name, build in builders.items():
+            samples = await _measure(build, number)
+            print(
+                f"{name:<12}{statistics.fmean(samples) * 1e3:>10.3f}"
+                f"{_percentile(samples, 0.5) * 1e3:>10.3f}"
+                f"{_percentile(samples, 0.95) * 1e3:>10.3f}"
+                f"{_percentile(samples, 0.99) * 1e3:>10.3f}"
+            )
+    finally:
+        await _cleanup(factory, room_id, user_ids)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None, help="기본값: settings.database_url")
+    parser.add_argument("--members", type=int, default=7)
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        from app.core.config import get_settings
+
+        database_url = get_settings().database_url
+    asyncio.run(_run(database_url, args.members, args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,6 @@ def create_app(*, lifespan=None) -> FastAPI:
     return app
 
 
-mvp_lifespan = create_mvp_lifespan(get_sessionmaker())
+mvp_lifespan = create_mvp_lifespan(get_sessionmaker(), drain_outbox=True)
 
 api = create_app(lifespan=mvp_lifespan)
@@ -0,0 +1,44 @@
+import asyncio
+from collections import defaultdict
+from typing import AsyncIterator, Sequence
+
+from app.infra.pubsub.topics import Topic
+from app.infra.serialization.codec import Payload
+
+
+class LivePubSub:
+    """subscribe가 publish될 때까지 대기하는 fake. upstream 구독 수를 기록한다."""
+
+    passes_objects = False
+
+    def __init__(self) -> None:
+        self.subscribe_calls: dict[Topic, int] = defaultdict(int)
+        self.active: dict[Topic, int] = defaultdict(int)
+        self._queues: dict[Topic, list[asyncio.Queue[Payload]]] = defaultdict(list)
+
+    async def publish(self, topic: Topic, message: Payload) -> int:
+        for q in self._queues[topic]:
+            q.put_nowait(message)
+        return len(self._queues[topic])
+
+    async def publish_many(self, messages: Sequence[tuple[Topic, Payload]]) -> None:
+        for topic, message in messages:
+            await self.publish(topic, message)
+
+    async def subscribe(self, topic: Topic) -> AsyncIterator[Payload]:
+        q: asyncio.Queue[Payload] = asyncio.Queue()
+        self.subscribe_calls[topic] += 1
+        self.active[topic] += 1
+        self._queues[topic].append(q)
+        try:
+            while True:
+                yield await q.get()
+        finally:
+            self._queues[topic].remove(q)
+            self.active[topic] -= 1
+
+
+async def wait_until(predicate, timeout_s: float = 1.0) -> None:
+    async with asyncio.timeout(timeout_s):
+        while not predicate():
+            await asyncio.sleep(0)
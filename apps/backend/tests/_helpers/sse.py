@@ -78,10 +78,14 @@ class SSEReader:
                     self._buf = bytearray(rest)
                     return raw_event.decode("utf-8") + "\n\n"
 
-        if timeout_s is None:
-            raw = await _read_until_event()
-        else:
-            with anyio.fail_after(timeout_s):
-                raw = await _read_until_event()
+        async def _read_until_message() -> SSEPayload:
+            # retry 힌트, heartbeat comment처럼 event/data가 없는 블록은 EventSource처럼 건너뛴다.
+            while True:
+                msg = self._parse_sse_message(await _read_until_event())
+                if msg["event"] is not None or msg["data"] is not None:
+                    return msg
 
-        return self._parse_sse_message(raw)
+        if timeout_s is None:
+            return await _read_until_message()
+        with anyio.fail_after(timeout_s):
+            return await _read_until_message()
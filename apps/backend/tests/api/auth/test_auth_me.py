@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import jwt  # PyJWT
 import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.core.config import JwtConfig
 from app.core.security.jwt import ACCESS_TOKEN, JwtHandler
+from app.mvp import MVP_ROOM_ID
 from app.schemas.auth.response import UserInfoResponse
 from app.services.auth import AuthService
+from tests._helpers.auth import UserAuth
 from tests._helpers.validators import RespValidator, general_failure_validator
 
 info_resp_validator = RespValidator(UserInfoResponse)
@@ -156,3 +161,31 @@ async def test_me_rejects_refresh_token_used_as_access(client, app, jwt_test_con
     assert resp.status_code == 401
 
     _ = general_failure_validator.assert_envelope(resp.json(), ok=False, meta_is_null=True)
+
+
+@pytest.mark.api
+async def test_me_reads_cached_context_until_membership_changes(
+    client: AsyncClient, user_auth: UserAuth, async_engine: AsyncEngine
+):
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    resp = await client.get("/api/v1/auth/me")
+    assert resp.json()["data"]["current_room_id"] is None
+
+    # 두 번째 요청부터는 user/room/case를 캐시에서 읽는다.
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        resp = await client.get("/api/v1/auth/me")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _count)
+    assert resp.status_code == 200
+    assert statements == []
+
+    # join이 캐시를 무효화하므로 바로 반영된다.
+    resp = await client.post(f"/api/v1/rooms/{MVP_ROOM_ID}/join")
+    assert resp.status_code == 200
+    resp = await client.get("/api/v1/auth/me")
+    assert resp.json()["data"]["current_room_id"] == str(MVP_ROOM_ID)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import Settings, get_jwt_config
+from app.core.security.jwt import ACCESS_TOKEN, REFRESH_TOKEN, JwtHandler
+from tests._helpers.auth import UserAuth
+
+
+@pytest.fixture
+def test_settings(db_url: str) -> Settings:
+    return Settings(
+        database_url=db_url,
+        redis_url="redis://fake_redis/0",
+        jwt_secret="valid-test-token2-valid-test-token2-valid-test-token2",
+        jwt_stateless_access=True,
+    )  # type: ignore[reportCallIssue]
+
+
+@pytest.fixture
+def jwt_test_config(test_settings: Settings):
+    # tests/api/auth/conftest.py의 고정 JwtConfig 대신 stateless 설정을 그대로 쓴다.
+    return get_jwt_config(test_settings)
+
+
+@pytest.mark.api
+async def test_stateless_access_token_skips_users_lookup(
+    client: AsyncClient,
+    fake_redis,
+    user_auth: UserAuth,
+    jwt_test_handler: JwtHandler,
+    async_engine: AsyncEngine,
+):
+    claims = jwt_test_handler.decode_and_verify(user_auth[ACCESS_TOKEN])
+    assert claims["username"] == user_auth["username"]
+    assert claims["jti"]
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        resp = await client.get("/api/v1/auth/me")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _count)
+    assert resp.status_code == 200
+    assert resp.json()["data"]["username"] == user_auth["username"]
+    assert not any("FROM users" in statement for statement in statements)
+
+
+@pytest.mark.api
+async def test_logout_revokes_access_and_refresh_tokens(
+    client: AsyncClient, fake_redis, user_auth: UserAuth
+):
+    resp = await client.post("/api/v1/auth/logout")
+    assert resp.status_code == 200
+
+    # 쿠키를 지워도, 이미 발급된 token을 다시 보내면 거부해야 한다.
+    client.cookies.set(ACCESS_TOKEN, user_auth[ACCESS_TOKEN])
+    client.cookies.set(REFRESH_TOKEN, user_auth[REFRESH_TOKEN])
+
+    resp = await client.get("/api/v1/auth/me")
+    assert resp.status_code == 401
+    assert resp.json()["code"] == "AUTH_TOKEN_INVALID"
+
+    resp = await client.post("/api/v1/auth/refresh")
+    assert resp.status_code == 401
+    assert resp.json()["code"] == "AUTH_TOKEN_INVALID"
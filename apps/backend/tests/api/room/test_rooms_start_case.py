@@ -13,6 +13,7 @@ from app.schemas.room.mutation import CaseStartMutation
 from app.schemas.room.response import CaseStartResponse
 from tests._helpers.auth import UserAuth
 from tests._helpers.entity import room_with_members
+from tests._helpers.pubsub import wait_until
 from tests._helpers.validators import RespValidator
 from tests.conftest import FakePubSub
 
@@ -157,6 +158,8 @@ async def test_start_case_publishes_case_event(
 
     # then
     assert response.status_code == status.HTTP_200_OK
+    # commit 후 outbox relay가 background로 publish한다.
+    await wait_until(lambda: len(fake_pubsub.published) > 0)
     assert len(fake_pubsub.published) == 1
 
     case_start_response = CaseStartResponse.model_validate(response.json())
@@ -6,3 +6,19 @@ async def test_health(client, fake_redis):
     response = await client.get("/api/health")
     assert response.status_code == 200
     assert response.json() == {"ok": True}
+
+
+@pytest.mark.basic
+async def test_health_pools(client, fake_redis):
+    response = await client.get("/api/health/pools")
+    assert response.status_code == 200
+    body = response.json()
+    assert {"db", "redis"} <= body.keys()
+    assert {stats["name"] for stats in body["redis"]} >= {"redis", "redis_binary"}
+
+
+@pytest.mark.basic
+async def test_health_jwt(client, fake_redis):
+    response = await client.get("/api/health/jwt")
+    assert response.status_code == 200
+    assert {"hits", "misses", "verified", "verify_seconds_max"} <= response.json().keys()
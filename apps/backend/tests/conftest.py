@@ -8,7 +8,7 @@ import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
 
 import fakeredis
 import httpx
@@ -26,25 +26,31 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.config import JwtConfig, Settings, get_jwt_config, get_settings
 from app.core.security.jwt import ACCESS_TOKEN, REFRESH_TOKEN, JwtHandler
-from app.infra.db.session import get_db
+from app.infra.db.session import get_db, get_realtime_session_factory, get_session_factory
 from app.infra.pubsub.bus.case_event_bus import CaseEventBus
 from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
 from app.infra.pubsub.topics import RoomTopic
 from app.infra.pubsub.transport.deps import get_pubsub
 from app.infra.redis.client import Redis, get_redis_client
 from app.infra.redis.pubsub import RedisPubSub
+from app.infra.redis.request_context import RequestContextCache
+from app.infra.serialization.codec import Payload
 from app.models.auth import User
 from app.models.room import Room
 from app.mvp import create_mvp_lifespan
+from app.realtime_.sse.case_frame_cache import CaseFrameCache
 from app.repositories.case import CaseRepo
 from app.repositories.case_history import CaseSnapshotHistoryRepo
 from app.repositories.case_player import CasePlayerRepo
+from app.repositories.outbox import EventOutboxRepo
 from app.repositories.phase import PhaseRepo
 from app.repositories.room import RoomRepo
 from app.repositories.room_member import RoomMemberRepo
 from app.repositories.user import UserRepo
 from app.schemas.auth.response import UserInfoResponse
 from app.services.case import CaseService
+from app.services.outbox_relay import OutboxRelay
 from main import create_app
 from tests._helpers.auth import UserAuth, login_url
 from tests._helpers.validators import RespValidator
@@ -94,29 +100,29 @@ async def prepare_database(async_engine: AsyncEngine):
         await conn.run_sync(Base.metadata.drop_all)
 
 
-@pytest_asyncio.fixture
-async def db_session_(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
-    """Provide an AsyncSession bound to the per-test engine."""
-    SessionMaker = async_sessionmaker(
+@pytest.fixture
+def session_factory(async_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to the per-test engine."""
+    return async_sessionmaker(
         bind=async_engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
 
-    async with SessionMaker() as session:
+
+@pytest_asyncio.fixture
+async def db_session_(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Provide an AsyncSession bound to the per-test engine."""
+    async with session_factory() as session:
         yield session
 
 
 @pytest_asyncio.fixture
-async def mvp_app(async_engine: AsyncEngine):
+async def mvp_app(session_factory: async_sessionmaker[AsyncSession]):
     """Provide an AsyncSession bound to the per-test engine."""
-    SessionMaker = async_sessionmaker(
-        bind=async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    mvp_lifespan = create_mvp_lifespan(SessionMaker)
+    mvp_lifespan = create_mvp_lifespan(session_factory)
     app = create_app(lifespan=mvp_lifespan)
     yield app
     app.dependency_overrides.clear()
@@ -128,11 +134,15 @@ async def app(mvp_app):
 
 
 @pytest_asyncio.fixture
-async def client(app: FastAPI, db_session_: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(
+    app: FastAPI, db_session_: AsyncSession, session_factory: async_sessionmaker[AsyncSession]
+) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db():
         yield db_session_
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_realtime_session_factory] = lambda: session_factory
     async with app.router.lifespan_context(app):
         async with AsyncClient(
             transport=ASGITransport(app=app),
@@ -352,7 +362,7 @@ async def user2_hosted_room(
 @dataclass
 class _Published:
     topic: RoomTopic
-    message: str
+    message: Payload
 
 
 class FakePubSub:
@@ -363,16 +373,22 @@ class FakePubSub:
     - subscribe(topic): yields enqueued messages for that topic, then completes.
     """
 
+    passes_objects = False
+
     def __init__(self) -> None:
         self.published: list[_Published] = []
-        self._queues: dict[RoomTopic, deque[str]] = defaultdict(deque)
+        self._queues: dict[RoomTopic, deque[Payload]] = defaultdict(deque)
 
-    async def publish(self, topic: RoomTopic, message: str) -> int:
+    async def publish(self, topic: RoomTopic, message: Payload) -> int:
         self.published.append(_Published(topic=topic, message=message))
         self._queues[topic].append(message)
         return 1
 
-    async def subscribe(self, topic: RoomTopic) -> AsyncIterator[str]:
+    async def publish_many(self, messages: Sequence[tuple[RoomTopic, Payload]]) -> None:
+        for topic, message in messages:
+            await self.publish(topic, message)
+
+    async def subscribe(self, topic: RoomTopic) -> AsyncIterator[Payload]:
         q = self._queues[topic]
         while q:
             yield q.popleft()
@@ -719,6 +735,36 @@ def phase_repo(db_session: AsyncSession) -> PhaseRepo:
     return PhaseRepo(db_session)
 
 
+@pytest.fixture
+def case_frame_cache() -> CaseFrameCache:
+    return CaseFrameCache(max_entries=128)
+
+
+@pytest.fixture
+def context_cache() -> RequestContextCache:
+    return RequestContextCache(None)
+
+
+@pytest.fixture
+def outbox_pubsub() -> FakePubSub:
+    return FakePubSub()
+
+
+@pytest_asyncio.fixture
+async def outbox_relay(
+    session_factory: async_sessionmaker[AsyncSession], outbox_pubsub: FakePubSub
+) -> AsyncGenerator[OutboxRelay, None]:
+    relay = OutboxRelay(
+        session_factory,
+        pubsub=outbox_pubsub,  # type: ignore[arg-type]
+        room_event_bus=RoomEventBus(outbox_pubsub),  # type: ignore[arg-type]
+        case_event_bus=CaseEventBus(outbox_pubsub),  # type: ignore[arg-type]
+        user_event_bus=UserEventBus(outbox_pubsub),  # type: ignore[arg-type]
+    )
+    yield relay
+    await relay.aclose()
+
+
 @pytest.fixture
 def case_service(
     db_session: AsyncSession,
@@ -730,6 +776,9 @@ def case_service(
     phase_repo: PhaseRepo,
     room_event_bus: RoomEventBus,
     case_event_bus: CaseEventBus,
+    case_frame_cache: CaseFrameCache,
+    outbox_relay: OutboxRelay,
+    context_cache: RequestContextCache,
 ) -> CaseService:
     return CaseService(
         db=db_session,
@@ -741,4 +790,8 @@ def case_service(
         phase_repo=phase_repo,
         room_event_bus=room_event_bus,
         case_event_bus=case_event_bus,
+        case_frame_cache=case_frame_cache,
+        outbox_repo=EventOutboxRepo(db_session),
+        outbox_relay=outbox_relay,
+        context_cache=context_cache,
     )
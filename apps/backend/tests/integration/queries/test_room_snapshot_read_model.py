@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from app.domain.enum import CaseStatus
+from app.domain.events.room import RoomSnapshotType
+from app.models.case import Case
+from app.queries.room_snapshot import RoomSnapshotQuery, RoomSnapshotReadModel
+from app.repositories.case import CaseRepo
+from app.repositories.room import RoomRepo
+from app.repositories.room_member import RoomMemberRepo
+from tests._helpers.entity import room_with_members
+
+
+async def _snapshots(db_session: AsyncSession, room_id):
+    kwargs = dict(room_id=room_id, last_event=RoomSnapshotType.ON_CONNECT, logs=["log"])
+    legacy = await RoomSnapshotQuery(
+        room_repo=RoomRepo(db_session),
+        room_member_repo=RoomMemberRepo(db_session),
+        case_repo=CaseRepo(db_session),
+    ).build_snapshot(**kwargs)
+    single = await RoomSnapshotReadModel(db_session).build_snapshot(**kwargs)
+    return legacy, single
+
+
+async def test_read_model_matches_room_snapshot_query_in_one_statement(
+    db_session: AsyncSession, async_engine: AsyncEngine
+) -> None:
+    room_id, (host, leaver, *_) = await room_with_members(db_session)
+    await RoomMemberRepo(db_session).leave_active_by_user_id(user_id=leaver)
+    running = Case(room_id=room_id, host_user_id=host, status=CaseStatus.RUNNING)
+    db_session.add(running)
+    await db_session.commit()
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    legacy, _ = await _snapshots(db_session, room_id)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        single = await RoomSnapshotReadModel(db_session).build_snapshot(
+            room_id=room_id, last_event=RoomSnapshotType.ON_CONNECT, logs=["log"]
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1
+    assert single == legacy
+    assert single.current_case is not None and single.current_case.case_id == running.id
+    assert leaver not in {m.user_id for m in single.members}
+
+
+async def test_read_model_handles_room_without_members_or_running_case(
+    db_session: AsyncSession,
+) -> None:
+    room_id, user_ids = await room_with_members(db_session, ["solo_user"])
+    await RoomMemberRepo(db_session).leave_active_by_user_id(user_id=user_ids[0])
+    db_session.add(
+        Case(
+            room_id=room_id,
+            host_user_id=user_ids[0],
+            status=CaseStatus.ENDED,
+            ended_at=datetime.now(timezone.utc),
+        )
+    )
+    await db_session.commit()
+
+    legacy, single = await _snapshots(db_session, room_id)
+
+    assert single == legacy
+    assert single.members == [] and single.current_case is None
@@ -116,6 +116,21 @@ async def test_get_latest_by_case_id_returns_none_when_no_snapshot(
     assert found is None
 
 
+@pytest.mark.anyio
+async def test_get_latest_snapshot_no_returns_highest_or_none(
+    db_session: AsyncSession, user_case: Case
+):
+    repo = CaseSnapshotHistoryRepo(db_session)
+    case_id = user_case.id
+
+    assert await repo.get_latest_snapshot_no(case_id=case_id) is None
+
+    await _create_snapshot(db_session, case_id=case_id, snapshot_no=1)
+    await _create_snapshot(db_session, case_id=case_id, snapshot_no=4)
+
+    assert await repo.get_latest_snapshot_no(case_id=case_id) == 4
+
+
 # Not in MVP
 # @pytest.mark.anyio
 # async def test_get_after_snapshot_no_returns_rows_strictly_after_and_in_order(
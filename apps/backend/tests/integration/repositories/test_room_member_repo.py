@@ -197,3 +197,48 @@ async def test_repo_upsert_membership_revives_when_left(db_session):
     # 복합 PK이므로 row 수는 여전히 1이어야 함
     assert await _count_room_user_rows(db_session, user_id=user_id, room_id=room_id) == 1
     assert await _count_active(db_session, user_id=user_id) == 1
+
+
+@pytest.mark.unit
+async def test_repo_upsert_membership_returns_none_when_already_active(db_session):
+    """
+    Repo 스펙(upsert 멱등):
+    - 이미 active인 (room_id, user_id)면 아무것도 바꾸지 않고 None을 반환한다.
+    """
+    user_id = await create_user(db_session, username="repo_upsert_user_3")
+    room_id = await create_room(db_session, host_id=user_id)
+
+    repo = RoomMemberRepo(db_session)
+    m1 = await repo.upsert_membership(user_id=user_id, room_id=room_id)
+    await db_session.commit()
+    assert m1 is not None
+
+    assert await repo.upsert_membership(user_id=user_id, room_id=room_id) is None
+    active = await _get_active(db_session, user_id=user_id)
+    assert active is not None
+    assert active.joined_at == m1.joined_at
+
+
+@pytest.mark.unit
+async def test_repo_leave_active_only_in_given_room(db_session):
+    """
+    Repo 스펙:
+    - leave_active_by_user_id(room_id=...)는 그 room의 active membership만 종료한다.
+    - except_room_id=...는 그 room 외의 active membership만 종료한다.
+    """
+    user_id = await create_user(db_session, username="repo_leave_room_user")
+    room_id = await create_room(db_session, host_id=user_id)
+    other_room_id = uuid.uuid4()
+
+    repo = RoomMemberRepo(db_session)
+    await repo.create_membership(user_id=user_id, room_id=room_id)
+
+    assert await repo.leave_active_by_user_id(user_id=user_id, room_id=other_room_id) is None
+    assert await repo.leave_active_by_user_id(user_id=user_id, except_room_id=room_id) is None
+    assert await _count_active(db_session, user_id=user_id) == 1
+
+    left = await repo.leave_active_by_user_id(user_id=user_id, room_id=room_id)
+    assert left is not None
+    assert left.room_id == room_id
+    assert left.left_at is not None
+    assert await _count_active(db_session, user_id=user_id) == 0
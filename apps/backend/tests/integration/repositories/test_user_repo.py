@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.auth import User
+from app.repositories.user import UserRepo
+
+
+async def test_upsert_by_username_creates_then_returns_same_user_in_one_statement(
+    db_session: AsyncSession, async_engine: AsyncEngine
+):
+    repo = UserRepo(db_session)
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        created = await repo.upsert_by_username("guest")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _count)
+    await db_session.commit()
+    assert len(statements) == 1
+    assert created.created_at is not None
+
+    again = await repo.upsert_by_username("guest")
+    await db_session.commit()
+    assert again.id == created.id
+
+    count = await db_session.scalar(
+        select(func.count()).select_from(User).where(User.username == "guest")
+    )
+    assert count == 1
@@ -9,6 +9,7 @@ from app.models.auth import User
 from app.models.case import Phase
 from app.models.case_snapshot import CaseSnapshotHistory
 from app.models.room import Room
+from app.realtime_.sse.case_frame_cache import CaseFrameCache, build_case_frame
 from app.repositories.case import CaseRepo
 from app.repositories.case_history import CaseSnapshotHistoryRepo
 from app.repositories.case_player import CasePlayerRepo
@@ -182,3 +183,23 @@ async def test_start_case_creates_initial_phase(
     assert phase.phase_type == PhaseType.NIGHT
     assert phase.round_no == 1
     assert phase.seq_in_round == 1
+
+
+@pytest.mark.anyio
+async def test_start_case_fills_case_frame_cache(
+    db_session: AsyncSession,
+    case_service: CaseService,
+    case_frame_cache: CaseFrameCache,
+    case_history_repo: CaseSnapshotHistoryRepo,
+):
+    room_id, _user_ids = await room_with_members(db_session)
+
+    mut = await case_service.start_case(room_id=room_id)
+
+    frames = await case_frame_cache.get_range(mut.subject_id, 1, 1)
+    assert frames is not None
+
+    # DB에서 다시 만든 frame과 바이트 단위로 같아야 한다.
+    row = await case_history_repo.get_by_snapshot_no(case_id=mut.subject_id, snapshot_no=1)
+    assert row is not None
+    assert frames[0] == build_case_frame(CaseSnapshot.model_validate(row.snapshot_json), 1)
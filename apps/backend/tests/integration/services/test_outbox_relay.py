@@ -0,0 +1,191 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.events.case import CaseEventDelta, CaseSnapshotType
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
+from app.infra.pubsub.topics import CaseTopic, RoomTopic
+from app.infra.redis.event_version import RoomEventVersions
+from app.infra.redis.pubsub import RedisPubSub, topic_to_channel
+from app.models.outbox import EventOutbox
+from app.repositories.outbox import EventOutboxRepo
+from app.services.case import CaseService
+from app.services.outbox_relay import OutboxRelay
+from tests._helpers.entity import room_with_members
+from tests._helpers.pubsub import wait_until
+from tests.conftest import FakePubSub
+
+
+async def _pending(db: AsyncSession) -> list[EventOutbox]:
+    q = select(EventOutbox).where(EventOutbox.delivered_at.is_(None))
+    return list((await db.execute(q)).scalars())
+
+
+def _room_event(type_: RoomSnapshotType) -> RoomEventDelta:
+    return RoomEventDelta(type=type_, user_id=uuid4())  # type: ignore[call-arg]
+
+
+@pytest.mark.anyio
+async def test_flush_publishes_in_order_and_marks_delivered(
+    db_session: AsyncSession, outbox_relay: OutboxRelay, outbox_pubsub: FakePubSub
+):
+    room_id, case_id = uuid4(), uuid4()
+    repo = EventOutboxRepo(db_session)
+    repo.add_room_event(room_id=room_id, event=_room_event(RoomSnapshotType.MEMBER_JOINED))
+    started = CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=1)  # type: ignore[call-arg]
+    repo.add_case_event(case_id=case_id, event=started)
+    repo.add_room_event(room_id=room_id, event=_room_event(RoomSnapshotType.MEMBER_LEFT))
+    await db_session.commit()
+
+    assert await outbox_relay.flush() == 3
+    assert await outbox_relay.flush() == 0
+
+    assert [p.topic for p in outbox_pubsub.published] == [
+        RoomTopic(room_id),
+        CaseTopic(case_id),
+        RoomTopic(room_id),
+    ]
+    types = [
+        RoomEventDelta.model_validate_json(outbox_pubsub.published[0].message).type,
+        CaseEventDelta.model_validate_json(outbox_pubsub.published[1].message).type,
+        RoomEventDelta.model_validate_json(outbox_pubsub.published[2].message).type,
+    ]
+    assert types == [
+        RoomSnapshotType.MEMBER_JOINED,
+        CaseSnapshotType.STARTED,
+        RoomSnapshotType.MEMBER_LEFT,
+    ]
+    db_session.expire_all()
+    assert await _pending(db_session) == []
+
+
+@pytest.mark.anyio
+async def test_failed_publish_keeps_rows_pending(
+    db_session: AsyncSession, outbox_relay: OutboxRelay, outbox_pubsub: FakePubSub, monkeypatch
+):
+    EventOutboxRepo(db_session).add_room_event(
+        room_id=uuid4(), event=_room_event(RoomSnapshotType.MEMBER_JOINED)
+    )
+    await db_session.commit()
+
+    async def _boom(messages):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(outbox_pubsub, "publish_many", _boom)
+    with pytest.raises(ConnectionError):
+        await outbox_relay.flush()
+    assert len(await _pending(db_session)) == 1
+
+    monkeypatch.undo()
+    assert await outbox_relay.flush() == 1
+    assert len(outbox_pubsub.published) == 1
+
+
+@pytest.mark.anyio
+async def test_retry_after_failed_commit_reuses_room_version(
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    outbox_pubsub: FakePubSub,
+    monkeypatch,
+):
+    versions = RoomEventVersions(fakeredis.FakeAsyncRedis(decode_responses=True))
+    relay = OutboxRelay(
+        session_factory,
+        pubsub=outbox_pubsub,  # type: ignore[arg-type]
+        room_event_bus=RoomEventBus(outbox_pubsub, versions=versions),  # type: ignore[arg-type]
+        case_event_bus=CaseEventBus(outbox_pubsub),  # type: ignore[arg-type]
+        user_event_bus=UserEventBus(outbox_pubsub),  # type: ignore[arg-type]
+    )
+    EventOutboxRepo(db_session).add_room_event(
+        room_id=uuid4(), event=_room_event(RoomSnapshotType.MEMBER_JOINED)
+    )
+    await db_session.commit()
+
+    # publish는 됐지만 delivered_at commit이 실패한 상황
+    async def _boom(self, *, ids):
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(EventOutboxRepo, "mark_delivered", _boom)
+    with pytest.raises(ConnectionError):
+        await relay.flush()
+    monkeypatch.undo()
+    assert await relay.flush() == 1
+
+    sent = [RoomEventDelta.model_validate_json(p.message) for p in outbox_pubsub.published]
+    assert [event.version for event in sent] == [1, 1]  # 수신 측이 중복으로 거를 수 있다.
+    await relay.aclose()
+
+
+@pytest.mark.anyio
+async def test_prune_deletes_only_old_delivered_rows(
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    outbox_pubsub: FakePubSub,
+):
+    relay = OutboxRelay(
+        session_factory,
+        pubsub=outbox_pubsub,  # type: ignore[arg-type]
+        room_event_bus=RoomEventBus(outbox_pubsub),  # type: ignore[arg-type]
+        case_event_bus=CaseEventBus(outbox_pubsub),  # type: ignore[arg-type]
+        user_event_bus=UserEventBus(outbox_pubsub),  # type: ignore[arg-type]
+        retention_s=0,
+    )
+    repo = EventOutboxRepo(db_session)
+    repo.add_room_event(room_id=uuid4(), event=_room_event(RoomSnapshotType.MEMBER_JOINED))
+    await db_session.commit()
+    assert await relay.flush() == 1
+    repo.add_room_event(room_id=uuid4(), event=_room_event(RoomSnapshotType.MEMBER_LEFT))
+    await db_session.commit()
+
+    assert await relay.prune() == 1
+
+    db_session.expire_all()
+    remaining = list((await db_session.execute(select(EventOutbox))).scalars())
+    assert [row.delivered_at for row in remaining] == [None]
+    await relay.aclose()
+
+
+@pytest.mark.anyio
+async def test_start_case_publishes_through_outbox(
+    db_session: AsyncSession,
+    case_service: CaseService,
+    outbox_pubsub: FakePubSub,
+):
+    room_id, _ = await room_with_members(
+        db_session, ["outbox_1", "outbox_2", "outbox_3", "outbox_4"]
+    )
+
+    mutation = await case_service.start_case(room_id=room_id)
+
+    # 서비스는 commit 후 relay를 깨우기만 하고, publish는 background에서 일어난다.
+    await wait_until(lambda: len(outbox_pubsub.published) == 1)
+    published = outbox_pubsub.published[0]
+    assert published.topic == CaseTopic(mutation.subject_id)
+    assert CaseEventDelta.model_validate_json(published.message).snapshot_no == 1
+
+
+@pytest.mark.anyio
+async def test_redis_publish_many_keeps_order() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    pubsub = RedisPubSub(redis)
+    topic = RoomTopic(uuid4())
+    it = pubsub.subscribe(topic)
+    read = asyncio.create_task(anext(it))
+
+    channel = topic_to_channel(topic).encode()
+    async with asyncio.timeout(1.0):
+        while dict(await redis.pubsub_numsub(channel)).get(channel, 0) == 0:
+            await asyncio.sleep(0.01)
+
+    await pubsub.publish_many([(topic, b"1"), (topic, b"2"), (topic, b"3")])
+
+    async with asyncio.timeout(1.0):
+        assert [await read, await anext(it), await anext(it)] == [b"1", b"2", b"3"]
+    await it.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,104 @@
+import asyncio
+
+import fakeredis
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.topics import RoomTopic
+from app.infra.redis.presence import RoomPresence
+from app.infra.redis.request_context import RequestContextCache
+from app.queries.room_snapshot import RoomSnapshotQuery
+from app.repositories.case import CaseRepo
+from app.repositories.case_player import CasePlayerRepo
+from app.repositories.room import RoomRepo
+from app.repositories.room_member import RoomMemberRepo
+from app.services.outbox_relay import OutboxRelay
+from app.services.presence_sweeper import PresenceSweeper
+from tests._helpers.entity import room_with_members
+from tests._helpers.pubsub import wait_until
+from tests.conftest import FakePubSub
+
+
+@pytest.mark.anyio
+async def test_sweeper_removes_member_after_ttl_lapses(
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    outbox_relay: OutboxRelay,
+    outbox_pubsub: FakePubSub,
+    context_cache: RequestContextCache,
+):
+    room_id, (crashed, alive) = await room_with_members(db_session, ["sweep_1", "sweep_2"])
+    redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    presence = RoomPresence(redis, ttl_seconds=1)
+    sweeper = PresenceSweeper(
+        session_factory, presence=presence, outbox_relay=outbox_relay, context_cache=context_cache
+    )
+
+    await presence.heartbeat(room_id, crashed)
+    await presence.heartbeat(room_id, alive)
+    assert await sweeper.sweep() == 0
+
+    await asyncio.sleep(1.1)
+    await presence.heartbeat(room_id, alive)  # alive만 계속 갱신
+    assert await sweeper.sweep() == 1
+    assert await sweeper.sweep() == 0
+
+    member_repo = RoomMemberRepo(db_session)
+    db_session.expire_all()
+    assert await member_repo.get_active_by_user_id(user_id=crashed) is None
+    assert await member_repo.get_active_by_user_id(user_id=alive) is not None
+
+    await wait_until(lambda: len(outbox_pubsub.published) == 1)
+    published = outbox_pubsub.published[0]
+    assert published.topic == RoomTopic(room_id)
+    event = RoomEventDelta.model_validate_json(published.message)
+    assert (event.type, event.user_id) == (RoomSnapshotType.MEMBER_LEFT, crashed)
+
+
+@pytest.mark.anyio
+async def test_sweeper_keeps_players_of_running_case(
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    outbox_relay: OutboxRelay,
+    outbox_pubsub: FakePubSub,
+    context_cache: RequestContextCache,
+):
+    room_id, (player,) = await room_with_members(db_session, ["sweep_player"])
+    case = await CaseRepo(db_session).create(room_id=room_id, host_user_id=player)
+    await db_session.flush()
+    await CasePlayerRepo(db_session).create_many(case_id=case.id, user_ids=[player])
+    await db_session.commit()
+    redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    presence = RoomPresence(redis, ttl_seconds=1)
+    sweeper = PresenceSweeper(
+        session_factory, presence=presence, outbox_relay=outbox_relay, context_cache=context_cache
+    )
+
+    await presence.heartbeat(room_id, player)
+    await asyncio.sleep(1.1)
+    assert await sweeper.sweep() == 0
+
+    db_session.expire_all()
+    assert await RoomMemberRepo(db_session).get_active_by_user_id(user_id=player) is not None
+    assert outbox_pubsub.published == []
+
+
+@pytest.mark.anyio
+async def test_room_snapshot_reads_online_status_from_presence(db_session: AsyncSession):
+    room_id, (online, offline) = await room_with_members(db_session, ["online_1", "offline_1"])
+    redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    presence = RoomPresence(redis, ttl_seconds=30)
+    await presence.heartbeat(room_id, online)
+    query = RoomSnapshotQuery(
+        room_repo=RoomRepo(db_session),
+        room_member_repo=RoomMemberRepo(db_session),
+        case_repo=CaseRepo(db_session),
+        presence=presence,
+    )
+
+    snapshot = await query.build_snapshot(
+        room_id=room_id, last_event=RoomSnapshotType.ON_CONNECT, logs=[]
+    )
+
+    assert {m.user_id: m.online for m in snapshot.members} == {online: True, offline: False}
@@ -81,3 +81,34 @@ async def test_case_state_sse_receives_initial_snapshot_after_case_start(
         with anyio.move_on_after(0.5):
             await reader.read_one()
             assert False, "sse should not emit additional snapshot"
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_case_state_sse_resumes_from_last_event_id(
+    live_db_session: AsyncSession,
+    sse_client: AsyncClient,
+    sse_user_auth: UserAuth,
+):
+    # given
+    usernames = [sse_user_auth["username"], "username3", "username4", "username5"]
+    _ = await room_with_members(live_db_session, usernames)
+
+    start_res = await sse_client.post(
+        "/api/v1/rooms/current/case-start", json={"red_player_count": None}
+    )
+    assert start_res.status_code == 200, start_res.text
+
+    # when: 이미 snapshot 1을 받은 EventSource가 재연결
+    async with sse_client.stream(
+        "GET",
+        "/rt/v1/sse/cases/current/state",
+        headers={"Last-Event-ID": "1"},
+    ) as r:
+        assert r.status_code == 200
+        reader = SSEReader(r)
+
+        # then: 이미 받은 snapshot은 다시 보내지 않는다.
+        with anyio.move_on_after(0.5):
+            await reader.read_one()
+            assert False, "sse should not replay snapshots before Last-Event-ID"
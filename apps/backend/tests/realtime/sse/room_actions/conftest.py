@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
 from fastapi import FastAPI
 
 from app.domain.events.case import CaseEventDelta
 from app.domain.events.room import RoomEventDelta
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
 from app.infra.pubsub.bus.deps import get_case_event_bus, get_room_event_bus
-from app.infra.pubsub.topics import CaseTopic, RoomTopic
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.topics import CaseTopic, RoomTopic, Topic
+from app.infra.pubsub.transport.deps import get_pubsub
+from tests._helpers.pubsub import wait_until
 
 
 @dataclass
@@ -18,16 +24,15 @@ class _RoomPublishCall:
 
 
 class FakeRoomEventBus:
-    """RoomEventBus 대체용 fake. publish 호출만 기록한다."""
+    """room event publish 기록. (outbox relay가 보낸 delta 객체)"""
 
     def __init__(self) -> None:
         self.calls: list[_RoomPublishCall] = []
 
-    async def publish(self, room_topic: RoomTopic, event: RoomEventDelta) -> None:
-        self.calls.append(_RoomPublishCall(topic=room_topic, event=event))
-
-    async def subscribe(self, room_topic: RoomTopic):  # pragma: no cover
-        raise RuntimeError("subscribe() is not used in these tests")
+    async def wait_for_calls(self, n: int) -> None:
+        """relay는 background로 publish하므로 n건이 기록될 때까지 기다린다."""
+        await wait_until(lambda: len(self.calls) >= n)
+        assert len(self.calls) == n
 
 
 @dataclass
@@ -37,29 +42,57 @@ class _CasePublishCall:
 
 
 class FakeCaseEventBus:
-    """RoomEventBus 대체용 fake. publish 호출만 기록한다."""
+    """case event publish 기록. (outbox relay가 보낸 delta 객체)"""
 
     def __init__(self) -> None:
         self.calls: list[_CasePublishCall] = []
 
-    async def publish(self, room_topic: CaseTopic, event: CaseEventDelta) -> None:
-        self.calls.append(_CasePublishCall(topic=room_topic, event=event))
+    async def wait_for_calls(self, n: int) -> None:
+        """relay는 background로 publish하므로 n건이 기록될 때까지 기다린다."""
+        await wait_until(lambda: len(self.calls) >= n)
+        assert len(self.calls) == n
+
+
+class _RecordingPubSub:
+    """객체를 그대로 받는(passes_objects) transport fake. topic 종류별로 기록만 한다."""
+
+    passes_objects = True
+
+    def __init__(self) -> None:
+        self.room = FakeRoomEventBus()
+        self.case = FakeCaseEventBus()
 
-    async def subscribe(self, room_topic: CaseTopic):  # pragma: no cover
+    async def publish(self, topic: Topic, message: Any) -> int:
+        if isinstance(topic, RoomTopic):
+            self.room.calls.append(_RoomPublishCall(topic=topic, event=message))
+        elif isinstance(topic, CaseTopic):
+            self.case.calls.append(_CasePublishCall(topic=topic, event=message))
+        return 1
+
+    async def publish_many(self, messages: Sequence[tuple[Topic, Any]]) -> None:
+        for topic, message in messages:
+            await self.publish(topic, message)
+
+    async def subscribe(self, topic: Topic):  # pragma: no cover
         raise RuntimeError("subscribe() is not used in these tests")
 
 
 @pytest.fixture
-def fake_room_bus(app: FastAPI):
-    bus = FakeRoomEventBus()
-    app.dependency_overrides[get_room_event_bus] = lambda: bus
-    yield bus
+def _recording_pubsub(app: FastAPI):
+    pubsub = _RecordingPubSub()
+    app.dependency_overrides[get_pubsub] = lambda: pubsub
+    # version(Redis INCR) 없이 publish하도록 bus도 교체한다.
+    app.dependency_overrides[get_room_event_bus] = lambda: RoomEventBus(pubsub)  # type: ignore[arg-type]
+    app.dependency_overrides[get_case_event_bus] = lambda: CaseEventBus(pubsub)  # type: ignore[arg-type]
+    yield pubsub
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def fake_case_bus(app: FastAPI):
-    bus = FakeCaseEventBus()
-    app.dependency_overrides[get_case_event_bus] = lambda: bus
-    yield bus
-    app.dependency_overrides.clear()
+def fake_room_bus(_recording_pubsub: _RecordingPubSub) -> FakeRoomEventBus:
+    return _recording_pubsub.room
+
+
+@pytest.fixture
+def fake_case_bus(_recording_pubsub: _RecordingPubSub) -> FakeCaseEventBus:
+    return _recording_pubsub.case
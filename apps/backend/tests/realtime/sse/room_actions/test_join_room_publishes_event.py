@@ -41,7 +41,7 @@ async def test_join_room_emits_member_joined_event(
     assert mutation.reason == JoinRoomReason.JOINED
 
     # 상태 변화가 있었다면 publish 되어야 함
-    assert len(fake_room_bus.calls) == 1
+    await fake_room_bus.wait_for_calls(1)
     call = fake_room_bus.calls[0]
     assert call.topic == RoomTopic(room_id)
     assert call.event.type == RoomSnapshotType.MEMBER_JOINED
@@ -59,7 +59,7 @@ async def test_join_room_does_not_emit_when_already_joined(
     room_id = MVP_ROOM_ID
     # 첫 join: join 발생 -> publish 1회
     _ = await join_room(client, room_id)
-    assert len(fake_room_bus.calls) == 1
+    await fake_room_bus.wait_for_calls(1)
 
     # 두 번째 join: already joined -> publish 증가 없음
     r = await client.post(f"/api/v1/rooms/{room_id}/join")
@@ -78,4 +78,4 @@ async def test_join_room_does_not_emit_when_already_joined(
     assert mutation.changed is False
     assert mutation.reason == JoinRoomReason.ALREADY_JOINED
 
-    assert len(fake_room_bus.calls) == 1
+    await fake_room_bus.wait_for_calls(1)
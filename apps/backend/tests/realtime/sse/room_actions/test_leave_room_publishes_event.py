@@ -36,7 +36,7 @@ async def test_leave_room_does_not_publish_before_join_room(
     assert mutation.reason == LeaveRoomReason.ALREADY_LEFT
 
     # 상태 변화가 있었다면 publish 되어야 함
-    assert len(fake_room_bus.calls) == 0
+    await fake_room_bus.wait_for_calls(0)
 
 
 @pytest.mark.anyio
@@ -47,7 +47,7 @@ async def test_leave_room_publishes_member_left_event(
 ) -> None:
     room_id = MVP_ROOM_ID
     _ = await join_room(client, room_id)
-    assert len(fake_room_bus.calls) == 1
+    await fake_room_bus.wait_for_calls(1)
 
     r = await client.post("/api/v1/rooms/current/leave")
     assert r.status_code == status.HTTP_200_OK
@@ -66,4 +66,4 @@ async def test_leave_room_publishes_member_left_event(
     assert mutation.reason == LeaveRoomReason.LEFT
 
     # 상태 변화가 있었다면 publish 되어야 함
-    assert len(fake_room_bus.calls) == 2
+    await fake_room_bus.wait_for_calls(2)
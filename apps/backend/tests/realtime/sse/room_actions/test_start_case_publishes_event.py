@@ -60,7 +60,7 @@ async def test_case_start_emits_member_joined_event(
     assert mutation.reason == CaseStartReason.STARTED
 
     # 상태 변화가 있었다면 publish 되어야 함
-    assert len(fake_case_bus.calls) == 1
+    await fake_case_bus.wait_for_calls(1)
     call = fake_case_bus.calls[0]
     assert call.topic == CaseTopic(mutation.subject_id)
     assert call.event.type == CaseSnapshotType.STARTED
@@ -82,7 +82,7 @@ async def test_case_start_does_not_emit_when_already_started(
         db_session, [user_auth["username"], "username3", "username4", "username5"]
     )
     r = await client.post("/api/v1/rooms/current/case-start", json={"red_player_count": None})
-    assert len(fake_case_bus.calls) == 1
+    await fake_case_bus.wait_for_calls(1)
 
     # 두 번째 start -> publish 증가 없음
     r = await client.post("/api/v1/rooms/current/case-start", json={"red_player_count": None})
@@ -92,4 +92,4 @@ async def test_case_start_does_not_emit_when_already_started(
     assert envelope.ok is False
     assert envelope.code == ConflictErrorCode.CONFLICT_ROOM_CASE_RUNNING
     assert envelope.data is None
-    assert len(fake_case_bus.calls) == 1
+    await fake_case_bus.wait_for_calls(1)
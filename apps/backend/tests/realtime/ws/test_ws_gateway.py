@@ -0,0 +1,113 @@
+import json
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import InvalidStatus
+
+from app.core.error_codes import CommonErrorCode, ConflictErrorCode
+from app.mvp import MVP_ROOM_ID
+from app.schemas.case.action_responses.common_action import ActionConflictCode
+from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
+from tests._helpers.auth import UserAuth
+from tests._helpers.room_actions import join_room
+
+_WS_PATH = "/rt/v1/ws"
+
+
+def _ws_url(client: AsyncClient) -> str:
+    return str(client.base_url).replace("http://", "ws://").rstrip("/") + _WS_PATH
+
+
+def _cookie_header(client: AsyncClient) -> str:
+    return "; ".join(f"{name}={value}" for name, value in client.cookies.items())
+
+
+async def _recv(ws: ClientConnection) -> dict[str, Any]:
+    return json.loads(await ws.recv(decode=True))
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_ws_multiplexes_room_events_and_actions(
+    sse_client: AsyncClient,
+    sse_user_auth: UserAuth,
+    sse_client2: AsyncClient,
+    sse_user_auth2: UserAuth,
+) -> None:
+    _ = await join_room(sse_client, MVP_ROOM_ID)
+
+    async with connect(
+        _ws_url(sse_client), additional_headers={"Cookie": _cookie_header(sse_client)}
+    ) as ws:
+        await ws.send(json.dumps({"type": "subscribe", "stream": "room"}))
+
+        on_connect = await _recv(ws)
+        assert on_connect["type"] == "event"
+        assert on_connect["stream"] == "room"
+        assert on_connect["event"] == SSEEventType.ON_CONNECT
+        assert on_connect["data"]["code"] == SSEEnvelopeCode.ROOM_STATE
+
+        # 다른 유저의 입장이 같은 socket으로 온다.
+        _ = await join_room(sse_client2, MVP_ROOM_ID)
+        joined = await _recv(ws)
+        assert joined["event"] == SSEEventType.ROOM_EVENT
+        assert int(joined["id"]) > 0
+        assert len(joined["data"]["data"]["members"]) == 2
+
+        # action도 같은 socket으로 제출한다. (결과는 REST 응답과 같은 envelope, MVP: NIGHT phase)
+        await ws.send(
+            json.dumps(
+                {
+                    "type": "action",
+                    "request_id": "a-1",
+                    "action": "blue-vote",
+                    "body": {"choice": "YES"},
+                }
+            )
+        )
+        result = await _recv(ws)
+        assert result["type"] == "action_result"
+        assert result["request_id"] == "a-1"
+        assert result["data"]["ok"] is False
+        assert result["data"]["code"] == ActionConflictCode.PHASE_REJECTED_CONFLICT_ACTION
+
+        # 잘못된 body는 422 error
+        await ws.send(
+            json.dumps({"type": "action", "request_id": "a-2", "action": "blue-vote", "body": {}})
+        )
+        error = await _recv(ws)
+        assert error["type"] == "error"
+        assert error["request_id"] == "a-2"
+        assert error["status"] == 422
+        assert error["data"]["code"] == CommonErrorCode.VALIDATION_ERROR
+
+        # 진행 중인 case가 없으면 case stream, red-vote 모두 409 error
+        await ws.send(json.dumps({"type": "subscribe", "stream": "case"}))
+        error = await _recv(ws)
+        assert error["status"] == 409
+        assert error["data"]["code"] == ConflictErrorCode.CONFLICT_NOT_ON_CASE
+
+        await ws.send(
+            json.dumps(
+                {
+                    "type": "action",
+                    "request_id": "a-3",
+                    "action": "red-vote",
+                    "body": {"target_seat_no": 1},
+                }
+            )
+        )
+        error = await _recv(ws)
+        assert error["request_id"] == "a-3"
+        assert error["data"]["code"] == ConflictErrorCode.CONFLICT_NOT_ON_CASE
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_ws_rejects_unauthenticated_connection(sse_client: AsyncClient) -> None:
+    with pytest.raises(InvalidStatus) as exc_info:
+        async with connect(_ws_url(sse_client)):
+            pass
+    assert exc_info.value.response.status_code == 401
@@ -1,15 +1,22 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.infra.pubsub.bus.deps import get_room_event_bus
-from app.infra.pubsub.bus.room_event_bus import RoomEventBus
-from app.infra.redis.client import get_redis_client
+from app.infra.redis.client import get_redis_binary_client, get_redis_client
+from app.infra.redis.event_version import get_room_event_versions
 from app.infra.redis.pubsub import get_redis_pubsub
-from app.repositories.deps import get_room_member_repo, get_user_repo
+from app.infra.redis.request_context import RequestContextCache
+from app.infra.serialization.codec import get_pubsub_codec
+from app.queries.deps import get_room_snapshot_query
+from app.repositories.case import CaseRepo
+from app.repositories.deps import get_event_outbox_repo, get_room_member_repo, get_user_repo
+from app.repositories.room import RoomRepo
 from app.repositories.room_member import RoomMemberRepo
 from app.repositories.user import UserRepo
 from app.services.auth import get_auth_service
 from app.services.deps import get_room_service
+from app.services.outbox_relay import OutboxRelay
 
 
 @pytest.fixture
@@ -33,13 +40,23 @@ def redis_client():
 
 
 @pytest.fixture
-def redis_pubsub(redis_client):
-    return get_redis_pubsub(redis_client)
+def redis_pubsub():
+    return get_redis_pubsub(get_redis_binary_client())
 
 
 @pytest.fixture
-def room_event_bus(redis_pubsub):
-    return get_room_event_bus(redis_pubsub)
+def room_event_bus(redis_client, redis_pubsub):
+    return get_room_event_bus(
+        redis_pubsub,
+        get_settings(),
+        get_room_event_versions(redis_client),
+        get_pubsub_codec(),
+    )
+
+
+@pytest.fixture
+def room_snapshot_query(room_repo: RoomRepo, room_member_repo: RoomMemberRepo, case_repo: CaseRepo):
+    return get_room_snapshot_query(room_repo, room_member_repo, case_repo)
 
 
 @pytest.fixture
@@ -47,6 +64,14 @@ def room_service(
     db_session: AsyncSession,
     room_member_repo: RoomMemberRepo,
     user_repo: UserRepo,
-    room_event_bus: RoomEventBus,
+    outbox_relay: OutboxRelay,
+    context_cache: RequestContextCache,
 ):
-    return get_room_service(db_session, room_member_repo, user_repo, room_event_bus)
+    return get_room_service(
+        db_session,
+        room_member_repo,
+        user_repo,
+        get_event_outbox_repo(db_session),
+        outbox_relay,
+        context_cache,
+    )
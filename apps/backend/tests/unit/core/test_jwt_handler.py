@@ -0,0 +1,80 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.config import JwtConfig
+from app.core.error_codes import AuthTokenErrorCode
+from app.core.exceptions import EnvelopeHTTPException
+from app.core.security.jwt import ACCESS_TOKEN, REFRESH_TOKEN, JwtHandler
+
+
+def _config(**overrides) -> JwtConfig:
+    values = dict(
+        issuer="trap-mafia-test",
+        audience="trap-mafia-test",
+        access_ttl=timedelta(minutes=5),
+        refresh_ttl=timedelta(days=7),
+        algorithm="HS256",
+        secret_key="valid-test-token-valid-test-token-valid-test-token-valid-test-token",
+    )
+    values.update(overrides)
+    return JwtConfig(**values)
+
+
+async def test_verified_claims_are_cached_until_exp() -> None:
+    handler = JwtHandler(_config(access_ttl=timedelta(seconds=1)))
+    token = handler.create_access_token(sub="user")
+
+    assert handler.decode_and_verify(token)["sub"] == "user"
+    assert (await handler.decode_and_verify_async(token))["sub"] == "user"
+    stats = handler.stats
+    assert (stats.hits, stats.misses, stats.verified, stats.size) == (1, 1, 1, 1)
+
+    # 캐시에 있어도 token 종류 검사는 매번 한다.
+    with pytest.raises(EnvelopeHTTPException) as exc:
+        handler.decode_and_verify(token, REFRESH_TOKEN)
+    assert exc.value.code == AuthTokenErrorCode.AUTH_TOKEN_INVALID
+
+    await asyncio.sleep(1.1)
+    with pytest.raises(EnvelopeHTTPException) as exc:
+        handler.decode_and_verify(token)
+    assert exc.value.code == AuthTokenErrorCode.AUTH_TOKEN_EXPIRED
+    assert (handler.stats.failed, handler.stats.size) == (1, 0)
+
+
+async def test_rs256_verification_runs_off_the_event_loop(monkeypatch) -> None:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    handler = JwtHandler(
+        _config(
+            algorithm="RS256",
+            secret_key=private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ).decode(),
+            public_key=private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            .decode(),
+        )
+    )
+    offloaded: list[object] = []
+    to_thread = asyncio.to_thread
+
+    async def _to_thread(func, /, *args):
+        offloaded.append(func)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", _to_thread)
+    token = handler.create_access_token(sub="user")
+
+    for _ in range(3):
+        assert (await handler.decode_and_verify_async(token, ACCESS_TOKEN))["sub"] == "user"
+
+    assert len(offloaded) == 1
+    assert (handler.stats.verified, handler.stats.hits) == (1, 2)
+    assert handler.stats.verify_seconds_max > 0
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from app.infra.pubsub.buffer import (
+    BufferOverflowError,
+    ListenerBuffer,
+    OverflowPolicy,
+    active_buffer_stats,
+)
+from app.infra.pubsub.fanout import TopicFanout
+from app.infra.pubsub.topics import RoomTopic
+from app.mvp import MVP_ROOM_ID
+from tests._helpers.pubsub import LivePubSub, wait_until
+
+
+async def test_coalesce_keeps_only_latest_item() -> None:
+    buffer: ListenerBuffer[int] = ListenerBuffer(maxsize=2, policy=OverflowPolicy.COALESCE)
+    for n in range(1, 6):
+        buffer.put_nowait(n)
+
+    # 1,2 -> 가득 참 -> 3에서 비우고 [3], 4 -> [3,4], 5에서 다시 비우고 [5]
+    assert await anext(buffer) == 5
+    assert buffer.pop_coalesced() is True
+    assert buffer.pop_coalesced() is False
+
+    stats = buffer.stats
+    assert (stats.depth, stats.max_depth, stats.evicted, stats.overflowed) == (0, 2, 4, False)
+
+
+async def test_drop_discards_incoming_items() -> None:
+    buffer: ListenerBuffer[int] = ListenerBuffer(maxsize=2, policy=OverflowPolicy.DROP)
+    for n in range(1, 5):
+        buffer.put_nowait(n)
+    buffer.close()
+
+    assert [n async for n in buffer] == [1, 2]
+    assert buffer.stats.evicted == 2
+
+
+async def test_disconnect_raises_once_overflowed() -> None:
+    buffer: ListenerBuffer[int] = ListenerBuffer(maxsize=1, policy=OverflowPolicy.DISCONNECT)
+    buffer.put_nowait(1)
+    buffer.put_nowait(2)
+    buffer.put_nowait(3)  # overflow 이후에는 받지 않는다.
+
+    with pytest.raises(BufferOverflowError):
+        await anext(buffer)
+    assert buffer.stats.overflowed is True
+    assert buffer.stats.depth == 0
+
+
+async def test_close_wakes_waiting_consumer_after_remaining_items() -> None:
+    buffer: ListenerBuffer[int] = ListenerBuffer(maxsize=4, policy=OverflowPolicy.DROP)
+    read = asyncio.create_task(anext(buffer))
+    await asyncio.sleep(0)
+
+    buffer.put_nowait(1)
+    assert await read == 1
+
+    buffer.put_nowait(2)
+    buffer.close(RuntimeError("upstream gone"))
+    assert await anext(buffer) == 2
+    with pytest.raises(RuntimeError):
+        await anext(buffer)
+
+
+async def test_slow_listener_does_not_block_fast_listener() -> None:
+    pubsub = LivePubSub()
+    fanout = TopicFanout(pubsub.subscribe, lambda m: m)  # type: ignore[arg-type]
+    topic = RoomTopic(MVP_ROOM_ID)
+
+    slow_buffer: ListenerBuffer[str] = ListenerBuffer(
+        maxsize=2, policy=OverflowPolicy.DISCONNECT, label="slow"
+    )
+    async with fanout.listen(topic, buffer=slow_buffer) as slow:
+        async with fanout.listen(topic) as fast:
+            await wait_until(lambda: pubsub.active[topic] == 1)
+            assert any(s.label == "slow" for s in active_buffer_stats())
+
+            for n in range(5):
+                await pubsub.publish(topic, str(n))
+                assert await anext(fast) == str(n)
+
+            assert slow_buffer.stats.overflowed is True
+            with pytest.raises(BufferOverflowError):
+                await anext(slow)
@@ -8,6 +8,7 @@ from app.domain.events.room import RoomEventDelta, RoomSnapshotType
 from app.infra.pubsub.bus.room_event_bus import RoomEventBus
 from app.infra.pubsub.topics import RoomTopic
 from app.mvp import MVP_ROOM_ID
+from app.schemas.room.state import RoomInfo, RoomSnapshot
 from tests.conftest import FakePubSub
 
 
@@ -76,3 +77,48 @@ async def test_subscribe_parses_json_to_room_event_message(fake_pubsub: FakePubS
         received.append(ev)
 
     assert received == [ev1, ev2]
+
+
+def _room_snapshot() -> RoomSnapshot:
+    return RoomSnapshot(
+        room=RoomInfo(room_name="test_room", created_at="2026-03-05T00:00:00Z"),
+        last_event=RoomSnapshotType.MEMBER_JOINED,
+    )
+
+
+async def test_publish_inlines_snapshot_in_fat_event_mode(fake_pubsub: FakePubSub) -> None:
+    bus = RoomEventBus(fake_pubsub, inline_snapshot_max_bytes=64 * 1024)  # type: ignore[arg-type]
+    snapshot = _room_snapshot()
+
+    async def loader() -> RoomSnapshot:
+        return snapshot
+
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_JOINED, user_id=uuid4())  # pyright: ignore[reportCallIssue]
+    await bus.publish(RoomTopic(MVP_ROOM_ID), ev, snapshot_loader=loader)
+
+    roundtrip = RoomEventDelta.model_validate_json(fake_pubsub.published[0].message)
+    assert roundtrip.snapshot_json is not None
+    assert RoomSnapshot.model_validate_json(roundtrip.snapshot_json) == snapshot
+
+
+async def test_publish_skips_oversize_or_disabled_snapshot(fake_pubsub: FakePubSub) -> None:
+    loads = 0
+
+    async def loader() -> RoomSnapshot:
+        nonlocal loads
+        loads += 1
+        return _room_snapshot()
+
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_JOINED, user_id=uuid4())  # pyright: ignore[reportCallIssue]
+
+    # 비활성: loader도 호출하지 않는다.
+    await RoomEventBus(fake_pubsub).publish(RoomTopic(MVP_ROOM_ID), ev, snapshot_loader=loader)  # type: ignore[arg-type]
+    assert loads == 0
+
+    # 크기 초과: id만 담긴 delta로 보낸다.
+    small = RoomEventBus(fake_pubsub, inline_snapshot_max_bytes=16)  # type: ignore[arg-type]
+    await small.publish(RoomTopic(MVP_ROOM_ID), ev, snapshot_loader=loader)
+    assert loads == 1
+
+    for published in fake_pubsub.published:
+        assert RoomEventDelta.model_validate_json(published.message).snapshot_json is None
@@ -0,0 +1,93 @@
+import asyncio
+import json
+from uuid import uuid4
+
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.fanout import TopicFanout
+from app.infra.pubsub.topics import RoomTopic
+from app.mvp import MVP_ROOM_ID
+from tests._helpers.pubsub import LivePubSub, wait_until
+
+
+async def test_fanout_shares_one_upstream_subscription_and_decodes_once() -> None:
+    pubsub = LivePubSub()
+    decoded: list[str] = []
+
+    def decode(msg: str) -> dict:
+        decoded.append(msg)
+        return json.loads(msg)
+
+    fanout = TopicFanout(pubsub.subscribe, decode)  # type: ignore[arg-type]
+    topic = RoomTopic(MVP_ROOM_ID)
+
+    listeners = [fanout.subscribe(topic) for _ in range(3)]
+    reads = [asyncio.create_task(anext(it)) for it in listeners]
+
+    await wait_until(lambda: pubsub.active[topic] == 1)
+    assert fanout.listener_count(topic) == 3
+
+    await pubsub.publish(topic, json.dumps({"n": 1}))
+    results = await asyncio.gather(*reads)
+
+    assert results == [{"n": 1}] * 3
+    # 같은 객체를 나눠 받는다.
+    assert all(r is results[0] for r in results)
+    assert decoded == [json.dumps({"n": 1})]
+    assert pubsub.subscribe_calls[topic] == 1
+
+    for it in listeners:
+        await it.aclose()  # type: ignore[attr-defined]
+
+    assert fanout.listener_count(topic) == 0
+    assert pubsub.active[topic] == 0
+
+
+async def test_fanout_keeps_upstream_until_last_listener_leaves() -> None:
+    pubsub = LivePubSub()
+    fanout = TopicFanout(pubsub.subscribe, lambda m: m)  # type: ignore[arg-type]
+    topic = RoomTopic(MVP_ROOM_ID)
+
+    first = fanout.subscribe(topic)
+    second = fanout.subscribe(topic)
+    first_read = asyncio.create_task(anext(first))
+    second_read = asyncio.create_task(anext(second))
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    await pubsub.publish(topic, "a")
+    assert await first_read == "a"
+    assert await second_read == "a"
+
+    await first.aclose()  # type: ignore[attr-defined]
+    assert pubsub.active[topic] == 1
+
+    await pubsub.publish(topic, "b")
+    assert await anext(second) == "b"
+
+    await second.aclose()  # type: ignore[attr-defined]
+    assert pubsub.active[topic] == 0
+    assert fanout.topics() == []
+
+
+async def test_room_event_buses_on_same_pubsub_share_subscription() -> None:
+    pubsub = LivePubSub()
+    bus1 = RoomEventBus(pubsub)  # type: ignore[arg-type]
+    bus2 = RoomEventBus(pubsub)  # type: ignore[arg-type]
+    topic = RoomTopic(MVP_ROOM_ID)
+
+    it1 = bus1.subscribe(topic)
+    it2 = bus2.subscribe(topic)
+    read1 = asyncio.create_task(anext(it1))
+    read2 = asyncio.create_task(anext(it2))
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_JOINED, user_id=uuid4())  # pyright: ignore[reportCallIssue]
+    await bus1.publish(topic, ev)
+
+    assert await read1 == ev
+    assert await read2 == ev
+    assert pubsub.subscribe_calls[topic] == 1
+
+    await it1.aclose()  # type: ignore[attr-defined]
+    await it2.aclose()  # type: ignore[attr-defined]
+    assert pubsub.active[topic] == 0
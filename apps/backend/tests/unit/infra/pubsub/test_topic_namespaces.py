@@ -0,0 +1,102 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from app.infra.pubsub.topics import (
+    CaseTopic,
+    ConnTopic,
+    RoomTopic,
+    Topic,
+    UserTopic,
+    topic_namespaces,
+)
+from app.infra.redis.pubsub import RedisPubSub, topic_to_channel
+from app.infra.redis.stream_pubsub import RedisStreamPubSub
+
+
+def _redis() -> fakeredis.FakeAsyncRedis:
+    # 서버를 따로 둬서 "다른 Redis instance"를 흉내낸다.
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+
+
+async def _numsub(redis, channel: str, *, sharded: bool = False) -> int:
+    if sharded:
+        resp = await redis.execute_command("PUBSUB", "SHARDNUMSUB", channel)
+    else:
+        resp = await redis.execute_command("PUBSUB", "NUMSUB", channel)
+    return int(resp[1])
+
+
+async def _wait_numsub(redis, channel: str, *, sharded: bool = False) -> None:
+    async with asyncio.timeout(1.0):
+        while await _numsub(redis, channel, sharded=sharded) == 0:
+            await asyncio.sleep(0.01)
+
+
+def test_each_topic_type_has_its_own_channel_prefix() -> None:
+    same_id = uuid4()
+
+    channels = {
+        topic_to_channel(t)
+        for t in (RoomTopic(same_id), CaseTopic(same_id), UserTopic(same_id), ConnTopic(same_id))
+    }
+
+    assert channels == {f"{ns}:{same_id}" for ns in ("room", "case", "user", "conn")}
+    assert set(topic_namespaces()) == {"room", "case", "user", "conn"}
+
+
+def test_namespace_cannot_be_registered_twice() -> None:
+    with pytest.raises(ValueError):
+
+        class _Dup(Topic, namespace="case"):  # pyright: ignore[reportUnusedClass]
+            pass
+
+
+async def test_case_namespace_is_routed_to_its_own_redis() -> None:
+    default, case_redis = _redis(), _redis()
+    pubsub = RedisPubSub(default, routes={"case": case_redis})
+    case_topic, room_topic = CaseTopic(uuid4()), RoomTopic(uuid4())
+
+    it = pubsub.subscribe(case_topic)
+    read = asyncio.create_task(anext(it))
+    await _wait_numsub(case_redis, topic_to_channel(case_topic))
+
+    assert await _numsub(default, topic_to_channel(case_topic)) == 0
+    await pubsub.publish_many([(room_topic, b"room"), (case_topic, b"case")])
+
+    async with asyncio.timeout(1.0):
+        assert await read == b"case"
+    await it.aclose()  # type: ignore[attr-defined]
+
+
+async def test_sharded_namespace_uses_spublish_and_ssubscribe() -> None:
+    redis = _redis()
+    pubsub = RedisPubSub(redis, sharded=["case"])
+    topic = CaseTopic(uuid4())
+    channel = topic_to_channel(topic)
+
+    it = pubsub.subscribe(topic)
+    read = asyncio.create_task(anext(it))
+    await _wait_numsub(redis, channel, sharded=True)
+
+    assert await _numsub(redis, channel) == 0  # 일반 SUBSCRIBE가 아님
+    await pubsub.publish(topic, b"1")
+    await pubsub.publish_many([(topic, b"2")])
+
+    async with asyncio.timeout(1.0):
+        assert [await read, await anext(it)] == [b"1", b"2"]
+    await it.aclose()  # type: ignore[attr-defined]
+
+
+async def test_stream_transport_routes_keys_by_namespace() -> None:
+    default, case_redis = _redis(), _redis()
+    pubsub = RedisStreamPubSub(default, routes={"case": case_redis})
+    topic = CaseTopic(uuid4())
+
+    await pubsub.publish(topic, b"x")
+
+    assert await pubsub.last_id(topic) is not None
+    assert await default.exists(f"stream:{topic_to_channel(topic)}") == 0
+    assert await case_redis.exists(f"stream:{topic_to_channel(topic)}") == 1
@@ -0,0 +1,211 @@
+"""transport 공용 테스트.
+
+PUB/SUB, Redis Streams, in-memory, hybrid transport가 같은 bus 동작을 보장하는지 확인한다.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from app.domain.events.case import CaseEventDelta, CaseSnapshotType
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.topics import CaseTopic, RoomTopic, Topic
+from app.infra.pubsub.transport.base import PubSub
+from app.infra.pubsub.transport.hybrid import HybridPubSub
+from app.infra.pubsub.transport.memory import InMemoryPubSub
+from app.infra.redis.event_version import RoomEventVersions
+from app.infra.redis.pubsub import RedisPubSub, topic_to_channel
+from app.infra.redis.stream_pubsub import RedisStreamPubSub
+from app.infra.serialization.codec import JSON_CODEC
+from app.mvp import MVP_ROOM_ID
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture(params=["redis", "redis_streams", "memory", "hybrid"])
+def transport(request, redis) -> PubSub:
+    if request.param == "redis_streams":
+        return RedisStreamPubSub(redis, block_ms=20)
+    if request.param == "memory":
+        return InMemoryPubSub()
+    if request.param == "hybrid":
+        return HybridPubSub(RedisPubSub(redis), codec=JSON_CODEC)
+    return RedisPubSub(redis)
+
+
+async def _wait_redis_subscribed(redis, topic: Topic) -> None:
+    channel = topic_to_channel(topic)
+    while dict(await redis.pubsub_numsub(channel)).get(channel, 0) == 0:
+        await asyncio.sleep(0.01)
+
+
+async def _wait_subscribed(transport: PubSub, redis, topic: Topic) -> None:
+    """upstream 구독이 실제로 붙을 때까지 기다린다. (붙기 전 publish는 PUB/SUB에서 유실)"""
+    async with asyncio.timeout(1.0):
+        if isinstance(transport, (InMemoryPubSub, HybridPubSub)):
+            while transport.subscriber_count(topic) == 0:
+                await asyncio.sleep(0)
+        if isinstance(transport, (RedisPubSub, HybridPubSub)):
+            await _wait_redis_subscribed(redis, topic)
+        elif isinstance(transport, RedisStreamPubSub):
+            # stream 구독은 시작 시점 last id부터 읽으므로, 첫 XREAD까지 잠시 양보한다.
+            await asyncio.sleep(0.05)
+
+
+async def _next(it: AsyncIterator):
+    async with asyncio.timeout(1.0):
+        return await anext(it)
+
+
+async def test_room_event_roundtrip(transport: PubSub, redis) -> None:
+    bus = RoomEventBus(transport)
+    topic = RoomTopic(MVP_ROOM_ID)
+    it = bus.subscribe(topic)
+    read = asyncio.create_task(_next(it))
+    await _wait_subscribed(transport, redis, topic)
+
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_JOINED, user_id=uuid4(), version=3)  # pyright: ignore[reportCallIssue]
+    await bus.publish(topic, ev)
+
+    assert await read == ev
+    await it.aclose()  # type: ignore[attr-defined]
+
+
+async def test_case_event_roundtrip(transport: PubSub, redis) -> None:
+    bus = CaseEventBus(transport)
+    topic = CaseTopic(uuid4())
+    it = bus.subscribe(topic)
+    read = asyncio.create_task(_next(it))
+    await _wait_subscribed(transport, redis, topic)
+
+    ev = CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=1)  # type: ignore[call-arg]
+    await bus.publish(topic, ev)
+
+    assert await read == ev
+    await it.aclose()  # type: ignore[attr-defined]
+
+
+async def test_events_keep_publish_order_and_topic_isolation(transport: PubSub, redis) -> None:
+    bus = RoomEventBus(transport)
+    topic, other = RoomTopic(MVP_ROOM_ID), RoomTopic(uuid4())
+    it = bus.subscribe(topic)
+    first = asyncio.create_task(_next(it))
+    await _wait_subscribed(transport, redis, topic)
+
+    await bus.publish(other, RoomEventDelta(type=RoomSnapshotType.MEMBER_LEFT))  # pyright: ignore[reportCallIssue]
+    types = [RoomSnapshotType.MEMBER_JOINED, RoomSnapshotType.MEMBER_READY]
+    for t in types:
+        await bus.publish(topic, RoomEventDelta(type=t))  # pyright: ignore[reportCallIssue]
+
+    received = [(await first).type, (await _next(it)).type]
+    assert received == types
+    await it.aclose()  # type: ignore[attr-defined]
+
+
+async def test_open_attaches_before_the_first_read(transport: PubSub, redis) -> None:
+    bus = RoomEventBus(transport)
+    topic = RoomTopic(MVP_ROOM_ID)
+    async with bus.open(topic) as events:
+        await _wait_subscribed(transport, redis, topic)
+        # 아직 아무도 읽고 있지 않아도 listener가 붙어 있으므로 놓치지 않는다.
+        await bus.publish(topic, RoomEventDelta(type=RoomSnapshotType.MEMBER_JOINED))  # pyright: ignore[reportCallIssue]
+        assert (await _next(events)).type == RoomSnapshotType.MEMBER_JOINED
+
+
+###############################################################################
+###### redis streams log
+###############################################################################
+
+
+async def test_stream_log_reads_recent_entries_and_expires(redis) -> None:
+    pubsub = RedisStreamPubSub(redis, ttl_seconds=60)
+    topic = RoomTopic(MVP_ROOM_ID)
+    for payload in ("a", "b", "c"):
+        await pubsub.publish(topic, payload)
+
+    assert await pubsub.read_recent(topic, 2) == ["b", "c"]
+    assert 0 < await redis.ttl(f"stream:{topic_to_channel(topic)}") <= 60
+
+
+async def test_read_missed_returns_versions_after_the_client(redis) -> None:
+    pubsub = RedisStreamPubSub(redis)
+    bus = RoomEventBus(pubsub, versions=RoomEventVersions(redis))
+    topic = RoomTopic(MVP_ROOM_ID)
+    for t in (RoomSnapshotType.MEMBER_JOINED, RoomSnapshotType.MEMBER_READY):
+        await bus.publish(topic, RoomEventDelta(type=t))  # pyright: ignore[reportCallIssue]
+    # outbox 재전송처럼 같은 version이 log에 두 번 남아도 한 번만 쓴다.
+    retried = RoomEventDelta(type=RoomSnapshotType.MEMBER_UNREADY, version=3)  # pyright: ignore[reportCallIssue]
+    await bus.publish(topic, retried)
+    await bus.publish(topic, retried)
+
+    missed = await bus.read_missed(topic, after_version=1, upto_version=3)
+    assert missed is not None
+    assert [e.version for e in missed] == [2, 3]
+    # log에 없는 version이 있으면 이어받지 않는다.
+    assert await bus.read_missed(topic, after_version=1, upto_version=4) is None
+    assert (
+        await RoomEventBus(InMemoryPubSub()).read_missed(topic, after_version=1, upto_version=3)
+        is None
+    )
+
+
+###############################################################################
+###### in-memory / hybrid
+###############################################################################
+
+
+async def test_memory_transport_hands_over_the_published_object() -> None:
+    pubsub = InMemoryPubSub()
+    bus = CaseEventBus(pubsub)
+    topic = CaseTopic(uuid4())
+    it = bus.subscribe(topic)
+    read = asyncio.create_task(_next(it))
+    await _wait_subscribed(pubsub, None, topic)
+
+    ev = CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=1)  # type: ignore[call-arg]
+    await bus.publish(topic, ev)
+
+    assert await read is ev  # 직렬화 없이 같은 객체
+    await it.aclose()  # type: ignore[attr-defined]
+    assert pubsub.subscriber_count(topic) == 0
+
+
+async def test_hybrid_delivers_locally_once_and_forwards_to_other_workers(redis) -> None:
+    worker_a = HybridPubSub(RedisPubSub(redis), codec=JSON_CODEC)
+    worker_b = HybridPubSub(RedisPubSub(redis), codec=JSON_CODEC)
+    topic = CaseTopic(uuid4())
+    local_it = CaseEventBus(worker_a).subscribe(topic)
+    remote_it = CaseEventBus(worker_b).subscribe(topic)
+    local_read = asyncio.create_task(_next(local_it))
+    remote_read = asyncio.create_task(_next(remote_it))
+    await _wait_subscribed(worker_a, redis, topic)
+    await _wait_subscribed(worker_b, redis, topic)
+    channel = topic_to_channel(topic)
+    async with asyncio.timeout(1.0):
+        while dict(await redis.pubsub_numsub(channel)).get(channel, 0) < 2:
+            await asyncio.sleep(0.01)
+
+    first, second = (
+        CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=no)  # type: ignore[call-arg]
+        for no in (1, 2)
+    )
+    await CaseEventBus(worker_a).publish(topic, first)
+    await CaseEventBus(worker_a).publish(topic, second)
+
+    # 같은 worker: 객체 그대로, Redis를 거쳐 되돌아온 자기 메시지는 중복으로 받지 않는다.
+    assert await local_read is first
+    assert await _next(local_it) is second
+    # 다른 worker: Redis를 거쳐 decode된 값
+    assert await remote_read == first
+    assert await _next(remote_it) == second
+
+    await local_it.aclose()  # type: ignore[attr-defined]
+    await remote_it.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,78 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from app.domain.events.case import CaseEventDelta, CaseSnapshotType
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.topics import CaseTopic
+from app.infra.redis.pubsub import RedisPubSub, topic_to_channel
+from app.infra.serialization.codec import Codec, get_codec
+from app.realtime_.sse.case_frame_cache import build_case_frame
+from app.realtime_.sse.frame import build_sse_frame
+from app.schemas.sse.response import SSEEventType
+from tests.unit.realtime.test_case_frame_cache import _case_snapshot
+
+
+def _codec_or_skip(name) -> Codec:
+    try:
+        return get_codec(name)
+    except RuntimeError as e:
+        pytest.skip(str(e))
+
+
+@pytest.fixture(params=["json", "orjson", "msgpack"])
+def codec(request) -> Codec:
+    return _codec_or_skip(request.param)
+
+
+def test_model_roundtrip(codec: Codec) -> None:
+    snapshot = _case_snapshot(uuid4())
+
+    encoded = codec.encode_model(snapshot)
+
+    assert isinstance(encoded, bytes)
+    assert codec.decode_model(type(snapshot), encoded) == snapshot
+    assert codec.loads(codec.dumps({"a": [1, "둘"]})) == {"a": [1, "둘"]}
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_codec("yaml")  # type: ignore[arg-type]
+
+
+def test_sse_frame_is_bytes_and_keeps_utf8_payload() -> None:
+    snapshot = _case_snapshot(uuid4())
+    snapshot.players[0].username = "플레이어"
+
+    frame = build_case_frame(snapshot, 3)
+
+    assert isinstance(frame, bytes)
+    assert frame.startswith(b"event: CASE_EVENT\nid: 3\ndata: {")
+    assert frame.endswith(b"}\n\n")
+    assert "플레이어".encode() in frame  # \uXXXX escape 없이 그대로
+    assert build_sse_frame(event=SSEEventType.CASE_EVENT, data=b"{}") == (
+        b"event: CASE_EVENT\ndata: {}\n\n"
+    )
+
+
+async def test_bus_roundtrip_over_binary_redis_client(codec: Codec) -> None:
+    # 운영과 같이 decode하지 않는 client로 payload(bytes)를 그대로 주고받는다.
+    redis = fakeredis.FakeAsyncRedis()
+    bus = CaseEventBus(RedisPubSub(redis), codec=codec)
+    topic = CaseTopic(uuid4())
+    it = bus.subscribe(topic)
+    read = asyncio.create_task(anext(it))
+
+    channel = topic_to_channel(topic).encode()
+    async with asyncio.timeout(1.0):
+        while dict(await redis.pubsub_numsub(channel)).get(channel, 0) == 0:
+            await asyncio.sleep(0.01)
+
+    ev = CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=1)  # type: ignore[call-arg]
+    await bus.publish(topic, ev)
+
+    async with asyncio.timeout(1.0):
+        assert await read == ev
+    await it.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infra.db.pool_metrics import InstrumentedQueuePool, PoolMetrics
+
+
+def _engine(tmp_path: Path):
+    return create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+
+async def test_pool_metrics_report_saturation_and_checkout_timeouts(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    metrics = PoolMetrics("test", max_overflow=0)
+    metrics.attach(engine)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = metrics.stats()
+            assert (stats.size, stats.max_overflow, stats.checked_out, stats.idle) == (1, 0, 1, 0)
+
+            # pool이 가득 차 있으면 pool_timeout 뒤에 실패하고, 대기 시간이 남는다.
+            with pytest.raises(sa_exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = metrics.stats()
+        assert (stats.checked_out, stats.idle) == (0, 1)
+        assert stats.checkout_timeouts == 1
+        assert stats.checkout_wait.count == 2
+        assert stats.checkout_wait.max_seconds >= 0.05
+        assert stats.checkout_wait.buckets[-1][1] <= stats.checkout_wait.count
+    finally:
+        await engine.dispose()
+
+
+async def test_pool_metrics_count_pre_ping_failures_across_dispose(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    metrics = PoolMetrics("test")
+    metrics.attach(engine)
+    try:
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            dbapi_connection = raw.driver_connection
+        # pool에 돌려준 connection이 밖에서 끊긴 상황
+        await dbapi_connection.close()
+
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+
+        stats = metrics.stats()
+        assert stats.pre_ping_failures == 1
+        assert stats.invalidated == 1
+
+        # dispose로 pool이 새로 만들어져도 같은 metrics에 쌓인다.
+        await engine.dispose()
+        async with engine.connect():
+            pass
+        assert metrics.stats().checkout_wait.count == 3
+    finally:
+        await engine.dispose()
@@ -0,0 +1,135 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import uuid4
+
+import fakeredis
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.infra.db.read_routing import (
+    ReadPinningSession,
+    ReadSessions,
+    WriteTrackingSession,
+    pin_committed_writes,
+    pin_on_commit,
+    pin_user_after_commit,
+)
+from app.infra.redis.read_pins import ReadPins
+from app.models.auth import User
+from app.models.base import Base
+from app.models.case_snapshot import CaseSnapshotHistory
+from app.realtime_.streams.reads import SessionPerCallCaseHistory
+
+
+@pytest_asyncio.fixture
+async def replica_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    # 아직 primary의 쓰기를 받지 못한 replica 역할. (스키마만 같은 빈 DB)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def _read_sessions(
+    async_engine: AsyncEngine, replica_engine: AsyncEngine, pins: ReadPins | None = None
+) -> ReadSessions:
+    return ReadSessions(
+        async_sessionmaker(bind=async_engine, expire_on_commit=False),
+        async_sessionmaker(bind=replica_engine, expire_on_commit=False),
+        pins=pins,
+    )
+
+
+async def test_user_reads_move_to_primary_only_after_a_committed_write(
+    async_engine: AsyncEngine, replica_engine: AsyncEngine
+) -> None:
+    pins = ReadPins(fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()), ttl_seconds=5)
+    read_sessions = _read_sessions(async_engine, replica_engine, pins)
+    request_sessions = async_sessionmaker(
+        bind=async_engine, expire_on_commit=False, sync_session_class=WriteTrackingSession
+    )
+    user_id = uuid4()
+
+    # 읽기만 한 요청은 pin하지 않는다.
+    async with request_sessions() as db:
+        pin_user_after_commit(db, user_id)
+        await db.execute(select(User))
+        await db.commit()
+        await pin_committed_writes(db, pins)
+    async with read_sessions.session(user_id=user_id) as session:
+        assert session.bind is replica_engine
+
+    async with request_sessions() as db:
+        pin_user_after_commit(db, user_id)
+        db.add(User(id=user_id, username="writer"))
+        await db.commit()
+        await pin_committed_writes(db, pins)
+
+    async with read_sessions.session(user_id=user_id) as session:
+        assert session.bind is async_engine
+        assert await session.get(User, user_id) is not None
+    async with read_sessions.session(user_id=uuid4()) as session:
+        assert session.bind is replica_engine
+
+    room_id = uuid4()
+    await pins.pin(room_ids=[room_id])
+    async with read_sessions.session(room_id=room_id) as session:
+        assert session.bind is async_engine
+
+
+async def test_commit_pins_before_returning(
+    async_engine: AsyncEngine, replica_engine: AsyncEngine
+) -> None:
+    # get_db의 teardown은 응답을 보낸 뒤에 돌므로, pin은 서비스의 commit() 안에서 끝나야 한다.
+    pins = ReadPins(fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()), ttl_seconds=5)
+    read_sessions = _read_sessions(async_engine, replica_engine, pins)
+    request_sessions = async_sessionmaker(
+        bind=async_engine,
+        class_=ReadPinningSession,
+        expire_on_commit=False,
+        sync_session_class=WriteTrackingSession,
+    )
+    user_id = uuid4()
+
+    async with request_sessions() as db:
+        pin_on_commit(db, pins)
+        pin_user_after_commit(db, user_id)
+        db.add(User(id=user_id, username="committer"))
+        await db.commit()
+
+        async with read_sessions.session(user_id=user_id) as session:
+            assert session.bind is async_engine
+
+
+async def test_case_history_rereads_primary_when_replica_is_behind(
+    async_engine: AsyncEngine, replica_engine: AsyncEngine
+) -> None:
+    history = SessionPerCallCaseHistory(_read_sessions(async_engine, replica_engine))
+    case_id = uuid4()
+    async with AsyncSession(async_engine) as db:
+        for snapshot_no in (1, 2):
+            db.add(
+                CaseSnapshotHistory(
+                    case_id=case_id, snapshot_no=snapshot_no, schema_version=1, snapshot_json={}
+                )
+            )
+        await db.commit()
+
+    # 기대 번호가 없으면 replica 결과를 그대로 쓴다.
+    assert await history.get_after_snapshot_no(case_id=case_id, last_seen_no=0) == []
+    assert await history.get_latest_snapshot_no(case_id=case_id) is None
+
+    rows = await history.get_after_snapshot_no(case_id=case_id, last_seen_no=0, until_no=2)
+    assert [row.snapshot_no for row in rows] == [1, 2]
+    rows = await history.get_between_snapshot_no(case_id=case_id, first_no=1, last_no=2)
+    assert [row.snapshot_no for row in rows] == [1, 2]
+    assert await history.get_latest_snapshot_no(case_id=case_id, at_least=2) == 2
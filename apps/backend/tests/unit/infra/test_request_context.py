@@ -0,0 +1,70 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+
+from app.domain.types import AuthUser
+from app.infra.redis.request_context import RequestContext, RequestContextCache
+
+
+def _redis() -> fakeredis.FakeAsyncRedis:
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+async def test_context_is_served_from_cache_until_invalidated() -> None:
+    redis = _redis()
+    user_id, room_id = uuid4(), uuid4()
+    contexts = [
+        RequestContext(user=AuthUser(id=user_id, username="ctx"), room_id=None, case_id=None),
+        RequestContext(user=AuthUser(id=user_id, username="ctx"), room_id=room_id, case_id=None),
+    ]
+    loads = 0
+
+    async def load() -> RequestContext:
+        nonlocal loads
+        loads += 1
+        return contexts[loads - 1]
+
+    cache = RequestContextCache(redis, ttl_seconds=60)
+    # 1차 캐시가 없는 다른 worker 역할
+    other_worker = RequestContextCache(redis, ttl_seconds=60, local_ttl_seconds=0)
+
+    assert await cache.get_or_load(user_id, load) == contexts[0]
+    assert await cache.get_or_load(user_id, load) == contexts[0]
+    assert await other_worker.get_or_load(user_id, load) == contexts[0]
+    assert loads == 1
+    assert (cache.stats.hits, cache.stats.misses, other_worker.stats.redis_hits) == (1, 1, 1)
+
+    await cache.invalidate([user_id])
+
+    assert await other_worker.get_or_load(user_id, load) == contexts[1]
+    assert await cache.get_or_load(user_id, load) == contexts[1]
+    assert loads == 2
+
+
+async def test_load_started_before_invalidation_is_not_served_afterwards() -> None:
+    redis = _redis()
+    user_id = uuid4()
+    stale = RequestContext(user=AuthUser(id=user_id, username="ctx"), room_id=uuid4(), case_id=None)
+    fresh = RequestContext(user=AuthUser(id=user_id, username="ctx"), room_id=None, case_id=None)
+    cache = RequestContextCache(redis, ttl_seconds=60)
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_load() -> RequestContext:
+        loading.set()
+        await release.wait()
+        return stale
+
+    async def load() -> RequestContext:
+        return fresh
+
+    # 무효화 전에 DB를 읽은 요청이 무효화 뒤에 캐시를 채운다.
+    pending = asyncio.create_task(cache.get_or_load(user_id, slow_load))
+    await loading.wait()
+    await cache.invalidate([user_id])
+    release.set()
+    assert await pending == stale
+
+    assert await cache.get_or_load(user_id, load) == fresh
+    assert await RequestContextCache(redis, local_ttl_seconds=0).get_or_load(user_id, load) == fresh
@@ -0,0 +1,51 @@
+import time
+from uuid import uuid4
+
+import fakeredis
+
+from app.infra.redis.presence import RoomPresence
+
+
+def _presence(ttl_seconds: int = 30) -> tuple[RoomPresence, fakeredis.FakeAsyncRedis]:
+    redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    return RoomPresence(redis, ttl_seconds=ttl_seconds), redis
+
+
+async def test_online_reads_all_members_in_one_mget() -> None:
+    presence, _ = _presence()
+    room_id, online_user, offline_user = uuid4(), uuid4(), uuid4()
+
+    await presence.heartbeat(room_id, online_user)
+
+    assert await presence.online(room_id, [online_user, offline_user]) == {online_user}
+    assert await presence.online(room_id, []) == set()
+    assert await presence.rooms() == [room_id]
+
+
+async def test_claim_expired_skips_live_users_and_claims_once() -> None:
+    presence, redis = _presence()
+    room_id, crashed, alive = uuid4(), uuid4(), uuid4()
+    await presence.heartbeat(room_id, crashed)
+    await presence.heartbeat(room_id, alive)
+    # crashed의 key만 TTL이 지난 상황
+    await redis.delete(f"presence:{room_id}:{crashed}")
+
+    later = time.time() + 60
+    assert await presence.claim_expired(room_id, now=later) == [crashed]
+    # 다른 sweeper가 다시 가져가지 않는다.
+    assert await presence.claim_expired(room_id, now=later) == []
+    assert await presence.online(room_id, [alive, crashed]) == {alive}
+
+
+async def test_claim_expired_drops_room_once_index_is_empty() -> None:
+    presence, redis = _presence()
+    room_id, crashed = uuid4(), uuid4()
+    await presence.heartbeat(room_id, crashed)
+    await redis.delete(f"presence:{room_id}:{crashed}")
+
+    assert await presence.claim_expired(room_id, now=time.time() + 60) == [crashed]
+    assert await presence.rooms() == []
+
+    # 다시 heartbeat가 오면 sweep 대상으로 돌아온다.
+    await presence.heartbeat(room_id, crashed)
+    assert await presence.rooms() == [room_id]
@@ -0,0 +1,20 @@
+import time
+
+import fakeredis
+
+from app.infra.redis.token_deny_list import TokenDenyList
+
+
+async def test_denied_jti_expires_with_token() -> None:
+    redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    deny_list = TokenDenyList(redis)
+    exp = int(time.time()) + 60
+
+    await deny_list.deny("live", expires_at=exp)
+    # 이미 만료된 token은 넣을 필요가 없다.
+    await deny_list.deny("expired", expires_at=int(time.time()) - 1)
+
+    assert await deny_list.is_denied("live")
+    assert not await deny_list.is_denied("expired")
+    assert not await deny_list.is_denied("other")
+    assert await redis.expiretime("auth_deny:live") == exp
@@ -0,0 +1,165 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+
+from app.domain.events.case import CaseEventDelta, CaseSnapshotType
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.topics import CaseTopic
+from app.realtime_.sse.case_frame_cache import CaseFrameCache, build_case_frame
+from app.realtime_.streams.case_state import CaseStateStream
+from app.schemas.case.state import (
+    CaseSnapshot,
+    CaseState,
+    NightPhaseInfo,
+    PhaseState,
+    PhaseType,
+    Player,
+)
+from tests._helpers.pubsub import LivePubSub, wait_until
+
+
+async def test_get_range_hits_only_when_every_frame_is_cached() -> None:
+    cache = CaseFrameCache(max_entries=8)
+    case_id = uuid4()
+
+    await cache.put(case_id, 1, b"f1")
+    await cache.put(case_id, 2, b"f2")
+
+    assert await cache.get_range(case_id, 1, 2) == [b"f1", b"f2"]
+    assert await cache.get_range(case_id, 1, 3) is None
+    assert await cache.get_range(case_id, 3, 2) == []
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 1, 0, 2)
+
+
+async def test_lru_evicts_least_recently_used() -> None:
+    cache = CaseFrameCache(max_entries=2)
+    case_id = uuid4()
+
+    await cache.put(case_id, 1, b"f1")
+    await cache.put(case_id, 2, b"f2")
+    assert await cache.get_range(case_id, 1, 1) == [b"f1"]  # 1을 최근 사용으로
+    await cache.put(case_id, 3, b"f3")
+
+    assert await cache.get_range(case_id, 2, 2) is None
+    assert await cache.get_range(case_id, 1, 1) == [b"f1"]
+    assert cache.stats.evictions == 1
+
+
+async def test_redis_tier_refills_local_cache() -> None:
+    redis = fakeredis.FakeAsyncRedis()  # frame은 bytes라서 decode하지 않는 client를 쓴다.
+    case_id = uuid4()
+
+    writer = CaseFrameCache(max_entries=8, redis=redis)
+    await writer.put(case_id, 1, b"f1")
+
+    # 다른 프로세스(빈 로컬 캐시)에서 읽는 상황
+    reader = CaseFrameCache(max_entries=8, redis=redis)
+    assert await reader.get_range(case_id, 1, 1) == [b"f1"]
+    assert reader.stats.redis_hits == 1
+    assert reader.stats.size == 1
+
+
+class CountingHistoryRepo:
+    """case_history repo 대역. DB 조회 횟수만 센다."""
+
+    def __init__(self) -> None:
+        self.rows: list = []
+        self.after_calls = 0
+        self.between_calls = 0
+
+    async def get_latest_snapshot_no(self, *, case_id):
+        return self.rows[-1].snapshot_no if self.rows else None
+
+    async def get_after_snapshot_no(self, *, case_id, last_seen_no, until_no=None):
+        self.after_calls += 1
+        return [
+            r
+            for r in self.rows
+            if r.snapshot_no > last_seen_no and (until_no is None or r.snapshot_no <= until_no)
+        ]
+
+    async def get_between_snapshot_no(self, *, case_id, first_no, last_no):
+        self.between_calls += 1
+        return [r for r in self.rows if first_no <= r.snapshot_no <= last_no]
+
+
+async def test_live_delta_is_served_from_cache_without_db_read() -> None:
+    pubsub = LivePubSub()
+    cache = CaseFrameCache(max_entries=8)
+    repo = CountingHistoryRepo()
+    case_id = uuid4()
+    topic = CaseTopic(case_id)
+
+    await cache.put(case_id, 1, b"frame-1")
+    await cache.put(case_id, 2, b"frame-2")
+
+    stream = CaseStateStream(
+        case_event_bus=CaseEventBus(pubsub),  # type: ignore[arg-type]
+        case_history_repo=repo,  # type: ignore[arg-type]
+        case_frame_cache=cache,
+    ).stream(case_id=case_id, after_snapshot_no=0)
+
+    read = asyncio.create_task(anext(stream))
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    delta = CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=2)  # type: ignore[call-arg]
+    await CaseEventBus(pubsub).publish(topic, delta)  # type: ignore[arg-type]
+
+    assert await read == b"frame-1"
+    assert await anext(stream) == b"frame-2"
+    assert repo.after_calls == 0
+
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+def _case_snapshot(case_id) -> CaseSnapshot:
+    return CaseSnapshot(
+        schema_version=1,
+        case_state=CaseState(case_id=case_id, round_no=1),
+        phase_state=PhaseState(
+            phase_id=uuid4(),
+            phase_type=PhaseType.NIGHT,
+            seq_in_round=1,
+            phase_no_in_round=1,
+            opened_at="2026-03-05T00:00:00.000Z",
+        ),
+        players=[
+            Player(user_id=uuid4(), username=f"user{i}", seat_no=i, life_left=2, vote_tokens=0)
+            for i in range(4)
+        ],
+        night_phase_info=NightPhaseInfo(),
+        vote_phase_info=None,
+        discuss_phase_info=None,
+        logs=[],
+    )
+
+
+async def test_fat_delta_is_emitted_without_db_read_and_cached() -> None:
+    pubsub = LivePubSub()
+    cache = CaseFrameCache(max_entries=8)
+    repo = CountingHistoryRepo()
+    case_id = uuid4()
+    topic = CaseTopic(case_id)
+    snapshot = _case_snapshot(case_id)
+
+    stream = CaseStateStream(
+        case_event_bus=CaseEventBus(pubsub),  # type: ignore[arg-type]
+        case_history_repo=repo,  # type: ignore[arg-type]
+        case_frame_cache=cache,
+    ).stream(case_id=case_id, after_snapshot_no=0)
+
+    read = asyncio.create_task(anext(stream))
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    publisher = CaseEventBus(pubsub, inline_snapshot_max_bytes=64 * 1024)  # type: ignore[arg-type]
+    delta = CaseEventDelta(type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=1)  # type: ignore[call-arg]
+    await publisher.publish(topic, delta, snapshot=snapshot)
+
+    assert await read == build_case_frame(snapshot, 1)
+    assert repo.after_calls == 0
+    assert await cache.get_range(case_id, 1, 1) == [build_case_frame(snapshot, 1)]
+
+    await stream.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,138 @@
+import asyncio
+import copy
+import json
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.realtime_.sse.case_frame_cache import CaseFrameCache, build_case_frame
+from app.realtime_.sse.case_patch import CasePatchFrames, json_diff
+from app.realtime_.streams.case_state import CaseStateStream
+from app.schemas.case.sse_response import CaseFrameEncoding
+from app.schemas.case.state import CaseSnapshot
+from app.schemas.sse.response import SSEEventType
+from tests._helpers.pubsub import LivePubSub
+from tests.unit.realtime.test_case_frame_cache import CountingHistoryRepo, _case_snapshot
+
+
+def _apply(doc: Any, ops: list[dict[str, Any]]) -> Any:
+    """테스트용 최소 RFC 6902 적용기 (add/remove/replace)."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        *parents, last = [
+            p.replace("~1", "/").replace("~0", "~") for p in op["path"].split("/")[1:]
+        ]
+        if not op["path"]:
+            doc = op["value"]
+            continue
+        target = doc
+        for p in parents:
+            target = target[int(p)] if isinstance(target, list) else target[p]
+        if op["op"] == "remove":
+            del target[int(last) if isinstance(target, list) else last]
+        elif isinstance(target, list) and last == "-":
+            target.append(op["value"])
+        elif isinstance(target, list):
+            target[int(last)] = op["value"]
+        else:
+            target[last] = op["value"]
+    return doc
+
+
+def _next(snapshot: CaseSnapshot, no: int) -> CaseSnapshot:
+    players = [p.model_copy() for p in snapshot.players]
+    players[no % len(players)] = players[no % len(players)].model_copy(update={"life_left": 1})
+    return snapshot.model_copy(
+        update={"snapshot_no": no, "players": players, "logs": [*snapshot.logs, f"log {no}"]}
+    )
+
+
+def _snapshots(count: int) -> list[CaseSnapshot]:
+    snapshots = [_case_snapshot(uuid4())]
+    for no in range(2, count + 1):
+        snapshots.append(_next(snapshots[-1], no))
+    return snapshots
+
+
+def _payload(frame: bytes) -> tuple[str, dict[str, Any]]:
+    event = frame.split(b"\n", 1)[0].removeprefix(b"event: ").decode()
+    return event, json.loads(frame.split(b"data: ", 1)[1])
+
+
+def test_json_diff_round_trips_and_appends_logs() -> None:
+    old, new = (s.model_dump(mode="json") for s in _snapshots(2))
+
+    ops = json_diff(old, new)
+
+    assert _apply(old, ops) == new
+    assert {"op": "add", "path": "/logs/-", "value": "log 2"} in ops
+    # 바뀐 필드만 담는다.
+    assert all(not op["path"].startswith("/case_state") for op in ops)
+
+
+def _stream(snapshots: list[CaseSnapshot], *, keyframe_interval: int = 0):
+    case_id = snapshots[0].case_state.case_id
+    repo = CountingHistoryRepo()
+    repo.rows = [
+        SimpleNamespace(snapshot_no=i, snapshot_json=s.model_dump(mode="json"))
+        for i, s in enumerate(snapshots, start=1)
+    ]
+    frames = CasePatchFrames(
+        cache=CaseFrameCache(max_entries=16, key_prefix="case_patch_frame"),
+        keyframe_interval=keyframe_interval,
+    )
+    stream = CaseStateStream(
+        case_event_bus=CaseEventBus(LivePubSub()),  # type: ignore[arg-type]
+        case_history_repo=repo,  # type: ignore[arg-type]
+        case_frame_cache=CaseFrameCache(max_entries=16),
+        case_patch_frames=frames,
+    )
+    return case_id, repo, stream
+
+
+async def _take(stream: CaseStateStream, case_id, after: int | None, n: int) -> list[bytes]:
+    it = stream.stream(case_id=case_id, after_snapshot_no=after, encoding=CaseFrameEncoding.PATCH)
+    out = [await anext(it) for _ in range(n)]
+    await it.aclose()  # type: ignore[attr-defined]
+    return out
+
+
+async def test_patch_stream_sends_keyframe_first_then_patches() -> None:
+    snapshots = _snapshots(3)
+    case_id, _repo, stream = _stream(snapshots)
+
+    frames = await _take(stream, case_id, None, 3)
+
+    assert frames[0] == build_case_frame(snapshots[0], 1)
+    doc = snapshots[0].model_dump(mode="json")
+    for no, frame in enumerate(frames[1:], start=2):
+        event, body = _payload(frame)
+        assert event == SSEEventType.CASE_PATCH
+        assert (body["data"]["base_snapshot_no"], body["data"]["snapshot_no"]) == (no - 1, no)
+        doc = _apply(doc, body["data"]["ops"])
+    assert doc == snapshots[2].model_dump(mode="json")
+
+
+async def test_patch_stream_resumes_from_client_snapshot_and_honors_keyframes() -> None:
+    snapshots = _snapshots(4)
+    case_id, _repo, stream = _stream(snapshots, keyframe_interval=3)
+
+    frames = await _take(stream, case_id, 1, 3)
+
+    assert [_payload(f)[0] for f in frames] == [
+        SSEEventType.CASE_PATCH,
+        SSEEventType.CASE_EVENT,  # 3은 keyframe
+        SSEEventType.CASE_PATCH,
+    ]
+
+
+async def test_patch_is_computed_once_per_transition() -> None:
+    snapshots = _snapshots(2)
+    case_id, repo, stream = _stream(snapshots)
+
+    first, second = await asyncio.gather(_take(stream, case_id, 1, 1), _take(stream, case_id, 1, 1))
+    again = await _take(stream, case_id, 1, 1)
+
+    assert first == second == again
+    assert repo.between_calls == 1
@@ -0,0 +1,150 @@
+import asyncio
+from collections.abc import Awaitable
+from uuid import uuid4
+
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.topics import RoomTopic
+from app.mvp import MVP_ROOM_ID
+from app.realtime_.streams import room_broadcast
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster
+from app.realtime_.streams.room_state import RoomStateStream
+from app.schemas.common.ids import UserId
+from app.schemas.room.state import RoomInfo, RoomMember, RoomSnapshot
+from tests._helpers.pubsub import LivePubSub, wait_until
+
+
+class CountingSnapshotQuery:
+    def __init__(self, member_ids: list[UserId]) -> None:
+        self.member_ids = member_ids
+        self.calls: list[RoomSnapshotType] = []
+
+    async def build_snapshot(self, *, room_id, last_event, logs) -> RoomSnapshot:
+        self.calls.append(last_event)
+        await asyncio.sleep(0)
+        return RoomSnapshot(
+            room=RoomInfo(id=room_id, room_name="test_room", created_at="2026-01-01T00:00:00Z"),
+            members=[
+                RoomMember(user_id=uid, username=f"user{i:04d}", joined_at="2026-01-01T00:00:00Z")
+                for i, uid in enumerate(self.member_ids)
+            ],
+            last_event=last_event,
+            logs=logs,
+        )
+
+
+async def test_room_snapshot_is_built_once_per_event_for_all_subscribers() -> None:
+    pubsub = LivePubSub()
+    topic = RoomTopic(MVP_ROOM_ID)
+    users = [uuid4() for _ in range(3)]
+    query = CountingSnapshotQuery(users)
+    broadcaster = RoomStateBroadcaster()
+
+    streams = [
+        RoomStateStream(RoomEventBus(pubsub), query, broadcaster).stream(u, MVP_ROOM_ID)  # type: ignore[arg-type]
+        for u in users
+    ]
+    # ON_CONNECT는 연결마다 만든다.
+    for s in streams:
+        await anext(s)
+    assert query.calls == [RoomSnapshotType.ON_CONNECT] * 3
+
+    reads = [asyncio.create_task(anext(s)) for s in streams]
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_JOINED, user_id=users[0])  # pyright: ignore[reportCallIssue]
+    await RoomEventBus(pubsub).publish(topic, ev)  # type: ignore[arg-type]
+    frames = await asyncio.gather(*reads)
+
+    assert query.calls.count(RoomSnapshotType.MEMBER_JOINED) == 1
+    assert all(f is frames[0] for f in frames)
+    assert b"ROOM_STATE" in frames[0]
+
+    for s in streams:
+        await s.aclose()  # type: ignore[attr-defined]
+    assert pubsub.active[topic] == 0
+
+
+async def test_non_member_gets_close_frame_from_shared_snapshot() -> None:
+    pubsub = LivePubSub()
+    topic = RoomTopic(MVP_ROOM_ID)
+    member, kicked = uuid4(), uuid4()
+    query = CountingSnapshotQuery([member, kicked])
+    broadcaster = RoomStateBroadcaster()
+
+    member_stream = RoomStateStream(
+        RoomEventBus(pubsub),
+        query,  # type: ignore[arg-type]
+        broadcaster,
+    ).stream(member, MVP_ROOM_ID)
+    kicked_stream = RoomStateStream(
+        RoomEventBus(pubsub),
+        query,  # type: ignore[arg-type]
+        broadcaster,
+    ).stream(kicked, MVP_ROOM_ID)
+    await anext(member_stream)
+    await anext(kicked_stream)
+
+    reads = [asyncio.create_task(anext(s)) for s in (member_stream, kicked_stream)]
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    query.member_ids = [member]
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_KICKED, user_id=kicked)  # pyright: ignore[reportCallIssue]
+    await RoomEventBus(pubsub).publish(topic, ev)  # type: ignore[arg-type]
+    member_frame, kicked_frame = await asyncio.gather(*reads)
+
+    assert query.calls.count(RoomSnapshotType.MEMBER_KICKED) == 1
+    assert b"ROOM_STATE" in member_frame
+    assert b"ROOM_KICKED" in kicked_frame
+
+    await member_stream.aclose()  # type: ignore[attr-defined]
+    await kicked_stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_fat_room_delta_skips_snapshot_query() -> None:
+    pubsub = LivePubSub()
+    topic = RoomTopic(MVP_ROOM_ID)
+    user = uuid4()
+    query = CountingSnapshotQuery([user])
+    stream = RoomStateStream(
+        RoomEventBus(pubsub),
+        query,  # type: ignore[arg-type]
+        RoomStateBroadcaster(),
+    ).stream(user, MVP_ROOM_ID)
+    await anext(stream)
+
+    read = asyncio.create_task(anext(stream))
+    await wait_until(lambda: pubsub.active[topic] == 1)
+
+    inline = await CountingSnapshotQuery([user]).build_snapshot(
+        room_id=MVP_ROOM_ID, last_event=RoomSnapshotType.MEMBER_READY, logs=[]
+    )
+
+    async def loader() -> RoomSnapshot:
+        return inline
+
+    publisher = RoomEventBus(pubsub, inline_snapshot_max_bytes=64 * 1024)  # type: ignore[arg-type]
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_READY, user_id=user)  # pyright: ignore[reportCallIssue]
+    await publisher.publish(topic, ev, snapshot_loader=loader)
+
+    assert b"room.member.readied" in await read
+    assert query.calls == [RoomSnapshotType.ON_CONNECT]
+
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_finished_broadcasts_are_forgotten(monkeypatch) -> None:
+    monkeypatch.setattr(room_broadcast, "_RECENT_BROADCAST_TTL_S", 0.0)
+    broadcaster = RoomStateBroadcaster()
+    query = CountingSnapshotQuery([uuid4()])
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_READY)  # pyright: ignore[reportCallIssue]
+
+    def build() -> Awaitable[RoomSnapshot]:
+        return query.build_snapshot(room_id=MVP_ROOM_ID, last_event=ev.type, logs=[])
+
+    await broadcaster.get_frame(MVP_ROOM_ID, ev, build)
+    await wait_until(lambda: not broadcaster._recent)
+
+    # 버린 뒤에 같은 delta가 오면 다시 만든다.
+    await broadcaster.get_frame(MVP_ROOM_ID, ev, build)
+    assert query.calls == [RoomSnapshotType.MEMBER_READY] * 2
@@ -0,0 +1,125 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.topics import RoomTopic
+from app.infra.redis.event_version import RoomEventVersions
+from app.infra.redis.stream_pubsub import RedisStreamPubSub
+from app.mvp import MVP_ROOM_ID
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster
+from app.realtime_.streams.room_state import RoomStateStream
+from app.schemas.room.state import RoomSnapshot
+from tests._helpers.pubsub import LivePubSub, wait_until
+from tests.unit.realtime.test_room_state_broadcast import CountingSnapshotQuery
+
+
+def _frame_id(frame: bytes) -> str:
+    lines = frame.decode().splitlines()
+    return next(line[len("id: ") :] for line in lines if line.startswith("id: "))
+
+
+class _Room:
+    def __init__(self) -> None:
+        self.pubsub = LivePubSub()
+        self.versions = RoomEventVersions(fakeredis.FakeAsyncRedis(decode_responses=True))
+        self.topic = RoomTopic(MVP_ROOM_ID)
+        self.user = uuid4()
+        self.query = CountingSnapshotQuery([self.user])
+
+    def bus(self) -> RoomEventBus:
+        return RoomEventBus(self.pubsub, versions=self.versions)  # type: ignore[arg-type]
+
+    def stream(self, last_event_id: str | None = None):
+        stream = RoomStateStream(self.bus(), self.query, RoomStateBroadcaster())  # type: ignore[arg-type]
+        return stream.stream(self.user, MVP_ROOM_ID, last_event_id=last_event_id)
+
+    async def publish(self, event_type: RoomSnapshotType) -> None:
+        await self.bus().publish(self.topic, RoomEventDelta(type=event_type))  # pyright: ignore[reportCallIssue]
+
+
+async def test_room_frames_carry_monotonic_versions() -> None:
+    room = _Room()
+    await room.publish(RoomSnapshotType.MEMBER_JOINED)
+
+    stream = room.stream()
+    assert _frame_id(await anext(stream)) == "1"
+
+    read = asyncio.create_task(anext(stream))
+    await wait_until(lambda: room.pubsub.active[room.topic] == 1)
+    await room.publish(RoomSnapshotType.MEMBER_READY)
+
+    assert _frame_id(await read) == "2"
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_reconnect_when_up_to_date_skips_on_connect_snapshot() -> None:
+    room = _Room()
+    await room.publish(RoomSnapshotType.MEMBER_JOINED)
+
+    stream = room.stream(last_event_id="1")
+    read = asyncio.create_task(anext(stream))
+    await wait_until(lambda: room.pubsub.active[room.topic] == 1)
+    await room.publish(RoomSnapshotType.MEMBER_READY)
+
+    frame = await read
+    assert b"ON_CONNECT" not in frame
+    assert _frame_id(frame) == "2"
+    assert room.query.calls == [RoomSnapshotType.MEMBER_READY]
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_reconnect_when_behind_sends_one_current_snapshot() -> None:
+    room = _Room()
+    for t in (
+        RoomSnapshotType.MEMBER_JOINED,
+        RoomSnapshotType.MEMBER_READY,
+        RoomSnapshotType.MEMBER_UNREADY,
+    ):
+        await room.publish(t)
+
+    stream = room.stream(last_event_id="1")
+    frame = await anext(stream)
+
+    # 놓친 2개 event를 하나씩 보내지 않고 현재 snapshot 한 번으로 따라잡는다.
+    assert b"ON_CONNECT" in frame
+    assert _frame_id(frame) == "3"
+    assert room.query.calls == [RoomSnapshotType.ON_CONNECT]
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_reconnect_on_stream_log_replays_last_missed_delta() -> None:
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    bus = RoomEventBus(
+        RedisStreamPubSub(redis, block_ms=20),
+        versions=RoomEventVersions(redis),
+        inline_snapshot_max_bytes=64 * 1024,
+    )
+    topic = RoomTopic(MVP_ROOM_ID)
+    user = uuid4()
+    query = CountingSnapshotQuery([user])
+
+    async def loader() -> RoomSnapshot:
+        return await CountingSnapshotQuery([user]).build_snapshot(
+            room_id=MVP_ROOM_ID, last_event=RoomSnapshotType.MEMBER_READY, logs=[]
+        )
+
+    for t in (RoomSnapshotType.MEMBER_JOINED, RoomSnapshotType.MEMBER_READY):
+        await bus.publish(topic, RoomEventDelta(type=t), snapshot_loader=loader)  # pyright: ignore[reportCallIssue]
+
+    room_stream = RoomStateStream(
+        bus,
+        query,  # type: ignore[arg-type]
+        RoomStateBroadcaster(),
+    )
+    stream = room_stream.stream(user, MVP_ROOM_ID, last_event_id="1")
+    frame = await anext(stream)
+
+    # 현재 snapshot을 새로 만들지 않고, log에 남은 마지막 delta(fat event)로 따라잡는다.
+    assert b"ON_CONNECT" not in frame
+    assert b"room.member.readied" in frame
+    assert _frame_id(frame) == "2"
+    assert query.calls == []
+    await stream.aclose()  # type: ignore[attr-defined]
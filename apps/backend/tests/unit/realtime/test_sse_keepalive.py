@@ -0,0 +1,70 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from app.realtime_.sse.stream import SSEKeepAliveOptions, keepalive_stream
+
+_OPTIONS = SSEKeepAliveOptions(
+    heartbeat_seconds=0.05,
+    retry_ms=1_000,
+    retry_jitter_ms=500,
+    disconnect_poll_seconds=0.01,
+)
+
+
+class _Source:
+    """frame을 직접 밀어 넣는 stream 대역. 닫혔는지 기록한다."""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self.closed = False
+
+    async def frames(self) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                yield await self.queue.get()
+        finally:
+            self.closed = True
+
+
+async def test_starts_with_jittered_retry_hint() -> None:
+    source = _Source()
+    stream = keepalive_stream(source.frames(), options=_OPTIONS)
+
+    first = await anext(stream)
+    assert first.startswith(b"retry: ")
+    assert 1_000 <= int(first.removeprefix(b"retry: ").strip()) <= 1_500
+
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+async def test_sends_heartbeat_comment_only_while_idle() -> None:
+    source = _Source()
+    stream = keepalive_stream(source.frames(), options=_OPTIONS)
+    await anext(stream)  # retry
+
+    assert await anext(stream) == b": ping\n\n"
+
+    source.queue.put_nowait(b"event: X\ndata: {}\n\n")
+    assert await anext(stream) == b"event: X\ndata: {}\n\n"
+
+    await stream.aclose()  # type: ignore[attr-defined]
+    assert source.closed
+
+
+async def test_tears_down_source_when_client_disconnects_while_idle() -> None:
+    source = _Source()
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        return disconnected
+
+    stream = keepalive_stream(source.frames(), options=_OPTIONS, is_disconnected=is_disconnected)
+    await anext(stream)  # retry
+
+    # event가 없는 상태에서 client가 끊기면, 다음 event를 기다리지 않고 정리한다.
+    disconnected = True
+    async with asyncio.timeout(1.0):
+        rest = [frame async for frame in stream]
+
+    assert all(frame == b": ping\n\n" for frame in rest)
+    assert source.closed
@@ -0,0 +1,79 @@
+import asyncio
+import json
+from uuid import uuid4
+
+from app.domain.events.case import CaseEventDelta, CaseSnapshotType
+from app.infra.pubsub.buffer import OverflowPolicy
+from app.infra.pubsub.bus.case_event_bus import CaseEventBus
+from app.infra.pubsub.topics import CaseTopic
+from app.realtime_.sse.case_frame_cache import CaseFrameCache
+from app.realtime_.streams.buffer import StreamBufferConfig
+from app.realtime_.streams.case_state import CaseStateStream
+from app.schemas.sse.response import SSEEnvelopeCode, SSEEventType
+from tests._helpers.pubsub import LivePubSub, wait_until
+from tests.unit.realtime.test_case_frame_cache import CountingHistoryRepo
+
+
+class _Case:
+    def __init__(self, policy: OverflowPolicy) -> None:
+        self.pubsub = LivePubSub()
+        self.cache = CaseFrameCache(max_entries=16)
+        self.case_id = uuid4()
+        self.topic = CaseTopic(self.case_id)
+        self.bus = CaseEventBus(self.pubsub)  # type: ignore[arg-type]
+        self.stream = CaseStateStream(
+            case_event_bus=self.bus,
+            case_history_repo=CountingHistoryRepo(),  # type: ignore[arg-type]
+            case_frame_cache=self.cache,
+            buffer_config=StreamBufferConfig(max_events=1, policy=policy),
+        )
+
+    async def publish(self, snapshot_no: int) -> None:
+        await self.cache.put(self.case_id, snapshot_no, f"frame-{snapshot_no}".encode())
+        delta = CaseEventDelta(  # type: ignore[call-arg]
+            type=CaseSnapshotType.STARTED, phase_id=uuid4(), snapshot_no=snapshot_no
+        )
+        await self.bus.publish(self.topic, delta)
+
+
+async def test_coalesce_skips_to_latest_snapshot_for_slow_consumer() -> None:
+    case = _Case(OverflowPolicy.COALESCE)
+    frames = case.stream.stream(case_id=case.case_id, after_snapshot_no=0)
+
+    read = asyncio.create_task(anext(frames))
+    await wait_until(lambda: case.pubsub.active[case.topic] == 1)
+    await case.publish(1)
+    assert await read == b"frame-1"
+
+    # consumer가 멈춰 있는 동안 2..5가 쌓인다.
+    for no in range(2, 6):
+        await case.publish(no)
+    await wait_until(lambda: case.stream.buffer_stats.evicted == 3)  # type: ignore[union-attr]
+
+    assert await anext(frames) == b"frame-5"
+    assert case.stream.buffer_stats.depth == 0  # type: ignore[union-attr]
+
+    await frames.aclose()  # type: ignore[attr-defined]
+
+
+async def test_disconnect_sends_stream_close_for_slow_consumer() -> None:
+    case = _Case(OverflowPolicy.DISCONNECT)
+    frames = case.stream.stream(case_id=case.case_id, after_snapshot_no=0)
+
+    read = asyncio.create_task(anext(frames))
+    await wait_until(lambda: case.pubsub.active[case.topic] == 1)
+    await case.publish(1)
+    assert await read == b"frame-1"
+
+    await case.publish(2)
+    await case.publish(3)
+    await wait_until(lambda: case.stream.buffer_stats.overflowed)  # type: ignore[union-attr]
+
+    close_frame = await anext(frames)
+    assert close_frame.startswith(f"event: {SSEEventType.STREAM_CLOSE.value}\n".encode())
+    payload = json.loads(close_frame.split(b"data: ", 1)[1])
+    assert payload["code"] == SSEEnvelopeCode.STREAM_CLOSE.value
+
+    # 종료 후에는 upstream 구독도 정리된다.
+    assert [f async for f in frames] == []
+    assert case.pubsub.active[case.topic] == 0
@@ -0,0 +1,61 @@
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.infra.db.read_routing import ReadSessions
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.topics import RoomTopic
+from app.realtime_.streams.reads import SessionPerCallRoomSnapshotQuery
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster
+from app.realtime_.streams.room_state import RoomStateStream
+from tests._helpers.entity import room_with_members
+from tests._helpers.pubsub import LivePubSub, wait_until
+
+
+class _CheckedOut:
+    """pool에서 빌려간 채 반납되지 않은 connection 수."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.count = 0
+        self.total = 0
+        event.listen(engine.sync_engine, "checkout", self._checkout)
+        event.listen(engine.sync_engine, "checkin", self._checkin)
+
+    def _checkout(self, *args) -> None:
+        self.count += 1
+        self.total += 1
+
+    def _checkin(self, *args) -> None:
+        self.count -= 1
+
+
+async def test_open_room_stream_holds_no_db_connection(
+    db_session: AsyncSession,
+    async_engine: AsyncEngine,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    room_id, (user_id, *_) = await room_with_members(db_session, ["pool_1", "pool_2"])
+    await db_session.close()
+    checked_out = _CheckedOut(async_engine)
+    pubsub = LivePubSub()
+    stream = RoomStateStream(
+        RoomEventBus(pubsub),  # type: ignore[arg-type]
+        SessionPerCallRoomSnapshotQuery(ReadSessions(session_factory)),
+        RoomStateBroadcaster(),
+    ).stream(user_id, room_id)
+
+    assert b"ON_CONNECT" in await anext(stream)
+    read = asyncio.create_task(anext(stream))
+    await wait_until(lambda: pubsub.active[RoomTopic(room_id)] == 1)
+    # 다음 event를 기다리는 동안에는 connection을 들고 있지 않다.
+    assert checked_out.count == 0
+
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_READY, user_id=user_id)  # pyright: ignore[reportCallIssue]
+    await RoomEventBus(pubsub).publish(RoomTopic(room_id), ev)  # type: ignore[arg-type]
+    assert b"ROOM_STATE" in await read
+    assert checked_out.count == 0
+    assert checked_out.total == 2  # ON_CONNECT, MEMBER_READY snapshot 조회마다 한 번씩
+
+    await stream.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,88 @@
+import asyncio
+from uuid import uuid4
+
+from app.domain.events.room import RoomEventDelta, RoomSnapshotType
+from app.domain.events.user import UserEvent, UserEventType
+from app.infra.pubsub.bus.room_event_bus import RoomEventBus
+from app.infra.pubsub.bus.user_event_bus import UserEventBus
+from app.infra.pubsub.topics import ConnTopic, RoomTopic, UserTopic
+from app.mvp import MVP_ROOM_ID
+from app.realtime_.connections import ConnectionRegistry
+from app.realtime_.streams.room_broadcast import RoomStateBroadcaster
+from app.realtime_.streams.room_state import RoomStateStream
+from tests._helpers.pubsub import LivePubSub, wait_until
+from tests.unit.realtime.test_room_state_broadcast import CountingSnapshotQuery
+
+
+def _stream(pubsub, query, connections: ConnectionRegistry) -> RoomStateStream:
+    return RoomStateStream(
+        RoomEventBus(pubsub),
+        query,
+        RoomStateBroadcaster(),
+        user_event_bus=UserEventBus(pubsub),
+        connections=connections,
+    )
+
+
+async def test_close_goes_only_to_the_closing_user_without_snapshot() -> None:
+    pubsub = LivePubSub()
+    closing, staying = uuid4(), uuid4()
+    query = CountingSnapshotQuery([closing, staying])
+    connections = ConnectionRegistry()
+    closing_stream = _stream(pubsub, query, connections).stream(closing, MVP_ROOM_ID)
+    staying_stream = _stream(pubsub, query, connections).stream(staying, MVP_ROOM_ID)
+    await anext(closing_stream)
+    await anext(staying_stream)
+
+    closing_read = asyncio.create_task(anext(closing_stream))
+    staying_read = asyncio.create_task(anext(staying_stream))
+    await wait_until(lambda: pubsub.active[UserTopic(staying)] == 1)
+
+    close = UserEvent(type=UserEventType.STREAM_CLOSE, user_id=closing, room_id=MVP_ROOM_ID)  # pyright: ignore[reportCallIssue]
+    await UserEventBus(pubsub).publish(UserTopic(closing), close)  # type: ignore[arg-type]
+
+    frame = await closing_read
+    assert b"STREAM_CLOSE" in frame
+    assert query.calls == [RoomSnapshotType.ON_CONNECT] * 2  # close 때문에 snapshot을 만들지 않음
+    await closing_stream.aclose()  # type: ignore[attr-defined]
+    assert connections.connections_of(closing) == set()
+
+    # 다른 user의 stream은 영향 없이 다음 room event를 받는다.
+    ev = RoomEventDelta(type=RoomSnapshotType.MEMBER_READY, user_id=staying)  # pyright: ignore[reportCallIssue]
+    await RoomEventBus(pubsub).publish(RoomTopic(MVP_ROOM_ID), ev)  # type: ignore[arg-type]
+    assert b"ROOM_STATE" in await staying_read
+
+    await staying_stream.aclose()  # type: ignore[attr-defined]
+    assert len(connections) == 0
+    assert pubsub.active[UserTopic(staying)] == 0
+
+
+async def test_conn_topic_reaches_only_that_connection() -> None:
+    pubsub = LivePubSub()
+    user = uuid4()
+    query = CountingSnapshotQuery([user])
+    connections = ConnectionRegistry()
+    streams = [_stream(pubsub, query, connections).stream(user, MVP_ROOM_ID) for _ in range(2)]
+    for s in streams:
+        await anext(s)
+    reads = [asyncio.create_task(anext(s)) for s in streams]
+    await wait_until(lambda: len(connections.connections_of(user)) == 2)
+    # 같은 user의 연결들은 upstream 구독 하나를 공유한다.
+    assert pubsub.active[UserTopic(user)] == 1
+
+    target = sorted(connections.connections_of(user))[0]
+    note = UserEvent(type=UserEventType.NOTIFICATION, user_id=user, message="hi")  # pyright: ignore[reportCallIssue]
+    await UserEventBus(pubsub).publish(ConnTopic(target), note)  # type: ignore[arg-type]
+    await UserEventBus(pubsub).publish(  # type: ignore[arg-type]
+        UserTopic(user),
+        UserEvent(type=UserEventType.ROOM_KICKED, user_id=user, room_id=MVP_ROOM_ID),  # pyright: ignore[reportCallIssue]
+    )
+
+    frames = await asyncio.gather(*reads)
+    notified = [f for f in frames if b"NOTIFICATION" in f]
+    assert len(notified) == 1 and b'"hi"' in notified[0]
+    assert sum(b"ROOM_KICKED" in f for f in frames) == 1
+
+    for s in streams:
+        await s.aclose()  # type: ignore[attr-defined]
+    assert len(connections) == 0
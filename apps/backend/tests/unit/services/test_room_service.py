@@ -7,13 +7,18 @@ import pytest
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
+from app.domain.events.user import UserEvent, UserEventType
 from app.domain.exceptions import EntityNotFoundError
+from app.infra.pubsub.topics import RoomTopic, UserTopic
 from app.models.room import RoomMember
 from app.mvp import MVP_ROOM_ID
 from app.schemas.common.mutation import BaseMutation, Subject, Target
 from app.schemas.room.mutation import JoinRoomReason, KickUserReason, LeaveRoomReason
+from app.services.outbox_relay import OutboxRelay
 from app.services.room import RoomService
 from tests._helpers.entity import create_room, create_user
+from tests._helpers.pubsub import wait_until
+from tests.conftest import FakePubSub
 
 
 async def _count_active(db, *, user_id: UUID) -> int:
@@ -285,3 +290,26 @@ async def test_service_kick_user_raises_when_target_user_missing(
         await room_service.kick_user(
             actor_user_id=actor_id, room_id=room_id, target_user_id=missing_target_id
         )
+
+
+async def test_service_kick_user_notifies_only_kicked_user(
+    db_session, room_service: RoomService, outbox_relay: OutboxRelay, outbox_pubsub: FakePubSub
+):
+    """
+    - 남은 멤버에게는 room event, 쫓겨난 user에게는 user event 하나만 간다.
+    """
+    user_a = await create_user(db_session, username="svc_kick3_a")
+    user_b = await create_user(db_session, username="svc_kick3_b")
+    room_id = await create_room(db_session, host_id=user_a)
+    await room_service.join_room(user_id=user_b, room_id=room_id)
+    await outbox_relay.flush()
+    outbox_pubsub.published.clear()
+
+    await room_service.kick_user(actor_user_id=user_a, room_id=room_id, target_user_id=user_b)
+    await wait_until(lambda: len(outbox_pubsub.published) == 2)
+
+    room_msg, user_msg = outbox_pubsub.published
+    assert room_msg.topic == RoomTopic(room_id)
+    assert user_msg.topic == UserTopic(user_b)
+    event = UserEvent.model_validate_json(user_msg.message)
+    assert (event.type, event.room_id) == (UserEventType.ROOM_KICKED, room_id)